@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark for `ChatCompletionStreamState`, which accumulates streamed chat completion chunks.
+
+Feeds synthetic streams with long answers, long tool call arguments and large structured
+outputs through the state in the same way as `client.beta.chat.completions.stream()` does.
+
+Usage:
+
+    python scripts/benchmarks/chat_stream_state.py --chunks 2000 8000
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+from typing import Any, List
+
+import pydantic
+
+from openai._models import construct_type
+from openai.types.chat import ChatCompletionChunk
+from openai.lib.streaming.chat import ChatCompletionStreamState
+
+
+def make_chunk(choices: list[dict[str, Any]]) -> ChatCompletionChunk:
+    return construct_type(
+        type_=ChatCompletionChunk,
+        value={
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1727346142,
+            "model": "gpt-4o-2024-08-06",
+            "choices": choices,
+        },
+    )  # type: ignore[return-value]
+
+
+def make_content_stream(chunks: int) -> list[ChatCompletionChunk]:
+    stream = [make_chunk([{"index": 0, "delta": {"role": "assistant", "content": ""}}])]
+    stream.extend(make_chunk([{"index": 0, "delta": {"content": f" word{i}"}}]) for i in range(chunks))
+    stream.append(make_chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+    return stream
+
+
+def make_tool_call_stream(chunks: int, tool_calls: int) -> list[ChatCompletionChunk]:
+    stream = [make_chunk([{"index": 0, "delta": {"role": "assistant", "content": None}}])]
+    for tool in range(tool_calls):
+        stream.append(
+            make_chunk(
+                [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": tool,
+                                    "id": f"call_{tool}",
+                                    "type": "function",
+                                    "function": {"name": "get_weather", "arguments": ""},
+                                }
+                            ]
+                        },
+                    }
+                ]
+            )
+        )
+        stream.extend(
+            make_chunk([{"index": 0, "delta": {"tool_calls": [{"index": tool, "function": {"arguments": '"ab'}}]}}])
+            for _ in range(chunks // tool_calls)
+        )
+    stream.append(make_chunk([{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]))
+    return stream
+
+
+class Row(pydantic.BaseModel):
+    name: str
+    value: int
+
+
+class Table(pydantic.BaseModel):
+    rows: List[Row]
+
+
+def make_structured_stream(chunks: int) -> list[ChatCompletionChunk]:
+    content = json.dumps({"rows": [{"name": f"row {i}", "value": i} for i in range(chunks // 6)]})
+    size = max(len(content) // chunks, 1)
+
+    stream = [make_chunk([{"index": 0, "delta": {"role": "assistant", "content": ""}}])]
+    stream.extend(
+        make_chunk([{"index": 0, "delta": {"content": content[i : i + size]}}]) for i in range(0, len(content), size)
+    )
+    stream.append(make_chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+    return stream
+
+
+def run(stream: list[ChatCompletionChunk], rounds: int, response_format: Any = None) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        state: ChatCompletionStreamState[object] = (
+            ChatCompletionStreamState(response_format=response_format)
+            if response_format is not None
+            else ChatCompletionStreamState()
+        )
+        start = time.perf_counter()
+        for chunk in stream:
+            state.handle_chunk(chunk)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1_000, 4_000], help="number of chunks per stream")
+    parser.add_argument("--tool-calls", type=int, default=4, help="number of tool calls in the tool call streams")
+    parser.add_argument("--rounds", type=int, default=3, help="number of rounds, the best round is reported")
+    args = parser.parse_args()
+
+    for chunks in args.chunks:
+        elapsed = run(make_content_stream(chunks), args.rounds)
+        print(f"content     chunks={chunks:>7}  {elapsed * 1000:9.1f} ms  {chunks / elapsed:>10,.0f} chunks/s")
+
+        elapsed = run(make_tool_call_stream(chunks, args.tool_calls), args.rounds)
+        print(f"tool calls  chunks={chunks:>7}  {elapsed * 1000:9.1f} ms  {chunks / elapsed:>10,.0f} chunks/s")
+
+        elapsed = run(make_structured_stream(chunks), args.rounds, response_format=Table)
+        print(f"structured  chunks={chunks:>7}  {elapsed * 1000:9.1f} ms  {chunks / elapsed:>10,.0f} chunks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark for importing the SDK and constructing clients.
+
+Reports the time to `import openai` in a fresh interpreter, and the time to construct a client,
+to derive a client with `with_options()`, and to access every resource of a client. Resources
+are constructed on first access, so the last number is what construction used to cost.
+
+Usage:
+
+    python scripts/benchmarks/client_construction.py --rounds 10000
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+import functools
+import subprocess
+from typing import Any, Callable
+
+import httpx
+
+from openai import OpenAI, AsyncOpenAI
+
+RESOURCES = [
+    "completions",
+    "chat",
+    "embeddings",
+    "files",
+    "images",
+    "audio",
+    "moderations",
+    "models",
+    "fine_tuning",
+    "beta",
+    "batches",
+    "uploads",
+    "with_raw_response",
+    "with_streaming_response",
+]
+
+
+def import_time(rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import openai"], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def construct(client_cls: Any, http_client: Any) -> Any:
+    return client_cls(api_key="sk-benchmark", http_client=http_client)
+
+
+def with_options(client: Any) -> Any:
+    return client.with_options(timeout=10)
+
+
+def access_resources(client_cls: Any, http_client: Any) -> Any:
+    client = client_cls(api_key="sk-benchmark", http_client=http_client)
+    for name in RESOURCES:
+        getattr(client, name)
+    return client
+
+
+def run(fn: Callable[[], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10000, help="number of clients to construct")
+    parser.add_argument("--import-rounds", type=int, default=5, help="number of imports, the best one is reported")
+    args = parser.parse_args()
+
+    print(f"import openai                      {import_time(args.import_rounds) * 1000:9.1f} ms")
+
+    for client_cls, http_client in ((OpenAI, httpx.Client()), (AsyncOpenAI, httpx.AsyncClient())):
+        name = client_cls.__name__
+        client = construct(client_cls, http_client)
+
+        elapsed = run(functools.partial(construct, client_cls, http_client), args.rounds)
+        print(f"{name + '()':<34} {elapsed * 1e6:9.1f} us")
+
+        elapsed = run(functools.partial(with_options, client), args.rounds)
+        print(f"{name + '.with_options()':<34} {elapsed * 1e6:9.1f} us")
+
+        elapsed = run(functools.partial(access_resources, client_cls, http_client), args.rounds)
+        print(f"{name + '() + every resource':<34} {elapsed * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
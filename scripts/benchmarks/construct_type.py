@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Microbenchmark for `construct_type()`, which builds response models from parsed JSON.
+
+Constructs large `SyncCursorPage` list responses and chat completions with many choices,
+these are built in the same way as `_process_response_data()` builds every response.
+
+Usage:
+
+    python scripts/benchmarks/construct_type.py --items 10000
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+from typing import Any, Callable
+
+from openai.types import FileObject
+from openai._models import construct_type
+from openai.pagination import SyncPage, SyncCursorPage
+from openai.types.chat import ChatCompletion
+from openai.types.fine_tuning import FineTuningJobEvent
+
+
+def make_events(count: int) -> dict[str, Any]:
+    return {
+        "object": "list",
+        "has_more": True,
+        "data": [
+            {
+                "id": f"ftevent-{i}",
+                "created_at": 1721764800 + i,
+                "level": "info",
+                "message": f"Step {i}/{count}: training loss=0.{i % 1000:03d}",
+                "object": "fine_tuning.job.event",
+                "data": {"step": i, "train_loss": i / count},
+                "type": "metrics",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_files(count: int) -> dict[str, Any]:
+    return {
+        "object": "list",
+        "data": [
+            {
+                "id": f"file-{i}",
+                "bytes": 120_000 + i,
+                "created_at": 1677610602 + i,
+                "filename": f"batch-{i}.jsonl",
+                "object": "file",
+                "purpose": "batch",
+                "status": "processed",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_chat_completion(choices: int) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "created": 1677652288,
+        "model": "gpt-4o-2024-08-06",
+        "system_fingerprint": "fp_44709d6fcb",
+        "choices": [
+            {
+                "index": i,
+                "message": {
+                    "role": "assistant",
+                    "content": f"Choice number {i}, with a reasonably long answer to the question that was asked.",
+                    "refusal": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+                        }
+                    ],
+                },
+                "logprobs": {
+                    "content": [
+                        {"token": "Choice", "logprob": -0.1, "bytes": [67, 104], "top_logprobs": []},
+                        {"token": " number", "logprob": -0.2, "bytes": [32, 110], "top_logprobs": []},
+                    ],
+                    "refusal": None,
+                },
+                "finish_reason": "stop",
+            }
+            for i in range(choices)
+        ],
+        "usage": {
+            "prompt_tokens": 9,
+            "completion_tokens": 12 * choices,
+            "total_tokens": 9 + 12 * choices,
+            "completion_tokens_details": {"reasoning_tokens": 0},
+        },
+    }
+
+
+def run(fn: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10_000, help="number of items in each list response")
+    parser.add_argument("--choices", type=int, default=1_000, help="number of choices in the chat completion")
+    parser.add_argument("--rounds", type=int, default=5, help="number of rounds, the best round is reported")
+    args = parser.parse_args()
+
+    cases: list[tuple[str, int, object, dict[str, Any]]] = [
+        ("SyncCursorPage[FineTuningJobEvent]", args.items, SyncCursorPage[FineTuningJobEvent], make_events(args.items)),
+        ("SyncPage[FileObject]", args.items, SyncPage[FileObject], make_files(args.items)),
+        ("ChatCompletion", args.choices, ChatCompletion, make_chat_completion(args.choices)),
+    ]
+
+    for name, count, type_, data in cases:
+        elapsed = run(lambda: construct_type(type_=type_, value=data), args.rounds)  # noqa: B023
+        print(f"{name:<36} items={count:>7}  {elapsed * 1000:8.1f} ms  {count / elapsed:>12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
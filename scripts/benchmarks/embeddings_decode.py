@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Microbenchmark for decoding embeddings responses into a matrix.
+
+Compares `client.embeddings.create()` followed by building a NumPy matrix from the
+`Embedding` objects with `client.embeddings.create_matrix()`, against a mock transport
+that returns a pre-built `base64` response, so only the client side work is measured.
+
+Usage:
+
+    python scripts/benchmarks/embeddings_decode.py --inputs 256 2048 --dimensions 1536
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import base64
+import argparse
+import functools
+from typing import Any, List, Callable
+
+import httpx
+import numpy as np
+
+from openai import OpenAI
+
+
+def make_client(inputs: int, dimensions: int) -> OpenAI:
+    vectors = np.random.default_rng(0).random((inputs, dimensions), dtype="float32")
+    body = json.dumps(
+        {
+            "data": [
+                {"embedding": base64.b64encode(vector.tobytes()).decode(), "index": index, "object": "embedding"}
+                for index, vector in enumerate(vectors)
+            ],
+            "model": "text-embedding-3-small",
+            "object": "list",
+            "usage": {"prompt_tokens": inputs, "total_tokens": inputs},
+        }
+    ).encode()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    return OpenAI(api_key="sk-benchmark", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def create(client: OpenAI, texts: List[str]) -> Any:
+    response = client.embeddings.create(input=texts, model="text-embedding-3-small")
+    return np.array([row.embedding for row in response.data], dtype="float32")
+
+
+def create_matrix(client: OpenAI, texts: List[str]) -> Any:
+    return client.embeddings.create_matrix(input=texts, model="text-embedding-3-small")
+
+
+def run(fn: Callable[[], Any], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inputs", type=int, nargs="+", default=[256, 2048], help="number of inputs per request")
+    parser.add_argument("--dimensions", type=int, default=1536, help="number of dimensions of each embedding")
+    parser.add_argument("--rounds", type=int, default=5, help="number of rounds, the best round is reported")
+    args = parser.parse_args()
+
+    for inputs in args.inputs:
+        client = make_client(inputs, args.dimensions)
+        texts = ["text"] * inputs
+
+        assert np.array_equal(create(client, texts), create_matrix(client, texts))
+
+        elapsed = run(functools.partial(create, client, texts), args.rounds)
+        print(f"create         inputs={inputs:>6}  {elapsed * 1000:9.1f} ms")
+
+        elapsed = run(functools.partial(create_matrix, client, texts), args.rounds)
+        print(f"create_matrix  inputs={inputs:>6}  {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark for many concurrent streaming chat completions over HTTP/1.1 and HTTP/2.
+
+Opens `--streams` concurrent streaming chat completions with `AsyncOpenAI(http2=False)` and
+`AsyncOpenAI(http2=True)`, and reports the wall time, chunk throughput and the peak number of
+open connections. HTTP/2 multiplexes the streams over a few connections, instead of opening
+(and TLS handshaking) one connection for each stream.
+
+Runs against the API given by `OPENAI_BASE_URL` & `OPENAI_API_KEY`, so it can be pointed at a
+local OpenAI-compatible server that supports HTTP/2. Requires `pip install openai[http2]`.
+
+Usage:
+
+    python scripts/benchmarks/http2_streams.py --streams 1000 --model gpt-4o-mini
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+from typing import Any, Dict
+
+import anyio
+import httpx
+
+from openai import AsyncOpenAI
+
+
+def open_connections(client: AsyncOpenAI) -> int:
+    transport = client._client._transport
+    assert isinstance(transport, httpx.AsyncHTTPTransport)
+    return len(transport._pool.connections)
+
+
+async def run(http2: bool, streams: int, model: str, max_tokens: int) -> Dict[str, Any]:
+    client = AsyncOpenAI(http2=http2, max_retries=0)
+    chunks = 0
+    errors = 0
+    peak_connections = 0
+
+    async def stream() -> None:
+        nonlocal chunks, errors
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": "Count from 1 to 20."}],
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for _ in response:
+                chunks += 1
+        except Exception:
+            errors += 1
+
+    async def sample_connections() -> None:
+        nonlocal peak_connections
+        while True:
+            peak_connections = max(peak_connections, open_connections(client))
+            await anyio.sleep(0.01)
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(sample_connections)
+        async with anyio.create_task_group() as streams_tg:
+            for _ in range(streams):
+                streams_tg.start_soon(stream)
+        tg.cancel_scope.cancel()
+    elapsed = time.perf_counter() - start
+
+    await client.close()
+    return {"elapsed": elapsed, "chunks": chunks, "errors": errors, "connections": peak_connections}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=1000, help="number of concurrent streams")
+    parser.add_argument("--model", default="gpt-4o-mini", help="model to create the chat completions with")
+    parser.add_argument("--max-tokens", type=int, default=64, help="max tokens of each chat completion")
+    args = parser.parse_args()
+
+    for http2 in (False, True):
+        result = anyio.run(run, http2, args.streams, args.model, args.max_tokens)
+        print(
+            f"{'HTTP/2  ' if http2 else 'HTTP/1.1'}  streams={args.streams:>5}  "
+            f"{result['elapsed']:7.2f} s  {result['chunks'] / result['elapsed']:9.0f} chunks/s  "
+            f"connections={result['connections']:>4}  errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
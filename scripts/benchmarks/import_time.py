@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark for the time it takes to `import openai`.
+
+Runs `python -X importtime -c "import openai"` in fresh interpreters, and reports the best
+cumulative import time of `openai`, the number of `openai` modules that were loaded and the
+slowest imports. With `--max-ms` the script exits with an error if the import is slower, so it
+can be run in CI.
+
+Usage:
+
+    python scripts/benchmarks/import_time.py --rounds 5 --top 15
+    python scripts/benchmarks/import_time.py --max-ms 500
+"""
+
+from __future__ import annotations
+
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+CODE = "import sys, openai; print(sum(name.split('.')[0] == 'openai' for name in sys.modules))"
+
+
+def import_openai() -> Tuple[Dict[str, int], int]:
+    """Returns the cumulative import time of each module in microseconds, and the number of `openai` modules"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE], capture_output=True, text=True, check=True
+    )
+
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _self, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        times[name] = int(cumulative)
+
+    return times, int(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5, help="number of imports, the fastest one is reported")
+    parser.add_argument("--top", type=int, default=10, help="number of the slowest imports to report")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if importing openai takes longer")
+    args = parser.parse_args()
+
+    runs: List[Tuple[Dict[str, int], int]] = [import_openai() for _ in range(args.rounds)]
+    times, modules = min(runs, key=lambda run: run[0]["openai"])
+    total_ms = times["openai"] / 1000
+
+    print(f"import openai  {total_ms:9.1f} ms  ({modules} openai modules)")
+    print()
+    for name, cumulative in sorted(times.items(), key=lambda item: item[1], reverse=True)[1 : args.top + 1]:
+        print(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        sys.exit(f"importing openai took {total_ms:.1f} ms, more than the {args.max_ms:.1f} ms limit")
+
+
+if __name__ == "__main__":
+    main()
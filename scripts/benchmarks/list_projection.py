@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Microbenchmark for listing a large collection of files.
+
+Compares iterating over `client.files.list()`, which constructs a page model and a `FileObject`
+for every file, with `client.iter_api_list()` selecting only the `id` and `status` of each file,
+against a mock transport that returns pre-built pages, so only the client side work is measured.
+
+Usage:
+
+    python scripts/benchmarks/list_projection.py --files 100000 --page-size 10000
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+import functools
+import tracemalloc
+from typing import Any, Dict, List, Tuple, Callable
+
+import httpx
+
+from openai import OpenAI
+
+
+def make_client(files: int, page_size: int) -> OpenAI:
+    ids = [f"file-{index:024d}" for index in range(files)]
+    pages: Dict[str, bytes] = {}
+    for start in range(0, files + 1, page_size):
+        data = [
+            {
+                "id": id,
+                "object": "file",
+                "bytes": 120000,
+                "created_at": 1677610602,
+                "filename": "mydata.jsonl",
+                "purpose": "assistants",
+                "status": "processed",
+            }
+            for id in ids[start : start + page_size]
+        ]
+        after = ids[start - 1] if start else ""
+        pages[after] = json.dumps({"object": "list", "data": data, "has_more": bool(data)}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = pages[request.url.params.get("after", "")]
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    return OpenAI(api_key="sk-benchmark", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def list_models(client: OpenAI, page_size: int) -> List[Tuple[str, Any]]:
+    return [(file.id, file.status) for file in client.files.list(limit=page_size)]
+
+
+def list_projection(client: OpenAI, page_size: int) -> List[Tuple[str, Any]]:
+    items = client.iter_api_list("/files", fields=["id", "status"], options={"params": {"limit": page_size}})
+    return [(item["id"], item["status"]) for item in items]
+
+
+def run(fn: Callable[[], Any], rounds: int) -> Tuple[float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100000, help="number of files to list")
+    parser.add_argument("--page-size", type=int, default=10000, help="number of files per page")
+    parser.add_argument("--rounds", type=int, default=3, help="number of rounds, the best round is reported")
+    args = parser.parse_args()
+
+    client = make_client(args.files, args.page_size)
+    assert list_models(client, args.page_size) == list_projection(client, args.page_size)
+
+    for name, fn in (("files.list", list_models), ("iter_api_list", list_projection)):
+        elapsed, peak = run(functools.partial(fn, client, args.page_size), args.rounds)
+        print(f"{name:<14} files={args.files:>7}  {elapsed * 1000:9.1f} ms  peak {peak / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
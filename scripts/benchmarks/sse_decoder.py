@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Microbenchmark for the SSE decoder used by `Stream` / `AsyncStream`.
+
+Replays recorded chat completion streams through `SSEDecoder` using a variety of
+network chunk sizes. By default the streams recorded for the test suite in
+`.inline-snapshot/external` are concatenated and repeated until the requested number
+of events is reached, other recorded response bodies can be given with `--file`.
+
+Usage:
+
+    python scripts/benchmarks/sse_decoder.py --events 20000
+    python scripts/benchmarks/sse_decoder.py --file recorded_stream.bin
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+from typing import Iterator
+from pathlib import Path
+
+from openai._streaming import SSEDecoder
+
+SNAPSHOTS_DIR = Path(__file__).parent.parent.parent / ".inline-snapshot" / "external"
+
+
+def load_recorded_events(files: list[Path]) -> list[bytes]:
+    events: list[bytes] = []
+    for file in files:
+        for event in file.read_bytes().split(b"\n\n"):
+            if event.strip() and not event.startswith(b"data: [DONE]"):
+                events.append(event + b"\n\n")
+    return events
+
+
+def make_stream(events: list[bytes], count: int) -> bytes:
+    repeated = (events * (count // len(events) + 1))[:count]
+    return b"".join(repeated) + b"data: [DONE]\n\n"
+
+
+def iter_chunks(body: bytes, chunk_size: int) -> Iterator[bytes]:
+    for i in range(0, len(body), chunk_size):
+        yield body[i : i + chunk_size]
+
+
+def run(body: bytes, chunk_size: int, rounds: int) -> tuple[float, int]:
+    best = float("inf")
+    count = 0
+    for _ in range(rounds):
+        chunks = list(iter_chunks(body, chunk_size))
+        start = time.perf_counter()
+        count = sum(1 for _ in SSEDecoder().iter_bytes(iter(chunks)))
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20_000, help="number of events to replay")
+    parser.add_argument("--file", type=Path, nargs="+", help="recorded raw SSE response bodies to replay")
+    parser.add_argument("--rounds", type=int, default=5, help="number of rounds, the best round is reported")
+    parser.add_argument(
+        "--chunk-sizes",
+        type=int,
+        nargs="+",
+        default=[16, 256, 4096, 65536],
+        help="network chunk sizes to replay the stream with",
+    )
+    args = parser.parse_args()
+
+    files: list[Path] = args.file or sorted(SNAPSHOTS_DIR.glob("*.bin"))
+    events = load_recorded_events(files)
+    if not events:
+        parser.error("no recorded events found")
+
+    body = make_stream(events, args.events)
+
+    print(f"replaying {args.events} events from {len(files)} recorded streams, {len(body) / 1024 / 1024:.2f} MiB")
+    for chunk_size in args.chunk_sizes:
+        elapsed, count = run(body, chunk_size, args.rounds)
+        print(
+            f"chunk_size={chunk_size:>6}  events={count:>7}  {elapsed * 1000:8.1f} ms  {count / elapsed:>12,.0f} events/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
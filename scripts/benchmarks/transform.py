@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Microbenchmark for `maybe_transform()` / `async_maybe_transform()`, which prepare request bodies.
+
+Transforms chat completion params with large `messages` arrays in the same way as
+`client.chat.completions.create()` does before sending a request.
+
+Usage:
+
+    python scripts/benchmarks/transform.py --messages 1000
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import argparse
+from typing import Any, Callable
+
+from openai import NOT_GIVEN
+from openai._utils import maybe_transform, async_maybe_transform
+from openai.types.chat import completion_create_params
+
+
+def make_params(messages: int, tools: int) -> dict[str, Any]:
+    conversation: list[dict[str, Any]] = [{"role": "system", "content": "You are a helpful assistant."}]
+    for i in range(messages - 1):
+        if i % 3 == 0:
+            conversation.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": f"Question {i}: what is in this image?"},
+                        {"type": "image_url", "image_url": {"url": "https://example.com/image.png", "detail": "low"}},
+                    ],
+                }
+            )
+        elif i % 3 == 1:
+            conversation.append(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+                        }
+                    ],
+                }
+            )
+        else:
+            conversation.append({"role": "tool", "tool_call_id": f"call_{i - 1}", "content": "Sunny, 24C"})
+
+    return {
+        "messages": conversation,
+        "model": "gpt-4o",
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "description": "An example tool",
+                    "parameters": {"type": "object", "properties": {"city": {"type": "string"}}},
+                },
+            }
+            for i in range(tools)
+        ],
+        "temperature": 0.5,
+        "stream": NOT_GIVEN,
+        "user": NOT_GIVEN,
+    }
+
+
+def run(fn: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, nargs="+", default=[10, 1_000], help="number of messages in a request")
+    parser.add_argument("--tools", type=int, default=20, help="number of tools in a request")
+    parser.add_argument("--rounds", type=int, default=20, help="number of rounds, the best round is reported")
+    args = parser.parse_args()
+
+    params_type = completion_create_params.CompletionCreateParams
+
+    for messages in args.messages:
+        params = make_params(messages, args.tools)
+
+        elapsed = run(lambda: maybe_transform(params, params_type), args.rounds)  # noqa: B023
+        print(f"maybe_transform        messages={messages:>6}  {elapsed * 1000:8.2f} ms")
+
+        loop = asyncio.new_event_loop()
+        elapsed = run(lambda: loop.run_until_complete(async_maybe_transform(params, params_type)), args.rounds)  # noqa: B023
+        loop.close()
+        print(f"async_maybe_transform  messages={messages:>6}  {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import os as _os
+from typing import TYPE_CHECKING
 from typing_extensions import override
 
-from . import types
 from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes
 from ._utils import file_from_path
 from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
 from ._models import BaseModel
+from ._poller import Poller, PollFuture, AsyncPoller
+from ._hedging import HedgingPolicy
+from ._retries import RequestAttempt, RetryScheduler
 from ._version import __title__, __version__
 from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
-from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
+from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS, DEFAULT_HTTP2_CONNECTION_LIMITS
 from ._exceptions import (
     APIError,
     OpenAIError,
@@ -33,6 +36,8 @@ from ._exceptions import (
 )
 from ._base_client import DefaultHttpxClient, DefaultAsyncHttpxClient
 from ._utils._logs import setup_logging as _setup_logging
+from ._rate_limiter import RateLimiter
+from ._connection_pool import KeepAlive, PoolStats, AsyncKeepAlive
 
 __all__ = [
     "types",
@@ -73,17 +78,45 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_CONNECTION_LIMITS",
+    "DEFAULT_HTTP2_CONNECTION_LIMITS",
     "DefaultHttpxClient",
     "DefaultAsyncHttpxClient",
+    "HedgingPolicy",
+    "RateLimiter",
+    "RetryScheduler",
+    "PoolStats",
+    "KeepAlive",
+    "AsyncKeepAlive",
+    "RequestAttempt",
+    "Poller",
+    "AsyncPoller",
+    "PollFuture",
 ]
 
-from .lib import azure as _azure, pydantic_function_tool as pydantic_function_tool
+from .lib import azure as _azure
 from .version import VERSION as VERSION
 from .lib.azure import AzureOpenAI as AzureOpenAI, AsyncAzureOpenAI as AsyncAzureOpenAI
+from ._utils._lazy import lazy_imports
 from .lib._old_api import *
-from .lib.streaming import (
-    AssistantEventHandler as AssistantEventHandler,
-    AsyncAssistantEventHandler as AsyncAssistantEventHandler,
+
+if TYPE_CHECKING:
+    from . import types as types, resources as resources
+    from .lib import pydantic_function_tool as pydantic_function_tool
+    from .lib.streaming import (
+        AssistantEventHandler as AssistantEventHandler,
+        AsyncAssistantEventHandler as AsyncAssistantEventHandler,
+    )
+
+# these modules pull in hundreds of type definitions, so they're only imported on first use
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "types": ".types",
+        "resources": ".resources",
+        "pydantic_function_tool": ".lib",
+        "AssistantEventHandler": ".lib.streaming",
+        "AsyncAssistantEventHandler": ".lib.streaming",
+    },
 )
 
 _setup_logging()
@@ -94,7 +127,7 @@ _setup_logging()
 # openai._exceptions.NotFoundError -> openai.NotFoundError
 __locals = locals()
 for __name in __all__:
-    if not __name.startswith("__"):
+    if not __name.startswith("__") and __name in __locals:
         try:
             __locals[__name].__module__ = "openai"
         except (TypeError, AttributeError):
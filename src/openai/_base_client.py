@@ -22,9 +22,11 @@ from typing import (
     Generic,
     Mapping,
     TypeVar,
+    Callable,
     Iterable,
     Iterator,
     Optional,
+    Sequence,
     Generator,
     AsyncIterator,
     cast,
@@ -65,6 +67,9 @@ from ._types import (
 from ._utils import SensitiveHeadersFilter, is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
 from ._compat import model_copy, model_dump
 from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._hedging import HedgingPolicy, can_hedge, send_hedged, async_send_hedged
+from ._retries import RequestAttempt, RetryScheduler
+from ._prefetch import check_prefetch, prefetch_pages, async_prefetch_pages
 from ._response import (
     APIResponse,
     BaseAPIResponse,
@@ -79,6 +84,7 @@ from ._constants import (
     RAW_RESPONSE_HEADER,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
+    DEFAULT_HTTP2_CONNECTION_LIMITS,
 )
 from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
 from ._exceptions import (
@@ -87,6 +93,17 @@ from ._exceptions import (
     APIConnectionError,
     APIResponseValidationError,
 )
+from ._projection import project_page, next_page_options
+from ._rate_limiter import RateLimiter
+from ._connection_pool import (
+    KeepAlive,
+    PoolStats,
+    AsyncKeepAlive,
+    ConnectionCounter,
+    warmup,
+    async_warmup,
+    get_pool_stats,
+)
 from ._legacy_response import LegacyAPIResponse
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -226,7 +243,23 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+    def iter_pages(self: SyncPageT, *, prefetch: int = 0) -> Iterator[SyncPageT]:
+        """Iterate over this page and all the pages after it.
+
+        With `prefetch`, up to that many of the following pages are fetched from a helper
+        thread while the current page is being processed, e.g.
+
+        ```py
+        for page in client.batches.list().iter_pages(prefetch=2):
+            for batch in page.data:
+                ...
+        ```
+        """
+        check_prefetch(prefetch)
+        if prefetch:
+            yield from prefetch_pages(self, prefetch)
+            return
+
         page = self
         while True:
             yield page
@@ -303,7 +336,23 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
+    async def iter_pages(self: AsyncPageT, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+        """Iterate over this page and all the pages after it.
+
+        With `prefetch`, up to that many of the following pages are fetched in a background
+        task while the current page is being processed. This requires `asyncio`, with other
+        async libraries the pages are fetched one after the other.
+        """
+        check_prefetch(prefetch)
+        if prefetch:
+            pages = async_prefetch_pages(self, prefetch)
+            try:
+                async for prefetched in pages:
+                    yield prefetched
+            finally:
+                await pages.aclose()
+            return
+
         page = self
         while True:
             yield page
@@ -333,6 +382,9 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _base_url: URL
     max_retries: int
     timeout: Union[float, Timeout, None]
+    hedging_policy: HedgingPolicy | None
+    rate_limiter: RateLimiter | None
+    retry_scheduler: RetryScheduler | None
     _limits: httpx.Limits
     _proxies: ProxiesTypes | None
     _transport: Transport | AsyncTransport | None
@@ -353,11 +405,17 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         proxies: ProxiesTypes | None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
     ) -> None:
         self._version = version
         self._base_url = self._enforce_trailing_slash(URL(base_url))
         self.max_retries = max_retries
         self.timeout = timeout
+        self.hedging_policy = hedging_policy
+        self.rate_limiter = rate_limiter
+        self.retry_scheduler = retry_scheduler
         self._limits = limits
         self._proxies = proxies
         self._transport = transport
@@ -708,6 +766,26 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         timeout = sleep_seconds * jitter
         return timeout if timeout >= 0 else 0
 
+    def _report_attempt(
+        self,
+        request: httpx.Request,
+        *,
+        retries_taken: int,
+        started_at: float,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> RequestAttempt:
+        attempt = RequestAttempt(
+            request=request,
+            response=response,
+            error=error,
+            retries_taken=retries_taken,
+            elapsed=time.monotonic() - started_at,
+        )
+        if self.retry_scheduler is not None:
+            self.retry_scheduler.on_attempt(attempt)
+        return attempt
+
     def _should_retry(self, response: httpx.Response) -> bool:
         # Note: this is not a standard header
         should_retry_header = response.headers.get("x-should-retry")
@@ -750,10 +828,19 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
 class _DefaultHttpxClient(httpx.Client):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        kwargs.setdefault(
+            "limits", DEFAULT_HTTP2_CONNECTION_LIMITS if kwargs.get("http2") else DEFAULT_CONNECTION_LIMITS
+        )
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
 
+        # count the connections that are opened for `client.pool_stats()`
+        self._connection_counter = ConnectionCounter()
+        self.event_hooks = {
+            **self.event_hooks,
+            "request": [*self.event_hooks["request"], self._connection_counter.on_request],
+        }
+
 
 if TYPE_CHECKING:
     DefaultHttpxClient = httpx.Client
@@ -790,8 +877,12 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         proxies: ProxiesTypes | None = None,
         limits: Limits | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool,
     ) -> None:
         kwargs: dict[str, Any] = {}
@@ -804,7 +895,10 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             if http_client is not None:
                 raise ValueError("The `http_client` argument is mutually exclusive with `connection_pool_limits`")
         else:
-            limits = DEFAULT_CONNECTION_LIMITS
+            limits = DEFAULT_HTTP2_CONNECTION_LIMITS if http2 else DEFAULT_CONNECTION_LIMITS
+
+        if http2 and http_client is not None:
+            raise ValueError("The `http_client` argument is mutually exclusive with `http2`")
 
         if transport is not None:
             kwargs["transport"] = transport
@@ -855,6 +949,9 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
         self._client = http_client or SyncHttpxClientWrapper(
@@ -862,6 +959,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
             limits=limits,
+            http2=http2,
             follow_redirects=True,
             **kwargs,  # type: ignore
         )
@@ -879,6 +977,35 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         if hasattr(self, "_client"):
             self._client.close()
 
+    def warmup(self, connections: int = 1, *, timeout: float | Timeout | None = None) -> PoolStats:
+        """Opens `connections` connections to the API ahead of the first requests.
+
+        This avoids paying for DNS, TCP & TLS on the first requests, e.g. after a cold start.
+        Up to `max_keepalive_connections` of the connections are kept open in the pool,
+        with HTTP/2 the requests are multiplexed over a single connection.
+
+        Raises `APIConnectionError` if a connection can't be opened.
+        """
+        warmup(self, connections, timeout=self.timeout if timeout is None else timeout)
+        return self.pool_stats()
+
+    def keep_alive(self, connections: int = 1, *, interval: float | None = None) -> KeepAlive:
+        """Keeps `connections` connections to the API open from a background thread.
+
+        Every `interval` seconds, by default half of the pool's keep-alive expiry, the
+        expired connections are closed and the idle ones are refreshed.
+
+        ```py
+        with client.keep_alive(connections=4):
+            ...
+        ```
+        """
+        return KeepAlive(self, connections=connections, interval=interval)
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the number of in-use & idle connections in the pool, and how many have been opened & closed"""
+        return get_pool_stats(self._client)
+
     def __enter__(self: _T) -> _T:
         return self
 
@@ -971,134 +1098,159 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         stream: bool,
         stream_cls: type[_StreamT] | None,
     ) -> ResponseT | _StreamT:
+        cast_to = self._maybe_override_cast_to(cast_to, options)
+
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
         # given the original options
         input_options = model_copy(options)
+        max_retries = input_options.get_max_retries(self.max_retries)
 
-        cast_to = self._maybe_override_cast_to(cast_to, options)
-        options = self._prepare_options(options)
-
-        remaining_retries = options.get_max_retries(self.max_retries) - retries_taken
-        request = self._build_request(options, retries_taken=retries_taken)
-        self._prepare_request(request)
+        while True:
+            options = self._prepare_options(model_copy(input_options))
 
-        kwargs: HttpxSendArgs = {}
-        if self.custom_auth is not None:
-            kwargs["auth"] = self.custom_auth
+            remaining_retries = max_retries - retries_taken
+            request = self._build_request(options, retries_taken=retries_taken)
+            self._prepare_request(request)
 
-        log.debug("Sending HTTP Request: %s %s", request.method, request.url)
+            kwargs: HttpxSendArgs = {}
+            if self.custom_auth is not None:
+                kwargs["auth"] = self.custom_auth
 
-        try:
-            response = self._client.send(
-                request,
-                stream=stream or self._should_stream_response_body(request=request),
-                **kwargs,
-            )
-        except httpx.TimeoutException as err:
-            log.debug("Encountered httpx.TimeoutException", exc_info=True)
+            log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
-            if remaining_retries > 0:
-                return self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                    response_headers=None,
+            started_at = time.monotonic()
+            try:
+                response = self._send_request(
+                    request,
+                    options=options,
+                    stream=stream or self._should_stream_response_body(request=request),
+                    send_args=kwargs,
                 )
+            except httpx.TimeoutException as err:
+                log.debug("Encountered httpx.TimeoutException", exc_info=True)
+
+                attempt = self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, error=err)
+                if remaining_retries > 0 and self._sleep_for_retry(input_options, attempt=attempt):
+                    retries_taken += 1
+                    continue
+
+                log.debug("Raising timeout error")
+                raise APITimeoutError(request=request) from err
+            except Exception as err:
+                log.debug("Encountered Exception", exc_info=True)
+
+                attempt = self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, error=err)
+                if remaining_retries > 0 and self._sleep_for_retry(input_options, attempt=attempt):
+                    retries_taken += 1
+                    continue
+
+                log.debug("Raising connection error")
+                raise APIConnectionError(request=request) from err
+
+            log.debug(
+                'HTTP Response: %s %s "%i %s" %s',
+                request.method,
+                request.url,
+                response.status_code,
+                response.reason_phrase,
+                response.headers,
+            )
+            log.debug("request_id: %s", response.headers.get("x-request-id"))
 
-            log.debug("Raising timeout error")
-            raise APITimeoutError(request=request) from err
-        except Exception as err:
-            log.debug("Encountered Exception", exc_info=True)
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+                log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-            if remaining_retries > 0:
-                return self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                    response_headers=None,
+                attempt = self._report_attempt(
+                    request, retries_taken=retries_taken, started_at=started_at, response=err.response
                 )
+                if remaining_retries > 0 and self._should_retry(err.response):
+                    # the body is read before the connection is released, as it's still needed for the
+                    # error if the retry scheduler doesn't allow another attempt
+                    _read_error_body(err.response)
+                    err.response.close()
+                    if self._sleep_for_retry(input_options, attempt=attempt):
+                        retries_taken += 1
+                        continue
+
+                # If the response is streamed then we need to explicitly read the response
+                # to completion before attempting to access the response text.
+                if not err.response.is_closed:
+                    err.response.read()
+
+                log.debug("Re-raising status error")
+                raise self._make_status_error_from_response(err.response) from None
+
+            self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, response=response)
+
+            return self._process_response(
+                cast_to=cast_to,
+                options=options,
+                response=response,
+                stream=stream,
+                stream_cls=stream_cls,
+                retries_taken=retries_taken,
+            )
 
-            log.debug("Raising connection error")
-            raise APIConnectionError(request=request) from err
-
-        log.debug(
-            'HTTP Response: %s %s "%i %s" %s',
-            request.method,
-            request.url,
-            response.status_code,
-            response.reason_phrase,
-            response.headers,
-        )
-        log.debug("request_id: %s", response.headers.get("x-request-id"))
+    def _send_request(
+        self,
+        request: httpx.Request,
+        *,
+        options: FinalRequestOptions,
+        stream: bool,
+        send_args: HttpxSendArgs,
+    ) -> httpx.Response:
+        """Send the given request, applying the client-side rate limiter and hedging policy if they are configured"""
+
+        def send(req: httpx.Request) -> httpx.Response:
+            return self._client.send(req, stream=stream, **send_args)
+
+        rate_limiter = self.rate_limiter
+        reservation = rate_limiter.reserve(options) if rate_limiter is not None else None
+        if reservation is not None and reservation.delay > 0:
+            log.info(
+                "Delaying request to %s by %f seconds to stay under the rate limit", options.url, reservation.delay
+            )
+            time.sleep(reservation.delay)
 
         try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-            log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
-
-            if remaining_retries > 0 and self._should_retry(err.response):
-                err.response.close()
-                return self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    response_headers=err.response.headers,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                )
+            hedging_policy = self.hedging_policy
+            if hedging_policy is not None and can_hedge(request):
+                response = send_hedged(send, request, policy=hedging_policy, endpoint=options.url)
+            else:
+                response = send(request)
+        except BaseException:
+            if rate_limiter is not None and reservation is not None:
+                rate_limiter.release(reservation)
+            raise
 
-            # If the response is streamed then we need to explicitly read the response
-            # to completion before attempting to access the response text.
-            if not err.response.is_closed:
-                err.response.read()
+        if rate_limiter is not None and reservation is not None:
+            rate_limiter.release(reservation, response.headers)
 
-            log.debug("Re-raising status error")
-            raise self._make_status_error_from_response(err.response) from None
+        return response
 
-        return self._process_response(
-            cast_to=cast_to,
-            options=options,
-            response=response,
-            stream=stream,
-            stream_cls=stream_cls,
-            retries_taken=retries_taken,
-        )
-
-    def _retry_request(
-        self,
-        options: FinalRequestOptions,
-        cast_to: Type[ResponseT],
-        *,
-        retries_taken: int,
-        response_headers: httpx.Headers | None,
-        stream: bool,
-        stream_cls: type[_StreamT] | None,
-    ) -> ResponseT | _StreamT:
-        remaining_retries = options.get_max_retries(self.max_retries) - retries_taken
+    def _sleep_for_retry(self, options: FinalRequestOptions, *, attempt: RequestAttempt) -> bool:
+        """Wait until the failed attempt should be retried, returns `False` if it should not be retried after all"""
+        remaining_retries = options.get_max_retries(self.max_retries) - attempt.retries_taken
         if remaining_retries == 1:
             log.debug("1 retry left")
         else:
             log.debug("%i retries left", remaining_retries)
 
+        response_headers = attempt.response.headers if attempt.response is not None else None
         timeout = self._calculate_retry_timeout(remaining_retries, options, response_headers)
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
 
+        retry_scheduler = self.retry_scheduler
+        if retry_scheduler is not None:
+            return retry_scheduler.wait(timeout, attempt)
+
         # In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
-        # different thread if necessary.
+        # different thread if necessary, or to configure a `RetryScheduler` that bounds the number of pending retries.
         time.sleep(timeout)
-
-        return self._request(
-            options=options,
-            cast_to=cast_to,
-            retries_taken=retries_taken + 1,
-            stream=stream,
-            stream_cls=stream_cls,
-        )
+        return True
 
     def _process_response(
         self,
@@ -1328,14 +1480,86 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
         return self._request_api_list(model, page, opts)
 
+    @overload
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: None = None,
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> Iterator[Dict[str, Any]]: ...
+
+    @overload
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: Callable[..., _T],
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> Iterator[_T]: ...
+
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: Callable[..., Any] | None = None,
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> Iterator[Any]:
+        """Iterate over the items of a cursor paginated list endpoint without constructing any models.
+
+        Each page is parsed with `jiter` and only the given `fields` of each item are kept, as a
+        dictionary or passed as keyword arguments to `record`, e.g. a `NamedTuple` or a class with
+        `__slots__`. The pages are followed with the `after` cursor, like `SyncCursorPage`.
+
+        ```py
+        for file in client.iter_api_list("/files", fields=["id", "status"], options={"params": {"limit": 100}}):
+            ...
+        ```
+        """
+        opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
+        return self._iter_api_list(opts, fields, record)
+
+    def _iter_api_list(
+        self,
+        options: FinalRequestOptions,
+        fields: Sequence[str] | None,
+        record: Callable[..., Any] | None,
+    ) -> Iterator[Any]:
+        while True:
+            response = self.request(httpx.Response, options)
+            items, cursor = project_page(response.content, fields, record)
+            yield from items
+
+            if cursor is None:
+                return
+            options = next_page_options(options, cursor)
+
 
 class _DefaultAsyncHttpxClient(httpx.AsyncClient):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        kwargs.setdefault(
+            "limits", DEFAULT_HTTP2_CONNECTION_LIMITS if kwargs.get("http2") else DEFAULT_CONNECTION_LIMITS
+        )
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
 
+        # count the connections that are opened for `client.pool_stats()`
+        self._connection_counter = ConnectionCounter()
+        self.event_hooks = {
+            **self.event_hooks,
+            "request": [*self.event_hooks["request"], self._connection_counter.on_async_request],
+        }
+
 
 if TYPE_CHECKING:
     DefaultAsyncHttpxClient = httpx.AsyncClient
@@ -1374,8 +1598,12 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         proxies: ProxiesTypes | None = None,
         limits: Limits | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
     ) -> None:
         kwargs: dict[str, Any] = {}
         if limits is not None:
@@ -1387,7 +1615,10 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             if http_client is not None:
                 raise ValueError("The `http_client` argument is mutually exclusive with `connection_pool_limits`")
         else:
-            limits = DEFAULT_CONNECTION_LIMITS
+            limits = DEFAULT_HTTP2_CONNECTION_LIMITS if http2 else DEFAULT_CONNECTION_LIMITS
+
+        if http2 and http_client is not None:
+            raise ValueError("The `http_client` argument is mutually exclusive with `http2`")
 
         if transport is not None:
             kwargs["transport"] = transport
@@ -1438,6 +1669,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
         self._client = http_client or AsyncHttpxClientWrapper(
@@ -1445,6 +1679,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
             limits=limits,
+            http2=http2,
             follow_redirects=True,
             **kwargs,  # type: ignore
         )
@@ -1459,6 +1694,35 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         """
         await self._client.aclose()
 
+    async def warmup(self, connections: int = 1, *, timeout: float | Timeout | None = None) -> PoolStats:
+        """Opens `connections` connections to the API ahead of the first requests.
+
+        This avoids paying for DNS, TCP & TLS on the first requests, e.g. after a cold start.
+        Up to `max_keepalive_connections` of the connections are kept open in the pool,
+        with HTTP/2 the requests are multiplexed over a single connection.
+
+        Raises `APIConnectionError` if a connection can't be opened.
+        """
+        await async_warmup(self, connections, timeout=self.timeout if timeout is None else timeout)
+        return self.pool_stats()
+
+    def keep_alive(self, connections: int = 1, *, interval: float | None = None) -> AsyncKeepAlive:
+        """Keeps `connections` connections to the API open from a background task.
+
+        Every `interval` seconds, by default half of the pool's keep-alive expiry, the
+        expired connections are closed and the idle ones are refreshed.
+
+        ```py
+        async with client.keep_alive(connections=4):
+            ...
+        ```
+        """
+        return AsyncKeepAlive(self, connections=connections, interval=interval)
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the number of in-use & idle connections in the pool, and how many have been opened & closed"""
+        return get_pool_stats(self._client)
+
     async def __aenter__(self: _T) -> _T:
         return self
 
@@ -1556,124 +1820,149 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             # execute it earlier while we are in an async context
             self._platform = await asyncify(get_platform)()
 
+        cast_to = self._maybe_override_cast_to(cast_to, options)
+
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
         # given the original options
         input_options = model_copy(options)
+        max_retries = input_options.get_max_retries(self.max_retries)
 
-        cast_to = self._maybe_override_cast_to(cast_to, options)
-        options = await self._prepare_options(options)
-
-        remaining_retries = options.get_max_retries(self.max_retries) - retries_taken
-        request = self._build_request(options, retries_taken=retries_taken)
-        await self._prepare_request(request)
+        while True:
+            options = await self._prepare_options(model_copy(input_options))
 
-        kwargs: HttpxSendArgs = {}
-        if self.custom_auth is not None:
-            kwargs["auth"] = self.custom_auth
+            remaining_retries = max_retries - retries_taken
+            request = self._build_request(options, retries_taken=retries_taken)
+            await self._prepare_request(request)
 
-        try:
-            response = await self._client.send(
-                request,
-                stream=stream or self._should_stream_response_body(request=request),
-                **kwargs,
-            )
-        except httpx.TimeoutException as err:
-            log.debug("Encountered httpx.TimeoutException", exc_info=True)
+            kwargs: HttpxSendArgs = {}
+            if self.custom_auth is not None:
+                kwargs["auth"] = self.custom_auth
 
-            if remaining_retries > 0:
-                return await self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                    response_headers=None,
+            started_at = time.monotonic()
+            try:
+                response = await self._send_request(
+                    request,
+                    options=options,
+                    stream=stream or self._should_stream_response_body(request=request),
+                    send_args=kwargs,
                 )
+            except httpx.TimeoutException as err:
+                log.debug("Encountered httpx.TimeoutException", exc_info=True)
 
-            log.debug("Raising timeout error")
-            raise APITimeoutError(request=request) from err
-        except Exception as err:
-            log.debug("Encountered Exception", exc_info=True)
+                attempt = self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, error=err)
+                if remaining_retries > 0 and await self._sleep_for_retry(input_options, attempt=attempt):
+                    retries_taken += 1
+                    continue
 
-            if remaining_retries > 0:
-                return await self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                    response_headers=None,
-                )
+                log.debug("Raising timeout error")
+                raise APITimeoutError(request=request) from err
+            except Exception as err:
+                log.debug("Encountered Exception", exc_info=True)
 
-            log.debug("Raising connection error")
-            raise APIConnectionError(request=request) from err
+                attempt = self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, error=err)
+                if remaining_retries > 0 and await self._sleep_for_retry(input_options, attempt=attempt):
+                    retries_taken += 1
+                    continue
 
-        log.debug(
-            'HTTP Request: %s %s "%i %s"', request.method, request.url, response.status_code, response.reason_phrase
-        )
-
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-            log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
-
-            if remaining_retries > 0 and self._should_retry(err.response):
-                await err.response.aclose()
-                return await self._retry_request(
-                    input_options,
-                    cast_to,
-                    retries_taken=retries_taken,
-                    response_headers=err.response.headers,
-                    stream=stream,
-                    stream_cls=stream_cls,
-                )
+                log.debug("Raising connection error")
+                raise APIConnectionError(request=request) from err
 
-            # If the response is streamed then we need to explicitly read the response
-            # to completion before attempting to access the response text.
-            if not err.response.is_closed:
-                await err.response.aread()
+            log.debug(
+                'HTTP Request: %s %s "%i %s"', request.method, request.url, response.status_code, response.reason_phrase
+            )
 
-            log.debug("Re-raising status error")
-            raise self._make_status_error_from_response(err.response) from None
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+                log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-        return await self._process_response(
-            cast_to=cast_to,
-            options=options,
-            response=response,
-            stream=stream,
-            stream_cls=stream_cls,
-            retries_taken=retries_taken,
-        )
+                attempt = self._report_attempt(
+                    request, retries_taken=retries_taken, started_at=started_at, response=err.response
+                )
+                if remaining_retries > 0 and self._should_retry(err.response):
+                    # the body is read before the connection is released, as it's still needed for the
+                    # error if the retry scheduler doesn't allow another attempt
+                    await _async_read_error_body(err.response)
+                    await err.response.aclose()
+                    if await self._sleep_for_retry(input_options, attempt=attempt):
+                        retries_taken += 1
+                        continue
+
+                # If the response is streamed then we need to explicitly read the response
+                # to completion before attempting to access the response text.
+                if not err.response.is_closed:
+                    await err.response.aread()
+
+                log.debug("Re-raising status error")
+                raise self._make_status_error_from_response(err.response) from None
+
+            self._report_attempt(request, retries_taken=retries_taken, started_at=started_at, response=response)
+
+            return await self._process_response(
+                cast_to=cast_to,
+                options=options,
+                response=response,
+                stream=stream,
+                stream_cls=stream_cls,
+                retries_taken=retries_taken,
+            )
 
-    async def _retry_request(
+    async def _send_request(
         self,
-        options: FinalRequestOptions,
-        cast_to: Type[ResponseT],
+        request: httpx.Request,
         *,
-        retries_taken: int,
-        response_headers: httpx.Headers | None,
+        options: FinalRequestOptions,
         stream: bool,
-        stream_cls: type[_AsyncStreamT] | None,
-    ) -> ResponseT | _AsyncStreamT:
-        remaining_retries = options.get_max_retries(self.max_retries) - retries_taken
+        send_args: HttpxSendArgs,
+    ) -> httpx.Response:
+        """Send the given request, applying the client-side rate limiter and hedging policy if they are configured"""
+
+        async def send(req: httpx.Request) -> httpx.Response:
+            return await self._client.send(req, stream=stream, **send_args)
+
+        rate_limiter = self.rate_limiter
+        reservation = rate_limiter.reserve(options) if rate_limiter is not None else None
+        if reservation is not None and reservation.delay > 0:
+            log.info(
+                "Delaying request to %s by %f seconds to stay under the rate limit", options.url, reservation.delay
+            )
+            await anyio.sleep(reservation.delay)
+
+        try:
+            hedging_policy = self.hedging_policy
+            if hedging_policy is not None and can_hedge(request):
+                response = await async_send_hedged(send, request, policy=hedging_policy, endpoint=options.url)
+            else:
+                response = await send(request)
+        except BaseException:
+            if rate_limiter is not None and reservation is not None:
+                rate_limiter.release(reservation)
+            raise
+
+        if rate_limiter is not None and reservation is not None:
+            rate_limiter.release(reservation, response.headers)
+
+        return response
+
+    async def _sleep_for_retry(self, options: FinalRequestOptions, *, attempt: RequestAttempt) -> bool:
+        """Wait until the failed attempt should be retried, returns `False` if it should not be retried after all"""
+        remaining_retries = options.get_max_retries(self.max_retries) - attempt.retries_taken
         if remaining_retries == 1:
             log.debug("1 retry left")
         else:
             log.debug("%i retries left", remaining_retries)
 
+        response_headers = attempt.response.headers if attempt.response is not None else None
         timeout = self._calculate_retry_timeout(remaining_retries, options, response_headers)
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
 
-        await anyio.sleep(timeout)
+        retry_scheduler = self.retry_scheduler
+        if retry_scheduler is not None:
+            return await retry_scheduler.async_wait(timeout, attempt)
 
-        return await self._request(
-            options=options,
-            cast_to=cast_to,
-            retries_taken=retries_taken + 1,
-            stream=stream,
-            stream_cls=stream_cls,
-        )
+        await anyio.sleep(timeout)
+        return True
 
     async def _process_response(
         self,
@@ -1891,6 +2180,63 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
         return self._request_api_list(model, page, opts)
 
+    @overload
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: None = None,
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> AsyncIterator[Dict[str, Any]]: ...
+
+    @overload
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: Callable[..., _T],
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> AsyncIterator[_T]: ...
+
+    def iter_api_list(
+        self,
+        path: str,
+        *,
+        fields: Sequence[str] | None = None,
+        record: Callable[..., Any] | None = None,
+        body: Body | None = None,
+        options: RequestOptions = {},
+        method: str = "get",
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of a cursor paginated list endpoint without constructing any models.
+
+        See `OpenAI.iter_api_list()` for details.
+        """
+        opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
+        return self._iter_api_list(opts, fields, record)
+
+    async def _iter_api_list(
+        self,
+        options: FinalRequestOptions,
+        fields: Sequence[str] | None,
+        record: Callable[..., Any] | None,
+    ) -> AsyncIterator[Any]:
+        while True:
+            response = await self.request(httpx.Response, options)
+            items, cursor = project_page(response.content, fields, record)
+            for item in items:
+                yield item
+
+            if cursor is None:
+                return
+            options = next_page_options(options, cursor)
+
 
 def make_request_options(
     *,
@@ -2074,3 +2420,18 @@ def _merge_mappings(
     """
     merged = {**obj1, **obj2}
     return {key: value for key, value in merged.items() if not isinstance(value, Omit)}
+
+
+def _read_error_body(response: httpx.Response) -> None:
+    try:
+        response.read()
+    except httpx.HTTPError:
+        # the body is only needed if the request isn't retried after all
+        log.debug("Failed to read the body of the error response", exc_info=True)
+
+
+async def _async_read_error_body(response: httpx.Response) -> None:
+    try:
+        await response.aread()
+    except httpx.HTTPError:
+        log.debug("Failed to read the body of the error response", exc_info=True)
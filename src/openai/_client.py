@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Union, Mapping
+from typing import TYPE_CHECKING, Any, Union, Mapping
 from typing_extensions import Self, override
 
 import httpx
@@ -24,8 +24,11 @@ from ._utils import (
     is_mapping,
     get_async_library,
 )
+from ._compat import cached_property
+from ._poller import Poller, AsyncPoller
+from ._hedging import HedgingPolicy
+from ._retries import RetryScheduler
 from ._version import __version__
-from .resources import files, images, models, batches, embeddings, completions, moderations
 from ._streaming import Stream as Stream, AsyncStream as AsyncStream
 from ._exceptions import OpenAIError, APIStatusError
 from ._base_client import (
@@ -33,31 +36,20 @@ from ._base_client import (
     SyncAPIClient,
     AsyncAPIClient,
 )
-from .resources.beta import beta
-from .resources.chat import chat
-from .resources.audio import audio
-from .resources.uploads import uploads
-from .resources.fine_tuning import fine_tuning
+from ._rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from .resources import files, images, models, batches, embeddings, completions, moderations
+    from .resources.beta import beta
+    from .resources.chat import chat
+    from .resources.audio import audio
+    from .resources.uploads import uploads
+    from .resources.fine_tuning import fine_tuning
 
 __all__ = ["Timeout", "Transport", "ProxiesTypes", "RequestOptions", "OpenAI", "AsyncOpenAI", "Client", "AsyncClient"]
 
 
 class OpenAI(SyncAPIClient):
-    completions: completions.Completions
-    chat: chat.Chat
-    embeddings: embeddings.Embeddings
-    files: files.Files
-    images: images.Images
-    audio: audio.Audio
-    moderations: moderations.Moderations
-    models: models.Models
-    fine_tuning: fine_tuning.FineTuning
-    beta: beta.Beta
-    batches: batches.Batches
-    uploads: uploads.Uploads
-    with_raw_response: OpenAIWithRawResponse
-    with_streaming_response: OpenAIWithStreamedResponse
-
     # client options
     api_key: str
     organization: str | None
@@ -78,6 +70,18 @@ class OpenAI(SyncAPIClient):
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
+        # Use HTTP/2 for the default httpx client, which multiplexes concurrent requests over fewer connections.
+        # Requires the `h2` package, e.g. `pip install openai[http2]`.
+        http2: bool = False,
+        # Send a duplicate of requests that are slower than expected & use whichever response arrives first.
+        # See `HedgingPolicy` for details.
+        hedging_policy: HedgingPolicy | None = None,
+        # Pace requests on the client to stay under the API rate limits, based on the `x-ratelimit-*` response headers.
+        # A single `RateLimiter` can be shared between multiple clients.
+        rate_limiter: RateLimiter | None = None,
+        # Control how the client waits between retries & observe every request attempt.
+        # See `RetryScheduler` for details.
+        retry_scheduler: RetryScheduler | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -122,27 +126,100 @@ class OpenAI(SyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
 
         self._default_stream_cls = Stream
 
-        self.completions = completions.Completions(self)
-        self.chat = chat.Chat(self)
-        self.embeddings = embeddings.Embeddings(self)
-        self.files = files.Files(self)
-        self.images = images.Images(self)
-        self.audio = audio.Audio(self)
-        self.moderations = moderations.Moderations(self)
-        self.models = models.Models(self)
-        self.fine_tuning = fine_tuning.FineTuning(self)
-        self.beta = beta.Beta(self)
-        self.batches = batches.Batches(self)
-        self.uploads = uploads.Uploads(self)
-        self.with_raw_response = OpenAIWithRawResponse(self)
-        self.with_streaming_response = OpenAIWithStreamedResponse(self)
+    @cached_property
+    def completions(self) -> completions.Completions:
+        from .resources.completions import Completions
+
+        return Completions(self)
+
+    @cached_property
+    def chat(self) -> chat.Chat:
+        from .resources.chat import Chat
+
+        return Chat(self)
+
+    @cached_property
+    def embeddings(self) -> embeddings.Embeddings:
+        from .resources.embeddings import Embeddings
+
+        return Embeddings(self)
+
+    @cached_property
+    def files(self) -> files.Files:
+        from .resources.files import Files
+
+        return Files(self)
+
+    @cached_property
+    def images(self) -> images.Images:
+        from .resources.images import Images
+
+        return Images(self)
+
+    @cached_property
+    def audio(self) -> audio.Audio:
+        from .resources.audio import Audio
+
+        return Audio(self)
+
+    @cached_property
+    def moderations(self) -> moderations.Moderations:
+        from .resources.moderations import Moderations
+
+        return Moderations(self)
+
+    @cached_property
+    def models(self) -> models.Models:
+        from .resources.models import Models
+
+        return Models(self)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.FineTuning:
+        from .resources.fine_tuning import FineTuning
+
+        return FineTuning(self)
+
+    @cached_property
+    def beta(self) -> beta.Beta:
+        from .resources.beta import Beta
+
+        return Beta(self)
+
+    @cached_property
+    def batches(self) -> batches.Batches:
+        from .resources.batches import Batches
+
+        return Batches(self)
+
+    @cached_property
+    def uploads(self) -> uploads.Uploads:
+        from .resources.uploads import Uploads
+
+        return Uploads(self)
+
+    @cached_property
+    def poller(self) -> Poller:
+        return Poller(self)
+
+    @cached_property
+    def with_raw_response(self) -> OpenAIWithRawResponse:
+        return OpenAIWithRawResponse(self)
+
+    @cached_property
+    def with_streaming_response(self) -> OpenAIWithStreamedResponse:
+        return OpenAIWithStreamedResponse(self)
 
     @property
     @override
@@ -175,7 +252,11 @@ class OpenAI(SyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedging_policy: HedgingPolicy | None | NotGiven = NOT_GIVEN,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        retry_scheduler: RetryScheduler | None | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -203,7 +284,9 @@ class OpenAI(SyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        # a new httpx client is created when the protocol is changed
+        if not is_given(http2):
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             organization=organization or self.organization,
@@ -211,7 +294,11 @@ class OpenAI(SyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=http2 if is_given(http2) else False,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedging_policy=hedging_policy if is_given(hedging_policy) else self.hedging_policy,
+            rate_limiter=rate_limiter if is_given(rate_limiter) else self.rate_limiter,
+            retry_scheduler=retry_scheduler if is_given(retry_scheduler) else self.retry_scheduler,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
@@ -257,21 +344,6 @@ class OpenAI(SyncAPIClient):
 
 
 class AsyncOpenAI(AsyncAPIClient):
-    completions: completions.AsyncCompletions
-    chat: chat.AsyncChat
-    embeddings: embeddings.AsyncEmbeddings
-    files: files.AsyncFiles
-    images: images.AsyncImages
-    audio: audio.AsyncAudio
-    moderations: moderations.AsyncModerations
-    models: models.AsyncModels
-    fine_tuning: fine_tuning.AsyncFineTuning
-    beta: beta.AsyncBeta
-    batches: batches.AsyncBatches
-    uploads: uploads.AsyncUploads
-    with_raw_response: AsyncOpenAIWithRawResponse
-    with_streaming_response: AsyncOpenAIWithStreamedResponse
-
     # client options
     api_key: str
     organization: str | None
@@ -292,6 +364,18 @@ class AsyncOpenAI(AsyncAPIClient):
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
+        # Use HTTP/2 for the default httpx client, which multiplexes concurrent requests over fewer connections.
+        # Requires the `h2` package, e.g. `pip install openai[http2]`.
+        http2: bool = False,
+        # Send a duplicate of requests that are slower than expected & use whichever response arrives first.
+        # See `HedgingPolicy` for details.
+        hedging_policy: HedgingPolicy | None = None,
+        # Pace requests on the client to stay under the API rate limits, based on the `x-ratelimit-*` response headers.
+        # A single `RateLimiter` can be shared between multiple clients.
+        rate_limiter: RateLimiter | None = None,
+        # Control how the client waits between retries & observe every request attempt.
+        # See `RetryScheduler` for details.
+        retry_scheduler: RetryScheduler | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -336,27 +420,100 @@ class AsyncOpenAI(AsyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
 
         self._default_stream_cls = AsyncStream
 
-        self.completions = completions.AsyncCompletions(self)
-        self.chat = chat.AsyncChat(self)
-        self.embeddings = embeddings.AsyncEmbeddings(self)
-        self.files = files.AsyncFiles(self)
-        self.images = images.AsyncImages(self)
-        self.audio = audio.AsyncAudio(self)
-        self.moderations = moderations.AsyncModerations(self)
-        self.models = models.AsyncModels(self)
-        self.fine_tuning = fine_tuning.AsyncFineTuning(self)
-        self.beta = beta.AsyncBeta(self)
-        self.batches = batches.AsyncBatches(self)
-        self.uploads = uploads.AsyncUploads(self)
-        self.with_raw_response = AsyncOpenAIWithRawResponse(self)
-        self.with_streaming_response = AsyncOpenAIWithStreamedResponse(self)
+    @cached_property
+    def completions(self) -> completions.AsyncCompletions:
+        from .resources.completions import AsyncCompletions
+
+        return AsyncCompletions(self)
+
+    @cached_property
+    def chat(self) -> chat.AsyncChat:
+        from .resources.chat import AsyncChat
+
+        return AsyncChat(self)
+
+    @cached_property
+    def embeddings(self) -> embeddings.AsyncEmbeddings:
+        from .resources.embeddings import AsyncEmbeddings
+
+        return AsyncEmbeddings(self)
+
+    @cached_property
+    def files(self) -> files.AsyncFiles:
+        from .resources.files import AsyncFiles
+
+        return AsyncFiles(self)
+
+    @cached_property
+    def images(self) -> images.AsyncImages:
+        from .resources.images import AsyncImages
+
+        return AsyncImages(self)
+
+    @cached_property
+    def audio(self) -> audio.AsyncAudio:
+        from .resources.audio import AsyncAudio
+
+        return AsyncAudio(self)
+
+    @cached_property
+    def moderations(self) -> moderations.AsyncModerations:
+        from .resources.moderations import AsyncModerations
+
+        return AsyncModerations(self)
+
+    @cached_property
+    def models(self) -> models.AsyncModels:
+        from .resources.models import AsyncModels
+
+        return AsyncModels(self)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.AsyncFineTuning:
+        from .resources.fine_tuning import AsyncFineTuning
+
+        return AsyncFineTuning(self)
+
+    @cached_property
+    def beta(self) -> beta.AsyncBeta:
+        from .resources.beta import AsyncBeta
+
+        return AsyncBeta(self)
+
+    @cached_property
+    def batches(self) -> batches.AsyncBatches:
+        from .resources.batches import AsyncBatches
+
+        return AsyncBatches(self)
+
+    @cached_property
+    def uploads(self) -> uploads.AsyncUploads:
+        from .resources.uploads import AsyncUploads
+
+        return AsyncUploads(self)
+
+    @cached_property
+    def poller(self) -> AsyncPoller:
+        return AsyncPoller(self)
+
+    @cached_property
+    def with_raw_response(self) -> AsyncOpenAIWithRawResponse:
+        return AsyncOpenAIWithRawResponse(self)
+
+    @cached_property
+    def with_streaming_response(self) -> AsyncOpenAIWithStreamedResponse:
+        return AsyncOpenAIWithStreamedResponse(self)
 
     @property
     @override
@@ -389,7 +546,11 @@ class AsyncOpenAI(AsyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedging_policy: HedgingPolicy | None | NotGiven = NOT_GIVEN,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        retry_scheduler: RetryScheduler | None | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -417,7 +578,9 @@ class AsyncOpenAI(AsyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        # a new httpx client is created when the protocol is changed
+        if not is_given(http2):
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             organization=organization or self.organization,
@@ -425,7 +588,11 @@ class AsyncOpenAI(AsyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=http2 if is_given(http2) else False,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
+            hedging_policy=hedging_policy if is_given(hedging_policy) else self.hedging_policy,
+            rate_limiter=rate_limiter if is_given(rate_limiter) else self.rate_limiter,
+            retry_scheduler=retry_scheduler if is_given(retry_scheduler) else self.retry_scheduler,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
@@ -472,66 +639,310 @@ class AsyncOpenAI(AsyncAPIClient):
 
 class OpenAIWithRawResponse:
     def __init__(self, client: OpenAI) -> None:
-        self.completions = completions.CompletionsWithRawResponse(client.completions)
-        self.chat = chat.ChatWithRawResponse(client.chat)
-        self.embeddings = embeddings.EmbeddingsWithRawResponse(client.embeddings)
-        self.files = files.FilesWithRawResponse(client.files)
-        self.images = images.ImagesWithRawResponse(client.images)
-        self.audio = audio.AudioWithRawResponse(client.audio)
-        self.moderations = moderations.ModerationsWithRawResponse(client.moderations)
-        self.models = models.ModelsWithRawResponse(client.models)
-        self.fine_tuning = fine_tuning.FineTuningWithRawResponse(client.fine_tuning)
-        self.beta = beta.BetaWithRawResponse(client.beta)
-        self.batches = batches.BatchesWithRawResponse(client.batches)
-        self.uploads = uploads.UploadsWithRawResponse(client.uploads)
+        self._client = client
+
+    @cached_property
+    def completions(self) -> completions.CompletionsWithRawResponse:
+        from .resources.completions import CompletionsWithRawResponse
+
+        return CompletionsWithRawResponse(self._client.completions)
+
+    @cached_property
+    def chat(self) -> chat.ChatWithRawResponse:
+        from .resources.chat import ChatWithRawResponse
+
+        return ChatWithRawResponse(self._client.chat)
+
+    @cached_property
+    def embeddings(self) -> embeddings.EmbeddingsWithRawResponse:
+        from .resources.embeddings import EmbeddingsWithRawResponse
+
+        return EmbeddingsWithRawResponse(self._client.embeddings)
+
+    @cached_property
+    def files(self) -> files.FilesWithRawResponse:
+        from .resources.files import FilesWithRawResponse
+
+        return FilesWithRawResponse(self._client.files)
+
+    @cached_property
+    def images(self) -> images.ImagesWithRawResponse:
+        from .resources.images import ImagesWithRawResponse
+
+        return ImagesWithRawResponse(self._client.images)
+
+    @cached_property
+    def audio(self) -> audio.AudioWithRawResponse:
+        from .resources.audio import AudioWithRawResponse
+
+        return AudioWithRawResponse(self._client.audio)
+
+    @cached_property
+    def moderations(self) -> moderations.ModerationsWithRawResponse:
+        from .resources.moderations import ModerationsWithRawResponse
+
+        return ModerationsWithRawResponse(self._client.moderations)
+
+    @cached_property
+    def models(self) -> models.ModelsWithRawResponse:
+        from .resources.models import ModelsWithRawResponse
+
+        return ModelsWithRawResponse(self._client.models)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.FineTuningWithRawResponse:
+        from .resources.fine_tuning import FineTuningWithRawResponse
+
+        return FineTuningWithRawResponse(self._client.fine_tuning)
+
+    @cached_property
+    def beta(self) -> beta.BetaWithRawResponse:
+        from .resources.beta import BetaWithRawResponse
+
+        return BetaWithRawResponse(self._client.beta)
+
+    @cached_property
+    def batches(self) -> batches.BatchesWithRawResponse:
+        from .resources.batches import BatchesWithRawResponse
+
+        return BatchesWithRawResponse(self._client.batches)
+
+    @cached_property
+    def uploads(self) -> uploads.UploadsWithRawResponse:
+        from .resources.uploads import UploadsWithRawResponse
+
+        return UploadsWithRawResponse(self._client.uploads)
 
 
 class AsyncOpenAIWithRawResponse:
     def __init__(self, client: AsyncOpenAI) -> None:
-        self.completions = completions.AsyncCompletionsWithRawResponse(client.completions)
-        self.chat = chat.AsyncChatWithRawResponse(client.chat)
-        self.embeddings = embeddings.AsyncEmbeddingsWithRawResponse(client.embeddings)
-        self.files = files.AsyncFilesWithRawResponse(client.files)
-        self.images = images.AsyncImagesWithRawResponse(client.images)
-        self.audio = audio.AsyncAudioWithRawResponse(client.audio)
-        self.moderations = moderations.AsyncModerationsWithRawResponse(client.moderations)
-        self.models = models.AsyncModelsWithRawResponse(client.models)
-        self.fine_tuning = fine_tuning.AsyncFineTuningWithRawResponse(client.fine_tuning)
-        self.beta = beta.AsyncBetaWithRawResponse(client.beta)
-        self.batches = batches.AsyncBatchesWithRawResponse(client.batches)
-        self.uploads = uploads.AsyncUploadsWithRawResponse(client.uploads)
+        self._client = client
+
+    @cached_property
+    def completions(self) -> completions.AsyncCompletionsWithRawResponse:
+        from .resources.completions import AsyncCompletionsWithRawResponse
+
+        return AsyncCompletionsWithRawResponse(self._client.completions)
+
+    @cached_property
+    def chat(self) -> chat.AsyncChatWithRawResponse:
+        from .resources.chat import AsyncChatWithRawResponse
+
+        return AsyncChatWithRawResponse(self._client.chat)
+
+    @cached_property
+    def embeddings(self) -> embeddings.AsyncEmbeddingsWithRawResponse:
+        from .resources.embeddings import AsyncEmbeddingsWithRawResponse
+
+        return AsyncEmbeddingsWithRawResponse(self._client.embeddings)
+
+    @cached_property
+    def files(self) -> files.AsyncFilesWithRawResponse:
+        from .resources.files import AsyncFilesWithRawResponse
+
+        return AsyncFilesWithRawResponse(self._client.files)
+
+    @cached_property
+    def images(self) -> images.AsyncImagesWithRawResponse:
+        from .resources.images import AsyncImagesWithRawResponse
+
+        return AsyncImagesWithRawResponse(self._client.images)
+
+    @cached_property
+    def audio(self) -> audio.AsyncAudioWithRawResponse:
+        from .resources.audio import AsyncAudioWithRawResponse
+
+        return AsyncAudioWithRawResponse(self._client.audio)
+
+    @cached_property
+    def moderations(self) -> moderations.AsyncModerationsWithRawResponse:
+        from .resources.moderations import AsyncModerationsWithRawResponse
+
+        return AsyncModerationsWithRawResponse(self._client.moderations)
+
+    @cached_property
+    def models(self) -> models.AsyncModelsWithRawResponse:
+        from .resources.models import AsyncModelsWithRawResponse
+
+        return AsyncModelsWithRawResponse(self._client.models)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.AsyncFineTuningWithRawResponse:
+        from .resources.fine_tuning import AsyncFineTuningWithRawResponse
+
+        return AsyncFineTuningWithRawResponse(self._client.fine_tuning)
+
+    @cached_property
+    def beta(self) -> beta.AsyncBetaWithRawResponse:
+        from .resources.beta import AsyncBetaWithRawResponse
+
+        return AsyncBetaWithRawResponse(self._client.beta)
+
+    @cached_property
+    def batches(self) -> batches.AsyncBatchesWithRawResponse:
+        from .resources.batches import AsyncBatchesWithRawResponse
+
+        return AsyncBatchesWithRawResponse(self._client.batches)
+
+    @cached_property
+    def uploads(self) -> uploads.AsyncUploadsWithRawResponse:
+        from .resources.uploads import AsyncUploadsWithRawResponse
+
+        return AsyncUploadsWithRawResponse(self._client.uploads)
 
 
 class OpenAIWithStreamedResponse:
     def __init__(self, client: OpenAI) -> None:
-        self.completions = completions.CompletionsWithStreamingResponse(client.completions)
-        self.chat = chat.ChatWithStreamingResponse(client.chat)
-        self.embeddings = embeddings.EmbeddingsWithStreamingResponse(client.embeddings)
-        self.files = files.FilesWithStreamingResponse(client.files)
-        self.images = images.ImagesWithStreamingResponse(client.images)
-        self.audio = audio.AudioWithStreamingResponse(client.audio)
-        self.moderations = moderations.ModerationsWithStreamingResponse(client.moderations)
-        self.models = models.ModelsWithStreamingResponse(client.models)
-        self.fine_tuning = fine_tuning.FineTuningWithStreamingResponse(client.fine_tuning)
-        self.beta = beta.BetaWithStreamingResponse(client.beta)
-        self.batches = batches.BatchesWithStreamingResponse(client.batches)
-        self.uploads = uploads.UploadsWithStreamingResponse(client.uploads)
+        self._client = client
+
+    @cached_property
+    def completions(self) -> completions.CompletionsWithStreamingResponse:
+        from .resources.completions import CompletionsWithStreamingResponse
+
+        return CompletionsWithStreamingResponse(self._client.completions)
+
+    @cached_property
+    def chat(self) -> chat.ChatWithStreamingResponse:
+        from .resources.chat import ChatWithStreamingResponse
+
+        return ChatWithStreamingResponse(self._client.chat)
+
+    @cached_property
+    def embeddings(self) -> embeddings.EmbeddingsWithStreamingResponse:
+        from .resources.embeddings import EmbeddingsWithStreamingResponse
+
+        return EmbeddingsWithStreamingResponse(self._client.embeddings)
+
+    @cached_property
+    def files(self) -> files.FilesWithStreamingResponse:
+        from .resources.files import FilesWithStreamingResponse
+
+        return FilesWithStreamingResponse(self._client.files)
+
+    @cached_property
+    def images(self) -> images.ImagesWithStreamingResponse:
+        from .resources.images import ImagesWithStreamingResponse
+
+        return ImagesWithStreamingResponse(self._client.images)
+
+    @cached_property
+    def audio(self) -> audio.AudioWithStreamingResponse:
+        from .resources.audio import AudioWithStreamingResponse
+
+        return AudioWithStreamingResponse(self._client.audio)
+
+    @cached_property
+    def moderations(self) -> moderations.ModerationsWithStreamingResponse:
+        from .resources.moderations import ModerationsWithStreamingResponse
+
+        return ModerationsWithStreamingResponse(self._client.moderations)
+
+    @cached_property
+    def models(self) -> models.ModelsWithStreamingResponse:
+        from .resources.models import ModelsWithStreamingResponse
+
+        return ModelsWithStreamingResponse(self._client.models)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.FineTuningWithStreamingResponse:
+        from .resources.fine_tuning import FineTuningWithStreamingResponse
+
+        return FineTuningWithStreamingResponse(self._client.fine_tuning)
+
+    @cached_property
+    def beta(self) -> beta.BetaWithStreamingResponse:
+        from .resources.beta import BetaWithStreamingResponse
+
+        return BetaWithStreamingResponse(self._client.beta)
+
+    @cached_property
+    def batches(self) -> batches.BatchesWithStreamingResponse:
+        from .resources.batches import BatchesWithStreamingResponse
+
+        return BatchesWithStreamingResponse(self._client.batches)
+
+    @cached_property
+    def uploads(self) -> uploads.UploadsWithStreamingResponse:
+        from .resources.uploads import UploadsWithStreamingResponse
+
+        return UploadsWithStreamingResponse(self._client.uploads)
 
 
 class AsyncOpenAIWithStreamedResponse:
     def __init__(self, client: AsyncOpenAI) -> None:
-        self.completions = completions.AsyncCompletionsWithStreamingResponse(client.completions)
-        self.chat = chat.AsyncChatWithStreamingResponse(client.chat)
-        self.embeddings = embeddings.AsyncEmbeddingsWithStreamingResponse(client.embeddings)
-        self.files = files.AsyncFilesWithStreamingResponse(client.files)
-        self.images = images.AsyncImagesWithStreamingResponse(client.images)
-        self.audio = audio.AsyncAudioWithStreamingResponse(client.audio)
-        self.moderations = moderations.AsyncModerationsWithStreamingResponse(client.moderations)
-        self.models = models.AsyncModelsWithStreamingResponse(client.models)
-        self.fine_tuning = fine_tuning.AsyncFineTuningWithStreamingResponse(client.fine_tuning)
-        self.beta = beta.AsyncBetaWithStreamingResponse(client.beta)
-        self.batches = batches.AsyncBatchesWithStreamingResponse(client.batches)
-        self.uploads = uploads.AsyncUploadsWithStreamingResponse(client.uploads)
+        self._client = client
+
+    @cached_property
+    def completions(self) -> completions.AsyncCompletionsWithStreamingResponse:
+        from .resources.completions import AsyncCompletionsWithStreamingResponse
+
+        return AsyncCompletionsWithStreamingResponse(self._client.completions)
+
+    @cached_property
+    def chat(self) -> chat.AsyncChatWithStreamingResponse:
+        from .resources.chat import AsyncChatWithStreamingResponse
+
+        return AsyncChatWithStreamingResponse(self._client.chat)
+
+    @cached_property
+    def embeddings(self) -> embeddings.AsyncEmbeddingsWithStreamingResponse:
+        from .resources.embeddings import AsyncEmbeddingsWithStreamingResponse
+
+        return AsyncEmbeddingsWithStreamingResponse(self._client.embeddings)
+
+    @cached_property
+    def files(self) -> files.AsyncFilesWithStreamingResponse:
+        from .resources.files import AsyncFilesWithStreamingResponse
+
+        return AsyncFilesWithStreamingResponse(self._client.files)
+
+    @cached_property
+    def images(self) -> images.AsyncImagesWithStreamingResponse:
+        from .resources.images import AsyncImagesWithStreamingResponse
+
+        return AsyncImagesWithStreamingResponse(self._client.images)
+
+    @cached_property
+    def audio(self) -> audio.AsyncAudioWithStreamingResponse:
+        from .resources.audio import AsyncAudioWithStreamingResponse
+
+        return AsyncAudioWithStreamingResponse(self._client.audio)
+
+    @cached_property
+    def moderations(self) -> moderations.AsyncModerationsWithStreamingResponse:
+        from .resources.moderations import AsyncModerationsWithStreamingResponse
+
+        return AsyncModerationsWithStreamingResponse(self._client.moderations)
+
+    @cached_property
+    def models(self) -> models.AsyncModelsWithStreamingResponse:
+        from .resources.models import AsyncModelsWithStreamingResponse
+
+        return AsyncModelsWithStreamingResponse(self._client.models)
+
+    @cached_property
+    def fine_tuning(self) -> fine_tuning.AsyncFineTuningWithStreamingResponse:
+        from .resources.fine_tuning import AsyncFineTuningWithStreamingResponse
+
+        return AsyncFineTuningWithStreamingResponse(self._client.fine_tuning)
+
+    @cached_property
+    def beta(self) -> beta.AsyncBetaWithStreamingResponse:
+        from .resources.beta import AsyncBetaWithStreamingResponse
+
+        return AsyncBetaWithStreamingResponse(self._client.beta)
+
+    @cached_property
+    def batches(self) -> batches.AsyncBatchesWithStreamingResponse:
+        from .resources.batches import AsyncBatchesWithStreamingResponse
+
+        return AsyncBatchesWithStreamingResponse(self._client.batches)
+
+    @cached_property
+    def uploads(self) -> uploads.AsyncUploadsWithStreamingResponse:
+        from .resources.uploads import AsyncUploadsWithStreamingResponse
+
+        return AsyncUploadsWithStreamingResponse(self._client.uploads)
 
 
 Client = OpenAI
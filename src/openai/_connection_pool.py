@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import logging
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import httpx
+import anyio.abc
+
+from ._exceptions import APIConnectionError
+
+if TYPE_CHECKING:
+    from ._base_client import SyncAPIClient, AsyncAPIClient
+
+__all__ = ["PoolStats", "KeepAlive", "AsyncKeepAlive"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# the `trace` events that are emitted when a new connection is opened
+_CONNECT_EVENTS = ("connection.connect_tcp.complete", "connection.connect_unix_socket.complete")
+
+
+class PoolStats:
+    """A snapshot of the connections in the client's connection pool, returned by `client.pool_stats()`."""
+
+    in_use: int
+    """The number of connections that are currently handling a request."""
+
+    idle: int
+    """The number of connections that are open and ready to be reused."""
+
+    opened: Optional[int]
+    """The total number of connections that have been opened by the client.
+
+    This is only tracked by the default httpx clients, e.g. `DefaultHttpxClient`, and is `None` otherwise.
+    """
+
+    closed: Optional[int]
+    """The total number of connections that have been closed, e.g. because they expired or were evicted."""
+
+    def __init__(self, *, in_use: int, idle: int, opened: Optional[int], closed: Optional[int]) -> None:
+        self.in_use = in_use
+        self.idle = idle
+        self.opened = opened
+        self.closed = closed
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(in_use={self.in_use}, idle={self.idle}, opened={self.opened}, closed={self.closed})"
+
+
+class ConnectionCounter:
+    """Counts the connections that are opened by an httpx client, using the `trace` request extension."""
+
+    def __init__(self) -> None:
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def _record(self, event_name: str) -> None:
+        if event_name in _CONNECT_EVENTS:
+            with self._lock:
+                self.opened += 1
+
+    def trace(self, event_name: str, _info: Dict[str, Any]) -> None:
+        self._record(event_name)
+
+    async def atrace(self, event_name: str, _info: Dict[str, Any]) -> None:
+        self._record(event_name)
+
+    def on_request(self, request: httpx.Request) -> None:
+        # a `trace` extension that was set for the request takes precedence
+        request.extensions.setdefault("trace", self.trace)
+
+    async def on_async_request(self, request: httpx.Request) -> None:
+        request.extensions.setdefault("trace", self.atrace)
+
+
+def _get_pool(http_client: Union[httpx.Client, httpx.AsyncClient]) -> Any:
+    transport = http_client._transport
+    if isinstance(transport, (httpx.HTTPTransport, httpx.AsyncHTTPTransport)):
+        return transport._pool
+    return None
+
+
+def get_pool_stats(http_client: Union[httpx.Client, httpx.AsyncClient]) -> PoolStats:
+    pool = _get_pool(http_client)
+    connections: List[Any] = list(pool.connections) if pool is not None else []
+    idle = sum(1 for connection in connections if connection.is_idle())
+
+    counter: Optional[ConnectionCounter] = getattr(http_client, "_connection_counter", None)
+    opened = counter.opened if counter is not None else None
+    return PoolStats(
+        in_use=len(connections) - idle,
+        idle=idle,
+        opened=opened,
+        # connections that are no longer in the pool have been closed
+        closed=max(opened - len(connections), 0) if opened is not None else None,
+    )
+
+
+def evict_expired_connections(http_client: httpx.Client) -> None:
+    """Closes the idle connections in the pool that have expired, or were closed by the server"""
+    pool = _get_pool(http_client)
+    if pool is None or not hasattr(pool, "_assign_requests_to_connections"):
+        # older versions of httpcore only evict expired connections when a request is sent
+        return
+
+    with pool._optional_thread_lock:
+        closing = pool._assign_requests_to_connections()
+    pool._close_connections(closing)
+
+
+async def async_evict_expired_connections(http_client: httpx.AsyncClient) -> None:
+    """Closes the idle connections in the pool that have expired, or were closed by the server"""
+    pool = _get_pool(http_client)
+    if pool is None or not hasattr(pool, "_assign_requests_to_connections"):
+        return
+
+    with pool._optional_thread_lock:
+        closing = pool._assign_requests_to_connections()
+    await pool._close_connections(closing)
+
+
+def keepalive_expiry(http_client: Union[httpx.Client, httpx.AsyncClient]) -> Optional[float]:
+    pool = _get_pool(http_client)
+    return getattr(pool, "_keepalive_expiry", None) if pool is not None else None
+
+
+def warmup(client: SyncAPIClient, connections: int, timeout: Union[float, httpx.Timeout, None]) -> None:
+    """Sends `connections` concurrent requests to the client's `base_url`"""
+    if connections < 1:
+        raise ValueError("The `connections` argument must be greater than 0")
+
+    def send(_: int) -> None:
+        request = client._client.build_request("HEAD", client.base_url, timeout=timeout)
+        try:
+            # any response means that the connection is usable, whatever its status code
+            client._client.send(request).close()
+        except httpx.HTTPError as err:
+            raise APIConnectionError(request=request) from err
+
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="openai-warmup") as executor:
+        list(executor.map(send, range(connections)))
+
+
+async def async_warmup(client: AsyncAPIClient, connections: int, timeout: Union[float, httpx.Timeout, None]) -> None:
+    """Sends `connections` concurrent requests to the client's `base_url`"""
+    if connections < 1:
+        raise ValueError("The `connections` argument must be greater than 0")
+
+    errors: List[APIConnectionError] = []
+
+    async def send() -> None:
+        request = client._client.build_request("HEAD", client.base_url, timeout=timeout)
+        try:
+            await (await client._client.send(request)).aclose()
+        except httpx.HTTPError as err:
+            error = APIConnectionError(request=request)
+            error.__cause__ = err
+            errors.append(error)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(connections):
+            tg.start_soon(send)
+
+    if errors:
+        raise errors[0]
+
+
+def _default_interval(http_client: Union[httpx.Client, httpx.AsyncClient], interval: Optional[float]) -> float:
+    if interval is not None:
+        if interval <= 0:
+            raise ValueError("The `interval` argument must be greater than 0")
+        return interval
+
+    # refresh the connections before the pool considers them expired
+    expiry = keepalive_expiry(http_client)
+    return expiry / 2 if expiry else 2.5
+
+
+class KeepAlive:
+    """Keeps `connections` connections to the API open in the background, returned by `client.keep_alive()`.
+
+    Every `interval` seconds the expired idle connections are closed, and if fewer than
+    `connections` connections are in use, requests are sent to the client's `base_url`
+    to open new connections and refresh the idle ones before they expire.
+    """
+
+    def __init__(self, client: SyncAPIClient, *, connections: int, interval: Optional[float]) -> None:
+        if connections < 1:
+            raise ValueError("The `connections` argument must be greater than 0")
+
+        self._client = client
+        self.connections = connections
+        self.interval = _default_interval(client._client, interval)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="openai-keep-alive", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            # a refresh that is in flight times out after `interval` seconds, and the thread is a
+            # daemon thread, so it's never waited for any longer than that
+            self._thread.join(self.interval)
+
+    def __enter__(self) -> KeepAlive:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if self._client.is_closed():
+                return
+
+            try:
+                evict_expired_connections(self._client._client)
+                in_use = get_pool_stats(self._client._client).in_use
+                if in_use < self.connections:
+                    # the client's timeout can be minutes, a refresh should never outlive the interval
+                    warmup(self._client, self.connections - in_use, timeout=self.interval)
+            except Exception:
+                log.debug("Failed to refresh the connection pool", exc_info=True)
+
+
+class AsyncKeepAlive:
+    """Keeps `connections` connections to the API open in the background, returned by `client.keep_alive()`.
+
+    The connections are refreshed from a task that runs while the context manager is open, see
+    `KeepAlive` for details.
+    """
+
+    def __init__(self, client: AsyncAPIClient, *, connections: int, interval: Optional[float]) -> None:
+        if connections < 1:
+            raise ValueError("The `connections` argument must be greater than 0")
+
+        self._client = client
+        self.connections = connections
+        self.interval = _default_interval(client._client, interval)
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+
+    async def __aenter__(self) -> AsyncKeepAlive:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._run)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Optional[bool]:
+        if self._task_group is None:
+            return None
+
+        self._task_group.cancel_scope.cancel()
+        return await self._task_group.__aexit__(exc_type, exc, exc_tb)
+
+    async def _run(self) -> None:
+        while True:
+            await anyio.sleep(self.interval)
+            if self._client.is_closed():
+                return
+
+            try:
+                await async_evict_expired_connections(self._client._client)
+                in_use = get_pool_stats(self._client._client).in_use
+                if in_use < self.connections:
+                    await async_warmup(self._client, self.connections - in_use, timeout=self.interval)
+            except Exception:
+                log.debug("Failed to refresh the connection pool", exc_info=True)
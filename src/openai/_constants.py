@@ -9,6 +9,9 @@ OVERRIDE_CAST_TO_HEADER = "____stainless_override_cast_to"
 DEFAULT_TIMEOUT = httpx.Timeout(timeout=600.0, connect=5.0)
 DEFAULT_MAX_RETRIES = 2
 DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+# each HTTP/2 connection multiplexes up to ~100 concurrent streams, so far fewer connections are needed,
+# and they're kept alive for longer to avoid paying for new TLS handshakes
+DEFAULT_HTTP2_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
 
 INITIAL_RETRY_DELAY = 0.5
 MAX_RETRY_DELAY = 8.0
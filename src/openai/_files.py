@@ -3,7 +3,7 @@ from __future__ import annotations
 import io
 import os
 import pathlib
-from typing import overload
+from typing import IO, Any, Optional, cast, overload
 from typing_extensions import TypeGuard
 
 import anyio
@@ -20,6 +20,82 @@ from ._types import (
 from ._utils import is_tuple_t, is_mapping_t, is_sequence_t
 
 
+class PathFile(io.RawIOBase):
+    """A read-only view of a file on disk that is opened on the first read, so that it can be
+    streamed in a multipart request in chunks instead of being read into memory first.
+
+    The size of the file is recorded when the view is created so that httpx can send a
+    `Content-Length` header, and the file is closed once it has been read to the end. Seeking,
+    e.g. when the request is retried, closes the file so that it's opened again on the next
+    read instead of keeping a copy of the data.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        super().__init__()
+        self.path = path
+        self.name = path.name
+        self.size = path.stat().st_size
+        self._position = 0
+        self._file: Optional[io.FileIO] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._close_file()
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        # the file is never read past the size that was sent as the `Content-Length`
+        view = memoryview(buffer).cast("B")[: max(self.size - self._position, 0)]
+        if not view:
+            self._close_file()
+            return 0
+
+        if self._file is None:
+            self._file = io.FileIO(self.path)
+            self._file.seek(self._position)
+
+        read = self._file.readinto(view) or 0
+        self._position += read
+        if read == 0 or self._position >= self.size:
+            self._close_file()
+        return read
+
+    def close(self) -> None:
+        self._close_file()
+        super().close()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _stream_file(path: pathlib.Path) -> IO[bytes]:
+    # `PathFile` implements all of the `IO[bytes]` methods that httpx uses to send files
+    return cast("IO[bytes]", PathFile(path))
+
+
 def is_base64_file_input(obj: object) -> TypeGuard[Base64FileInput]:
     return isinstance(obj, io.IOBase) or isinstance(obj, os.PathLike)
 
@@ -64,7 +140,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
             path = pathlib.Path(file)
-            return (path.name, path.read_bytes())
+            return (path.name, _stream_file(path))
 
         return file
 
@@ -76,7 +152,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 
 def _read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return pathlib.Path(file).read_bytes()
+        return _stream_file(pathlib.Path(file))
     return file
 
 
@@ -105,8 +181,8 @@ async def async_to_httpx_files(files: RequestFiles | None) -> HttpxRequestFiles
 async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
-            path = anyio.Path(file)
-            return (path.name, await path.read_bytes())
+            path = pathlib.Path(file)
+            return (path.name, await anyio.to_thread.run_sync(_stream_file, path))
 
         return file
 
@@ -118,6 +194,6 @@ async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
 
 async def _async_read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return await anyio.Path(file).read_bytes()
+        return await anyio.to_thread.run_sync(_stream_file, pathlib.Path(file))
 
     return file
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import math
+import time
+import queue
+import logging
+import threading
+from typing import Dict, List, Tuple, Union, Callable, Optional, Awaitable
+from collections import deque
+
+import anyio
+import httpx
+
+__all__ = ["HedgingPolicy"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class HedgingPolicy:
+    """Configures hedged requests, where a duplicate of a slow request is sent and the first response wins.
+
+    When a client is configured with a hedging policy, a request that has not received a
+    response after the hedge delay is sent again, whichever attempt responds first is used
+    and the other attempts are cancelled. Every attempt is an exact copy of the original
+    request, including its idempotency key.
+
+    By default the hedge delay is the given percentile of the recently observed latencies for
+    the same endpoint, `initial_delay` is used until `min_samples` latencies have been recorded.
+
+    Hedging is only applied to requests without file uploads, it is usually best suited to
+    short, latency sensitive requests, e.g.
+
+    ```py
+    client.with_options(hedging_policy=HedgingPolicy(percentile=95)).embeddings.create(...)
+    ```
+    """
+
+    percentile: float
+    delay: float | None
+    initial_delay: float
+    min_delay: float
+    max_hedges: int
+    min_samples: int
+    window_size: int
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        delay: float | None = None,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.0,
+        max_hedges: int = 1,
+        min_samples: int = 20,
+        window_size: int = 1000,
+    ) -> None:
+        """
+        Args:
+            percentile: The latency percentile, between 0 and 100, after which a hedged request is sent.
+
+            delay: A fixed delay in seconds after which a hedged request is sent, overrides `percentile`.
+
+            initial_delay: The delay in seconds used until enough latencies have been observed.
+
+            min_delay: The lower bound for the computed delay in seconds.
+
+            max_hedges: The maximum number of duplicate requests to send for a single request.
+
+            min_samples: The number of latencies that must be observed for an endpoint before `percentile` is used.
+
+            window_size: The number of most recent latencies to keep for each endpoint.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError(f"percentile must be in the range (0, 100], got {percentile}")
+        if max_hedges < 1:
+            raise ValueError(f"max_hedges must be at least 1, got {max_hedges}")
+
+        self.percentile = percentile
+        self.delay = delay
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+        self.min_samples = min_samples
+        self.window_size = window_size
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque[float]] = {}
+        self._delays: Dict[str, float] = {}
+
+    def get_delay(self, endpoint: str) -> float:
+        """Returns the number of seconds to wait before sending a hedged request for the given endpoint"""
+        if self.delay is not None:
+            return max(self.delay, self.min_delay)
+
+        with self._lock:
+            cached = self._delays.get(endpoint)
+            if cached is not None:
+                return cached
+
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return max(self.initial_delay, self.min_delay)
+
+            ordered = sorted(latencies)
+            index = min(math.ceil(len(ordered) * self.percentile / 100) - 1, len(ordered) - 1)
+            delay = max(ordered[max(index, 0)], self.min_delay)
+            self._delays[endpoint] = delay
+            return delay
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a successful attempt for the given endpoint"""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window_size)
+
+            latencies.append(seconds)
+            self._delays.pop(endpoint, None)
+
+    def __repr__(self) -> str:
+        if self.delay is not None:
+            return f"{self.__class__.__name__}(delay={self.delay}, max_hedges={self.max_hedges})"
+        return f"{self.__class__.__name__}(percentile={self.percentile}, max_hedges={self.max_hedges})"
+
+
+def can_hedge(request: httpx.Request) -> bool:
+    """Whether or not the given request can be safely sent more than once"""
+    # requests with files are sent using a stream that can only be consumed once
+    return isinstance(request.stream, httpx.ByteStream)
+
+
+def copy_request(request: httpx.Request) -> httpx.Request:
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        content=request.content,
+        extensions=request.extensions,
+    )
+
+
+_Attempt = Tuple[int, Union[httpx.Response, None], Union[Exception, None]]
+
+
+def send_hedged(
+    send: Callable[[httpx.Request], httpx.Response],
+    request: httpx.Request,
+    *,
+    policy: HedgingPolicy,
+    endpoint: str,
+) -> httpx.Response:
+    """Send the given request, sending duplicates if no response has been received after the hedge delay.
+
+    Every attempt is sent from a separate thread, the calling thread returns as soon as any
+    attempt succeeds. The responses of attempts that complete after the winner are closed.
+    If every attempt fails then the error from the first attempt is raised.
+    """
+    delay = policy.get_delay(endpoint)
+    results: queue.Queue[_Attempt] = queue.Queue()
+    lock = threading.Lock()
+    settled = False
+
+    def attempt(index: int, req: httpx.Request) -> None:
+        start = time.monotonic()
+        try:
+            response = send(req)
+        except Exception as err:
+            results.put((index, None, err))
+            return
+
+        with lock:
+            if settled:
+                response.close()
+                return
+
+            policy.record_latency(endpoint, time.monotonic() - start)
+            results.put((index, response, None))
+
+    def start(index: int) -> None:
+        req = request if index == 0 else copy_request(request)
+        threading.Thread(target=attempt, args=(index, req), daemon=True).start()
+
+    start(0)
+    launched = 1
+    errors: List[Tuple[int, Exception]] = []
+
+    while True:
+        try:
+            index, response, err = results.get(timeout=delay if launched <= policy.max_hedges and not errors else None)
+        except queue.Empty:
+            log.debug("Sending hedged request %i to %s after %f seconds", launched, request.url, delay)
+            start(launched)
+            launched += 1
+            continue
+
+        if response is not None:
+            with lock:
+                settled = True
+
+            # any responses that were queued before we settled on a winner have to be released
+            while True:
+                try:
+                    _, other, _ = results.get_nowait()
+                except queue.Empty:
+                    break
+                if other is not None:
+                    other.close()
+
+            if index > 0:
+                log.debug("Hedged request %i to %s won", index, request.url)
+            return response
+
+        assert err is not None
+        errors.append((index, err))
+        if len(errors) == launched:
+            raise min(errors, key=lambda e: e[0])[1]
+
+
+async def async_send_hedged(
+    send: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    request: httpx.Request,
+    *,
+    policy: HedgingPolicy,
+    endpoint: str,
+) -> httpx.Response:
+    """Send the given request, sending duplicates if no response has been received after the hedge delay.
+
+    Every attempt is sent from a separate task, as soon as any attempt succeeds the remaining
+    attempts are cancelled. If every attempt fails then the error from the first attempt is raised.
+    """
+    delay = policy.get_delay(endpoint)
+    winner: Optional[httpx.Response] = None
+    errors: List[Tuple[int, Exception]] = []
+    launched = 0
+
+    async with anyio.create_task_group() as tg:
+
+        async def attempt(index: int, req: httpx.Request) -> None:
+            nonlocal winner
+
+            start = time.monotonic()
+            try:
+                response = await send(req)
+            except Exception as err:
+                errors.append((index, err))
+                if len(errors) == launched:
+                    tg.cancel_scope.cancel()
+                return
+
+            if winner is not None:
+                await response.aclose()
+                return
+
+            policy.record_latency(endpoint, time.monotonic() - start)
+            winner = response
+            if index > 0:
+                log.debug("Hedged request %i to %s won", index, request.url)
+            tg.cancel_scope.cancel()
+
+        tg.start_soon(attempt, 0, request)
+        launched += 1
+
+        while launched <= policy.max_hedges:
+            await anyio.sleep(delay)
+            if errors:
+                # the request is failing, not slow, so there's no point in hedging
+                break
+
+            log.debug("Sending hedged request %i to %s after %f seconds", launched, request.url, delay)
+            tg.start_soon(attempt, launched, copy_request(request))
+            launched += 1
+
+    if winner is not None:
+        return winner
+
+    raise min(errors, key=lambda e: e[0])[1]
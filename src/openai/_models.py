@@ -211,29 +211,23 @@ class BaseModel(pydantic.BaseModel):
         m = cls.__new__(cls)
         fields_values: dict[str, object] = {}
 
-        config = get_model_config(cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
-
         if _fields_set is None:
             _fields_set = set()
 
-        model_fields = get_model_fields(cls)
-        for name, field in model_fields.items():
-            key = field.alias
-            if key is None or (key not in values and populate_by_name):
-                key = name
+        plan = _get_model_plan(cls)
+        for field in plan.fields:
+            key = field.key
+            if key not in values and field.fallback_key is not None:
+                key = field.fallback_key
 
             if key in values:
-                fields_values[name] = _construct_field(value=values[key], field=field, key=key)
-                _fields_set.add(name)
+                fields_values[field.name] = field.construct(values[key])
+                _fields_set.add(field.name)
             else:
-                fields_values[name] = field_get_default(field)
+                fields_values[field.name] = field.get_default()
 
         _extra = {}
+        model_fields = plan.model_fields
         for key, value in values.items():
             if key not in model_fields:
                 if PYDANTIC_V2:
@@ -380,19 +374,88 @@ class BaseModel(pydantic.BaseModel):
             )
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
+_IMMUTABLE_DEFAULTS = (type(None), str, bytes, int, float, bool, tuple, frozenset)
 
-    if PYDANTIC_V2:
-        type_ = field.annotation
-    else:
-        type_ = cast(type, field.outer_type_)  # type: ignore
 
-    if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
+class _FieldPlan:
+    """How to construct a single model field, see `_ModelPlan`"""
+
+    __slots__ = ("name", "key", "fallback_key", "field", "_default", "_type", "_construct")
+
+    def __init__(self, *, name: str, field: FieldInfo, populate_by_name: bool) -> None:
+        self.name = name
+        self.field = field
+
+        if field.alias is None:
+            self.key = name
+            self.fallback_key: str | None = None
+        else:
+            self.key = field.alias
+            self.fallback_key = name if populate_by_name else None
+
+        # mutable defaults are copied every time they're retrieved so only immutable ones can be reused
+        default = field_get_default(field)
+        self._default = default if isinstance(default, _IMMUTABLE_DEFAULTS) else _MISSING
+        self._type: object = _MISSING
+        self._construct: _Constructor = _construct_identity
 
-    return construct_type(value=value, type_=type_)
+    def get_default(self) -> object:
+        if self._default is _MISSING:
+            return field_get_default(self.field)
+        return self._default
+
+    def construct(self, value: object) -> object:
+        if value is None:
+            return self.get_default()
+
+        if PYDANTIC_V2:
+            type_ = self.field.annotation
+        else:
+            type_ = cast(type, self.field.outer_type_)  # type: ignore
+
+        # the constructor is compiled lazily so that we don't recurse forever on self-referencing
+        # models & the field type is checked every time as it is updated when forward references
+        # are resolved by rebuilding the model
+        if type_ is not self._type:
+            if type_ is None:
+                raise RuntimeError(f"Unexpected field type is None for {self.key}")
+
+            self._construct = _get_constructor(type_)
+            self._type = type_
+
+        return self._construct(value)
+
+
+class _ModelPlan:
+    """The precomputed details needed to construct a model class from a response without validation"""
+
+    model_fields: dict[str, FieldInfo]
+    fields: list[_FieldPlan]
+
+    def __init__(self, model: type[pydantic.BaseModel]) -> None:
+        config = get_model_config(model)
+        populate_by_name = (
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+
+        self.model_fields = get_model_fields(model)
+        self.fields = [
+            _FieldPlan(name=name, field=field, populate_by_name=bool(populate_by_name))
+            for name, field in self.model_fields.items()
+        ]
+
+
+_model_plans: dict[type, _ModelPlan] = {}
+
+
+def _get_model_plan(model: type[pydantic.BaseModel]) -> _ModelPlan:
+    plan = _model_plans.get(model)
+    # the fields of a model are replaced when it is rebuilt, e.g. to resolve forward references
+    if plan is None or plan.model_fields is not get_model_fields(model):
+        plan = _model_plans[model] = _ModelPlan(model)
+    return plan
 
 
 def is_basemodel(type_: type) -> bool:
@@ -451,6 +514,39 @@ def construct_type(*, value: object, type_: object) -> object:
 
     If the given value does not match the expected type then it is returned as-is.
     """
+    return _get_constructor(type_)(value)
+
+
+_Constructor = Callable[[object], object]
+
+_MISSING = object()
+
+_constructors: dict[object, _Constructor] = {}
+
+
+def _get_constructor(type_: object) -> _Constructor:
+    """Returns a function that constructs values of the given type, see `construct_type()`.
+
+    Inspecting a type is much more expensive than constructing a value so every type is
+    compiled into a constructor the first time it is seen & then cached.
+    """
+    try:
+        return _constructors[type_]
+    except KeyError:
+        pass
+    except TypeError:
+        # the type isn't hashable, e.g. `Annotated[]` with unhashable metadata
+        return _compile_constructor(type_)
+
+    constructor = _constructors[type_] = _compile_constructor(type_)
+    return constructor
+
+
+def _construct_identity(value: object) -> object:
+    return value
+
+
+def _compile_constructor(type_: object) -> _Constructor:
     # we allow `object` as the input type because otherwise, passing things like
     # `Literal['value']` will be reported as a type error by type checkers
     type_ = cast("type[object]", type_)
@@ -470,6 +566,75 @@ def construct_type(*, value: object, type_: object) -> object:
     args = get_args(type_)
 
     if is_union(origin):
+        return _compile_union_constructor(type_, args=args, meta=meta)
+
+    if origin == dict:
+
+        def construct_dict(value: object) -> object:
+            if not is_mapping(value):
+                return value
+
+            _, items_type = args  # Dict[_, items_type]
+            construct = _get_constructor(items_type)
+            return {key: construct(item) for key, item in value.items()}
+
+        return construct_dict
+
+    try:
+        is_model = not is_literal_type(type_) and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
+    except TypeError as err:
+        # `origin` isn't a class, constructing this type has always been an error
+        message = str(err)
+
+        def construct_invalid(value: object) -> object:  # noqa: ARG001
+            raise TypeError(message)
+
+        return construct_invalid
+
+    if is_model:
+        model_construct = cast(Any, type_).construct
+
+        def construct_model(value: object) -> object:
+            if is_list(value):
+                return [model_construct(**entry) if is_mapping(entry) else entry for entry in value]
+
+            if is_mapping(value):
+                return model_construct(**value)
+
+            return value
+
+        return construct_model
+
+    if origin == list:
+
+        def construct_list(value: object) -> object:
+            if not is_list(value):
+                return value
+
+            inner_type = args[0]  # List[inner_type]
+            construct = _get_constructor(inner_type)
+            return [construct(entry) for entry in value]
+
+        return construct_list
+
+    if origin == float:
+        return _construct_float
+
+    if type_ == datetime:
+        return _construct_datetime
+
+    if type_ == date:
+        return _construct_date
+
+    return _construct_identity
+
+
+def _compile_union_constructor(type_: type, *, args: tuple[Any, ...], meta: tuple[Any, ...]) -> _Constructor:
+    discriminator: DiscriminatorDetails | None | object = _MISSING
+
+    def construct_union(value: object) -> object:
+        nonlocal discriminator
+
         try:
             return validate_type(type_=cast("type[object]", type_), value=value)
         except Exception:
@@ -489,69 +654,50 @@ def construct_type(*, value: object, type_: object) -> object:
         #
         # without this block, if the data we get is something like `{'kind': 'bar', 'value': 'foo'}` then
         # we'd end up constructing `FooType` when it should be `BarType`.
-        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
-        if discriminator and is_mapping(value):
+        if discriminator is _MISSING:
+            discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
+
+        if isinstance(discriminator, DiscriminatorDetails) and is_mapping(value):
             variant_value = value.get(discriminator.field_alias_from or discriminator.field_name)
             if variant_value and isinstance(variant_value, str):
                 variant_type = discriminator.mapping.get(variant_value)
                 if variant_type:
-                    return construct_type(type_=variant_type, value=value)
+                    return _get_constructor(variant_type)(value)
 
         # if the data is not valid, use the first variant that doesn't fail while deserializing
         for variant in args:
             try:
-                return construct_type(value=value, type_=variant)
+                return _get_constructor(variant)(value)
             except Exception:
                 continue
 
         raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
 
-    if origin == dict:
-        if not is_mapping(value):
-            return value
+    return construct_union
 
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {key: construct_type(value=item, type_=items_type) for key, item in value.items()}
 
-    if not is_literal_type(type_) and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel)):
-        if is_list(value):
-            return [cast(Any, type_).construct(**entry) if is_mapping(entry) else entry for entry in value]
-
-        if is_mapping(value):
-            if issubclass(type_, BaseModel):
-                return type_.construct(**value)  # type: ignore[arg-type]
-
-            return cast(Any, type_).construct(**value)
-
-    if origin == list:
-        if not is_list(value):
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
             return value
+        return coerced
 
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
+    return value
 
-    if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
 
+def _construct_datetime(value: object) -> object:
+    try:
+        return parse_datetime(value)  # type: ignore
+    except Exception:
         return value
 
-    if type_ == datetime:
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
-            return value
-
-    if type_ == date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
 
-    return value
+def _construct_date(value: object) -> object:
+    try:
+        return parse_date(value)  # type: ignore
+    except Exception:
+        return value
 
 
 @runtime_checkable
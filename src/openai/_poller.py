@@ -0,0 +1,633 @@
+from __future__ import annotations
+
+import math
+import time
+import heapq
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Generic, TypeVar, Callable, Iterable, Iterator, Optional
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor, as_completed
+
+import anyio
+import httpx
+
+from ._types import NOT_GIVEN, NotGiven
+from ._utils import is_given
+
+if TYPE_CHECKING:
+    from ._client import OpenAI, AsyncOpenAI
+    from .types.file_object import FileObject
+    from .types.beta.threads.run import Run
+    from .types.beta.vector_stores.vector_store_file import VectorStoreFile
+    from .types.beta.vector_stores.vector_store_file_batch import VectorStoreFileBatch
+
+__all__ = ["Poller", "AsyncPoller", "PollFuture"]
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_QPS = 20.0
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_TICK = 0.1
+
+# mirrors the default intervals of the `.poll()` and `.wait_for_processing()` helpers
+_DEFAULT_POLL_INTERVAL_MS = 1000
+_DEFAULT_FILE_POLL_INTERVAL_MS = 5000
+
+_RUN_TERMINAL_STATES = {"requires_action", "cancelled", "completed", "failed", "expired", "incomplete"}
+_FILE_TERMINAL_STATES = {"processed", "error", "deleted"}
+
+
+class _TimingWheel(Generic[_T]):
+    """Buckets scheduled entries by the tick that they're due in.
+
+    Entries that are due within the same tick are coalesced into a single bucket and are
+    dispatched together in the order that they were scheduled, so the cost of scheduling
+    doesn't depend on how many entries are waiting.
+    """
+
+    def __init__(self, tick: float) -> None:
+        self._tick = tick
+        self._buckets: Dict[int, deque[_T]] = {}
+        self._ticks: List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, entry: _T, due: float) -> None:
+        tick = math.ceil(due / self._tick)
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = deque()
+            heapq.heappush(self._ticks, tick)
+
+        bucket.append(entry)
+        self._size += 1
+
+    def next_due(self) -> Optional[float]:
+        if not self._ticks:
+            return None
+        return self._ticks[0] * self._tick
+
+    def pop(self) -> _T:
+        tick = self._ticks[0]
+        bucket = self._buckets[tick]
+        entry = bucket.popleft()
+        if not bucket:
+            heapq.heappop(self._ticks)
+            del self._buckets[tick]
+
+        self._size -= 1
+        return entry
+
+    def clear(self) -> List[_T]:
+        entries = [entry for bucket in self._buckets.values() for entry in bucket]
+        self._buckets.clear()
+        self._ticks.clear()
+        self._size = 0
+        return entries
+
+
+class PollFuture(Generic[_T]):
+    """The eventual result of an object that is polled by an `AsyncPoller`."""
+
+    id: str
+    """The ID of the object that is being polled"""
+
+    def __init__(self, id: str) -> None:
+        self.id = id
+        self._done = False
+        self._cancelled = False
+        self._result: Optional[_T] = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        """Stop polling the object, returns `False` if polling has already finished"""
+        if self._done:
+            return False
+
+        self._done = self._cancelled = True
+        return True
+
+    def result(self) -> _T:
+        """Returns the object once it has reached a terminal state, or raises the error that polling failed with"""
+        if not self._done:
+            raise RuntimeError(f"Polling {self.id} hasn't finished yet")
+        if self._cancelled:
+            raise RuntimeError(f"Polling {self.id} was cancelled")
+        if self._exception is not None:
+            raise self._exception
+        return self._result  # type: ignore[return-value]
+
+    def exception(self) -> Optional[BaseException]:
+        if not self._done:
+            raise RuntimeError(f"Polling {self.id} hasn't finished yet")
+        return self._exception
+
+    def _set_result(self, result: _T) -> None:
+        self._result = result
+        self._done = True
+
+    def _set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._done = True
+
+
+def _resolve(resolve: Callable[[Any], None], value: Any) -> None:
+    # the future can be cancelled by the caller at any point while it's being polled
+    try:
+        resolve(value)
+    except InvalidStateError:
+        pass
+
+
+class _PollTarget:
+    """A single object that is being polled"""
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        retrieve: Callable[[Dict[str, str]], Any],
+        is_done: Callable[[Any], bool],
+        future: Any,
+        poll_interval_ms: int | NotGiven,
+        default_poll_interval_ms: int,
+        max_wait_seconds: Optional[float] = None,
+    ) -> None:
+        self.id = id
+        self.retrieve = retrieve
+        self.is_done = is_done
+        self.future = future
+        self.poll_interval_ms = poll_interval_ms
+        self.default_poll_interval_ms = default_poll_interval_ms
+        self.deadline = time.monotonic() + max_wait_seconds if max_wait_seconds is not None else None
+        self.max_wait_seconds = max_wait_seconds
+
+        self.headers = {"X-Stainless-Poll-Helper": "true"}
+        if is_given(poll_interval_ms):
+            self.headers["X-Stainless-Custom-Poll-Interval"] = str(poll_interval_ms)
+
+    def next_delay(self, headers: httpx.Headers) -> float:
+        if is_given(self.poll_interval_ms):
+            return self.poll_interval_ms / 1000
+
+        from_header = headers.get("openai-poll-after-ms")
+        if from_header is not None:
+            return int(from_header) / 1000
+
+        return self.default_poll_interval_ms / 1000
+
+    def timed_out(self, now: float) -> bool:
+        return self.deadline is not None and now > self.deadline
+
+    def timeout_error(self) -> RuntimeError:
+        return RuntimeError(
+            f"Giving up on waiting for file {self.id} to finish processing after {self.max_wait_seconds} seconds."
+        )
+
+
+class _BasePoller:
+    def __init__(self, *, max_qps: float, max_concurrency: int, tick: float) -> None:
+        if max_qps <= 0:
+            raise ValueError("The `max_qps` argument must be greater than 0")
+        if max_concurrency < 1:
+            raise ValueError("The `max_concurrency` argument must be greater than 0")
+
+        self.max_qps = max_qps
+        self.max_concurrency = max_concurrency
+        self._wheel: _TimingWheel[_PollTarget] = _TimingWheel(tick)
+        self._in_flight = 0
+        self._next_slot = 0.0
+
+    @property
+    def pending(self) -> int:
+        """The number of objects that are still being polled"""
+        return len(self._wheel) + self._in_flight
+
+    def _next_wait(self, now: float) -> Optional[float]:
+        """How long to wait until the next poll can be sent, `None` if that depends on a poll finishing first"""
+        if self._in_flight >= self.max_concurrency:
+            return None
+
+        due = self._wheel.next_due()
+        if due is None:
+            return None
+
+        return max(due - now, self._next_slot - now, 0.0)
+
+    def _take(self, now: float) -> _PollTarget:
+        self._in_flight += 1
+        # polls are spread out evenly to respect `max_qps`
+        self._next_slot = max(now, self._next_slot) + 1 / self.max_qps
+        return self._wheel.pop()
+
+
+class Poller(_BasePoller):
+    """Polls many runs, vector store file batches, vector store files and files at once.
+
+    All of the objects share a single scheduler thread, the polls that are due are dispatched
+    to a pool of `max_concurrency` threads at no more than `max_qps` requests per second,
+    and every object is polled again after the delay given by the `openai-poll-after-ms`
+    header of its last response.
+
+    Each `poll_*()` method returns a `concurrent.futures.Future` that is resolved once the
+    object reaches a terminal state, or fails with the error that retrieving it raised.
+
+    ```py
+    futures = [client.poller.poll_run(run.id, thread_id=run.thread_id) for run in runs]
+
+    for future in client.poller.as_completed(futures):
+        print(future.result().status)
+    ```
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        *,
+        max_qps: float = DEFAULT_MAX_QPS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tick: float = DEFAULT_TICK,
+    ) -> None:
+        super().__init__(max_qps=max_qps, max_concurrency=max_concurrency, tick=tick)
+        self._client = client
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def poll_run(self, run_id: str, *, thread_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN) -> Future[Run]:
+        """Poll a run until it reaches a terminal state, like `client.beta.threads.runs.poll()`"""
+        runs = self._client.beta.threads.runs
+        return self._add(
+            id=run_id,
+            retrieve=lambda headers: runs.with_raw_response.retrieve(
+                thread_id=thread_id, run_id=run_id, extra_headers=headers
+            ),
+            is_done=lambda run: run.status in _RUN_TERMINAL_STATES,
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_file_batch(
+        self, batch_id: str, *, vector_store_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN
+    ) -> Future[VectorStoreFileBatch]:
+        """Poll a vector store file batch until it's processed, like `client.beta.vector_stores.file_batches.poll()`"""
+        file_batches = self._client.beta.vector_stores.file_batches
+        return self._add(
+            id=batch_id,
+            retrieve=lambda headers: file_batches.with_raw_response.retrieve(
+                batch_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=lambda batch: batch.file_counts.in_progress <= 0,
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_vector_store_file(
+        self, file_id: str, *, vector_store_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN
+    ) -> Future[VectorStoreFile]:
+        """Poll a vector store file until it's processed, like `client.beta.vector_stores.files.poll()`"""
+        files = self._client.beta.vector_stores.files
+        return self._add(
+            id=file_id,
+            retrieve=lambda headers: files.with_raw_response.retrieve(
+                file_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=lambda file: file.status != "in_progress",
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_file(
+        self,
+        file_id: str,
+        *,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+        max_wait_seconds: float = 30 * 60,
+    ) -> Future[FileObject]:
+        """Poll a file until it's processed, like `client.files.wait_for_processing()`"""
+        files = self._client.files
+        return self._add(
+            id=file_id,
+            retrieve=lambda headers: files.with_raw_response.retrieve(file_id, extra_headers=headers),
+            is_done=lambda file: file.status in _FILE_TERMINAL_STATES,
+            poll_interval_ms=poll_interval_ms,
+            default_poll_interval_ms=_DEFAULT_FILE_POLL_INTERVAL_MS,
+            max_wait_seconds=max_wait_seconds,
+        )
+
+    def as_completed(self, futures: Iterable[Future[_T]]) -> Iterator[Future[_T]]:
+        """Yields the given futures as they complete, see `concurrent.futures.as_completed()`"""
+        return as_completed(futures)
+
+    def close(self) -> None:
+        """Stop polling, any objects that are still being polled have their futures cancelled"""
+        with self._cond:
+            self._closed = True
+            for target in self._wheel.clear():
+                target.future.cancel()
+            self._cond.notify_all()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _add(
+        self,
+        *,
+        id: str,
+        retrieve: Callable[[Dict[str, str]], Any],
+        is_done: Callable[[Any], bool],
+        poll_interval_ms: int | NotGiven,
+        default_poll_interval_ms: int = _DEFAULT_POLL_INTERVAL_MS,
+        max_wait_seconds: Optional[float] = None,
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        target = _PollTarget(
+            id=id,
+            retrieve=retrieve,
+            is_done=is_done,
+            future=future,
+            poll_interval_ms=poll_interval_ms,
+            default_poll_interval_ms=default_poll_interval_ms,
+            max_wait_seconds=max_wait_seconds,
+        )
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot poll with a closed poller")
+
+            self._wheel.schedule(target, time.monotonic())
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="openai-poller"
+                )
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="openai-poller", daemon=True)
+                self._thread.start()
+            else:
+                self._cond.notify_all()
+
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed or (not self._wheel and not self._in_flight):
+                        # the thread is started again once there's something to poll
+                        self._thread = None
+                        return
+
+                    now = time.monotonic()
+                    wait = self._next_wait(now)
+                    if wait == 0:
+                        target = self._take(now)
+                        break
+
+                    self._cond.wait(wait)
+
+            if target.future.cancelled():
+                self._finish()
+                continue
+
+            assert self._executor is not None
+            self._executor.submit(self._poll, target)
+
+    def _poll(self, target: _PollTarget) -> None:
+        due: Optional[float] = None
+        try:
+            try:
+                response = target.retrieve(target.headers)
+                obj = response.parse()
+            except BaseException as err:
+                _resolve(target.future.set_exception, err)
+                return
+
+            if target.future.cancelled():
+                return
+
+            if target.is_done(obj):
+                _resolve(target.future.set_result, obj)
+            elif target.timed_out(time.monotonic()):
+                _resolve(target.future.set_exception, target.timeout_error())
+            else:
+                due = time.monotonic() + target.next_delay(response.headers)
+        finally:
+            # the slot is always released, even if the future was cancelled while the poll was in flight
+            if due is None:
+                self._finish()
+            else:
+                self._finish(target, due)
+
+    def _finish(self, target: Optional[_PollTarget] = None, due: float = 0.0) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if target is not None:
+                if self._closed:
+                    target.future.cancel()
+                else:
+                    self._wheel.schedule(target, due)
+            self._cond.notify_all()
+
+
+class AsyncPoller(_BasePoller):
+    """Polls many runs, vector store file batches, vector store files and files at once.
+
+    Each `poll_*()` method returns a `PollFuture`, the objects are polled while iterating over
+    `.as_completed()`, which yields the futures as the objects reach a terminal state. The
+    polls that are due are sent from a single task group with at most `max_concurrency`
+    requests in flight and no more than `max_qps` requests per second, and every object is
+    polled again after the delay given by the `openai-poll-after-ms` header of its last response.
+
+    ```py
+    for run in runs:
+        client.poller.poll_run(run.id, thread_id=run.thread_id)
+
+    async for future in client.poller.as_completed():
+        print(future.result().status)
+    ```
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        *,
+        max_qps: float = DEFAULT_MAX_QPS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tick: float = DEFAULT_TICK,
+    ) -> None:
+        super().__init__(max_qps=max_qps, max_concurrency=max_concurrency, tick=tick)
+        self._client = client
+        self._completed: deque[PollFuture[Any]] = deque()
+        self._lock: Optional[anyio.Lock] = None
+
+    def poll_run(self, run_id: str, *, thread_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN) -> PollFuture[Run]:
+        """Poll a run until it reaches a terminal state, like `client.beta.threads.runs.poll()`"""
+        runs = self._client.beta.threads.runs
+        return self._add(
+            id=run_id,
+            retrieve=lambda headers: runs.with_raw_response.retrieve(
+                thread_id=thread_id, run_id=run_id, extra_headers=headers
+            ),
+            is_done=lambda run: run.status in _RUN_TERMINAL_STATES,
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_file_batch(
+        self, batch_id: str, *, vector_store_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN
+    ) -> PollFuture[VectorStoreFileBatch]:
+        """Poll a vector store file batch until it's processed, like `client.beta.vector_stores.file_batches.poll()`"""
+        file_batches = self._client.beta.vector_stores.file_batches
+        return self._add(
+            id=batch_id,
+            retrieve=lambda headers: file_batches.with_raw_response.retrieve(
+                batch_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=lambda batch: batch.file_counts.in_progress <= 0,
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_vector_store_file(
+        self, file_id: str, *, vector_store_id: str, poll_interval_ms: int | NotGiven = NOT_GIVEN
+    ) -> PollFuture[VectorStoreFile]:
+        """Poll a vector store file until it's processed, like `client.beta.vector_stores.files.poll()`"""
+        files = self._client.beta.vector_stores.files
+        return self._add(
+            id=file_id,
+            retrieve=lambda headers: files.with_raw_response.retrieve(
+                file_id, vector_store_id=vector_store_id, extra_headers=headers
+            ),
+            is_done=lambda file: file.status != "in_progress",
+            poll_interval_ms=poll_interval_ms,
+        )
+
+    def poll_file(
+        self,
+        file_id: str,
+        *,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+        max_wait_seconds: float = 30 * 60,
+    ) -> PollFuture[FileObject]:
+        """Poll a file until it's processed, like `client.files.wait_for_processing()`"""
+        files = self._client.files
+        return self._add(
+            id=file_id,
+            retrieve=lambda headers: files.with_raw_response.retrieve(file_id, extra_headers=headers),
+            is_done=lambda file: file.status in _FILE_TERMINAL_STATES,
+            poll_interval_ms=poll_interval_ms,
+            default_poll_interval_ms=_DEFAULT_FILE_POLL_INTERVAL_MS,
+            max_wait_seconds=max_wait_seconds,
+        )
+
+    def as_completed(self) -> _AsyncCompletions:
+        """Poll every pending object, yielding their futures as they complete.
+
+        Iteration stops once there is nothing left to poll, objects that are added while
+        iterating are polled as well.
+        """
+        return _AsyncCompletions(self)
+
+    def _add(
+        self,
+        *,
+        id: str,
+        retrieve: Callable[[Dict[str, str]], Any],
+        is_done: Callable[[Any], bool],
+        poll_interval_ms: int | NotGiven,
+        default_poll_interval_ms: int = _DEFAULT_POLL_INTERVAL_MS,
+        max_wait_seconds: Optional[float] = None,
+    ) -> PollFuture[Any]:
+        future: PollFuture[Any] = PollFuture(id)
+        target = _PollTarget(
+            id=id,
+            retrieve=retrieve,
+            is_done=is_done,
+            future=future,
+            poll_interval_ms=poll_interval_ms,
+            default_poll_interval_ms=default_poll_interval_ms,
+            max_wait_seconds=max_wait_seconds,
+        )
+        self._wheel.schedule(target, time.monotonic())
+        return future
+
+    async def _next_completed(self) -> Optional[PollFuture[Any]]:
+        if self._lock is None:
+            self._lock = anyio.Lock()
+
+        async with self._lock:
+            if not self._completed and self._wheel:
+                await self._poll_until_completed()
+
+            return self._completed.popleft() if self._completed else None
+
+    async def _poll_until_completed(self) -> None:
+        """Send polls until at least one object has completed, then wait for the polls that are still in flight"""
+        changed = anyio.Event()
+
+        async def poll(target: _PollTarget) -> None:
+            try:
+                await self._poll(target)
+            finally:
+                self._in_flight -= 1
+                changed.set()
+
+        async with anyio.create_task_group() as tg:
+            while not self._completed and (self._wheel or self._in_flight):
+                now = time.monotonic()
+                wait = self._next_wait(now)
+                if wait == 0:
+                    target = self._take(now)
+                    if target.future.cancelled():
+                        self._in_flight -= 1
+                        continue
+
+                    tg.start_soon(poll, target)
+                    continue
+
+                changed = anyio.Event()
+                with anyio.move_on_after(wait if wait is not None else math.inf):
+                    await changed.wait()
+
+    async def _poll(self, target: _PollTarget) -> None:
+        future: PollFuture[Any] = target.future
+
+        try:
+            response = await target.retrieve(target.headers)
+            obj = response.parse()
+        except Exception as err:
+            future._set_exception(err)
+            self._completed.append(future)
+            return
+
+        if future.cancelled():
+            return
+
+        if target.is_done(obj):
+            future._set_result(obj)
+            self._completed.append(future)
+        elif target.timed_out(time.monotonic()):
+            future._set_exception(target.timeout_error())
+            self._completed.append(future)
+        else:
+            self._wheel.schedule(target, time.monotonic() + target.next_delay(response.headers))
+
+
+class _AsyncCompletions:
+    def __init__(self, poller: AsyncPoller) -> None:
+        self._poller = poller
+
+    def __aiter__(self) -> _AsyncCompletions:
+        return self
+
+    async def __anext__(self) -> PollFuture[Any]:
+        future = await self._poller._next_completed()
+        if future is None:
+            raise StopAsyncIteration
+        return future
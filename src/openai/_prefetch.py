@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import queue
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, Union, TypeVar, Iterator, AsyncGenerator
+
+import sniffio
+
+if TYPE_CHECKING:
+    from ._base_client import BaseSyncPage, BaseAsyncPage
+
+_SyncPageT = TypeVar("_SyncPageT", bound="BaseSyncPage[Any]")
+_AsyncPageT = TypeVar("_AsyncPageT", bound="BaseAsyncPage[Any]")
+
+
+class _Done:
+    pass
+
+
+_DONE = _Done()
+
+
+def check_prefetch(prefetch: int) -> None:
+    if prefetch < 0:
+        raise ValueError("The `prefetch` argument must not be negative")
+
+
+def prefetch_pages(page: _SyncPageT, prefetch: int) -> Iterator[_SyncPageT]:
+    """Yields `page` and the pages that follow it, fetching up to `prefetch` pages ahead from a helper thread.
+
+    The pages are fetched in order as each one holds the cursor for the next one. If fetching a
+    page fails then the error is raised once all of the pages before it have been yielded.
+    """
+    pages: queue.Queue[Union[_SyncPageT, BaseException, _Done]] = queue.Queue()
+    # one slot for each page that can be fetched ahead of the page that is being iterated
+    slots = threading.Semaphore(prefetch)
+    stopped = threading.Event()
+
+    def fetch() -> None:
+        current = page
+        try:
+            while current.has_next_page():
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                current = current.get_next_page()
+                pages.put(current)
+        except BaseException as exc:
+            pages.put(exc)
+        else:
+            pages.put(_DONE)
+
+    thread = threading.Thread(target=fetch, name="openai-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        yield page
+
+        while True:
+            next_page = pages.get()
+            if isinstance(next_page, _Done):
+                return
+            if isinstance(next_page, BaseException):
+                raise next_page
+
+            slots.release()
+            yield next_page
+    finally:
+        # a request that is in flight isn't interrupted, but its page is discarded
+        stopped.set()
+        slots.release()
+
+
+async def async_prefetch_pages(page: _AsyncPageT, prefetch: int) -> AsyncGenerator[_AsyncPageT, None]:
+    """Yields `page` and the pages that follow it, fetching up to `prefetch` pages ahead from a background task.
+
+    See `prefetch_pages()` for details. The background task is only supported with `asyncio`, as
+    structured concurrency libraries like `trio` don't allow a task to outlive the generator that
+    started it, so the pages are fetched one after the other otherwise.
+    """
+    if sniffio.current_async_library() != "asyncio":
+        current = page
+        while True:
+            yield current
+            if not current.has_next_page():
+                return
+            current = await current.get_next_page()
+
+    pages: asyncio.Queue[Union[_AsyncPageT, Exception, _Done]] = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def fetch() -> None:
+        current = page
+        try:
+            while current.has_next_page():
+                await slots.acquire()
+                current = await current.get_next_page()
+                pages.put_nowait(current)
+        except Exception as exc:
+            pages.put_nowait(exc)
+        else:
+            pages.put_nowait(_DONE)
+
+    task = asyncio.get_running_loop().create_task(fetch())
+
+    try:
+        yield page
+
+        while True:
+            next_page = await pages.get()
+            if isinstance(next_page, _Done):
+                return
+            if isinstance(next_page, Exception):
+                raise next_page
+
+            slots.release()
+            yield next_page
+    finally:
+        # cancels the request that is in flight, if any, and waits for it to be closed, the
+        # cancellation itself isn't raised here as it's expected
+        task.cancel()
+        await asyncio.wait({task})
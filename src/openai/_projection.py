@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple, Callable, Optional, Sequence
+
+from jiter import from_json
+
+from ._compat import model_copy
+from ._models import FinalRequestOptions
+
+
+def project_page(
+    content: bytes,
+    fields: Optional[Sequence[str]],
+    record: Optional[Callable[..., Any]],
+) -> Tuple[List[Any], Optional[str]]:
+    """Parses the body of a list response with `jiter` and returns the selected fields of each item,
+    as a dictionary or the result of `record(**fields)`, and the cursor for the next page.
+
+    The cursor is the `id` of the last item, the same as `SyncCursorPage.next_page_info()`, and
+    `None` if there are no more pages.
+    """
+    data: List[Dict[str, Any]] = from_json(content).get("data") or []
+
+    if fields is None:
+        items: List[Any] = data
+    else:
+        items = [{field: item.get(field) for field in fields} for item in data]
+
+    if record is not None:
+        items = [record(**item) for item in items]
+
+    cursor = data[-1].get("id") if data else None
+    return items, cursor if isinstance(cursor, str) else None
+
+
+def next_page_options(options: FinalRequestOptions, cursor: str) -> FinalRequestOptions:
+    options = model_copy(options)
+    options.params = {**options.params, "after": cursor}
+    return options
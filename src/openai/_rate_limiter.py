@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import re
+import time
+import threading
+from typing import Any, Dict, Tuple, Callable, Optional
+
+import httpx
+
+from ._utils import is_dict, is_list, is_mapping
+from ._models import FinalRequestOptions
+
+__all__ = ["RateLimiter"]
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# rate limits are enforced per minute so in the absence of a reset header
+# we assume that the limit is replenished linearly over a minute
+_DEFAULT_WINDOW = 60.0
+
+
+class _Bucket:
+    limit: Optional[float]
+    available: float
+    rate: float
+    in_flight: float
+    updated_at: float
+
+    def __init__(self) -> None:
+        self.limit = None
+        self.available = 0.0
+        self.rate = 0.0
+        self.in_flight = 0.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.limit is None:
+            return
+
+        self.available = min(self.limit, self.available + self.rate * (now - self.updated_at))
+        self.updated_at = now
+
+    def reserve(self, cost: float, now: float) -> float:
+        """Take the given cost out of the bucket and return how long the caller must wait for it to be available"""
+        self.in_flight += cost
+
+        if self.limit is None:
+            # we haven't seen any rate limit headers yet
+            return 0.0
+
+        self._refill(now)
+
+        # a single request can never cost more than the whole limit
+        self.available -= min(cost, self.limit)
+        if self.available >= 0 or self.rate <= 0:
+            return 0.0
+
+        return -self.available / self.rate
+
+    def release(self, cost: float) -> None:
+        self.in_flight = max(self.in_flight - cost, 0.0)
+
+    def update(self, *, limit: float, remaining: float, reset: float | None, now: float) -> None:
+        if reset is not None and reset > 0 and remaining < limit:
+            self.rate = (limit - remaining) / reset
+        else:
+            self.rate = limit / _DEFAULT_WINDOW
+
+        self.limit = limit
+        # the server hasn't necessarily seen the requests that are still in flight yet
+        self.available = remaining - self.in_flight
+        self.updated_at = now
+
+
+class RateLimitReservation:
+    """The capacity reserved for a single request, returned by `RateLimiter.reserve()`."""
+
+    key: Optional[str]
+    tokens: int
+    delay: float
+
+    def __init__(self, *, key: Optional[str], tokens: int, delay: float) -> None:
+        self.key = key
+        self.tokens = tokens
+        self.delay = delay
+
+
+class RateLimiter:
+    """A client-side rate limiter that paces requests to stay under the API rate limits.
+
+    The limiter keeps a token bucket for requests and one for tokens, per model, which are
+    continuously synchronised with the `x-ratelimit-*` headers returned on every response.
+    Before a request is sent its token cost is estimated from the request body and, if the
+    buckets don't have enough capacity left, the request is delayed until they do instead
+    of being sent and rejected with a 429 error.
+
+    A single limiter can be shared between multiple clients, threads and async tasks, e.g.
+
+    ```py
+    limiter = RateLimiter()
+    client = OpenAI(rate_limiter=limiter)
+    async_client = AsyncOpenAI(rate_limiter=limiter)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        token_estimator: Callable[[FinalRequestOptions], int] | None = None,
+        max_delay: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            token_estimator: A function that estimates the number of tokens a request will consume,
+                by default this is approximated from the number of characters in the request body
+                and the maximum number of tokens that can be generated.
+
+            max_delay: The maximum number of seconds a single request will be delayed by.
+        """
+        self.token_estimator = token_estimator or estimate_tokens
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[Optional[str], Tuple[_Bucket, _Bucket]] = {}
+
+    def _get_buckets(self, key: Optional[str]) -> Tuple[_Bucket, _Bucket]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = (_Bucket(), _Bucket())
+        return buckets
+
+    def reserve(self, options: FinalRequestOptions) -> RateLimitReservation:
+        """Reserve capacity for the given request.
+
+        The caller is expected to wait for `reservation.delay` seconds before sending the request
+        and to call `release()` once a response has been received, or the request has failed.
+        """
+        key = _get_model(options.json_data)
+        tokens = self.token_estimator(options)
+
+        with self._lock:
+            requests_bucket, tokens_bucket = self._get_buckets(key)
+            now = time.monotonic()
+            delay = max(requests_bucket.reserve(1, now), tokens_bucket.reserve(tokens, now))
+
+        return RateLimitReservation(key=key, tokens=tokens, delay=min(delay, self.max_delay))
+
+    def release(self, reservation: RateLimitReservation, headers: httpx.Headers | None = None) -> None:
+        """Release the given reservation & update the limits from the response headers, if there are any"""
+        with self._lock:
+            requests_bucket, tokens_bucket = self._get_buckets(reservation.key)
+            requests_bucket.release(1)
+            tokens_bucket.release(reservation.tokens)
+
+            if headers is None:
+                return
+
+            now = time.monotonic()
+            for bucket, kind in ((requests_bucket, "requests"), (tokens_bucket, "tokens")):
+                limit = _parse_number(headers.get(f"x-ratelimit-limit-{kind}"))
+                remaining = _parse_number(headers.get(f"x-ratelimit-remaining-{kind}"))
+                if limit is None or remaining is None:
+                    continue
+
+                reset = parse_reset_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                bucket.update(limit=limit, remaining=remaining, reset=reset, now=now)
+
+
+def estimate_tokens(options: FinalRequestOptions) -> int:
+    """Roughly estimate the number of tokens the given request will count towards the tokens rate limit.
+
+    Similar to the API, this is the number of characters in the request body divided by 4
+    plus the maximum number of tokens that can be generated.
+    """
+    body = options.json_data
+    tokens = _count_characters(body) // 4 + 1
+
+    if is_mapping(body):
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        if isinstance(max_tokens, int):
+            n = body.get("n")
+            tokens += max_tokens * (n if isinstance(n, int) and n > 0 else 1)
+
+    return tokens
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parse a duration as given in the `x-ratelimit-reset-*` headers, e.g. `6m0s` or `20ms`, into seconds"""
+    if not value:
+        return None
+
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return _parse_number(value)
+
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _parse_number(value: str | None) -> float | None:
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _get_model(body: object) -> Optional[str]:
+    if is_mapping(body):
+        model = body.get("model")
+        if isinstance(model, str):
+            return model
+    return None
+
+
+def _count_characters(obj: Any) -> int:
+    if isinstance(obj, str):
+        return len(obj)
+
+    if is_dict(obj):
+        return sum(_count_characters(value) for value in obj.values())
+
+    if is_list(obj):
+        return sum(_count_characters(item) for item in obj)
+
+    return 0
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+import logging
+import threading
+from typing import Optional
+
+import anyio
+import httpx
+
+__all__ = ["RetryScheduler", "RequestAttempt"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestAttempt:
+    """Describes a single attempt at sending a request, passed to the `RetryScheduler` hooks."""
+
+    request: httpx.Request
+    """The request that was sent."""
+
+    response: Optional[httpx.Response]
+    """The response that was received, if any.
+
+    Responses with an error status code that are retried are closed once `on_attempt()` returns.
+    """
+
+    error: Optional[Exception]
+    """The exception that was raised while sending the request, e.g. `httpx.TimeoutException`."""
+
+    retries_taken: int
+    """The number of retries that were taken before this attempt, i.e. `0` for the first attempt."""
+
+    elapsed: float
+    """The number of seconds this attempt took."""
+
+    def __init__(
+        self,
+        *,
+        request: httpx.Request,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+        retries_taken: int,
+        elapsed: float,
+    ) -> None:
+        self.request = request
+        self.response = response
+        self.error = error
+        self.retries_taken = retries_taken
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        outcome = f"status_code={self.response.status_code}" if self.response is not None else f"error={self.error!r}"
+        return f"{self.__class__.__name__}({self.request.method} {self.request.url}, {outcome}, retries_taken={self.retries_taken})"
+
+
+class RetryScheduler:
+    """Controls how a client waits before retrying a request & reports every request attempt.
+
+    By default the calling thread, or task, sleeps until the retry is due, in the same way as
+    clients without a scheduler. A single scheduler can be shared between many clients and threads.
+
+    When `max_pending` is given, at most that many retries can be waiting at the same time,
+    any further retries are not scheduled and the error is raised to the caller immediately
+    instead. This stops retry storms from tying up every worker in a thread pool with sleeping
+    requests.
+
+    Subclasses can override `on_attempt()` to record metrics or `wait()` / `async_wait()`
+    to change how the client waits, e.g.
+
+    ```py
+    class MetricsRetryScheduler(RetryScheduler):
+        def on_attempt(self, attempt: RequestAttempt) -> None:  # noqa: ARG002
+            statsd.timing("openai.request", attempt.elapsed)
+    ```
+    """
+
+    max_pending: Optional[int]
+
+    def __init__(self, *, max_pending: Optional[int] = None) -> None:
+        if max_pending is not None and max_pending < 0:
+            raise ValueError(f"max_pending must not be negative, got {max_pending}")
+
+        self.max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """The number of retries that are currently waiting"""
+        return self._pending
+
+    def on_attempt(self, attempt: RequestAttempt) -> None:  # noqa: ARG002
+        """Called after every attempt at sending a request, including the first one"""
+        return None
+
+    def wait(self, delay: float, attempt: RequestAttempt) -> bool:  # noqa: ARG002
+        """Block until the failed attempt should be retried.
+
+        Returns `False` if the request should not be retried after all.
+        """
+        if not self._acquire():
+            return False
+
+        try:
+            time.sleep(delay)
+        finally:
+            self._release()
+
+        return True
+
+    async def async_wait(self, delay: float, attempt: RequestAttempt) -> bool:  # noqa: ARG002
+        """Wait until the failed attempt should be retried.
+
+        Returns `False` if the request should not be retried after all.
+        """
+        if not self._acquire():
+            return False
+
+        try:
+            await anyio.sleep(delay)
+        finally:
+            self._release()
+
+        return True
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self.max_pending is not None and self._pending >= self.max_pending:
+                log.debug("Not retrying as there are already %i pending retries", self._pending)
+                return False
+
+            self._pending += 1
+            return True
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
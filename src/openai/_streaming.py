@@ -1,6 +1,7 @@
 # Note: initially copied from https://github.com/florimondmanca/httpx-sse/blob/master/src/httpx_sse/_decoders.py
 from __future__ import annotations
 
+import re
 import json
 import inspect
 from types import TracebackType
@@ -277,47 +278,31 @@ class SSEDecoder:
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
+        buffer = _SSELineBuffer()
+        for chunk in iterator:
+            for line in buffer.feed(chunk):
                 sse = self.decode(line)
                 if sse:
                     yield sse
 
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
-        for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+        for line in buffer.flush():
+            sse = self.decode(line)
+            if sse:
+                yield sse
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
+        buffer = _SSELineBuffer()
+        async for chunk in iterator:
+            for line in buffer.feed(chunk):
                 sse = self.decode(line)
                 if sse:
                     yield sse
 
-    async def _aiter_chunks(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
-        async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+        for line in buffer.flush():
+            sse = self.decode(line)
+            if sse:
+                yield sse
 
     def decode(self, line: str) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -368,6 +353,71 @@ class SSEDecoder:
         return None
 
 
+class _SSELineBuffer:
+    """Splits a stream of raw bytes into decoded lines as per the SSE spec.
+
+    Only newly received bytes are scanned for line terminators, so a line that spans
+    many chunks is never rescanned. Partial lines are accumulated in a single `bytearray`
+    and every completed region is decoded in one pass, directly from the chunk or from a
+    `memoryview` of the buffer, instead of decoding each line separately.
+    """
+
+    _buffer: bytearray
+    _skip_lf: bool
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # whether or not the last consumed line ended with `\r`, in which
+        # case a leading `\n` in the next chunk completes a `\r\n` pair
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Add the given chunk to the buffer and return every line that has been completed"""
+        if self._skip_lf and chunk:
+            self._skip_lf = False
+            if chunk[0] == 0x0A:
+                chunk = chunk[1:]
+
+        lf = chunk.rfind(b"\n")
+        cr = chunk.rfind(b"\r")
+        end = lf if lf > cr else cr
+
+        buffer = self._buffer
+        if end == -1:
+            buffer += chunk
+            return []
+
+        self._skip_lf = end == cr and end == len(chunk) - 1
+
+        if not buffer and end == len(chunk) - 1:
+            # fast path, the chunk contains complete lines only
+            text = chunk.decode("utf-8")
+        else:
+            size = len(buffer) + end + 1
+            buffer += chunk
+            with memoryview(buffer) as view, view[:size] as completed:
+                text = str(completed, "utf-8")
+            del buffer[:size]
+
+        # the text always ends with a line terminator so the last item is always empty
+        lines = _LINE_TERMINATOR_RE.split(text) if "\r" in text else text.split("\n")
+        lines.pop()
+        return lines
+
+    def flush(self) -> list[str]:
+        """Return the trailing line that was never terminated, if there is one"""
+        buffer = self._buffer
+        if not buffer:
+            return []
+
+        text = buffer.decode("utf-8")
+        buffer.clear()
+        return [text]
+
+
+_LINE_TERMINATOR_RE = re.compile(r"\r\n|\r|\n")
+
+
 @runtime_checkable
 class SSEBytesDecoder(Protocol):
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
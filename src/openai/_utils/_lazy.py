@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import sys
+import importlib
+from typing import Any, List, Tuple, Mapping, Callable
+
+
+def lazy_imports(module_name: str, imports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns a module level `__getattr__` & `__dir__` that import the given names on first access.
+
+    `imports` maps each name to the module it's defined in, relative to `module_name`, or
+    to itself for a submodule, e.g. `{"types": ".types"}`. The names should also be imported
+    in an `if TYPE_CHECKING:` block so that type checkers can still see them, e.g.
+
+    ```py
+    if TYPE_CHECKING:
+        from .batch import Batch as Batch
+
+    __getattr__, __dir__ = lazy_imports(__name__, {"Batch": ".batch"})
+    ```
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = imports[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+
+        module = importlib.import_module(submodule, module_name)
+        value = module if submodule == f".{name}" else getattr(module, name)
+        # cache the value so that `__getattr__` isn't called again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*vars(sys.modules[module_name]), *imports})
+
+    return __getattr__, __dir__
@@ -3,9 +3,9 @@ from __future__ import annotations
 import io
 import base64
 import pathlib
-from typing import Any, Mapping, TypeVar, cast
+from typing import Any, Mapping, TypeVar, Iterable, cast
 from datetime import date, datetime
-from typing_extensions import Literal, get_args, override, get_type_hints
+from typing_extensions import Literal, TypeGuard, get_args, override, get_type_hints
 
 import anyio
 import pydantic
@@ -16,6 +16,7 @@ from ._utils import (
     is_iterable,
 )
 from .._files import is_base64_file_input
+from .._types import NotGiven
 from ._typing import (
     is_list_type,
     is_union_type,
@@ -104,7 +105,7 @@ def transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = _transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = _get_transformer(expected_type).transform(data)
     return cast(_T, transformed)
 
 
@@ -142,70 +143,6 @@ def _maybe_transform_key(key: str, type_: type) -> str:
     return key
 
 
-def _transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
-
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
-    """
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json")
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
-
-    return data
-
-
 def _format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
     if isinstance(data, (date, datetime)):
         if format_ == "iso8601":
@@ -233,22 +170,6 @@ def _format_data(data: object, format_: PropertyFormat, format_template: str | N
     return data
 
 
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
-
-
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -281,17 +202,67 @@ async def async_transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = await _async_transform_recursive(data, annotation=cast(type, expected_type))
+    transformer = _get_transformer(expected_type)
+    if transformer.needs_async():
+        transformed = await transformer.async_transform(data)
+    else:
+        # nothing needs to be read from disk so we can avoid the overhead of awaiting every value
+        transformed = transformer.transform(data)
     return cast(_T, transformed)
 
 
-async def _async_transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
+async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
+    if isinstance(data, (date, datetime)):
+        if format_ == "iso8601":
+            return data.isoformat()
+
+        if format_ == "custom" and format_template is not None:
+            return data.strftime(format_template)
+
+    if format_ == "base64" and is_base64_file_input(data):
+        binary: str | bytes | None = None
+
+        if isinstance(data, pathlib.Path):
+            binary = await anyio.Path(data).read_bytes()
+        elif isinstance(data, io.IOBase):
+            binary = data.read()
+
+            if isinstance(binary, str):  # type: ignore[unreachable]
+                binary = binary.encode()
+
+        if not isinstance(binary, bytes):
+            raise RuntimeError(f"Could not read bytes from {data}; Received {type(binary)}")
+
+        return base64.b64encode(binary).decode("ascii")
+
+    return data
+
+
+_transformers: dict[object, _Transformer] = {}
+_typeddict_transformers: dict[type, _TypedDictTransformer] = {}
+
+
+def _get_transformer(expected_type: object) -> _Transformer:
+    """Returns the transformer for the given type, see `transform()`.
+
+    Resolving type hints & `PropertyInfo` metadata is much more expensive than transforming
+    the data itself, so every type is compiled into a tree of transformers the first time it
+    is seen & then cached.
+    """
+    try:
+        return _transformers[expected_type]
+    except KeyError:
+        pass
+    except TypeError:
+        # the type isn't hashable, e.g. `Annotated[]` with unhashable metadata
+        return _compile_transformer(cast(type, expected_type))
+
+    transformer = _transformers[expected_type] = _compile_transformer(cast(type, expected_type))
+    return transformer
+
+
+def _compile_transformer(annotation: type, inner_type: type | None = None) -> _Transformer:
+    """Compile a transformer for data of the given type.
 
     Args:
         annotation: The direct type annotation given to the particular piece of data.
@@ -306,87 +277,290 @@ async def _async_transform_recursive(
     if inner_type is None:
         inner_type = annotation
 
+    fallback = _LeafTransformer(_get_format(annotation))
+
     stripped_type = strip_annotated_type(inner_type)
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return await _async_transform_typeddict(data, stripped_type)
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
+    if is_typeddict(stripped_type):
+        typeddict = _typeddict_transformers.get(stripped_type)
+        if typeddict is None:
+            typeddict = _typeddict_transformers[stripped_type] = _TypedDictTransformer(stripped_type)
+        return _MappingTransformer(typeddict, fallback=fallback)
 
-        inner_type = extract_type_arg(stripped_type, 0)
-        return [await _async_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
+    if is_list_type(stripped_type) or is_iterable_type(stripped_type):
+        items = _compile_transformer(annotation, extract_type_arg(stripped_type, 0))
+        return _IterableTransformer(items, fallback=fallback, list_only=is_list_type(stripped_type))
 
     if is_union_type(stripped_type):
         # For union types we run the transformation against all subtypes to ensure that everything is transformed.
         #
         # TODO: there may be edge cases where the same normalized field name will transform to two different names
         # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = await _async_transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
+        return _UnionTransformer(
+            [_compile_transformer(annotation, subtype) for subtype in get_args(stripped_type)],
+        )
 
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json")
+    return fallback
 
+
+def _get_format(annotation: type) -> PropertyInfo | None:
     annotated_type = _get_annotated_type(annotation)
     if annotated_type is None:
-        return data
+        return None
 
     # ignore the first argument as it is the actual type
     annotations = get_args(annotated_type)[1:]
     for annotation in annotations:
         if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return await _async_format_data(data, annotation.format, annotation.format_template)
+            return annotation
 
-    return data
+    return None
 
 
-async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
-    if isinstance(data, (date, datetime)):
-        if format_ == "iso8601":
-            return data.isoformat()
+# types that are commonly given in request params which can never be pydantic models,
+# `isinstance()` checks against `pydantic.BaseModel` are relatively expensive
+_NON_MODEL_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None), dict, list, NotGiven})
 
-        if format_ == "custom" and format_template is not None:
-            return data.strftime(format_template)
 
-    if format_ == "base64" and is_base64_file_input(data):
-        binary: str | bytes | None = None
+def _is_model(data: object) -> TypeGuard[pydantic.BaseModel]:
+    return type(data) not in _NON_MODEL_TYPES and isinstance(data, pydantic.BaseModel)
 
-        if isinstance(data, pathlib.Path):
-            binary = await anyio.Path(data).read_bytes()
-        elif isinstance(data, io.IOBase):
-            binary = data.read()
 
-            if isinstance(binary, str):  # type: ignore[unreachable]
-                binary = binary.encode()
+class _Transformer:
+    _needs_async: bool | None = None
 
-        if not isinstance(binary, bytes):
-            raise RuntimeError(f"Could not read bytes from {data}; Received {type(binary)}")
+    def transform(self, data: object) -> object:
+        raise NotImplementedError()
 
-        return base64.b64encode(binary).decode("ascii")
+    async def async_transform(self, data: object) -> object:
+        raise NotImplementedError()
 
-    return data
+    def children(self) -> Iterable[_Transformer]:
+        return ()
+
+    def needs_async(self) -> bool:
+        """Whether or not transforming data may require async IO, i.e. reading files for the `base64` format"""
+        if self._needs_async is None:
+            seen: set[int] = set()
+            stack: list[_Transformer] = [self]
+            needs_async = False
+            while stack and not needs_async:
+                transformer = stack.pop()
+                if id(transformer) in seen:
+                    continue
+                seen.add(id(transformer))
+
+                if isinstance(transformer, _LeafTransformer) and transformer.format is not None:
+                    needs_async = transformer.format.format == "base64"
+                stack.extend(transformer.children())
 
+            self._needs_async = needs_async
+        return self._needs_async
+
+
+class _LeafTransformer(_Transformer):
+    def __init__(self, format: PropertyInfo | None) -> None:
+        self.format = format
 
-async def _async_transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = await _async_transform_recursive(value, annotation=type_)
-    return result
+    @override
+    def transform(self, data: object) -> object:
+        if _is_model(data):
+            return model_dump(data, exclude_unset=True, mode="json")
+
+        if self.format is None:
+            return data
+
+        return _format_data(data, self.format.format, self.format.format_template)  # type: ignore[arg-type]
+
+    @override
+    async def async_transform(self, data: object) -> object:
+        if _is_model(data):
+            return model_dump(data, exclude_unset=True, mode="json")
+
+        if self.format is None:
+            return data
+
+        return await _async_format_data(data, self.format.format, self.format.format_template)  # type: ignore[arg-type]
+
+
+class _IterableTransformer(_Transformer):
+    """Transforms `List[T]` & `Iterable[T]` data"""
+
+    def __init__(self, items: _Transformer, *, fallback: _LeafTransformer, list_only: bool) -> None:
+        self.items = items
+        self.fallback = fallback
+        self.list_only = list_only
+
+    def _matches(self, data: object) -> bool:
+        if type(data) is list:
+            return True
+        if self.list_only:
+            return is_list(data)
+        return is_iterable(data) and not isinstance(data, str)
+
+    @override
+    def transform(self, data: object) -> object:
+        if not self._matches(data):
+            return self.fallback.transform(data)
+
+        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+        # intended as an iterable, so we don't transform it.
+        if isinstance(data, dict):
+            return cast(object, data)
+
+        transform = self.items.transform
+        return [transform(item) for item in cast(Iterable[object], data)]
+
+    @override
+    async def async_transform(self, data: object) -> object:
+        if not self._matches(data):
+            return await self.fallback.async_transform(data)
+
+        if isinstance(data, dict):
+            return cast(object, data)
+
+        return [await self.items.async_transform(item) for item in cast(Iterable[object], data)]
+
+    @override
+    def children(self) -> Iterable[_Transformer]:
+        return (self.items, self.fallback)
+
+
+class _UnionTransformer(_Transformer):
+    def __init__(self, variants: list[_Transformer]) -> None:
+        self.variants = variants
+
+    @override
+    def transform(self, data: object) -> object:
+        for variant in self.variants:
+            data = variant.transform(data)
+        return data
+
+    @override
+    async def async_transform(self, data: object) -> object:
+        for variant in self.variants:
+            data = await variant.async_transform(data)
+        return data
+
+    @override
+    def children(self) -> Iterable[_Transformer]:
+        return self.variants
+
+
+class _MappingTransformer(_Transformer):
+    """Transforms data given for a `TypedDict`, falling back to the outer annotation for non-mapping data"""
+
+    def __init__(self, typeddict: _TypedDictTransformer, *, fallback: _LeafTransformer) -> None:
+        self.typeddict = typeddict
+        self.fallback = fallback
+
+    @override
+    def transform(self, data: object) -> object:
+        if type(data) is dict or is_mapping(data):
+            return self.typeddict.transform(data)
+        return self.fallback.transform(data)
+
+    @override
+    async def async_transform(self, data: object) -> object:
+        if type(data) is dict or is_mapping(data):
+            return await self.typeddict.async_transform(data)
+        return await self.fallback.async_transform(data)
+
+    @override
+    def children(self) -> Iterable[_Transformer]:
+        return (self.typeddict, self.fallback)
+
+
+class _TypedDictTransformer(_Transformer):
+    """Transforms the keys & values of a `TypedDict`.
+
+    The fields are compiled lazily, the first time data is transformed, so that recursive
+    `TypedDict`s are supported.
+    """
+
+    # field name -> (transformed key, transformer), the transformer is `None` for fields
+    # without any `PropertyInfo` formats where only pydantic models have to be converted
+    _fields: dict[str, tuple[str, _Transformer | None]] | None
+
+    # whether or not no field is aliased & no field has a transformer
+    _plain: bool
+
+    def __init__(self, expected_type: type) -> None:
+        self.expected_type = expected_type
+        self._fields = None
+        self._plain = False
+
+    def _get_fields(self) -> dict[str, tuple[str, _Transformer | None]]:
+        if self._fields is not None:
+            return self._fields
+
+        # compiling the fields doesn't compile the fields of nested `TypedDict`s, which are only compiled
+        # when they're first used, so a `TypedDict` that references itself never sees its own fields here
+        fields: dict[str, tuple[str, _Transformer | None]] = {}
+        annotations = get_type_hints(self.expected_type, include_extras=True)
+        for key, type_ in annotations.items():
+            transformer: _Transformer | None = _compile_transformer(type_)
+            if isinstance(transformer, _LeafTransformer) and transformer.format is None:
+                transformer = None
+            fields[key] = (_maybe_transform_key(key, type_), transformer)
+
+        # the fields are only published once they're complete, as other threads may be transforming
+        # data for the same `TypedDict`, and `_plain` is read after `_fields` so it's set first
+        self._plain = all(key == name and transformer is None for key, (name, transformer) in fields.items())
+        self._fields = fields
+        return fields
+
+    @override
+    def transform(self, data: object) -> object:
+        fields = self._get_fields()
+        data = cast("Mapping[str, object]", data)
+
+        if self._plain:
+            # fast path, the data is passed through as-is apart from any pydantic models
+            copied = dict(data)
+            for key, value in copied.items():
+                if _is_model(value) and key in fields:
+                    copied[key] = model_dump(value, exclude_unset=True, mode="json")
+            return copied
+
+        result: dict[str, object] = {}
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                # we do not have a type annotation for this field, leave it as is
+                result[key] = value
+                continue
+
+            name, transformer = field
+            if transformer is not None:
+                result[name] = transformer.transform(value)
+            elif _is_model(value):
+                result[name] = model_dump(value, exclude_unset=True, mode="json")
+            else:
+                result[name] = value
+        return result
+
+    @override
+    async def async_transform(self, data: object) -> object:
+        fields = self._get_fields()
+        data = cast("Mapping[str, object]", data)
+
+        result: dict[str, object] = {}
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                # we do not have a type annotation for this field, leave it as is
+                result[key] = value
+                continue
+
+            name, transformer = field
+            if transformer is not None:
+                result[name] = await transformer.async_transform(value)
+            elif _is_model(value):
+                result[name] = model_dump(value, exclude_unset=True, mode="json")
+            else:
+                result[name] = value
+        return result
+
+    @override
+    def children(self) -> Iterable[_Transformer]:
+        return [transformer for _, transformer in self._get_fields().values() if transformer is not None]
@@ -1,2 +1,20 @@
-from ._tools import pydantic_function_tool as pydantic_function_tool
-from ._parsing import ResponseFormatT as ResponseFormatT
+from typing import TYPE_CHECKING
+
+from .._utils._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from ._tools import pydantic_function_tool as pydantic_function_tool
+    from ._parsing import ResponseFormatT as ResponseFormatT
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "pydantic_function_tool": "._tools",
+        "ResponseFormatT": "._parsing",
+    },
+)
+
+__all__ = [
+    "pydantic_function_tool",
+    "ResponseFormatT",
+]
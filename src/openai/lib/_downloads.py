@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+import os
+import re
+import json
+import logging
+import threading
+from typing import Dict, List, Tuple, Union, Callable, Optional, ContextManager, AsyncContextManager
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import anyio
+import httpx
+
+from .._response import StreamedBinaryAPIResponse, AsyncStreamedBinaryAPIResponse
+from .._exceptions import OpenAIError, APIStatusError, APIResponseValidationError
+
+DEFAULT_PART_SIZE = 32 * 1024 * 1024
+
+DEFAULT_CONCURRENCY = 4
+
+# async downloads buffer this much data before it's written to the file from a worker thread
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+FetchRange = Callable[[Dict[str, str]], ContextManager[StreamedBinaryAPIResponse]]
+AsyncFetchRange = Callable[[Dict[str, str]], AsyncContextManager[AsyncStreamedBinaryAPIResponse]]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class DownloadManifest:
+    """Records the parts of a download that have been written to the partial file so that a
+    download that failed can be resumed, without fetching the parts that were already written again.
+
+    A recorded part is only reused if the file is downloaded with the same part size, and the
+    size and validators (`ETag` / `Last-Modified`) of the remote file haven't changed.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, params: Dict[str, object]) -> None:
+        self.path = Path(path)
+        self.params = params
+        self.completed: set[int] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"], **params: object) -> "DownloadManifest":
+        """Loads the manifest at `path`, `completed` is only set if it can be resumed with the given parameters"""
+        manifest = cls(path, params=params)
+
+        try:
+            data = json.loads(manifest.path.read_text())
+        except FileNotFoundError:
+            return manifest
+        except ValueError:
+            log.warning("Ignoring invalid download manifest %s", manifest.path)
+            return manifest
+
+        if not isinstance(data, dict) or data.get("params") != params:
+            log.info("Ignoring download manifest %s as it was created for a different file", manifest.path)
+            return manifest
+
+        manifest.completed = set(data["parts"])
+        return manifest
+
+    def start(self) -> None:
+        """Records a new download, discarding any parts of a previous download"""
+        with self._lock:
+            self.completed = set()
+            self._save()
+
+    def record(self, offset: int) -> None:
+        """Records a part that was written to the partial file successfully"""
+        with self._lock:
+            self.completed.add(offset)
+            self._save()
+
+    def remove(self) -> None:
+        """Removes the manifest once the download has been completed"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _save(self) -> None:
+        data = {"params": self.params, "parts": sorted(self.completed)}
+
+        # write to a temporary file first so that the manifest is never left half written
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, self.path)
+
+
+class _Download:
+    """The state of a ranged download that is shared by the sync and async implementations"""
+
+    def __init__(
+        self, path: Path, *, size: int, part_size: int, validators: Dict[str, str], params: Dict[str, object]
+    ) -> None:
+        self.path = path
+        self.partial = path.with_name(path.name + ".part")
+        self.size = size
+        self.part_size = part_size
+        self.manifest = DownloadManifest.load(
+            path.with_name(path.name + ".part.json"), **params, size=size, part_size=part_size, **validators
+        )
+        self.headers = {"Accept-Encoding": "identity"}
+        if "etag" in validators:
+            # the server responds with the whole file instead if it has changed in the meantime
+            self.headers["If-Range"] = validators["etag"]
+
+    def parts(self) -> List[Tuple[int, int]]:
+        """Returns the offset and size of every part that hasn't been downloaded yet"""
+        return [
+            (offset, min(self.part_size, self.size - offset))
+            for offset in range(0, self.size, self.part_size)
+            if offset not in self.manifest.completed
+        ]
+
+    def open(self) -> int:
+        """Opens the partial file, which is preallocated to the size of the file unless the download is resumed"""
+        resume = bool(self.manifest.completed) and self.partial.exists() and self.partial.stat().st_size == self.size
+        if resume:
+            log.info("Resuming download of %s from %s", self.path, self.manifest.path)
+        else:
+            self.manifest.start()
+
+        fd = os.open(self.partial, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        if not resume:
+            os.ftruncate(fd, self.size)
+        return fd
+
+    def finish(self, fd: int) -> None:
+        """Checks that every part was downloaded and moves the partial file to `path`"""
+        size = os.fstat(fd).st_size
+        os.close(fd)
+
+        missing = [offset for offset, _ in self.parts()]
+        if missing or size != self.size:
+            raise OpenAIError(
+                f"Download of {self.path} is incomplete, expected {self.size} bytes but {len(missing)} parts are missing and the file has {size} bytes"
+            )
+
+        os.replace(self.partial, self.path)
+        self.manifest.remove()
+
+
+def parse_content_range(response: httpx.Response) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Returns the first and last byte, and the total size if known, of a `206 Partial Content` response"""
+    match = _CONTENT_RANGE.fullmatch(response.headers.get("content-range", "").strip())
+    if response.status_code != 206 or match is None:
+        return None
+
+    first, last, size = match.groups()
+    return int(first), int(last), int(size) if size != "*" else None
+
+
+def _check_range(response: httpx.Response, first: int, last: int) -> None:
+    content_range = parse_content_range(response)
+    if content_range is None or content_range[:2] != (first, last):
+        raise APIResponseValidationError(
+            response,
+            None,
+            message=f"Expected bytes {first}-{last} of the file but received {response.headers.get('content-range') or 'the whole file'}",
+        )
+
+
+def _validators(response: httpx.Response) -> Dict[str, str]:
+    return {name: response.headers[name] for name in ("etag", "last-modified") if name in response.headers}
+
+
+def _is_empty_file(err: APIStatusError) -> bool:
+    # there is no first byte to request if the file is empty
+    return err.status_code == 416 and err.response.headers.get("content-range", "").strip() == "bytes */0"
+
+
+_seek_lock = threading.Lock()
+
+
+def _write_at(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            # Windows doesn't have `pwrite()`, so the position of the shared file descriptor is moved instead
+            with _seek_lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def _check_size(path: Path, response: Union[StreamedBinaryAPIResponse, AsyncStreamedBinaryAPIResponse]) -> None:
+    expected = response.headers.get("content-length")
+    size = path.stat().st_size
+    if (
+        expected is not None
+        and response.headers.get("content-encoding", "identity") == "identity"
+        and int(expected) != size
+    ):
+        raise OpenAIError(f"Download of {path} is incomplete, expected {expected} bytes but received {size} bytes")
+
+
+def download_file(
+    fetch: FetchRange,
+    path: Path,
+    *,
+    part_size: int,
+    concurrency: int,
+    max_retries: int,
+    params: Dict[str, object],
+) -> Path:
+    """Downloads a file to `path` with `Range` requests for up to `concurrency` parts at once.
+
+    The parts are written to a preallocated `{path}.part` file and recorded in a `{path}.part.json`
+    manifest, so that if the download fails it's resumed by downloading the same file to the same
+    path again. A part that fails while its content is being read is requested again from where
+    it stopped, up to `max_retries` times.
+
+    If the server doesn't support `Range` requests then the file is downloaded with a single request.
+    """
+    if part_size < 1:
+        raise ValueError("The `part_size` argument must be greater than 0")
+    if concurrency < 1:
+        raise ValueError("The `concurrency` argument must be greater than 0")
+
+    size: Optional[int]
+    try:
+        with fetch({"Range": "bytes=0-0", "Accept-Encoding": "identity"}) as response:
+            if response.http_response.status_code != 206:
+                log.info("The server doesn't support ranged downloads, downloading %s with a single request", path)
+                return _download_whole(response, path)
+
+            content_range = parse_content_range(response.http_response)
+            size = content_range[2] if content_range is not None else None
+            validators = _validators(response.http_response)
+    except APIStatusError as err:
+        if not _is_empty_file(err):
+            raise
+        size, validators = 0, _validators(err.response)
+
+    if size is None:
+        # the body of the probe is only the first byte, so the whole file is requested again
+        log.info("The server didn't report the size of %s, downloading it with a single request", path)
+        with fetch({"Accept-Encoding": "identity"}) as response:
+            return _download_whole(response, path)
+
+    download = _Download(path, size=size, part_size=part_size, validators=validators, params=params)
+    fd = download.open()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="openai-download") as executor:
+            futures: Dict[Future[None], int] = {
+                executor.submit(_download_part, fetch, download, fd, offset, length, max_retries): offset
+                for offset, length in download.parts()
+            }
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    except BaseException:
+        os.close(fd)
+        raise
+
+    download.finish(fd)
+    return path
+
+
+def _download_whole(response: StreamedBinaryAPIResponse, path: Path) -> Path:
+    partial = path.with_name(path.name + ".part")
+    with open(partial, mode="wb") as f:
+        for data in response.iter_bytes():
+            f.write(data)
+
+    _check_size(partial, response)
+    os.replace(partial, path)
+    return path
+
+
+def _download_part(fetch: FetchRange, download: _Download, fd: int, offset: int, length: int, max_retries: int) -> None:
+    position, last = offset, offset + length - 1
+    retries = 0
+
+    while True:
+        try:
+            with fetch({**download.headers, "Range": f"bytes={position}-{last}"}) as response:
+                _check_range(response.http_response, position, last)
+                for data in response.iter_bytes():
+                    data = data[: last + 1 - position]
+                    _write_at(fd, data, position)
+                    position += len(data)
+        except httpx.TransportError:
+            if retries >= max_retries:
+                raise
+            retries += 1
+            log.info(
+                "Download of %s was interrupted, requesting the rest of the part at %s again", download.path, offset
+            )
+            continue
+
+        if position <= last:
+            raise OpenAIError(
+                f"Expected bytes {offset}-{last} of {download.path} but the response ended at byte {position}"
+            )
+
+        download.manifest.record(offset)
+        return
+
+
+async def async_download_file(
+    fetch: AsyncFetchRange,
+    path: Path,
+    *,
+    part_size: int,
+    concurrency: int,
+    max_retries: int,
+    params: Dict[str, object],
+) -> Path:
+    """Downloads a file to `path` with `Range` requests from a task group with at most `concurrency` parts in flight.
+
+    The file is written from worker threads so that the event loop isn't blocked while writing
+    it, see `download_file()` for details.
+    """
+    if part_size < 1:
+        raise ValueError("The `part_size` argument must be greater than 0")
+    if concurrency < 1:
+        raise ValueError("The `concurrency` argument must be greater than 0")
+
+    size: Optional[int]
+    try:
+        async with fetch({"Range": "bytes=0-0", "Accept-Encoding": "identity"}) as response:
+            if response.http_response.status_code != 206:
+                log.info("The server doesn't support ranged downloads, downloading %s with a single request", path)
+                return await _async_download_whole(response, path)
+
+            content_range = parse_content_range(response.http_response)
+            size = content_range[2] if content_range is not None else None
+            validators = _validators(response.http_response)
+    except APIStatusError as err:
+        if not _is_empty_file(err):
+            raise
+        size, validators = 0, _validators(err.response)
+
+    if size is None:
+        # the body of the probe is only the first byte, so the whole file is requested again
+        log.info("The server didn't report the size of %s, downloading it with a single request", path)
+        async with fetch({"Accept-Encoding": "identity"}) as response:
+            return await _async_download_whole(response, path)
+
+    download = _Download(path, size=size, part_size=part_size, validators=validators, params=params)
+    fd = await anyio.to_thread.run_sync(download.open)
+
+    errors: List[Tuple[int, BaseException]] = []
+    limiter = anyio.Semaphore(concurrency)
+
+    try:
+        async with anyio.create_task_group() as tg:
+
+            async def run_download(offset: int, length: int) -> None:
+                async with limiter:
+                    try:
+                        await _async_download_part(fetch, download, fd, offset, length, max_retries)
+                    except Exception as err:
+                        errors.append((offset, err))
+                        tg.cancel_scope.cancel()
+
+            for offset, length in download.parts():
+                tg.start_soon(run_download, offset, length)
+    except BaseException:
+        os.close(fd)
+        raise
+
+    if errors:
+        os.close(fd)
+        raise min(errors, key=lambda e: e[0])[1]
+
+    await anyio.to_thread.run_sync(download.finish, fd)
+    return path
+
+
+async def _async_download_whole(response: AsyncStreamedBinaryAPIResponse, path: Path) -> Path:
+    partial = path.with_name(path.name + ".part")
+    await response.stream_to_file(partial)
+
+    await anyio.to_thread.run_sync(_check_size, partial, response)
+    os.replace(partial, path)
+    return path
+
+
+async def _async_download_part(
+    fetch: AsyncFetchRange, download: _Download, fd: int, offset: int, length: int, max_retries: int
+) -> None:
+    position, last = offset, offset + length - 1
+    retries = 0
+
+    while True:
+        buffer = bytearray()
+        try:
+            async with fetch({**download.headers, "Range": f"bytes={position}-{last}"}) as response:
+                _check_range(response.http_response, position, last)
+                async for data in response.iter_bytes():
+                    buffer += data[: last + 1 - position - len(buffer)]
+                    if len(buffer) >= _WRITE_BUFFER_SIZE:
+                        await anyio.to_thread.run_sync(_write_at, fd, bytes(buffer), position)
+                        position += len(buffer)
+                        buffer.clear()
+        except httpx.TransportError:
+            if retries >= max_retries:
+                raise
+            retries += 1
+            log.info(
+                "Download of %s was interrupted, requesting the rest of the part at %s again", download.path, offset
+            )
+            continue
+        finally:
+            # the data that was received before an error is kept, so it isn't requested again
+            if buffer:
+                await anyio.to_thread.run_sync(_write_at, fd, bytes(buffer), position)
+                position += len(buffer)
+
+        if position <= last:
+            raise OpenAIError(
+                f"Expected bytes {offset}-{last} of {download.path} but the response ended at byte {position}"
+            )
+
+        await anyio.to_thread.run_sync(download.manifest.record, offset)
+        return
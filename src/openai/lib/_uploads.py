@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import io
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import IO, Any, Dict, List, Tuple, Union, Callable, Optional, Awaitable, cast
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import anyio
+
+from .._types import FileContent
+from ..types.upload import Upload
+
+FileSource = Union[Path, memoryview]
+
+_MD5_BLOCK_SIZE = 1024 * 1024
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class FilePart(io.RawIOBase):
+    """A read-only view of a single part of a file.
+
+    Parts of files on disk are read on demand through their own file handle and parts of
+    in-memory files are read from the original buffer, so parts never have to be copied into
+    memory before they're uploaded and multiple parts can be read from different threads.
+
+    The view is seekable so that the request can be sent again if it is retried, and the
+    MD5 checksum of the part is computed as it is read.
+    """
+
+    def __init__(self, source: FileSource, *, offset: int, length: int) -> None:
+        super().__init__()
+        self.source = source
+        self.offset = offset
+        self.length = length
+        self._position = 0
+        self._file: Optional[io.FileIO] = None
+        self._digest = hashlib.md5()
+        self._hashed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.length + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), self.length - self._position)
+        if size <= 0:
+            return 0
+
+        start = self.offset + self._position
+        if isinstance(self.source, memoryview):
+            view[:size] = self.source[start : start + size]
+        else:
+            if self._file is None:
+                self._file = io.FileIO(self.source)
+
+            self._file.seek(start)
+            size = self._file.readinto(view[:size]) or 0
+
+        if self._position == self._hashed:
+            self._digest.update(view[:size])
+            self._hashed += size
+
+        self._position += size
+        return size
+
+    def md5(self) -> str:
+        """The MD5 checksum of the part, any data that hasn't been read yet is read first"""
+        if self._hashed < self.length:
+            position = self._position
+            self.seek(self._hashed)
+            while self.read(_MD5_BLOCK_SIZE):
+                pass
+            self.seek(position)
+
+        return self._digest.hexdigest()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+class UploadManifest:
+    """Records the parts of an upload that have been uploaded to a JSON file so that an upload
+    that failed can be resumed, without sending the parts that were already uploaded again.
+
+    The manifest records the offset, size, MD5 checksum and ID of every uploaded part. A
+    recorded part is only reused if the same part of the local file still has the same
+    checksum, and the whole upload is started again if the file, the part size or any of the
+    upload parameters changed, or if the upload has expired.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], *, params: Dict[str, object]) -> None:
+        self.path = Path(path)
+        self.params = params
+        self.upload_id: Optional[str] = None
+        self._expires_at = 0
+        self._parts: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"], **params: object) -> "UploadManifest":
+        """Loads the manifest at `path`, `upload_id` is only set if it can be resumed with the given parameters"""
+        manifest = cls(path, params=params)
+
+        try:
+            data = json.loads(manifest.path.read_text())
+        except FileNotFoundError:
+            return manifest
+        except ValueError:
+            log.warning("Ignoring invalid upload manifest %s", manifest.path)
+            return manifest
+
+        if not isinstance(data, dict) or data.get("params") != params:
+            log.info("Ignoring upload manifest %s as it was created for a different file", manifest.path)
+            return manifest
+
+        if data["expires_at"] <= time.time():
+            log.info("Ignoring upload manifest %s as upload %s has expired", manifest.path, data["upload_id"])
+            return manifest
+
+        manifest.upload_id = data["upload_id"]
+        manifest._expires_at = data["expires_at"]
+        manifest._parts = {part["offset"]: part for part in data["parts"]}
+        return manifest
+
+    def start(self, upload: Upload) -> None:
+        """Records a new upload, discarding any parts of a previous upload"""
+        with self._lock:
+            self.upload_id = upload.id
+            self._expires_at = upload.expires_at
+            self._parts = {}
+            self._save()
+
+    def completed_part(self, part: FilePart) -> Optional[str]:
+        """Returns the ID of the given part if it was already uploaded"""
+        recorded = self._parts.get(part.offset)
+        if recorded is None or recorded["size"] != part.length or recorded["md5"] != part.md5():
+            return None
+        return cast(str, recorded["id"])
+
+    def record(self, part: FilePart, part_id: str) -> None:
+        """Records a part that was uploaded successfully"""
+        md5 = part.md5()
+        with self._lock:
+            self._parts[part.offset] = {"offset": part.offset, "size": part.length, "md5": md5, "id": part_id}
+            self._save()
+
+    def remove(self) -> None:
+        """Removes the manifest once the upload has been completed"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _save(self) -> None:
+        data = {
+            "upload_id": self.upload_id,
+            "expires_at": self._expires_at,
+            "params": self.params,
+            "parts": sorted(self._parts.values(), key=lambda part: cast(int, part["offset"])),
+        }
+
+        # write to a temporary file first so that the manifest is never left half written
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, self.path)
+
+
+def split_file(source: FileSource, *, size: int, part_size: int) -> List[FilePart]:
+    """Splits the file into parts of `part_size` bytes, the last part may be smaller"""
+    if part_size < 1:
+        raise ValueError("The `part_size` argument must be greater than 0")
+
+    return [
+        FilePart(source, offset=offset, length=min(part_size, size - offset)) for offset in range(0, size, part_size)
+    ]
+
+
+def compute_md5(source: FileSource) -> str:
+    """Computes the MD5 checksum of the file in a single streaming pass"""
+    if isinstance(source, memoryview):
+        return hashlib.md5(source).hexdigest()
+
+    digest = hashlib.md5()
+    with io.FileIO(source) as f:
+        while True:
+            block = f.read(_MD5_BLOCK_SIZE)
+            if not block:
+                break
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def upload_parts(
+    upload_part: Callable[[FileContent], str],
+    parts: List[FilePart],
+    *,
+    max_concurrency: int,
+    md5_source: Optional[FileSource] = None,
+    manifest: Optional[UploadManifest] = None,
+) -> Tuple[List[str], Optional[str]]:
+    """Uploads the given parts using a pool of `max_concurrency` threads.
+
+    Returns the part IDs in the same order as the given parts, and the MD5 checksum of the
+    `md5_source` file if given, which is computed in a separate thread while the parts are uploaded.
+
+    If any part fails to upload then the parts that haven't been started are cancelled and the
+    error is raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("The `max_concurrency` argument must be greater than 0")
+
+    part_ids: List[str] = [""] * len(parts)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency + (1 if md5_source is not None else 0)) as executor:
+        checksum = executor.submit(compute_md5, md5_source) if md5_source is not None else None
+
+        futures: dict[Future[str], int] = {
+            executor.submit(_upload_part, upload_part, part, manifest): index for index, part in enumerate(parts)
+        }
+        try:
+            for future in as_completed(futures):
+                part_ids[futures[future]] = future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        md5 = checksum.result() if checksum is not None else None
+
+    return part_ids, md5
+
+
+async def async_upload_parts(
+    upload_part: Callable[[FileContent], Awaitable[str]],
+    parts: List[FilePart],
+    *,
+    max_concurrency: int,
+    md5_source: Optional[FileSource] = None,
+    manifest: Optional[UploadManifest] = None,
+) -> Tuple[List[str], Optional[str]]:
+    """Uploads the given parts from a task group with at most `max_concurrency` parts in flight.
+
+    Parts are streamed like the sync `upload_parts()`, so at most a single chunk of each part is
+    held in memory instead of the whole part. httpx reads the file fields of multipart requests
+    synchronously, so the chunks of parts of files on disk are read on the event loop, as they
+    are for any file that's given to the async client.
+
+    Returns the part IDs in the same order as the given parts, and the MD5 checksum of the
+    `md5_source` file if given, which is computed in a worker thread while the parts are uploaded.
+
+    If any part fails to upload then the remaining uploads are cancelled and the error is raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("The `max_concurrency` argument must be greater than 0")
+
+    part_ids: List[str] = [""] * len(parts)
+    md5: Optional[str] = None
+    errors: List[Tuple[int, BaseException]] = []
+    limiter = anyio.Semaphore(max_concurrency)
+
+    async with anyio.create_task_group() as tg:
+
+        async def run_upload(index: int, part: FilePart) -> None:
+            async with limiter:
+                try:
+                    if manifest is not None:
+                        part_id = await anyio.to_thread.run_sync(manifest.completed_part, part)
+                        if part_id is not None:
+                            part_ids[index] = part_id
+                            return
+
+                    part_ids[index] = await upload_part(cast("IO[bytes]", part))
+
+                    if manifest is not None:
+                        await anyio.to_thread.run_sync(manifest.record, part, part_ids[index])
+                except Exception as err:
+                    errors.append((index, err))
+                    tg.cancel_scope.cancel()
+                finally:
+                    part.close()
+
+        async def run_md5(source: FileSource) -> None:
+            nonlocal md5
+
+            try:
+                md5 = await anyio.to_thread.run_sync(compute_md5, source)
+            except Exception as err:
+                errors.append((-1, err))
+                tg.cancel_scope.cancel()
+
+        if md5_source is not None:
+            tg.start_soon(run_md5, md5_source)
+
+        for index, part in enumerate(parts):
+            tg.start_soon(run_upload, index, part)
+
+    if errors:
+        raise min(errors, key=lambda e: e[0])[1]
+
+    return part_ids, md5
+
+
+def _upload_part(upload_part: Callable[[FileContent], str], part: FilePart, manifest: Optional[UploadManifest]) -> str:
+    try:
+        if manifest is not None:
+            part_id = manifest.completed_part(part)
+            if part_id is not None:
+                return part_id
+
+        # `FilePart` implements all of the `IO[bytes]` methods that are used to send files
+        part_id = upload_part(cast("IO[bytes]", part))
+
+        if manifest is not None:
+            manifest.record(part, part_id)
+
+        return part_id
+    finally:
+        part.close()
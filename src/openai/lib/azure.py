@@ -12,9 +12,12 @@ from .._utils import is_given, is_mapping
 from .._client import OpenAI, AsyncOpenAI
 from .._compat import model_copy
 from .._models import FinalRequestOptions
+from .._hedging import HedgingPolicy
+from .._retries import RetryScheduler
 from .._streaming import Stream, AsyncStream
 from .._exceptions import OpenAIError
 from .._base_client import DEFAULT_MAX_RETRIES, BaseClient
+from .._rate_limiter import RateLimiter
 
 _deployments_endpoints = set(
     [
@@ -81,6 +84,10 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -99,6 +106,10 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -117,6 +128,10 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -137,6 +152,10 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new synchronous azure openai client instance.
@@ -214,6 +233,10 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -233,7 +256,11 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedging_policy: HedgingPolicy | None | NotGiven = NOT_GIVEN,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        retry_scheduler: RetryScheduler | None | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -250,7 +277,11 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             max_retries=max_retries,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
             default_query=default_query,
@@ -319,6 +350,10 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -338,6 +373,10 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -357,6 +396,10 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -377,6 +420,10 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_scheduler: RetryScheduler | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new asynchronous azure openai client instance.
@@ -454,6 +501,10 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -473,7 +524,11 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
+        hedging_policy: HedgingPolicy | None | NotGiven = NOT_GIVEN,
+        rate_limiter: RateLimiter | None | NotGiven = NOT_GIVEN,
+        retry_scheduler: RetryScheduler | None | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
@@ -490,7 +545,11 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             max_retries=max_retries,
+            hedging_policy=hedging_policy,
+            rate_limiter=rate_limiter,
+            retry_scheduler=retry_scheduler,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
             default_query=default_query,
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import json
+import tempfile
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    AsyncIterable,
+    AsyncIterator,
+    cast,
+)
+from pathlib import Path
+from typing_extensions import Literal, Required, TypedDict
+
+import anyio
+
+from .._models import BaseModel, construct_type
+from ..types.batch import Batch
+
+if TYPE_CHECKING:
+    from ..resources.files import Files, AsyncFiles
+
+__all__ = [
+    "BatchRequest",
+    "BatchResponse",
+    "BatchResultError",
+    "BatchResult",
+    "BatchResults",
+    "AsyncBatchResults",
+]
+
+# requests are written to the input file in blocks of roughly this size from async code
+_WRITE_BLOCK_SIZE = 1024 * 1024
+
+
+class BatchRequest(TypedDict, total=False):
+    custom_id: Required[str]
+    """A unique ID that is used to match the result to the request."""
+
+    body: Required[Dict[str, object]]
+    """The request body, e.g. the parameters for `client.chat.completions.create()`."""
+
+    method: Literal["POST"]
+    """The HTTP method of the request, defaults to `POST`."""
+
+    url: str
+    """The endpoint of the request, defaults to the endpoint of the batch."""
+
+
+class BatchResponse(BaseModel):
+    status_code: int
+    """The HTTP status code of the response."""
+
+    request_id: str
+    """A unique identifier for the API request."""
+
+    body: Dict[str, object]
+    """The JSON body of the response."""
+
+
+class BatchResultError(BaseModel):
+    code: Optional[str] = None
+    """A machine-readable error code."""
+
+    message: Optional[str] = None
+    """A human-readable error message."""
+
+
+class BatchResult(BaseModel):
+    custom_id: str
+    """The `custom_id` of the request that this is the result of."""
+
+    id: Optional[str] = None
+
+    response: Optional[BatchResponse] = None
+    """The response to the request, which may be an error response."""
+
+    error: Optional[BatchResultError] = None
+    """The reason that the request failed without a response."""
+
+
+class BatchResults:
+    """The results of a batch that reached a terminal state.
+
+    Iterating over this object yields a `BatchResult` for every request that is in the output or
+    error file of the batch, the files are streamed so the results are never all held in memory.
+    Results are not necessarily in the same order as the requests, use `custom_id` to match them.
+    """
+
+    batch: Batch
+
+    def __init__(self, files: Files, batch: Batch) -> None:
+        self.batch = batch
+        self._files = files
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        for file_id in (self.batch.output_file_id, self.batch.error_file_id):
+            if file_id is None:
+                continue
+
+            with self._files.with_streaming_response.content(file_id) as response:
+                for line in response.iter_lines():
+                    if line:
+                        yield _parse_result(line)
+
+
+class AsyncBatchResults:
+    """The results of a batch that reached a terminal state.
+
+    Iterating over this object yields a `BatchResult` for every request that is in the output or
+    error file of the batch, the files are streamed so the results are never all held in memory.
+    Results are not necessarily in the same order as the requests, use `custom_id` to match them.
+    """
+
+    batch: Batch
+
+    def __init__(self, files: AsyncFiles, batch: Batch) -> None:
+        self.batch = batch
+        self._files = files
+
+    async def __aiter__(self) -> AsyncIterator[BatchResult]:
+        for file_id in (self.batch.output_file_id, self.batch.error_file_id):
+            if file_id is None:
+                continue
+
+            async with self._files.with_streaming_response.content(file_id) as response:
+                async for line in response.iter_lines():
+                    if line:
+                        yield _parse_result(line)
+
+
+def _parse_result(line: str) -> BatchResult:
+    return cast(BatchResult, construct_type(type_=BatchResult, value=json.loads(line)))
+
+
+def _encode_request(request: BatchRequest, *, endpoint: str) -> bytes:
+    line = {
+        "custom_id": request["custom_id"],
+        "method": request.get("method", "POST"),
+        "url": request.get("url", endpoint),
+        "body": request["body"],
+    }
+    return json.dumps(line, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def create_input_file() -> Path:
+    """Creates an empty temporary file that the JSONL input of a batch can be written to"""
+    fd, path = tempfile.mkstemp(prefix="batch_input_", suffix=".jsonl")
+    os.close(fd)
+    return Path(path)
+
+
+def write_requests(requests: Iterable[BatchRequest], path: Path, *, endpoint: str) -> int:
+    """Writes the requests to `path` one line at a time, returns the number of requests that were written"""
+    count = 0
+    with path.open("wb") as f:
+        for request in requests:
+            f.write(_encode_request(request, endpoint=endpoint))
+            count += 1
+
+    if not count:
+        raise ValueError("Expected at least one request in the batch")
+
+    return count
+
+
+async def async_write_requests(
+    requests: Union[Iterable[BatchRequest], AsyncIterable[BatchRequest]], path: Path, *, endpoint: str
+) -> int:
+    """Writes the requests to `path` without blocking the event loop, returns the number of requests that were written"""
+    if not isinstance(requests, AsyncIterable):
+        return await anyio.to_thread.run_sync(lambda: write_requests(requests, path, endpoint=endpoint))
+
+    count = 0
+    block: List[bytes] = []
+    block_size = 0
+
+    f: IO[bytes] = await anyio.to_thread.run_sync(path.open, "wb")
+    try:
+        async for request in requests:
+            line = _encode_request(request, endpoint=endpoint)
+            block.append(line)
+            block_size += len(line)
+            count += 1
+
+            if block_size >= _WRITE_BLOCK_SIZE:
+                await anyio.to_thread.run_sync(f.writelines, block)
+                block = []
+                block_size = 0
+
+        if block:
+            await anyio.to_thread.run_sync(f.writelines, block)
+    finally:
+        await anyio.to_thread.run_sync(f.close)
+
+    if not count:
+        raise ValueError("Expected at least one request in the batch")
+
+    return count
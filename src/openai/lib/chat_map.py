@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+from types import TracebackType
+from typing import (
+    Dict,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Awaitable,
+    Generator,
+    AsyncIterable,
+    AsyncIterator,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import anyio
+import anyio.abc
+from anyio.streams.memory import MemoryObjectSendStream, MemoryObjectReceiveStream
+
+from ..types.chat.chat_completion import ChatCompletion
+from ..types.chat.completion_create_params import CompletionCreateParamsNonStreaming
+
+__all__ = [
+    "ChatCompletionMapResult",
+    "ChatCompletionMap",
+    "AsyncChatCompletionMap",
+    "ChatCompletionMapManager",
+    "AsyncChatCompletionMapManager",
+]
+
+DEFAULT_CONCURRENCY = 8
+
+
+class ChatCompletionMapResult:
+    """The result of a single request that was made by `.map()`"""
+
+    index: int
+    """The position of the request in the requests that were given to `.map()`"""
+
+    request: CompletionCreateParamsNonStreaming
+    """The parameters of the request"""
+
+    completion: Optional[ChatCompletion]
+    """The chat completion, if the request succeeded"""
+
+    error: Optional[Exception]
+    """The error that the request failed with, after it was retried"""
+
+    def __init__(
+        self,
+        index: int,
+        request: CompletionCreateParamsNonStreaming,
+        completion: Optional[ChatCompletion] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.index = index
+        self.request = request
+        self.completion = completion
+        self.error = error
+
+    def result(self) -> ChatCompletion:
+        """Returns the chat completion, or raises the error that the request failed with"""
+        if self.error is not None:
+            raise self.error
+        assert self.completion is not None
+        return self.completion
+
+    def __repr__(self) -> str:
+        return f"ChatCompletionMapResult(index={self.index}, completion={self.completion!r}, error={self.error!r})"
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("The `concurrency` argument must be greater than 0")
+
+
+class ChatCompletionMap:
+    """Iterator over the results of `.map()`"""
+
+    def __init__(
+        self,
+        create: Callable[..., ChatCompletion],
+        requests: Iterable[CompletionCreateParamsNonStreaming],
+        *,
+        concurrency: int,
+        ordered: bool,
+    ) -> None:
+        self._iterator = self._map(create, requests, concurrency=concurrency, ordered=ordered)
+
+    def __iter__(self) -> Iterator[ChatCompletionMapResult]:
+        return self._iterator
+
+    def __next__(self) -> ChatCompletionMapResult:
+        return next(self._iterator)
+
+    def close(self) -> None:
+        """Cancels the requests that haven't been sent yet and waits for the requests that are in flight"""
+        self._iterator.close()
+
+    def _map(
+        self,
+        create: Callable[..., ChatCompletion],
+        requests: Iterable[CompletionCreateParamsNonStreaming],
+        *,
+        concurrency: int,
+        ordered: bool,
+    ) -> Generator[ChatCompletionMapResult, None, None]:
+        requests_iter = enumerate(requests)
+        in_flight: Dict[Future[ChatCompletionMapResult], int] = {}
+        # results that are waiting for an earlier result in ordered mode
+        finished: Dict[int, ChatCompletionMapResult] = {}
+        next_index = 0
+        exhausted = False
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="openai-map")
+        try:
+            while True:
+                # requests are only taken from the input when there's room for them, so that the
+                # input can be a lazy generator over a large dataset
+                while (
+                    not exhausted and len(in_flight) < concurrency and len(in_flight) + len(finished) < 2 * concurrency
+                ):
+                    item = next(requests_iter, None)
+                    if item is None:
+                        exhausted = True
+                        break
+
+                    index, request = item
+                    in_flight[executor.submit(_create, create, index, request)] = index
+
+                if not in_flight:
+                    return
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=in_flight.__getitem__):
+                    del in_flight[future]
+                    result = future.result()
+                    if ordered:
+                        finished[result.index] = result
+                    else:
+                        yield result
+
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+class ChatCompletionMapManager:
+    """Context manager over the `ChatCompletionMap` that is returned by `.map()`.
+
+    The requests are sent from a pool of `concurrency` threads, and the context manager
+    ensures that the pool is shut down if the results aren't read to completion.
+
+    Usage:
+    ```py
+    with client.chat.completions.map(requests, concurrency=16) as results:
+        for result in results:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., ChatCompletion],
+        requests: Iterable[CompletionCreateParamsNonStreaming],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> None:
+        _check_concurrency(concurrency)
+        self.__map: ChatCompletionMap | None = None
+        self.__create = create
+        self.__requests = requests
+        self.__concurrency = concurrency
+        self.__ordered = ordered
+
+    def __enter__(self) -> ChatCompletionMap:
+        self.__map = ChatCompletionMap(
+            self.__create, self.__requests, concurrency=self.__concurrency, ordered=self.__ordered
+        )
+        return self.__map
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__map is not None:
+            self.__map.close()
+
+
+def _create(
+    create: Callable[..., ChatCompletion], index: int, request: CompletionCreateParamsNonStreaming
+) -> ChatCompletionMapResult:
+    try:
+        return ChatCompletionMapResult(index, request, completion=create(**request))
+    except Exception as err:
+        return ChatCompletionMapResult(index, request, error=err)
+
+
+class AsyncChatCompletionMap:
+    """Async iterator over the results of `.map()`"""
+
+    def __init__(self, receive: MemoryObjectReceiveStream[ChatCompletionMapResult]) -> None:
+        self._receive = receive
+
+    def __aiter__(self) -> AsyncIterator[ChatCompletionMapResult]:
+        return self
+
+    async def __anext__(self) -> ChatCompletionMapResult:
+        try:
+            return await self._receive.receive()
+        except anyio.EndOfStream:
+            raise StopAsyncIteration from None
+
+
+class AsyncChatCompletionMapManager:
+    """Async context manager over the `AsyncChatCompletionMap` that is returned by `.map()`.
+
+    The requests are sent from a task group that is owned by the context manager, with at
+    most `concurrency` requests in flight, and any requests that are still in flight are
+    cancelled if the results aren't read to completion.
+
+    Usage:
+    ```py
+    async with client.chat.completions.map(requests, concurrency=16) as results:
+        async for result in results:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., Awaitable[ChatCompletion]],
+        requests: Union[
+            Iterable[CompletionCreateParamsNonStreaming], AsyncIterable[CompletionCreateParamsNonStreaming]
+        ],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> None:
+        _check_concurrency(concurrency)
+        self.__task_group: anyio.abc.TaskGroup | None = None
+        self.__create = create
+        self.__requests = requests
+        self.__concurrency = concurrency
+        self.__ordered = ordered
+
+    async def __aenter__(self) -> AsyncChatCompletionMap:
+        send, receive = anyio.create_memory_object_stream[ChatCompletionMapResult]()
+
+        self.__task_group = anyio.create_task_group()
+        await self.__task_group.__aenter__()
+        self.__task_group.start_soon(self.__run, send)
+
+        return AsyncChatCompletionMap(receive)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Optional[bool]:
+        if self.__task_group is None:
+            return None
+
+        # stop sending requests if the results weren't read to completion
+        self.__task_group.cancel_scope.cancel()
+        return await self.__task_group.__aexit__(exc_type, exc, exc_tb)
+
+    async def __run(self, send: MemoryObjectSendStream[ChatCompletionMapResult]) -> None:
+        in_flight = anyio.Semaphore(self.__concurrency)
+        # bounds the results that are waiting for an earlier result in ordered mode, or for the consumer
+        outstanding = anyio.Semaphore(2 * self.__concurrency)
+        finished: Dict[int, ChatCompletionMapResult] = {}
+        next_index = 0
+
+        async def deliver(result: ChatCompletionMapResult) -> None:
+            nonlocal next_index
+
+            if not self.__ordered:
+                await send.send(result)
+                outstanding.release()
+                return
+
+            finished[result.index] = result
+            # only the task that completes the next result in order sends the results, any
+            # other task returns straight away
+            while result.index == next_index and next_index in finished:
+                await send.send(finished.pop(next_index))
+                next_index += 1
+                outstanding.release()
+                result = finished.get(next_index, result)
+
+        async def run(index: int, request: CompletionCreateParamsNonStreaming) -> None:
+            try:
+                result = ChatCompletionMapResult(index, request, completion=await self.__create(**request))
+            except Exception as err:
+                result = ChatCompletionMapResult(index, request, error=err)
+            finally:
+                in_flight.release()
+
+            await deliver(result)
+
+        async with send:
+            async with anyio.create_task_group() as tg:
+                if isinstance(self.__requests, AsyncIterable):
+                    async_requests = self.__requests.__aiter__()
+                    requests = None
+                else:
+                    async_requests = None
+                    requests = iter(self.__requests)
+
+                index = 0
+                while True:
+                    # requests are only taken from the input when there's room for them, so that
+                    # the input can be a lazy generator over a large dataset
+                    await outstanding.acquire()
+                    await in_flight.acquire()
+
+                    try:
+                        if async_requests is not None:
+                            request = await async_requests.__anext__()
+                        else:
+                            assert requests is not None
+                            request = next(requests)
+                    except (StopIteration, StopAsyncIteration):
+                        break
+
+                    tg.start_soon(run, index, request)
+                    index += 1
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Union, Mapping, Iterable, Optional, Sequence
+from collections import OrderedDict
+
+__all__ = [
+    "EmbeddingCache",
+    "AsyncEmbeddingCache",
+    "LRUEmbeddingCache",
+    "SQLiteEmbeddingCache",
+    "embedding_cache_key",
+]
+
+# SQLite limits the number of parameters in a single statement
+_SQLITE_BATCH_SIZE = 500
+
+
+def embedding_cache_key(model: str, dimensions: Optional[int], input: Union[str, Iterable[int]]) -> str:
+    """Returns the key of the embedding of a single input, a hash of the model, dimensions and input"""
+    value = input if isinstance(input, str) else list(input)
+    payload = json.dumps([model, dimensions, value], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache(ABC):
+    """A cache of embeddings, stored as the raw bytes of their float32 vectors.
+
+    Implement this class to store embeddings in a different backend, or `AsyncEmbeddingCache`
+    if the backend has an async API.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Returns the embedding of each key, or `None` if it isn't cached"""
+
+    @abstractmethod
+    def set_many(self, items: Mapping[str, bytes]) -> None:
+        """Stores the given embeddings"""
+
+
+class AsyncEmbeddingCache(ABC):
+    """A cache of embeddings with an async API, stored as the raw bytes of their float32 vectors."""
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Returns the embedding of each key, or `None` if it isn't cached"""
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, bytes]) -> None:
+        """Stores the given embeddings"""
+
+
+class LRUEmbeddingCache(EmbeddingCache):
+    """An in-process cache that keeps the `max_entries` most recently used embeddings."""
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        if max_entries < 1:
+            raise ValueError("The `max_entries` argument must be greater than 0")
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        values: List[Optional[bytes]] = []
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                values.append(value)
+        return values
+
+    def set_many(self, items: Mapping[str, bytes]) -> None:
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """A persistent cache that stores embeddings in a SQLite database at `path`.
+
+    The database can be shared between processes, and the connection between threads.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                batch = keys[start : start + _SQLITE_BATCH_SIZE]
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", list(batch)
+                )
+                found.update(rows)
+
+        return [found.get(key) for key in keys]
+
+    def set_many(self, items: Mapping[str, bytes]) -> None:
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", list(items.items())
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
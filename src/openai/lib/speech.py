@@ -0,0 +1,735 @@
+from __future__ import annotations
+
+import os
+import time
+import queue
+import asyncio
+import inspect
+import logging
+import threading
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import (
+    IO,
+    Deque,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Awaitable,
+    Generator,
+    AsyncIterable,
+    AsyncIterator,
+    AsyncGenerator,
+)
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import anyio.abc
+import anyio.to_thread
+from anyio.streams.memory import MemoryObjectSendStream, MemoryObjectReceiveStream
+
+from .._response import (
+    ResponseContextManager,
+    StreamedBinaryAPIResponse,
+    AsyncResponseContextManager,
+    AsyncStreamedBinaryAPIResponse,
+)
+from ..types.audio.speech_create_params import SpeechCreateParams
+
+__all__ = [
+    "SpeechSink",
+    "FileSink",
+    "PipeSink",
+    "CallbackSink",
+    "QueueSink",
+    "SpeechStream",
+    "AsyncSpeechStream",
+    "SpeechStreamManager",
+    "AsyncSpeechStreamManager",
+    "SpeechStreamGroup",
+    "AsyncSpeechStreamGroup",
+    "SpeechStreamGroupManager",
+    "AsyncSpeechStreamGroupManager",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_BUFFERED_FRAMES = 64
+DEFAULT_FILE_BUFFER_SIZE = 256 * 1024
+DEFAULT_PIPE_BUFFER_SIZE = 4096
+
+_DONE = object()
+
+
+class SpeechSink(ABC):
+    """A destination for the audio frames of a speech stream, see `SpeechStream.to_sink()`.
+
+    The first frame of every response is written as soon as it's received, and the frames after
+    it are coalesced into writes of at least `buffer_size` bytes, so a sink with a `buffer_size`
+    of `0` receives every frame as it arrives.
+    """
+
+    buffer_size: int = 0
+
+    blocking: bool = True
+    """Whether `write()` can block, in which case the async streams call it from a worker thread"""
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Writes the given audio"""
+
+    def close(self) -> None:  # noqa: B027
+        """Called once all of the audio has been written"""
+
+    async def awrite(self, data: bytes) -> None:
+        if self.blocking:
+            await anyio.to_thread.run_sync(self.write, data)
+        else:
+            self.write(data)
+
+    async def aclose(self) -> None:
+        if self.blocking:
+            await anyio.to_thread.run_sync(self.close)
+        else:
+            self.close()
+
+
+class FileSink(SpeechSink):
+    """Writes the audio to a file at the given path, which is created or truncated."""
+
+    def __init__(self, file: Union[str, os.PathLike[str]], *, buffer_size: int = DEFAULT_FILE_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        # writes are already coalesced, so the file doesn't need a buffer of its own
+        self._file = open(file, mode="wb", buffering=0)  # noqa: SIM115
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class PipeSink(SpeechSink):
+    """Writes the audio to a pipe, e.g. the stdin of an audio player, and flushes it after every write.
+
+    The pipe can be a binary file object or a file descriptor, and isn't closed by the sink.
+    """
+
+    def __init__(self, pipe: Union[IO[bytes], int], *, buffer_size: int = DEFAULT_PIPE_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        self._pipe = pipe
+
+    def write(self, data: bytes) -> None:
+        if isinstance(self._pipe, int):
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._pipe, view) :]
+        else:
+            self._pipe.write(data)
+            self._pipe.flush()
+
+
+class CallbackSink(SpeechSink):
+    """Calls the given function with the audio as it's received.
+
+    With the async client the function can also be a coroutine function. The function is called on
+    the event loop unless `blocking=True` is given, in which case it's called from a worker thread.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[bytes], object],
+        *,
+        buffer_size: int = 0,
+        blocking: bool = False,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.blocking = blocking
+        self._callback = callback
+
+    def write(self, data: bytes) -> None:
+        self._callback(data)
+
+    async def awrite(self, data: bytes) -> None:
+        if self.blocking:
+            await anyio.to_thread.run_sync(self._callback, data)
+            return
+
+        result = self._callback(data)
+        if inspect.isawaitable(result):
+            await result
+
+
+class QueueSink(SpeechSink):
+    """Puts the audio onto the given queue, followed by `None` once all of the audio has been put.
+
+    The queue can be an `asyncio.Queue`, which can only be used with the async client, or a `queue.Queue`.
+    A bounded queue applies backpressure to the stream.
+    """
+
+    def __init__(
+        self,
+        queue: Union[asyncio.Queue[Optional[bytes]], queue.Queue[Optional[bytes]]],
+        *,
+        buffer_size: int = 0,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self._queue = queue
+
+    def write(self, data: bytes) -> None:
+        self._put(data)
+
+    def close(self) -> None:
+        self._put(None)
+
+    async def awrite(self, data: bytes) -> None:
+        await self._aput(data)
+
+    async def aclose(self) -> None:
+        await self._aput(None)
+
+    def _put(self, item: Optional[bytes]) -> None:
+        if isinstance(self._queue, asyncio.Queue):
+            raise TypeError("An `asyncio.Queue` can only be used with the async client")
+        self._queue.put(item)
+
+    async def _aput(self, item: Optional[bytes]) -> None:
+        if isinstance(self._queue, asyncio.Queue):
+            await self._queue.put(item)
+        else:
+            await anyio.to_thread.run_sync(self._queue.put, item)
+
+
+class _Timing:
+    """Measures the time between sending a request and receiving the first byte of audio"""
+
+    def __init__(self) -> None:
+        self.started_at: Optional[float] = None
+        self.time_to_first_byte: Optional[float] = None
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+
+    def received(self) -> None:
+        if self.time_to_first_byte is None and self.started_at is not None:
+            self.time_to_first_byte = time.monotonic() - self.started_at
+            log.debug("Received the first byte of audio after %.3f seconds", self.time_to_first_byte)
+
+    def frames(self, frames: Iterator[bytes]) -> Iterator[bytes]:
+        for frame in frames:
+            if frame:
+                self.received()
+                yield frame
+
+    async def aframes(self, frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for frame in frames:
+            if frame:
+                self.received()
+                yield frame
+
+
+def _write_frames(frames: Iterable[bytes], sink: SpeechSink) -> None:
+    buffer = bytearray()
+    first = True
+    for frame in frames:
+        # the first frame is written straight away, so that playback can start as soon as possible
+        if first or (not buffer and len(frame) >= sink.buffer_size):
+            sink.write(frame)
+            first = False
+            continue
+
+        buffer += frame
+        if len(buffer) >= sink.buffer_size:
+            sink.write(bytes(buffer))
+            buffer.clear()
+
+    if buffer:
+        sink.write(bytes(buffer))
+
+
+async def _awrite_frames(frames: AsyncIterable[bytes], sink: SpeechSink) -> None:
+    buffer = bytearray()
+    first = True
+    async for frame in frames:
+        if first or (not buffer and len(frame) >= sink.buffer_size):
+            await sink.awrite(frame)
+            first = False
+            continue
+
+        buffer += frame
+        if len(buffer) >= sink.buffer_size:
+            await sink.awrite(bytes(buffer))
+            buffer.clear()
+
+    if buffer:
+        await sink.awrite(bytes(buffer))
+
+
+def _check_arguments(concurrency: int, max_buffered_frames: int) -> None:
+    if concurrency < 1:
+        raise ValueError("The `concurrency` argument must be greater than 0")
+    if max_buffered_frames < 1:
+        raise ValueError("The `max_buffered_frames` argument must be greater than 0")
+
+
+class SpeechStream:
+    """Iterator over the frames of audio of a speech response, as they're received"""
+
+    def __init__(self, frames: Iterator[bytes], *, timing: _Timing, close: Callable[[], None]) -> None:
+        self._iterator = frames
+        self._timing = timing
+        self._close = close
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """The number of seconds between sending the request and receiving the first byte of audio,
+        or `None` if no audio has been received yet.
+        """
+        return self._timing.time_to_first_byte
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._iterator)
+
+    def to_sink(self, sink: SpeechSink) -> None:
+        """Writes the rest of the audio to the given sink, and closes the sink"""
+        try:
+            _write_frames(self, sink)
+        finally:
+            sink.close()
+
+    def close(self) -> None:
+        """Closes the response, if it hasn't been read to completion"""
+        self._close()
+
+
+class AsyncSpeechStream:
+    """Async iterator over the frames of audio of a speech response, as they're received"""
+
+    def __init__(self, frames: AsyncIterator[bytes], *, timing: _Timing, close: Callable[[], Awaitable[None]]) -> None:
+        self._iterator = frames
+        self._timing = timing
+        self._close = close
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """The number of seconds between sending the request and receiving the first byte of audio,
+        or `None` if no audio has been received yet.
+        """
+        return self._timing.time_to_first_byte
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        return await self._iterator.__anext__()
+
+    async def to_sink(self, sink: SpeechSink) -> None:
+        """Writes the rest of the audio to the given sink, and closes the sink"""
+        try:
+            await _awrite_frames(self, sink)
+        finally:
+            await sink.aclose()
+
+    async def close(self) -> None:
+        """Closes the response, if it hasn't been read to completion"""
+        await self._close()
+
+
+class SpeechStreamManager:
+    """Context manager over a `SpeechStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+
+    Usage:
+    ```py
+    with client.audio.speech.stream(...) as stream:
+        for frame in stream:
+            ...
+    ```
+    """
+
+    def __init__(self, api_request: Callable[[], ResponseContextManager[StreamedBinaryAPIResponse]]) -> None:
+        self.__response: ResponseContextManager[StreamedBinaryAPIResponse] | None = None
+        self.__api_request = api_request
+
+    def __enter__(self) -> SpeechStream:
+        timing = _Timing()
+        timing.start()
+
+        self.__response = self.__api_request()
+        response = self.__response.__enter__()
+        return SpeechStream(timing.frames(response.iter_bytes()), timing=timing, close=response.close)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__response is not None:
+            self.__response.__exit__(exc_type, exc, exc_tb)
+
+
+class AsyncSpeechStreamManager:
+    """Async context manager over an `AsyncSpeechStream` that is returned by `.stream()`.
+
+    This context manager ensures the response cannot be leaked if you don't read
+    the stream to completion.
+
+    Usage:
+    ```py
+    async with client.audio.speech.stream(...) as stream:
+        async for frame in stream:
+            ...
+    ```
+    """
+
+    def __init__(self, api_request: Callable[[], AsyncResponseContextManager[AsyncStreamedBinaryAPIResponse]]) -> None:
+        self.__response: AsyncResponseContextManager[AsyncStreamedBinaryAPIResponse] | None = None
+        self.__api_request = api_request
+
+    async def __aenter__(self) -> AsyncSpeechStream:
+        timing = _Timing()
+        timing.start()
+
+        self.__response = self.__api_request()
+        response = await self.__response.__aenter__()
+        return AsyncSpeechStream(timing.aframes(response.iter_bytes()), timing=timing, close=response.close)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__response is not None:
+            await self.__response.__aexit__(exc_type, exc, exc_tb)
+
+
+class _PendingSpeech:
+    """A request of `.stream_many()` whose audio is buffered by a worker thread until it's read"""
+
+    def __init__(self, request: SpeechCreateParams, *, max_buffered_frames: int) -> None:
+        self.request = request
+        self.timing = _Timing()
+        self.frames: queue.Queue[object] = queue.Queue(max_buffered_frames)
+        self.stopped = threading.Event()
+
+    def run(self, create: Callable[..., ResponseContextManager[StreamedBinaryAPIResponse]]) -> None:
+        if self.stopped.is_set():
+            return
+
+        item: object = _DONE
+        try:
+            self.timing.start()
+            with create(**self.request) as response:
+                for frame in self.timing.frames(response.iter_bytes()):
+                    self.frames.put(frame)
+                    if self.stopped.is_set():
+                        return
+        except Exception as err:
+            item = err
+
+        if not self.stopped.is_set():
+            self.frames.put(item)
+
+    def read(self) -> Iterator[bytes]:
+        while True:
+            item = self.frames.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            assert isinstance(item, bytes)
+            yield item
+
+    def stop(self) -> None:
+        self.stopped.set()
+        # unblocks the worker if it's waiting for room in the buffer, so that it sees it has been stopped
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
+
+
+class SpeechStreamGroup:
+    """Iterator over a `SpeechStream` for each of the requests given to `.stream_many()`, in order.
+
+    Each stream must be read before moving on to the next one, which closes it.
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., ResponseContextManager[StreamedBinaryAPIResponse]],
+        requests: Iterable[SpeechCreateParams],
+        *,
+        concurrency: int,
+        max_buffered_frames: int,
+    ) -> None:
+        self._iterator = self._stream(
+            create, requests, concurrency=concurrency, max_buffered_frames=max_buffered_frames
+        )
+
+    def __iter__(self) -> Iterator[SpeechStream]:
+        return self._iterator
+
+    def __next__(self) -> SpeechStream:
+        return next(self._iterator)
+
+    def to_sink(self, sink: SpeechSink) -> None:
+        """Writes the audio of the rest of the requests to the given sink, in order, and closes the sink"""
+        try:
+            for stream in self:
+                _write_frames(stream, sink)
+        finally:
+            sink.close()
+
+    def close(self) -> None:
+        """Stops the requests that are in flight and waits for them to be closed"""
+        self._iterator.close()
+
+    def _stream(
+        self,
+        create: Callable[..., ResponseContextManager[StreamedBinaryAPIResponse]],
+        requests: Iterable[SpeechCreateParams],
+        *,
+        concurrency: int,
+        max_buffered_frames: int,
+    ) -> Generator[SpeechStream, None, None]:
+        requests_iter = iter(requests)
+        pending: Deque[_PendingSpeech] = deque()
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="openai-speech")
+        try:
+            while True:
+                # the requests after the one that is being read are sent ahead of time, so that their
+                # audio is ready as soon as the audio before it has been read
+                while len(pending) < concurrency:
+                    request = next(requests_iter, None)
+                    if request is None:
+                        break
+
+                    speech = _PendingSpeech(request, max_buffered_frames=max_buffered_frames)
+                    executor.submit(speech.run, create)
+                    pending.append(speech)
+
+                if not pending:
+                    return
+
+                speech = pending.popleft()
+                try:
+                    yield SpeechStream(speech.read(), timing=speech.timing, close=speech.stop)
+                finally:
+                    speech.stop()
+        finally:
+            for speech in pending:
+                speech.stop()
+            executor.shutdown(wait=True)
+
+
+class AsyncSpeechStreamGroup:
+    """Async iterator over an `AsyncSpeechStream` for each of the requests given to `.stream_many()`, in order.
+
+    Each stream must be read before moving on to the next one, which closes it.
+    """
+
+    def __init__(self, receive: MemoryObjectReceiveStream[AsyncSpeechStream]) -> None:
+        self._iterator = self._stream(receive)
+
+    def __aiter__(self) -> AsyncIterator[AsyncSpeechStream]:
+        return self
+
+    async def __anext__(self) -> AsyncSpeechStream:
+        return await self._iterator.__anext__()
+
+    async def to_sink(self, sink: SpeechSink) -> None:
+        """Writes the audio of the rest of the requests to the given sink, in order, and closes the sink"""
+        try:
+            async for stream in self:
+                await _awrite_frames(stream, sink)
+        finally:
+            await sink.aclose()
+
+    async def _stream(
+        self, receive: MemoryObjectReceiveStream[AsyncSpeechStream]
+    ) -> AsyncGenerator[AsyncSpeechStream, None]:
+        async with receive:
+            async for stream in receive:
+                try:
+                    yield stream
+                finally:
+                    await stream.close()
+
+
+class SpeechStreamGroupManager:
+    """Context manager over the `SpeechStreamGroup` that is returned by `.stream_many()`.
+
+    The requests are sent from a pool of `concurrency` threads, each buffering at most
+    `max_buffered_frames` frames of audio until it's read, and the context manager ensures that
+    the pool is shut down if the streams aren't read to completion.
+
+    Usage:
+    ```py
+    with client.audio.speech.stream_many(requests) as streams:
+        for stream in streams:
+            for frame in stream:
+                ...
+    ```
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., ResponseContextManager[StreamedBinaryAPIResponse]],
+        requests: Iterable[SpeechCreateParams],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_buffered_frames: int = DEFAULT_MAX_BUFFERED_FRAMES,
+    ) -> None:
+        _check_arguments(concurrency, max_buffered_frames)
+        self.__group: SpeechStreamGroup | None = None
+        self.__create = create
+        self.__requests = requests
+        self.__concurrency = concurrency
+        self.__max_buffered_frames = max_buffered_frames
+
+    def __enter__(self) -> SpeechStreamGroup:
+        self.__group = SpeechStreamGroup(
+            self.__create,
+            self.__requests,
+            concurrency=self.__concurrency,
+            max_buffered_frames=self.__max_buffered_frames,
+        )
+        return self.__group
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.__group is not None:
+            self.__group.close()
+
+
+class AsyncSpeechStreamGroupManager:
+    """Async context manager over the `AsyncSpeechStreamGroup` that is returned by `.stream_many()`.
+
+    The requests are sent from a task group that is owned by the context manager, with at most
+    `concurrency` requests in flight that each buffer at most `max_buffered_frames` frames of audio
+    until it's read, and any requests that are still in flight are cancelled if the streams aren't
+    read to completion.
+
+    Usage:
+    ```py
+    async with client.audio.speech.stream_many(requests) as streams:
+        async for stream in streams:
+            async for frame in stream:
+                ...
+    ```
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., AsyncResponseContextManager[AsyncStreamedBinaryAPIResponse]],
+        requests: Union[Iterable[SpeechCreateParams], AsyncIterable[SpeechCreateParams]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_buffered_frames: int = DEFAULT_MAX_BUFFERED_FRAMES,
+    ) -> None:
+        _check_arguments(concurrency, max_buffered_frames)
+        self.__task_group: anyio.abc.TaskGroup | None = None
+        self.__create = create
+        self.__requests = requests
+        self.__concurrency = concurrency
+        self.__max_buffered_frames = max_buffered_frames
+
+    async def __aenter__(self) -> AsyncSpeechStreamGroup:
+        send, receive = anyio.create_memory_object_stream[AsyncSpeechStream](self.__concurrency)
+
+        self.__task_group = anyio.create_task_group()
+        await self.__task_group.__aenter__()
+        self.__task_group.start_soon(self.__run, send)
+
+        return AsyncSpeechStreamGroup(receive)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Optional[bool]:
+        if self.__task_group is None:
+            return None
+
+        # stop sending requests if the streams weren't read to completion
+        self.__task_group.cancel_scope.cancel()
+        return await self.__task_group.__aexit__(exc_type, exc, exc_tb)
+
+    async def __run(self, send: MemoryObjectSendStream[AsyncSpeechStream]) -> None:
+        in_flight = anyio.Semaphore(self.__concurrency)
+
+        async def run(
+            request: SpeechCreateParams, frames: MemoryObjectSendStream[Union[bytes, Exception]], timing: _Timing
+        ) -> None:
+            try:
+                async with frames:
+                    try:
+                        timing.start()
+                        async with self.__create(**request) as response:
+                            async for frame in timing.aframes(response.iter_bytes()):
+                                await frames.send(frame)
+                    except Exception as err:
+                        # the stream may have been closed by the consumer already
+                        try:
+                            await frames.send(err)
+                        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                            pass
+            finally:
+                in_flight.release()
+
+        async with send:
+            async with anyio.create_task_group() as tg:
+                if isinstance(self.__requests, AsyncIterable):
+                    async_requests = self.__requests.__aiter__()
+                    requests = None
+                else:
+                    async_requests = None
+                    requests = iter(self.__requests)
+
+                while True:
+                    await in_flight.acquire()
+
+                    try:
+                        if async_requests is not None:
+                            request = await async_requests.__anext__()
+                        else:
+                            assert requests is not None
+                            request = next(requests)
+                    except (StopIteration, StopAsyncIteration):
+                        break
+
+                    frames_send, frames_receive = anyio.create_memory_object_stream[Union[bytes, Exception]](
+                        self.__max_buffered_frames
+                    )
+                    timing = _Timing()
+                    tg.start_soon(run, request, frames_send, timing)
+                    await send.send(
+                        AsyncSpeechStream(_receive_frames(frames_receive), timing=timing, close=frames_receive.aclose)
+                    )
+
+
+async def _receive_frames(frames: MemoryObjectReceiveStream[Union[bytes, Exception]]) -> AsyncIterator[bytes]:
+    async with frames:
+        async for item in frames:
+            if isinstance(item, Exception):
+                raise item
+            yield item
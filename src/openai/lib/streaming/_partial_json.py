@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Union
+
+from jiter import from_json
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_SPECIAL = re.compile(r'["\\\x00-\x1f]')
+_UNICODE_ESCAPE = re.compile(r"[0-9a-fA-F]{0,4}")
+_LOW_SURROGATE_ESCAPE = re.compile(r"(?:\\(?:u(?:[dD](?:[c-fC-F][0-9a-fA-F]{0,2})?)?)?)?")
+_SCALAR = re.compile(r"[-+.0-9A-Za-z]+")
+
+# what the parser expects next in the innermost open container
+_VALUE = 0
+_VALUE_OR_END = 1
+_KEY = 2
+_KEY_OR_END = 3
+_COLON = 4
+_COMMA_OR_END = 5
+_DONE = 6
+
+_Container = Union[Dict[str, object], List[object]]
+
+
+class _InvalidJSON(Exception):
+    pass
+
+
+class PartialJSONParser:
+    """Resumable equivalent of `jiter.from_json(text, partial_mode=True)` for JSON documents
+    that are received incrementally, e.g. streamed structured outputs.
+
+    Every call to `.parse()` is given the accumulated text so far and only scans the text
+    that was added since the previous call, completed values are kept between calls so
+    the cost of parsing a document no longer grows with the square of its size.
+
+    Individual tokens are still decoded by `jiter`, and any input that this parser can't
+    handle, e.g. invalid JSON or a top-level value that isn't an object or an array, is
+    delegated to `jiter` in full so that the results and errors are always the same.
+
+    Snapshots returned by `.parse()` share the values that were already complete, so they
+    should not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._pos = 0
+        self._state = _VALUE
+        self._stack: list[tuple[_Container, str | None]] = []
+        self._root: _Container | None = None
+
+        # the position that the scan for the end of an incomplete string was at
+        self._string_scan = 0
+        # a value at the end of the text that may still change, e.g. `12` in `[12`
+        self._tentative: object = None
+        self._has_tentative = False
+
+        self._delegate = False
+        self._snapshot: object = None
+        self._snapshot_stale = True
+
+    def parse(self, text: str) -> object:
+        """Parse `text`, which must start with the text given to the previous call"""
+        if self._delegate:
+            return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+        if self._state != _DONE:
+            try:
+                self._consume(text)
+            except _InvalidJSON:
+                self._delegate = True
+                return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+        if self._root is None:
+            # nothing other than whitespace has been received
+            return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+        if self._snapshot_stale:
+            self._snapshot = self._build_snapshot()
+            self._snapshot_stale = False
+
+        return self._snapshot
+
+    def _consume(self, text: str) -> None:
+        pos = self._pos
+        end = len(text)
+
+        if self._has_tentative:
+            self._has_tentative = False
+            self._snapshot_stale = True
+
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+            if pos >= end:
+                break
+
+            char = text[pos]
+            state = self._state
+
+            if state == _COMMA_OR_END:
+                container = self._stack[-1][0]
+                if char == ",":
+                    self._state = _KEY if isinstance(container, dict) else _VALUE
+                    pos += 1
+                elif char == ("}" if isinstance(container, dict) else "]"):
+                    self._stack.pop()
+                    self._state = _COMMA_OR_END if self._stack else _DONE
+                    self._snapshot_stale = True
+                    pos += 1
+                    if not self._stack:
+                        break
+                else:
+                    raise _InvalidJSON()
+            elif state == _KEY or state == _KEY_OR_END:
+                if char == "}" and state == _KEY_OR_END:
+                    self._stack.pop()
+                    self._state = _COMMA_OR_END if self._stack else _DONE
+                    self._snapshot_stale = True
+                    pos += 1
+                    if not self._stack:
+                        break
+                elif char == '"':
+                    string_end = self._scan_string(text, pos)
+                    if string_end is None:
+                        break
+
+                    key = _decode(text[pos:string_end])
+                    container, _ = self._stack[-1]
+                    self._stack[-1] = (container, key)
+                    self._state = _COLON
+                    pos = string_end
+                else:
+                    raise _InvalidJSON()
+            elif state == _COLON:
+                if char != ":":
+                    raise _InvalidJSON()
+                self._state = _VALUE
+                pos += 1
+            elif char == "]" and state == _VALUE_OR_END:
+                self._stack.pop()
+                self._state = _COMMA_OR_END if self._stack else _DONE
+                self._snapshot_stale = True
+                pos += 1
+                if not self._stack:
+                    break
+            elif char == "{" or char == "[":
+                child: _Container = {} if char == "{" else []
+                self._add_value(child)
+                self._stack.append((child, None))
+                self._state = _KEY_OR_END if char == "{" else _VALUE_OR_END
+                pos += 1
+            elif not self._stack:
+                # only objects & arrays are parsed incrementally
+                raise _InvalidJSON()
+            elif char == '"':
+                string_end = self._scan_string(text, pos)
+                if string_end is None:
+                    break
+
+                self._add_value(_decode(text[pos:string_end]))
+                self._state = _COMMA_OR_END
+                pos = string_end
+            else:
+                match = _SCALAR.match(text, pos)
+                if match is None:
+                    raise _InvalidJSON()
+
+                token = match.group()
+                if match.end() == end:
+                    # the scalar may continue in the next chunk, e.g. `1` -> `12` or `tru` -> `true`
+                    self._set_tentative(token)
+                    break
+
+                self._add_value(_decode(token))
+                self._state = _COMMA_OR_END
+                pos = match.end()
+
+        self._pos = pos
+
+    def _scan_string(self, text: str, start: int) -> int | None:
+        """Returns the end position of the string that starts at `start`, or `None` if it is incomplete"""
+        pos = self._string_scan if self._string_scan > start else start + 1
+        end = len(text)
+
+        while True:
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                self._string_scan = end
+                return None
+
+            char = match.group()
+            if char == '"':
+                self._string_scan = 0
+                return match.end()
+
+            if char != "\\":
+                # control characters are not allowed in strings
+                raise _InvalidJSON()
+
+            escape_end = _scan_escape(text, match.start())
+            if escape_end is None:
+                self._string_scan = match.start()
+                return None
+
+            pos = escape_end
+
+    def _set_tentative(self, token: str) -> None:
+        try:
+            values = from_json(bytes("[" + token, "utf-8"), partial_mode=True)
+        except ValueError as exc:
+            raise _InvalidJSON() from exc
+
+        if values:
+            self._tentative = values[0]
+            self._has_tentative = True
+            self._snapshot_stale = True
+
+    def _add_value(self, value: object) -> None:
+        self._snapshot_stale = True
+
+        if not self._stack:
+            self._root = value  # type: ignore[assignment]
+            return
+
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            assert key is not None
+            container[key] = value
+        else:
+            container.append(value)
+
+    def _build_snapshot(self) -> object:
+        if not self._stack:
+            return self._root
+
+        child: object = None
+        for index in range(len(self._stack) - 1, -1, -1):
+            container, key = self._stack[index]
+
+            if isinstance(container, dict):
+                copied_dict = dict(container)
+                if child is not None:
+                    assert key is not None
+                    copied_dict[key] = child
+                elif self._has_tentative:
+                    assert key is not None
+                    copied_dict[key] = self._tentative
+                child = copied_dict
+            else:
+                copied_list = list(container)
+                if child is not None:
+                    copied_list[-1] = child
+                elif self._has_tentative:
+                    copied_list.append(self._tentative)
+                child = copied_list
+
+        return child
+
+
+def _decode(token: str) -> Any:
+    try:
+        return from_json(bytes(token, "utf-8"))
+    except ValueError as exc:
+        raise _InvalidJSON() from exc
+
+
+def _scan_escape(text: str, start: int) -> int | None:
+    """Returns the end position of the escape sequence that starts at `start`, or `None` if it is incomplete.
+
+    Escape sequences that `jiter` may not accept raise `_InvalidJSON` so that the document is delegated to it.
+    """
+    end = len(text)
+    if start + 1 >= end:
+        return None
+
+    char = text[start + 1]
+    if char in '"\\/bfnrt':
+        return start + 2
+    if char != "u":
+        raise _InvalidJSON()
+
+    digits = _UNICODE_ESCAPE.match(text, start + 2).group()  # type: ignore[union-attr]
+    if len(digits) < 4:
+        if start + 2 + len(digits) == end:
+            return None
+        raise _InvalidJSON()
+
+    code = int(digits, 16)
+    if 0xDC00 <= code <= 0xDFFF:
+        raise _InvalidJSON()
+    if code < 0xD800 or code > 0xDBFF:
+        return start + 6
+
+    # a high surrogate must be followed by a low surrogate
+    low = _LOW_SURROGATE_ESCAPE.match(text, start + 6).group()  # type: ignore[union-attr]
+    if len(low) == 6:
+        return start + 12
+    if start + 6 + len(low) == end:
+        return None
+    raise _InvalidJSON()
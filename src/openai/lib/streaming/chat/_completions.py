@@ -5,8 +5,6 @@ from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, Callable, Iterable, Awaitable, AsyncIterator, cast
 from typing_extensions import Self, Iterator, assert_never
 
-from jiter import from_json
-
 from ._types import ParsedChoiceSnapshot, ParsedChatCompletionSnapshot, ParsedChatCompletionMessageSnapshot
 from ._events import (
     ChunkEvent,
@@ -23,10 +21,10 @@ from ._events import (
     FunctionToolCallArgumentsDeltaEvent,
 )
 from .._deltas import accumulate_delta
-from ...._types import NOT_GIVEN, IncEx, NotGiven
-from ...._utils import is_given, consume_sync_iterator, consume_async_iterator
-from ...._compat import model_dump
-from ...._models import build, construct_type
+from ...._types import NOT_GIVEN, NotGiven
+from ...._utils import is_list, is_given, consume_sync_iterator, consume_async_iterator
+from ...._compat import get_model_fields
+from ...._models import BaseModel, build, construct_type
 from ..._parsing import (
     ResponseFormatT,
     has_parseable_input,
@@ -39,9 +37,11 @@ from ..._parsing import (
 from ...._streaming import Stream, AsyncStream
 from ....types.chat import ChatCompletionChunk, ParsedChatCompletion, ChatCompletionToolParam
 from ...._exceptions import LengthFinishReasonError, ContentFilterFinishReasonError
+from .._partial_json import PartialJSONParser
 from ....types.chat.chat_completion import ChoiceLogprobs
-from ....types.chat.chat_completion_chunk import Choice as ChoiceChunk
+from ....types.chat.chat_completion_chunk import Choice as ChoiceChunk, ChoiceDelta
 from ....types.chat.completion_create_params import ResponseFormat as ResponseFormatParam
+from ....types.chat.parsed_function_tool_call import ParsedFunctionToolCall
 
 
 class ChatCompletionStream(Generic[ResponseFormatT]):
@@ -315,6 +315,7 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
     ) -> None:
         self.__current_completion_snapshot: ParsedChatCompletionSnapshot | None = None
         self.__choice_event_states: list[ChoiceEventState] = []
+        self.__message_accumulators: dict[int, _MessageAccumulator] = {}
 
         self._input_tools = [tool for tool in input_tools] if is_given(input_tools) else []
         self._response_format = response_format
@@ -358,53 +359,14 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
         completion_snapshot = self.__current_completion_snapshot
 
         if completion_snapshot is None:
+            for choice in chunk.choices:
+                self.__message_accumulators[choice.index] = _MessageAccumulator(choice.delta)
+
             return _convert_initial_chunk_into_snapshot(chunk)
 
         for choice in chunk.choices:
             try:
                 choice_snapshot = completion_snapshot.choices[choice.index]
-                previous_tool_calls = choice_snapshot.message.tool_calls or []
-
-                choice_snapshot.message = cast(
-                    ParsedChatCompletionMessageSnapshot,
-                    construct_type(
-                        type_=ParsedChatCompletionMessageSnapshot,
-                        value=accumulate_delta(
-                            cast(
-                                "dict[object, object]",
-                                model_dump(
-                                    choice_snapshot.message,
-                                    # we don't want to serialise / deserialise our custom properties
-                                    # as they won't appear in the delta and we don't want to have to
-                                    # continuosly reparse the content
-                                    exclude=cast(
-                                        # cast required as mypy isn't smart enough to infer `True` here to `Literal[True]`
-                                        IncEx,
-                                        {
-                                            "parsed": True,
-                                            "tool_calls": {
-                                                idx: {"function": {"parsed_arguments": True}}
-                                                for idx, _ in enumerate(choice_snapshot.message.tool_calls or [])
-                                            },
-                                        },
-                                    ),
-                                ),
-                            ),
-                            cast("dict[object, object]", choice.delta.to_dict()),
-                        ),
-                    ),
-                )
-
-                # ensure tools that have already been parsed are added back into the newly
-                # constructed message snapshot
-                for tool_index, prev_tool in enumerate(previous_tool_calls):
-                    new_tool = (choice_snapshot.message.tool_calls or [])[tool_index]
-
-                    if prev_tool.type == "function":
-                        assert new_tool.type == "function"
-                        new_tool.function.parsed_arguments = prev_tool.function.parsed_arguments
-                    elif TYPE_CHECKING:  # type: ignore[unreachable]
-                        assert_never(prev_tool)
             except IndexError:
                 choice_snapshot = cast(
                     ParsedChoiceSnapshot,
@@ -417,6 +379,9 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                     ),
                 )
                 completion_snapshot.choices.append(choice_snapshot)
+                self.__message_accumulators[choice.index] = _MessageAccumulator(choice.delta)
+            else:
+                self.__message_accumulators[choice.index].accumulate(choice_snapshot.message, choice.delta)
 
             if choice.finish_reason:
                 choice_snapshot.finish_reason = choice.finish_reason
@@ -435,9 +400,8 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                 and not choice_snapshot.message.refusal
                 and is_given(self._rich_response_format)
             ):
-                choice_snapshot.message.parsed = from_json(
-                    bytes(choice_snapshot.message.content, "utf-8"),
-                    partial_mode=True,
+                choice_snapshot.message.parsed = self.__message_accumulators[choice.index].parse_content(
+                    choice_snapshot.message.content
                 )
 
             for tool_call_chunk in choice.delta.tool_calls or []:
@@ -453,10 +417,9 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                         and input_tool.get("function", {}).get("strict")
                         and tool_call_snapshot.function.arguments
                     ):
-                        tool_call_snapshot.function.parsed_arguments = from_json(
-                            bytes(tool_call_snapshot.function.arguments, "utf-8"),
-                            partial_mode=True,
-                        )
+                        tool_call_snapshot.function.parsed_arguments = self.__message_accumulators[
+                            choice.index
+                        ].parse_arguments(tool_call_chunk.index, tool_call_snapshot.function.arguments)
                 elif TYPE_CHECKING:  # type: ignore[unreachable]
                     assert_never(tool_call_snapshot)
 
@@ -732,6 +695,121 @@ class ChoiceEventState:
             assert_never(tool_call_snapshot)
 
 
+class _MessageAccumulator:
+    """Accumulates the deltas for a single choice into its message snapshot in place.
+
+    The raw deltas are merged into a plain dictionary with `accumulate_delta()`, then only the
+    properties of the snapshot that were present in the delta are constructed again, e.g. a
+    content delta only replaces `.content` and a tool call arguments delta only re-constructs
+    that tool call, so the cost of each chunk does not grow with the size of the message.
+    """
+
+    def __init__(self, delta: ChoiceDelta) -> None:
+        self._message: dict[object, object] = cast("dict[object, object]", delta.to_dict())
+
+        # snapshots that were constructed from a single delta, see `_mark_fields_set()`
+        self._initial = True
+        self._new_tool_calls: list[ParsedFunctionToolCall] = []
+
+        self._content_parser = PartialJSONParser()
+        self._arguments_parsers: dict[int, PartialJSONParser] = {}
+
+    def parse_content(self, content: str) -> object:
+        """Incrementally parse the accumulated content for structured outputs"""
+        return self._content_parser.parse(content)
+
+    def parse_arguments(self, index: int, arguments: str) -> object:
+        """Incrementally parse the accumulated arguments of the tool call at `index`"""
+        parser = self._arguments_parsers.get(index)
+        if parser is None:
+            parser = self._arguments_parsers[index] = PartialJSONParser()
+        return parser.parse(arguments)
+
+    def accumulate(self, message: ParsedChatCompletionMessageSnapshot, delta: ChoiceDelta) -> None:
+        delta_dict = cast("dict[object, object]", delta.to_dict())
+        accumulate_delta(self._message, delta_dict)
+
+        if self._initial:
+            self._initial = False
+            _mark_fields_set(message, exclude="parsed")
+            self._new_tool_calls.extend(message.tool_calls or [])
+
+        for tool_call in self._new_tool_calls:
+            _mark_tool_call_fields_set(tool_call)
+        self._new_tool_calls.clear()
+
+        for key in delta_dict:
+            value = self._message[key]
+            if key == "tool_calls" and is_list(value) and (message.tool_calls is None or is_list(message.tool_calls)):
+                self._accumulate_tool_calls(message, cast("list[object]", value), cast(Any, delta_dict[key]))
+                continue
+
+            assert isinstance(key, str)
+            field = get_model_fields(type(message)).get(key)
+            if field is not None and field.annotation is not None:
+                value = construct_type(type_=field.annotation, value=value)
+            setattr(message, key, value)
+
+    def _accumulate_tool_calls(
+        self,
+        message: ParsedChatCompletionMessageSnapshot,
+        tool_calls: list[object],
+        tool_call_deltas: list[dict[str, object]],
+    ) -> None:
+        tool_call_snapshots = message.tool_calls
+        if tool_call_snapshots is None:
+            tool_call_snapshots = message.tool_calls = []
+
+        # `accumulate_delta()` has already merged the deltas into the raw tool calls, the
+        # snapshots are updated in the same order so that the indices line up
+        for tool_call_delta in tool_call_deltas:
+            index = cast(int, tool_call_delta["index"])
+            if index < len(tool_call_snapshots):
+                previous = tool_call_snapshots[index]
+            else:
+                previous = None
+                index = len(tool_call_snapshots)
+
+            tool_call = cast(
+                ParsedFunctionToolCall, construct_type(type_=ParsedFunctionToolCall, value=tool_calls[index])
+            )
+
+            # ensure tools that have already been parsed are added back into the
+            # newly constructed tool call snapshot
+            if previous is not None:
+                if previous.type == "function":
+                    assert tool_call.type == "function"
+                    tool_call.function.parsed_arguments = previous.function.parsed_arguments
+                elif TYPE_CHECKING:  # type: ignore[unreachable]
+                    assert_never(previous)
+
+                _mark_tool_call_fields_set(tool_call)
+                tool_call_snapshots[index] = tool_call
+            else:
+                self._new_tool_calls.append(tool_call)
+                tool_call_snapshots.insert(index, tool_call)
+
+
+def _mark_tool_call_fields_set(tool_call: ParsedFunctionToolCall) -> None:
+    _mark_fields_set(tool_call)
+    if tool_call.type == "function":
+        _mark_fields_set(tool_call.function, exclude="parsed_arguments")
+    elif TYPE_CHECKING:  # type: ignore[unreachable]
+        assert_never(tool_call)
+
+
+def _mark_fields_set(model: BaseModel, *, exclude: str | None = None) -> None:
+    """Mark every field of a snapshot constructed from a single delta as set.
+
+    This ensures the snapshot is the same as if it had been constructed from the
+    fully accumulated message, where every field is present.
+    """
+    fields_set = model.model_fields_set
+    for name in get_model_fields(type(model)):
+        if name != exclude:
+            fields_set.add(name)
+
+
 def _convert_initial_chunk_into_snapshot(chunk: ChatCompletionChunk) -> ParsedChatCompletionSnapshot:
     data = chunk.to_dict()
     choices = cast("list[object]", data["choices"])
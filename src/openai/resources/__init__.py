@@ -1,100 +1,195 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .beta import (
-    Beta,
-    AsyncBeta,
-    BetaWithRawResponse,
-    AsyncBetaWithRawResponse,
-    BetaWithStreamingResponse,
-    AsyncBetaWithStreamingResponse,
-)
-from .chat import (
-    Chat,
-    AsyncChat,
-    ChatWithRawResponse,
-    AsyncChatWithRawResponse,
-    ChatWithStreamingResponse,
-    AsyncChatWithStreamingResponse,
-)
-from .audio import (
-    Audio,
-    AsyncAudio,
-    AudioWithRawResponse,
-    AsyncAudioWithRawResponse,
-    AudioWithStreamingResponse,
-    AsyncAudioWithStreamingResponse,
-)
-from .files import (
-    Files,
-    AsyncFiles,
-    FilesWithRawResponse,
-    AsyncFilesWithRawResponse,
-    FilesWithStreamingResponse,
-    AsyncFilesWithStreamingResponse,
-)
-from .images import (
-    Images,
-    AsyncImages,
-    ImagesWithRawResponse,
-    AsyncImagesWithRawResponse,
-    ImagesWithStreamingResponse,
-    AsyncImagesWithStreamingResponse,
-)
-from .models import (
-    Models,
-    AsyncModels,
-    ModelsWithRawResponse,
-    AsyncModelsWithRawResponse,
-    ModelsWithStreamingResponse,
-    AsyncModelsWithStreamingResponse,
-)
-from .batches import (
-    Batches,
-    AsyncBatches,
-    BatchesWithRawResponse,
-    AsyncBatchesWithRawResponse,
-    BatchesWithStreamingResponse,
-    AsyncBatchesWithStreamingResponse,
-)
-from .uploads import (
-    Uploads,
-    AsyncUploads,
-    UploadsWithRawResponse,
-    AsyncUploadsWithRawResponse,
-    UploadsWithStreamingResponse,
-    AsyncUploadsWithStreamingResponse,
-)
-from .embeddings import (
-    Embeddings,
-    AsyncEmbeddings,
-    EmbeddingsWithRawResponse,
-    AsyncEmbeddingsWithRawResponse,
-    EmbeddingsWithStreamingResponse,
-    AsyncEmbeddingsWithStreamingResponse,
-)
-from .completions import (
-    Completions,
-    AsyncCompletions,
-    CompletionsWithRawResponse,
-    AsyncCompletionsWithRawResponse,
-    CompletionsWithStreamingResponse,
-    AsyncCompletionsWithStreamingResponse,
-)
-from .fine_tuning import (
-    FineTuning,
-    AsyncFineTuning,
-    FineTuningWithRawResponse,
-    AsyncFineTuningWithRawResponse,
-    FineTuningWithStreamingResponse,
-    AsyncFineTuningWithStreamingResponse,
-)
-from .moderations import (
-    Moderations,
-    AsyncModerations,
-    ModerationsWithRawResponse,
-    AsyncModerationsWithRawResponse,
-    ModerationsWithStreamingResponse,
-    AsyncModerationsWithStreamingResponse,
+from typing import TYPE_CHECKING
+
+from .._utils._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from .beta import (
+        Beta,
+        AsyncBeta,
+        BetaWithRawResponse,
+        AsyncBetaWithRawResponse,
+        BetaWithStreamingResponse,
+        AsyncBetaWithStreamingResponse,
+    )
+    from .chat import (
+        Chat,
+        AsyncChat,
+        ChatWithRawResponse,
+        AsyncChatWithRawResponse,
+        ChatWithStreamingResponse,
+        AsyncChatWithStreamingResponse,
+    )
+    from .audio import (
+        Audio,
+        AsyncAudio,
+        AudioWithRawResponse,
+        AsyncAudioWithRawResponse,
+        AudioWithStreamingResponse,
+        AsyncAudioWithStreamingResponse,
+    )
+    from .files import (
+        Files,
+        AsyncFiles,
+        FilesWithRawResponse,
+        AsyncFilesWithRawResponse,
+        FilesWithStreamingResponse,
+        AsyncFilesWithStreamingResponse,
+    )
+    from .images import (
+        Images,
+        AsyncImages,
+        ImagesWithRawResponse,
+        AsyncImagesWithRawResponse,
+        ImagesWithStreamingResponse,
+        AsyncImagesWithStreamingResponse,
+    )
+    from .models import (
+        Models,
+        AsyncModels,
+        ModelsWithRawResponse,
+        AsyncModelsWithRawResponse,
+        ModelsWithStreamingResponse,
+        AsyncModelsWithStreamingResponse,
+    )
+    from .batches import (
+        Batches,
+        AsyncBatches,
+        BatchesWithRawResponse,
+        AsyncBatchesWithRawResponse,
+        BatchesWithStreamingResponse,
+        AsyncBatchesWithStreamingResponse,
+    )
+    from .uploads import (
+        Uploads,
+        AsyncUploads,
+        UploadsWithRawResponse,
+        AsyncUploadsWithRawResponse,
+        UploadsWithStreamingResponse,
+        AsyncUploadsWithStreamingResponse,
+    )
+    from .embeddings import (
+        Embeddings,
+        AsyncEmbeddings,
+        EmbeddingsWithRawResponse,
+        AsyncEmbeddingsWithRawResponse,
+        EmbeddingsWithStreamingResponse,
+        AsyncEmbeddingsWithStreamingResponse,
+    )
+    from .completions import (
+        Completions,
+        AsyncCompletions,
+        CompletionsWithRawResponse,
+        AsyncCompletionsWithRawResponse,
+        CompletionsWithStreamingResponse,
+        AsyncCompletionsWithStreamingResponse,
+    )
+    from .fine_tuning import (
+        FineTuning,
+        AsyncFineTuning,
+        FineTuningWithRawResponse,
+        AsyncFineTuningWithRawResponse,
+        FineTuningWithStreamingResponse,
+        AsyncFineTuningWithStreamingResponse,
+    )
+    from .moderations import (
+        Moderations,
+        AsyncModerations,
+        ModerationsWithRawResponse,
+        AsyncModerationsWithRawResponse,
+        ModerationsWithStreamingResponse,
+        AsyncModerationsWithStreamingResponse,
+    )
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "beta": ".beta",
+        "chat": ".chat",
+        "audio": ".audio",
+        "files": ".files",
+        "images": ".images",
+        "models": ".models",
+        "batches": ".batches",
+        "uploads": ".uploads",
+        "embeddings": ".embeddings",
+        "completions": ".completions",
+        "fine_tuning": ".fine_tuning",
+        "moderations": ".moderations",
+        "Beta": ".beta",
+        "AsyncBeta": ".beta",
+        "BetaWithRawResponse": ".beta",
+        "AsyncBetaWithRawResponse": ".beta",
+        "BetaWithStreamingResponse": ".beta",
+        "AsyncBetaWithStreamingResponse": ".beta",
+        "Chat": ".chat",
+        "AsyncChat": ".chat",
+        "ChatWithRawResponse": ".chat",
+        "AsyncChatWithRawResponse": ".chat",
+        "ChatWithStreamingResponse": ".chat",
+        "AsyncChatWithStreamingResponse": ".chat",
+        "Audio": ".audio",
+        "AsyncAudio": ".audio",
+        "AudioWithRawResponse": ".audio",
+        "AsyncAudioWithRawResponse": ".audio",
+        "AudioWithStreamingResponse": ".audio",
+        "AsyncAudioWithStreamingResponse": ".audio",
+        "Files": ".files",
+        "AsyncFiles": ".files",
+        "FilesWithRawResponse": ".files",
+        "AsyncFilesWithRawResponse": ".files",
+        "FilesWithStreamingResponse": ".files",
+        "AsyncFilesWithStreamingResponse": ".files",
+        "Images": ".images",
+        "AsyncImages": ".images",
+        "ImagesWithRawResponse": ".images",
+        "AsyncImagesWithRawResponse": ".images",
+        "ImagesWithStreamingResponse": ".images",
+        "AsyncImagesWithStreamingResponse": ".images",
+        "Models": ".models",
+        "AsyncModels": ".models",
+        "ModelsWithRawResponse": ".models",
+        "AsyncModelsWithRawResponse": ".models",
+        "ModelsWithStreamingResponse": ".models",
+        "AsyncModelsWithStreamingResponse": ".models",
+        "Batches": ".batches",
+        "AsyncBatches": ".batches",
+        "BatchesWithRawResponse": ".batches",
+        "AsyncBatchesWithRawResponse": ".batches",
+        "BatchesWithStreamingResponse": ".batches",
+        "AsyncBatchesWithStreamingResponse": ".batches",
+        "Uploads": ".uploads",
+        "AsyncUploads": ".uploads",
+        "UploadsWithRawResponse": ".uploads",
+        "AsyncUploadsWithRawResponse": ".uploads",
+        "UploadsWithStreamingResponse": ".uploads",
+        "AsyncUploadsWithStreamingResponse": ".uploads",
+        "Embeddings": ".embeddings",
+        "AsyncEmbeddings": ".embeddings",
+        "EmbeddingsWithRawResponse": ".embeddings",
+        "AsyncEmbeddingsWithRawResponse": ".embeddings",
+        "EmbeddingsWithStreamingResponse": ".embeddings",
+        "AsyncEmbeddingsWithStreamingResponse": ".embeddings",
+        "Completions": ".completions",
+        "AsyncCompletions": ".completions",
+        "CompletionsWithRawResponse": ".completions",
+        "AsyncCompletionsWithRawResponse": ".completions",
+        "CompletionsWithStreamingResponse": ".completions",
+        "AsyncCompletionsWithStreamingResponse": ".completions",
+        "FineTuning": ".fine_tuning",
+        "AsyncFineTuning": ".fine_tuning",
+        "FineTuningWithRawResponse": ".fine_tuning",
+        "AsyncFineTuningWithRawResponse": ".fine_tuning",
+        "FineTuningWithStreamingResponse": ".fine_tuning",
+        "AsyncFineTuningWithStreamingResponse": ".fine_tuning",
+        "Moderations": ".moderations",
+        "AsyncModerations": ".moderations",
+        "ModerationsWithRawResponse": ".moderations",
+        "AsyncModerationsWithRawResponse": ".moderations",
+        "ModerationsWithStreamingResponse": ".moderations",
+        "AsyncModerationsWithStreamingResponse": ".moderations",
+    },
 )
 
 __all__ = [
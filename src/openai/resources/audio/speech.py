@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Union
+import functools
+from typing import Union, Iterable, AsyncIterable
 from typing_extensions import Literal
 
 import httpx
@@ -21,9 +22,18 @@ from ..._response import (
     to_custom_streamed_response_wrapper,
     async_to_custom_streamed_response_wrapper,
 )
+from ...lib.speech import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_BUFFERED_FRAMES,
+    SpeechStreamManager,
+    AsyncSpeechStreamManager,
+    SpeechStreamGroupManager,
+    AsyncSpeechStreamGroupManager,
+)
 from ...types.audio import speech_create_params
 from ..._base_client import make_request_options
 from ...types.audio.speech_model import SpeechModel
+from ...types.audio.speech_create_params import SpeechCreateParams
 
 __all__ = ["Speech", "AsyncSpeech"]
 
@@ -111,6 +121,72 @@ class Speech(SyncAPIResource):
             cast_to=_legacy_response.HttpxBinaryResponseContent,
         )
 
+    def stream(
+        self,
+        *,
+        input: str,
+        model: Union[str, SpeechModel],
+        voice: Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"],
+        response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] | NotGiven = NOT_GIVEN,
+        speed: float | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> SpeechStreamManager:
+        """
+        Generates audio from the input text, and streams the frames of audio as they're received.
+
+        The stream reports its `time_to_first_byte` and can write the audio to a sink from
+        `openai.lib.speech`, e.g. a `PipeSink` that feeds an audio player:
+
+        ```py
+        with client.audio.speech.stream(model="tts-1", voice="alloy", input="Hello!") as stream:
+            stream.to_sink(PipeSink(player.stdin))
+        ```
+        """
+        api_request = functools.partial(
+            self.with_streaming_response.create,
+            input=input,
+            model=model,
+            voice=voice,
+            response_format=response_format,
+            speed=speed,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        return SpeechStreamManager(api_request)
+
+    def stream_many(
+        self,
+        requests: Iterable[SpeechCreateParams],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_buffered_frames: int = DEFAULT_MAX_BUFFERED_FRAMES,
+    ) -> SpeechStreamGroupManager:
+        """
+        Generates audio for each of the given `requests`, and streams it in the order of `requests`.
+
+        While the audio of a request is being read, the requests after it are sent ahead of time,
+        with at most `concurrency` requests in flight that each buffer at most `max_buffered_frames`
+        frames of audio, so that the audio of the next request is ready as soon as it's needed.
+
+        ```py
+        with client.audio.speech.stream_many(requests) as streams:
+            streams.to_sink(FileSink("speech.mp3"))
+        ```
+        """
+        return SpeechStreamGroupManager(
+            self.with_streaming_response.create,
+            requests,
+            concurrency=concurrency,
+            max_buffered_frames=max_buffered_frames,
+        )
+
 
 class AsyncSpeech(AsyncAPIResource):
     @cached_property
@@ -195,6 +271,73 @@ class AsyncSpeech(AsyncAPIResource):
             cast_to=_legacy_response.HttpxBinaryResponseContent,
         )
 
+    def stream(
+        self,
+        *,
+        input: str,
+        model: Union[str, SpeechModel],
+        voice: Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"],
+        response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] | NotGiven = NOT_GIVEN,
+        speed: float | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncSpeechStreamManager:
+        """
+        Generates audio from the input text, and streams the frames of audio as they're received.
+
+        The stream reports its `time_to_first_byte` and can write the audio to a sink from
+        `openai.lib.speech`, e.g. a `PipeSink` that feeds an audio player:
+
+        ```py
+        async with client.audio.speech.stream(model="tts-1", voice="alloy", input="Hello!") as stream:
+            async for frame in stream:
+                ...
+        ```
+        """
+        api_request = functools.partial(
+            self.with_streaming_response.create,
+            input=input,
+            model=model,
+            voice=voice,
+            response_format=response_format,
+            speed=speed,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        return AsyncSpeechStreamManager(api_request)
+
+    def stream_many(
+        self,
+        requests: Union[Iterable[SpeechCreateParams], AsyncIterable[SpeechCreateParams]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_buffered_frames: int = DEFAULT_MAX_BUFFERED_FRAMES,
+    ) -> AsyncSpeechStreamGroupManager:
+        """
+        Generates audio for each of the given `requests`, and streams it in the order of `requests`.
+
+        While the audio of a request is being read, the requests after it are sent ahead of time,
+        with at most `concurrency` requests in flight that each buffer at most `max_buffered_frames`
+        frames of audio, so that the audio of the next request is ready as soon as it's needed.
+
+        ```py
+        async with client.audio.speech.stream_many(requests) as streams:
+            await streams.to_sink(FileSink("speech.mp3"))
+        ```
+        """
+        return AsyncSpeechStreamGroupManager(
+            self.with_streaming_response.create,
+            requests,
+            concurrency=concurrency,
+            max_buffered_frames=max_buffered_frames,
+        )
+
 
 class SpeechWithRawResponse:
     def __init__(self, speech: Speech) -> None:
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Union, Iterable, Optional, AsyncIterable
+from pathlib import Path
 from typing_extensions import Literal
 
+import anyio
 import httpx
 
 from .. import _legacy_response
 from ..types import batch_list_params, batch_create_params
 from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
 from .._utils import (
+    is_given,
     maybe_transform,
     async_maybe_transform,
 )
@@ -18,6 +21,14 @@ from .._compat import cached_property
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from ..pagination import SyncCursorPage, AsyncCursorPage
+from ..lib.batches import (
+    BatchRequest,
+    BatchResults,
+    AsyncBatchResults,
+    write_requests,
+    create_input_file,
+    async_write_requests,
+)
 from ..types.batch import Batch
 from .._base_client import (
     AsyncPaginator,
@@ -26,6 +37,14 @@ from .._base_client import (
 
 __all__ = ["Batches", "AsyncBatches"]
 
+# input files that are larger than this are sent with the Uploads API
+CHUNKED_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+
+_MIN_POLL_INTERVAL_MS = 1000
+_MAX_POLL_INTERVAL_MS = 60 * 1000
+
+_TERMINAL_STATES = {"failed", "completed", "expired", "cancelled"}
+
 
 class Batches(SyncAPIResource):
     @cached_property
@@ -231,6 +250,110 @@ class Batches(SyncAPIResource):
             cast_to=Batch,
         )
 
+    def poll(
+        self,
+        batch_id: str,
+        *,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+    ) -> Batch:
+        """
+        A helper to poll a batch until it reaches a terminal state.
+
+        Unless `poll_interval_ms` is given, or the API asks for a different interval, the
+        interval between polls starts at one second and doubles after every poll, up to
+        one minute.
+        """
+        extra_headers = {"X-Stainless-Poll-Helper": "true", **(extra_headers or {})}
+
+        if is_given(poll_interval_ms):
+            extra_headers["X-Stainless-Custom-Poll-Interval"] = str(poll_interval_ms)
+
+        backoff_ms = _MIN_POLL_INTERVAL_MS
+        while True:
+            response = self.with_raw_response.retrieve(
+                batch_id,
+                extra_headers=extra_headers,
+                extra_body=extra_body,
+                extra_query=extra_query,
+                timeout=timeout,
+            )
+
+            batch = response.parse()
+            if batch.status in _TERMINAL_STATES:
+                return batch
+
+            if is_given(poll_interval_ms):
+                interval_ms = poll_interval_ms
+            else:
+                from_header = response.headers.get("openai-poll-after-ms")
+                if from_header is not None:
+                    interval_ms = int(from_header)
+                else:
+                    interval_ms = backoff_ms
+                    backoff_ms = min(backoff_ms * 2, _MAX_POLL_INTERVAL_MS)
+
+            self._sleep(interval_ms / 1000)
+
+    def run(
+        self,
+        requests: Iterable[BatchRequest],
+        *,
+        endpoint: Literal["/v1/chat/completions", "/v1/embeddings", "/v1/completions"],
+        completion_window: Literal["24h"] = "24h",
+        metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+    ) -> BatchResults:
+        """Runs the given requests as a batch and waits for the batch to reach a terminal state.
+
+        The requests are written to a temporary JSONL file one at a time, so they never have
+        to be held in memory, which is then uploaded, using the Uploads API for large files.
+        The batch is then created and polled with `.poll()`.
+
+        Returns a lazy iterable of the results, which streams the output and error files of the
+        batch and yields a `BatchResult` with the `custom_id` of each request. Check `.batch.status`
+        to tell whether the batch completed, failed or expired.
+
+        ```py
+        results = client.batches.run(
+            ({"custom_id": str(i), "body": {"model": "gpt-4o-mini", "messages": [...]}} for i in range(1000)),
+            endpoint="/v1/chat/completions",
+        )
+        for result in results:
+            print(result.custom_id, result.response)
+        ```
+        """
+        path = create_input_file()
+        try:
+            write_requests(requests, path, endpoint=endpoint)
+            input_file_id = self._upload_input_file(path)
+        finally:
+            path.unlink()
+
+        batch = self.create(
+            completion_window=completion_window,
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            metadata=metadata,
+        )
+        batch = self.poll(batch.id, poll_interval_ms=poll_interval_ms)
+        return BatchResults(self._client.files, batch)
+
+    def _upload_input_file(self, path: Path) -> str:
+        size = path.stat().st_size
+        if size <= CHUNKED_UPLOAD_THRESHOLD:
+            file = self._client.files.create(file=path, purpose="batch")
+            return file.id
+
+        upload = self._client.uploads.upload_file_chunked(
+            file=path, mime_type="application/jsonl", purpose="batch", bytes=size
+        )
+        assert upload.file is not None
+        return upload.file.id
+
 
 class AsyncBatches(AsyncAPIResource):
     @cached_property
@@ -436,6 +559,110 @@ class AsyncBatches(AsyncAPIResource):
             cast_to=Batch,
         )
 
+    async def poll(
+        self,
+        batch_id: str,
+        *,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+    ) -> Batch:
+        """
+        A helper to poll a batch until it reaches a terminal state.
+
+        Unless `poll_interval_ms` is given, or the API asks for a different interval, the
+        interval between polls starts at one second and doubles after every poll, up to
+        one minute.
+        """
+        extra_headers = {"X-Stainless-Poll-Helper": "true", **(extra_headers or {})}
+
+        if is_given(poll_interval_ms):
+            extra_headers["X-Stainless-Custom-Poll-Interval"] = str(poll_interval_ms)
+
+        backoff_ms = _MIN_POLL_INTERVAL_MS
+        while True:
+            response = await self.with_raw_response.retrieve(
+                batch_id,
+                extra_headers=extra_headers,
+                extra_body=extra_body,
+                extra_query=extra_query,
+                timeout=timeout,
+            )
+
+            batch = response.parse()
+            if batch.status in _TERMINAL_STATES:
+                return batch
+
+            if is_given(poll_interval_ms):
+                interval_ms = poll_interval_ms
+            else:
+                from_header = response.headers.get("openai-poll-after-ms")
+                if from_header is not None:
+                    interval_ms = int(from_header)
+                else:
+                    interval_ms = backoff_ms
+                    backoff_ms = min(backoff_ms * 2, _MAX_POLL_INTERVAL_MS)
+
+            await self._sleep(interval_ms / 1000)
+
+    async def run(
+        self,
+        requests: Union[Iterable[BatchRequest], AsyncIterable[BatchRequest]],
+        *,
+        endpoint: Literal["/v1/chat/completions", "/v1/embeddings", "/v1/completions"],
+        completion_window: Literal["24h"] = "24h",
+        metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+        poll_interval_ms: int | NotGiven = NOT_GIVEN,
+    ) -> AsyncBatchResults:
+        """Runs the given requests as a batch and waits for the batch to reach a terminal state.
+
+        The requests are written to a temporary JSONL file one at a time, so they never have
+        to be held in memory, which is then uploaded, using the Uploads API for large files.
+        The batch is then created and polled with `.poll()`.
+
+        Returns a lazy iterable of the results, which streams the output and error files of the
+        batch and yields a `BatchResult` with the `custom_id` of each request. Check `.batch.status`
+        to tell whether the batch completed, failed or expired.
+
+        ```py
+        results = await client.batches.run(
+            ({"custom_id": str(i), "body": {"model": "gpt-4o-mini", "messages": [...]}} for i in range(1000)),
+            endpoint="/v1/chat/completions",
+        )
+        async for result in results:
+            print(result.custom_id, result.response)
+        ```
+        """
+        path = await anyio.to_thread.run_sync(create_input_file)
+        try:
+            await async_write_requests(requests, path, endpoint=endpoint)
+            input_file_id = await self._upload_input_file(path)
+        finally:
+            await anyio.to_thread.run_sync(path.unlink)
+
+        batch = await self.create(
+            completion_window=completion_window,
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            metadata=metadata,
+        )
+        batch = await self.poll(batch.id, poll_interval_ms=poll_interval_ms)
+        return AsyncBatchResults(self._client.files, batch)
+
+    async def _upload_input_file(self, path: Path) -> str:
+        size = (await anyio.Path(path).stat()).st_size
+        if size <= CHUNKED_UPLOAD_THRESHOLD:
+            file = await self._client.files.create(file=path, purpose="batch")
+            return file.id
+
+        upload = await self._client.uploads.upload_file_chunked(
+            file=path, mime_type="application/jsonl", purpose="batch", bytes=size
+        )
+        assert upload.file is not None
+        return upload.file.id
+
 
 class BatchesWithRawResponse:
     def __init__(self, batches: Batches) -> None:
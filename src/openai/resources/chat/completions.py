@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Dict, List, Union, Iterable, Optional
+from typing import Dict, List, Union, Iterable, Optional, AsyncIterable
 from typing_extensions import Literal, overload
 
 import httpx
@@ -25,10 +25,12 @@ from ...types.chat import (
     completion_create_params,
 )
 from ..._base_client import make_request_options
+from ...lib.chat_map import DEFAULT_CONCURRENCY, ChatCompletionMapManager, AsyncChatCompletionMapManager
 from ...types.chat_model import ChatModel
 from ...types.chat.chat_completion import ChatCompletion
 from ...types.chat.chat_completion_chunk import ChatCompletionChunk
 from ...types.chat.chat_completion_modality import ChatCompletionModality
+from ...types.chat.completion_create_params import CompletionCreateParamsNonStreaming
 from ...types.chat.chat_completion_tool_param import ChatCompletionToolParam
 from ...types.chat.chat_completion_audio_param import ChatCompletionAudioParam
 from ...types.chat.chat_completion_message_param import ChatCompletionMessageParam
@@ -870,6 +872,37 @@ class Completions(SyncAPIResource):
             stream_cls=Stream[ChatCompletionChunk],
         )
 
+    def map(
+        self,
+        requests: Iterable[CompletionCreateParamsNonStreaming],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        max_retries: int | NotGiven = NOT_GIVEN,
+    ) -> ChatCompletionMapManager:
+        """
+        Creates a chat completion for each of the given `requests`, with at most `concurrency`
+        requests in flight at a time.
+
+        `requests` can be a lazy iterable, inputs are only taken from it when
+        there's room for another request. Each result is a `ChatCompletionMapResult`
+        holding either the `completion` or the `error` that its request failed with after
+        `max_retries` retries, so a failed request doesn't stop the others. Results are
+        returned in the order of `requests`, or as they complete when `ordered=False`.
+
+        ```py
+        with client.chat.completions.map(requests, concurrency=16) as results:
+            for result in results:
+                print(result.index, result.result().choices[0].message.content)
+        ```
+        """
+        client = (
+            self._client if isinstance(max_retries, NotGiven) else self._client.with_options(max_retries=max_retries)
+        )
+        return ChatCompletionMapManager(
+            client.chat.completions.create, requests, concurrency=concurrency, ordered=ordered
+        )
+
 
 class AsyncCompletions(AsyncAPIResource):
     @cached_property
@@ -1702,6 +1735,39 @@ class AsyncCompletions(AsyncAPIResource):
             stream_cls=AsyncStream[ChatCompletionChunk],
         )
 
+    def map(
+        self,
+        requests: Union[
+            Iterable[CompletionCreateParamsNonStreaming], AsyncIterable[CompletionCreateParamsNonStreaming]
+        ],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        max_retries: int | NotGiven = NOT_GIVEN,
+    ) -> AsyncChatCompletionMapManager:
+        """
+        Creates a chat completion for each of the given `requests`, with at most `concurrency`
+        requests in flight at a time.
+
+        `requests` can be a lazy iterable or an async iterable, inputs are only taken from it when
+        there's room for another request. Each result is a `ChatCompletionMapResult`
+        holding either the `completion` or the `error` that its request failed with after
+        `max_retries` retries, so a failed request doesn't stop the others. Results are
+        returned in the order of `requests`, or as they complete when `ordered=False`.
+
+        ```py
+        async with client.chat.completions.map(requests, concurrency=16) as results:
+            async for result in results:
+                print(result.index, result.result().choices[0].message.content)
+        ```
+        """
+        client = (
+            self._client if isinstance(max_retries, NotGiven) else self._client.with_options(max_retries=max_retries)
+        )
+        return AsyncChatCompletionMapManager(
+            client.chat.completions.create, requests, concurrency=concurrency, ordered=ordered
+        )
+
 
 class CompletionsWithRawResponse:
     def __init__(self, completions: Completions) -> None:
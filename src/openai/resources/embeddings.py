@@ -2,25 +2,53 @@
 
 from __future__ import annotations
 
+import array
 import base64
-from typing import List, Union, Iterable, cast
+import binascii
+import itertools
+import threading
+from typing import Any, Dict, List, Tuple, Union, Generic, TypeVar, Iterable, Optional, cast
 from typing_extensions import Literal
 
+import anyio
 import httpx
+from jiter import from_json
 
 from .. import _legacy_response
 from ..types import embedding_create_params
 from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
 from .._utils import is_given, maybe_transform
-from .._compat import cached_property
+from .._compat import model_copy, cached_property
 from .._extras import numpy as np, has_numpy
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from .._base_client import make_request_options
+from ..types.embedding import Embedding
+from ..lib.embedding_cache import EmbeddingCache, AsyncEmbeddingCache, embedding_cache_key
 from ..types.embedding_model import EmbeddingModel
-from ..types.create_embedding_response import CreateEmbeddingResponse
+from ..types.create_embedding_response import Usage, CreateEmbeddingResponse
 
-__all__ = ["Embeddings", "AsyncEmbeddings"]
+__all__ = [
+    "Embeddings",
+    "AsyncEmbeddings",
+    "EmbeddingBatcher",
+    "AsyncEmbeddingBatcher",
+    "CachedEmbeddings",
+    "AsyncCachedEmbeddings",
+]
+
+DEFAULT_BATCH_WINDOW_MS = 5
+
+# the API accepts at most 2048 inputs, and 300,000 tokens across all inputs, in a single request
+MAX_BATCH_INPUTS = 2048
+MAX_BATCH_TOKENS = 300_000
+
+_EventT = TypeVar("_EventT", threading.Event, anyio.Event)
+
+# model, dimensions, encoding_format, user and the kind of inputs
+_BatchKey = Tuple[str, object, object, object, str]
+
+EmbeddingMatrix = Union["np.ndarray[Any, np.dtype[np.float32]]", "memoryview[float]"]
 
 
 class Embeddings(SyncAPIResource):
@@ -134,6 +162,66 @@ class Embeddings(SyncAPIResource):
             cast_to=CreateEmbeddingResponse,
         )
 
+    def create_matrix(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> EmbeddingMatrix:
+        """
+        Creates embeddings for the given input, like `.create()`, and returns them as a single
+        contiguous `(len(input), dimensions)` float32 matrix.
+
+        The embeddings are requested in the `base64` format and decoded straight into the
+        matrix, without creating a list of floats or an `Embedding` object for every input.
+        The matrix is a NumPy array if NumPy is installed, or a 2D `memoryview` of floats
+        otherwise. Use `.create()` if you need the usage of the request.
+        """
+        params = {
+            "input": input,
+            "model": model,
+            "user": user,
+            "dimensions": dimensions,
+            "encoding_format": "base64",
+        }
+        response = self._post(
+            "/embeddings",
+            body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
+            options=make_request_options(
+                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+            ),
+            cast_to=httpx.Response,
+        )
+        return _decode_embedding_matrix(response.content)
+
+    def batcher(
+        self,
+        *,
+        max_wait_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_inputs: int = MAX_BATCH_INPUTS,
+        max_tokens: int = MAX_BATCH_TOKENS,
+    ) -> EmbeddingBatcher:
+        """
+        Returns an `EmbeddingBatcher` that combines concurrent `.create()` calls from multiple
+        threads into a single request, see `EmbeddingBatcher` for details.
+        """
+        return EmbeddingBatcher(self, max_wait_ms=max_wait_ms, max_inputs=max_inputs, max_tokens=max_tokens)
+
+    def with_cache(self, cache: EmbeddingCache) -> CachedEmbeddings:
+        """
+        Returns a `CachedEmbeddings` that only requests the embeddings of inputs that aren't
+        in the given cache, see `CachedEmbeddings` for details.
+        """
+        return CachedEmbeddings(self, cache)
+
 
 class AsyncEmbeddings(AsyncAPIResource):
     @cached_property
@@ -246,6 +334,566 @@ class AsyncEmbeddings(AsyncAPIResource):
             cast_to=CreateEmbeddingResponse,
         )
 
+    async def create_matrix(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> EmbeddingMatrix:
+        """
+        Creates embeddings for the given input, like `.create()`, and returns them as a single
+        contiguous `(len(input), dimensions)` float32 matrix.
+
+        The embeddings are requested in the `base64` format and decoded straight into the
+        matrix, without creating a list of floats or an `Embedding` object for every input.
+        The matrix is a NumPy array if NumPy is installed, or a 2D `memoryview` of floats
+        otherwise. Use `.create()` if you need the usage of the request.
+        """
+        params = {
+            "input": input,
+            "model": model,
+            "user": user,
+            "dimensions": dimensions,
+            "encoding_format": "base64",
+        }
+        response = await self._post(
+            "/embeddings",
+            body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
+            options=make_request_options(
+                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+            ),
+            cast_to=httpx.Response,
+        )
+        return _decode_embedding_matrix(response.content)
+
+    def batcher(
+        self,
+        *,
+        max_wait_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_inputs: int = MAX_BATCH_INPUTS,
+        max_tokens: int = MAX_BATCH_TOKENS,
+    ) -> AsyncEmbeddingBatcher:
+        """
+        Returns an `AsyncEmbeddingBatcher` that combines concurrent `.create()` calls from multiple
+        tasks into a single request, see `AsyncEmbeddingBatcher` for details.
+        """
+        return AsyncEmbeddingBatcher(self, max_wait_ms=max_wait_ms, max_inputs=max_inputs, max_tokens=max_tokens)
+
+    def with_cache(self, cache: Union[EmbeddingCache, AsyncEmbeddingCache]) -> AsyncCachedEmbeddings:
+        """
+        Returns an `AsyncCachedEmbeddings` that only requests the embeddings of inputs that
+        aren't in the given cache, see `AsyncCachedEmbeddings` for details.
+        """
+        return AsyncCachedEmbeddings(self, cache)
+
+
+def _decode_embedding_matrix(content: bytes) -> EmbeddingMatrix:
+    rows = sorted(from_json(content)["data"], key=lambda row: row["index"])
+    embeddings = [row["embedding"] for row in rows]
+
+    if embeddings and not isinstance(embeddings[0], str):
+        # the embeddings were returned as lists of floats
+        data = bytearray(array.array("f", itertools.chain.from_iterable(embeddings)).tobytes())
+    elif any(embedding.endswith("=") for embedding in embeddings):
+        # every embedding is padded separately, so they have to be decoded one at a time
+        data = bytearray().join(binascii.a2b_base64(embedding) for embedding in embeddings)
+    else:
+        # otherwise all of the embeddings can be decoded in a single pass
+        data = bytearray(binascii.a2b_base64("".join(embeddings)))
+
+    if not embeddings:
+        # the number of dimensions isn't known without any embeddings
+        if has_numpy():
+            return np.empty((0, 0), dtype="float32")  # type: ignore[no-any-return]
+        return memoryview(data).cast("f")
+
+    if has_numpy():
+        return np.frombuffer(data, dtype="float32").reshape(len(embeddings), -1)  # type: ignore[no-any-return]
+
+    dimensions = len(data) // 4 // len(embeddings)
+    return memoryview(data).cast("f", [len(embeddings), dimensions])
+
+
+class _PendingBatch(Generic[_EventT]):
+    """The inputs of concurrent `.create()` calls that are sent in a single request"""
+
+    def __init__(self, full: _EventT, done: _EventT) -> None:
+        self.inputs: List[Any] = []
+        self.tokens = 0
+        self.full: _EventT = full
+        self.done: _EventT = done
+        self.response: Optional[CreateEmbeddingResponse] = None
+        self.rows: List[Embedding] = []
+        self.error: Optional[BaseException] = None
+
+    def fits(self, inputs: int, tokens: int, *, max_inputs: int, max_tokens: int) -> bool:
+        return len(self.inputs) + inputs <= max_inputs and self.tokens + tokens <= max_tokens
+
+    def add(self, inputs: List[Any], tokens: int) -> Tuple[int, int]:
+        offset = (len(self.inputs), self.tokens)
+        self.inputs.extend(inputs)
+        self.tokens += tokens
+        return offset
+
+    def set_response(self, response: CreateEmbeddingResponse) -> None:
+        self.response = response
+        self.rows = sorted(response.data, key=lambda row: row.index)
+
+    def result(self, offset: int, count: int, token_offset: int, tokens: int) -> CreateEmbeddingResponse:
+        """Returns the part of the combined response that belongs to a single `.create()` call"""
+        if self.error is not None:
+            raise self.error
+        if self.response is None:
+            raise RuntimeError("The batched embeddings request was interrupted")
+
+        data: List[Embedding] = []
+        for index, row in enumerate(self.rows[offset : offset + count]):
+            row = model_copy(row)
+            row.index = index
+            data.append(row)
+
+        def share(total: int) -> int:
+            # split the usage in proportion to the (estimated) tokens of each call, so that
+            # the usage of all of the calls in the batch adds up to the usage of the request
+            return total * (token_offset + tokens) // self.tokens - total * token_offset // self.tokens
+
+        result = model_copy(self.response)
+        result.data = data
+        result.usage = model_copy(self.response.usage)
+        result.usage.prompt_tokens = share(self.response.usage.prompt_tokens)
+        result.usage.total_tokens = share(self.response.usage.total_tokens)
+        return result
+
+
+def _batch_inputs(input: List[Any]) -> Optional[Tuple[str, List[Any], int]]:
+    """Returns the kind of inputs, the individual inputs and an upper bound of their tokens, if they can be batched"""
+    if not input:
+        return None
+
+    if all(isinstance(item, str) for item in input):
+        # the number of tokens of a text is at most the number of bytes in it
+        return "text", input, sum(max(len(item.encode("utf-8")), 1) for item in input)
+
+    if all(isinstance(item, int) for item in input):
+        return "tokens", [input], len(input)
+
+    inputs = [list(item) for item in input]
+    if all(isinstance(token, int) for item in inputs for token in item):
+        return "tokens", inputs, sum(max(len(item), 1) for item in inputs)
+
+    return None
+
+
+class EmbeddingBatcher:
+    """Combines concurrent `.create()` calls into a single embeddings request.
+
+    The first call for a given model, `dimensions`, `encoding_format` and `user` waits for up
+    to `max_wait_ms` for other calls to join it, or until the batch reaches `max_inputs` inputs
+    or `max_tokens` tokens, before sending all of the inputs in one request. Every call then
+    receives the embeddings of its own inputs, indexed from 0, and a share of the usage.
+
+    Calls that would exceed the limits on their own are sent as separate requests, and if the
+    combined request fails then every call in the batch raises the error.
+
+    ```py
+    batcher = client.embeddings.batcher()
+
+    # from multiple threads
+    response = batcher.create(input="hello", model="text-embedding-3-small")
+    ```
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        *,
+        max_wait_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_inputs: int = MAX_BATCH_INPUTS,
+        max_tokens: int = MAX_BATCH_TOKENS,
+    ) -> None:
+        self._embeddings = embeddings
+        self._max_wait = max_wait_ms / 1000
+        self._max_inputs = max_inputs
+        self._max_tokens = max_tokens
+        self._pending: Dict[_BatchKey, _PendingBatch[threading.Event]] = {}
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        encoding_format: Literal["float", "base64"] | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+    ) -> CreateEmbeddingResponse:
+        """Creates embeddings for the given input, as part of a batch, see `Embeddings.create()`"""
+        items: List[Any] = [input] if isinstance(input, str) else list(cast("Iterable[Any]", input))
+        batch_inputs = _batch_inputs(items)
+        if batch_inputs is None or not self._fits_alone(batch_inputs):
+            return self._embeddings.create(
+                input=items, model=model, dimensions=dimensions, encoding_format=encoding_format, user=user
+            )
+
+        kind, inputs, tokens = batch_inputs
+        key: _BatchKey = (model, dimensions, encoding_format, user, kind)
+
+        with self._lock:
+            batch = self._pending.get(key)
+            if batch is not None and not batch.fits(
+                len(inputs), tokens, max_inputs=self._max_inputs, max_tokens=self._max_tokens
+            ):
+                # send the current batch straight away and start a new one
+                del self._pending[key]
+                batch.full.set()
+                batch = None
+
+            is_leader = batch is None
+            if batch is None:
+                batch = self._pending[key] = _PendingBatch(threading.Event(), threading.Event())
+
+            offset, token_offset = batch.add(inputs, tokens)
+
+        if not is_leader:
+            batch.done.wait()
+            return batch.result(offset, len(inputs), token_offset, tokens)
+
+        try:
+            batch.full.wait(self._max_wait)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+
+            batch.set_response(
+                self._embeddings.create(
+                    input=batch.inputs, model=model, dimensions=dimensions, encoding_format=encoding_format, user=user
+                )
+            )
+        except Exception as err:
+            batch.error = err
+        finally:
+            batch.done.set()
+
+        return batch.result(offset, len(inputs), token_offset, tokens)
+
+    def _fits_alone(self, batch_inputs: Tuple[str, List[Any], int]) -> bool:
+        _, inputs, tokens = batch_inputs
+        return len(inputs) <= self._max_inputs and tokens <= self._max_tokens
+
+
+class AsyncEmbeddingBatcher:
+    """Combines concurrent `.create()` calls into a single embeddings request.
+
+    The first call for a given model, `dimensions`, `encoding_format` and `user` waits for up
+    to `max_wait_ms` for other calls to join it, or until the batch reaches `max_inputs` inputs
+    or `max_tokens` tokens, before sending all of the inputs in one request. Every call then
+    receives the embeddings of its own inputs, indexed from 0, and a share of the usage.
+
+    Calls that would exceed the limits on their own are sent as separate requests, and if the
+    combined request fails then every call in the batch raises the error. The call that sends
+    the request is shielded from cancellation until the request has finished, so that the
+    other calls in the batch still receive their embeddings.
+
+    ```py
+    batcher = client.embeddings.batcher()
+
+    # from multiple tasks
+    response = await batcher.create(input="hello", model="text-embedding-3-small")
+    ```
+    """
+
+    def __init__(
+        self,
+        embeddings: AsyncEmbeddings,
+        *,
+        max_wait_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_inputs: int = MAX_BATCH_INPUTS,
+        max_tokens: int = MAX_BATCH_TOKENS,
+    ) -> None:
+        self._embeddings = embeddings
+        self._max_wait = max_wait_ms / 1000
+        self._max_inputs = max_inputs
+        self._max_tokens = max_tokens
+        self._pending: Dict[_BatchKey, _PendingBatch[anyio.Event]] = {}
+
+    async def create(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        encoding_format: Literal["float", "base64"] | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+    ) -> CreateEmbeddingResponse:
+        """Creates embeddings for the given input, as part of a batch, see `AsyncEmbeddings.create()`"""
+        items: List[Any] = [input] if isinstance(input, str) else list(cast("Iterable[Any]", input))
+        batch_inputs = _batch_inputs(items)
+        if batch_inputs is None or not self._fits_alone(batch_inputs):
+            return await self._embeddings.create(
+                input=items, model=model, dimensions=dimensions, encoding_format=encoding_format, user=user
+            )
+
+        kind, inputs, tokens = batch_inputs
+        key: _BatchKey = (model, dimensions, encoding_format, user, kind)
+
+        batch = self._pending.get(key)
+        if batch is not None and not batch.fits(
+            len(inputs), tokens, max_inputs=self._max_inputs, max_tokens=self._max_tokens
+        ):
+            # send the current batch straight away and start a new one
+            del self._pending[key]
+            batch.full.set()
+            batch = None
+
+        is_leader = batch is None
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(anyio.Event(), anyio.Event())
+
+        offset, token_offset = batch.add(inputs, tokens)
+
+        if not is_leader:
+            await batch.done.wait()
+            return batch.result(offset, len(inputs), token_offset, tokens)
+
+        with anyio.CancelScope(shield=True):
+            try:
+                with anyio.move_on_after(self._max_wait):
+                    await batch.full.wait()
+
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+
+                batch.set_response(
+                    await self._embeddings.create(
+                        input=batch.inputs,
+                        model=model,
+                        dimensions=dimensions,
+                        encoding_format=encoding_format,
+                        user=user,
+                    )
+                )
+            except Exception as err:
+                batch.error = err
+            finally:
+                batch.done.set()
+
+        return batch.result(offset, len(inputs), token_offset, tokens)
+
+    def _fits_alone(self, batch_inputs: Tuple[str, List[Any], int]) -> bool:
+        _, inputs, tokens = batch_inputs
+        return len(inputs) <= self._max_inputs and tokens <= self._max_tokens
+
+
+def _vector_bytes(embedding: object) -> bytes:
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    return array.array("f", cast("Iterable[float]", embedding)).tobytes()
+
+
+def _vector_output(vector: bytes, *, encoding_format: Literal["float", "base64"] | NotGiven) -> Any:
+    if encoding_format == "base64":
+        return base64.b64encode(vector).decode("ascii")
+
+    floats = array.array("f")
+    floats.frombytes(vector)
+    return floats.tolist()
+
+
+class _CacheLookup:
+    """The embeddings of the inputs of a `.create()` call that were found in the cache, and the inputs that weren't"""
+
+    def __init__(self, inputs: List[Any], keys: List[str], cached: List[Optional[bytes]]) -> None:
+        self.keys = keys
+        self.vectors = cached
+        # the inputs that have to be embedded, identical inputs are only embedded once
+        self.missing: Dict[str, Any] = {}
+        for key, item, vector in zip(keys, inputs, cached):
+            if vector is None:
+                self.missing.setdefault(key, item)
+
+    def add(self, response: CreateEmbeddingResponse) -> Dict[str, bytes]:
+        """Adds the embeddings of the missing inputs, returns them so that they can be cached"""
+        missing_keys = list(self.missing)
+        embedded = {missing_keys[row.index]: _vector_bytes(row.embedding) for row in response.data}
+        self.vectors = [embedded[key] if vector is None else vector for key, vector in zip(self.keys, self.vectors)]
+        return embedded
+
+    def response(
+        self, *, model: str, usage: Usage, encoding_format: Literal["float", "base64"] | NotGiven
+    ) -> CreateEmbeddingResponse:
+        data = [
+            Embedding.construct(
+                embedding=_vector_output(cast(bytes, vector), encoding_format=encoding_format),
+                index=index,
+                object="embedding",
+            )
+            for index, vector in enumerate(self.vectors)
+        ]
+        return CreateEmbeddingResponse.construct(data=data, model=model, object="list", usage=usage)
+
+
+class CachedEmbeddings:
+    """Creates embeddings like `Embeddings.create()`, but serves the embeddings of inputs that are in the cache.
+
+    Every input is cached separately, keyed by a hash of the model, `dimensions` and the input,
+    and only the inputs that aren't cached are sent to the API, in a single request. The
+    embeddings are returned in the same order as the inputs, the usage only includes the
+    tokens of the inputs that were sent.
+
+    ```py
+    from openai.lib.embedding_cache import SQLiteEmbeddingCache
+
+    embeddings = client.embeddings.with_cache(SQLiteEmbeddingCache("embeddings.db"))
+    response = embeddings.create(input=documents, model="text-embedding-3-small")
+    ```
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache) -> None:
+        self._embeddings = embeddings
+        self.cache = cache
+
+    def create(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        encoding_format: Literal["float", "base64"] | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> CreateEmbeddingResponse:
+        """Creates embeddings for the inputs that aren't cached, see `Embeddings.create()`"""
+        items: List[Any] = [input] if isinstance(input, str) else list(cast("Iterable[Any]", input))
+        batch_inputs = _batch_inputs(items)
+        if batch_inputs is None:
+            return self._embeddings.create(
+                input=items,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        _, inputs, _ = batch_inputs
+        keys = [embedding_cache_key(model, dimensions if is_given(dimensions) else None, item) for item in inputs]
+        lookup = _CacheLookup(inputs, keys, self.cache.get_many(keys))
+        if not lookup.missing:
+            return lookup.response(
+                model=model, usage=Usage(prompt_tokens=0, total_tokens=0), encoding_format=encoding_format
+            )
+
+        response = self._embeddings.create(
+            input=list(lookup.missing.values()),
+            model=model,
+            dimensions=dimensions,
+            encoding_format=encoding_format,
+            user=user,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        self.cache.set_many(lookup.add(response))
+        return lookup.response(model=response.model, usage=response.usage, encoding_format=encoding_format)
+
+
+class AsyncCachedEmbeddings:
+    """Creates embeddings like `AsyncEmbeddings.create()`, but serves the embeddings of inputs that are in the cache.
+
+    Every input is cached separately, keyed by a hash of the model, `dimensions` and the input,
+    and only the inputs that aren't cached are sent to the API, in a single request. The
+    embeddings are returned in the same order as the inputs, the usage only includes the
+    tokens of the inputs that were sent.
+
+    The cache can either be an `AsyncEmbeddingCache`, or an `EmbeddingCache` which is then
+    called from a worker thread so that it doesn't block the event loop.
+    """
+
+    def __init__(self, embeddings: AsyncEmbeddings, cache: Union[EmbeddingCache, AsyncEmbeddingCache]) -> None:
+        self._embeddings = embeddings
+        self.cache = cache
+
+    async def create(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: Union[str, EmbeddingModel],
+        dimensions: int | NotGiven = NOT_GIVEN,
+        encoding_format: Literal["float", "base64"] | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> CreateEmbeddingResponse:
+        """Creates embeddings for the inputs that aren't cached, see `AsyncEmbeddings.create()`"""
+        items: List[Any] = [input] if isinstance(input, str) else list(cast("Iterable[Any]", input))
+        batch_inputs = _batch_inputs(items)
+        if batch_inputs is None:
+            return await self._embeddings.create(
+                input=items,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        _, inputs, _ = batch_inputs
+        keys = [embedding_cache_key(model, dimensions if is_given(dimensions) else None, item) for item in inputs]
+        lookup = _CacheLookup(inputs, keys, await self._get_many(keys))
+        if not lookup.missing:
+            return lookup.response(
+                model=model, usage=Usage(prompt_tokens=0, total_tokens=0), encoding_format=encoding_format
+            )
+
+        response = await self._embeddings.create(
+            input=list(lookup.missing.values()),
+            model=model,
+            dimensions=dimensions,
+            encoding_format=encoding_format,
+            user=user,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        )
+        await self._set_many(lookup.add(response))
+        return lookup.response(model=response.model, usage=response.usage, encoding_format=encoding_format)
+
+    async def _get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        if isinstance(self.cache, AsyncEmbeddingCache):
+            return await self.cache.get_many(keys)
+        return await anyio.to_thread.run_sync(self.cache.get_many, keys)
+
+    async def _set_many(self, items: Dict[str, bytes]) -> None:
+        if isinstance(self.cache, AsyncEmbeddingCache):
+            await self.cache.set_many(items)
+        else:
+            await anyio.to_thread.run_sync(self.cache.set_many, items)
+
 
 class EmbeddingsWithRawResponse:
     def __init__(self, embeddings: Embeddings) -> None:
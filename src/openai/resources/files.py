@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import time
 import typing_extensions
-from typing import Mapping, cast
+from typing import Dict, Mapping, cast
+from pathlib import Path
 from typing_extensions import Literal
 
 import httpx
@@ -21,7 +23,9 @@ from .._utils import (
 from .._compat import cached_property
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import (
+    ResponseContextManager,
     StreamedBinaryAPIResponse,
+    AsyncResponseContextManager,
     AsyncStreamedBinaryAPIResponse,
     to_streamed_response_wrapper,
     async_to_streamed_response_wrapper,
@@ -30,6 +34,7 @@ from .._response import (
 )
 from ..pagination import SyncCursorPage, AsyncCursorPage
 from .._base_client import AsyncPaginator, make_request_options
+from ..lib._downloads import DEFAULT_PART_SIZE, DEFAULT_CONCURRENCY, download_file, async_download_file
 from ..types.file_object import FileObject
 from ..types.file_deleted import FileDeleted
 from ..types.file_purpose import FilePurpose
@@ -352,6 +357,40 @@ class Files(SyncAPIResource):
 
         return file
 
+    def download(
+        self,
+        file_id: str,
+        path: str | os.PathLike[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        part_size: int = DEFAULT_PART_SIZE,
+    ) -> Path:
+        """Downloads the contents of the specified file to `path`, fetching up to `concurrency` parts at once.
+
+        The parts are requested with `Range` requests and written to a preallocated `{path}.part`
+        file. If the download fails, downloading the same file to the same path again resumes it,
+        and only fetches the parts that haven't been written yet. If the server doesn't support
+        `Range` requests then the file is downloaded with a single request.
+
+        ```py
+        client.files.download(batch.output_file_id, "output.jsonl", concurrency=8)
+        ```
+        """
+        if not file_id:
+            raise ValueError(f"Expected a non-empty value for `file_id` but received {file_id!r}")
+
+        def fetch(headers: Dict[str, str]) -> ResponseContextManager[StreamedBinaryAPIResponse]:
+            return self.with_streaming_response.content(file_id, extra_headers=headers)
+
+        return download_file(
+            fetch,
+            Path(path),
+            part_size=part_size,
+            concurrency=concurrency,
+            max_retries=self._client.max_retries,
+            params={"file_id": file_id},
+        )
+
 
 class AsyncFiles(AsyncAPIResource):
     @cached_property
@@ -668,6 +707,40 @@ class AsyncFiles(AsyncAPIResource):
 
         return file
 
+    async def download(
+        self,
+        file_id: str,
+        path: str | os.PathLike[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        part_size: int = DEFAULT_PART_SIZE,
+    ) -> Path:
+        """Downloads the contents of the specified file to `path`, fetching up to `concurrency` parts at once.
+
+        The parts are requested with `Range` requests and written to a preallocated `{path}.part`
+        file. If the download fails, downloading the same file to the same path again resumes it,
+        and only fetches the parts that haven't been written yet. If the server doesn't support
+        `Range` requests then the file is downloaded with a single request.
+
+        ```py
+        await client.files.download(batch.output_file_id, "output.jsonl", concurrency=8)
+        ```
+        """
+        if not file_id:
+            raise ValueError(f"Expected a non-empty value for `file_id` but received {file_id!r}")
+
+        def fetch(headers: Dict[str, str]) -> AsyncResponseContextManager[AsyncStreamedBinaryAPIResponse]:
+            return self.with_streaming_response.content(file_id, extra_headers=headers)
+
+        return await async_download_file(
+            fetch,
+            Path(path),
+            part_size=part_size,
+            concurrency=concurrency,
+            max_retries=self._client.max_retries,
+            params={"file_id": file_id},
+        )
+
 
 class FilesWithRawResponse:
     def __init__(self, files: Files) -> None:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import io
 import os
 import logging
 import builtins
+import functools
 from typing import List, overload
 from pathlib import Path
 
@@ -22,8 +22,9 @@ from .parts import (
     AsyncPartsWithStreamingResponse,
 )
 from ...types import FilePurpose, upload_create_params, upload_complete_params
-from ..._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from ..._types import NOT_GIVEN, Body, Query, Headers, NotGiven, FileContent
 from ..._utils import (
+    is_given,
     maybe_transform,
     async_maybe_transform,
 )
@@ -31,6 +32,7 @@ from ..._compat import cached_property
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
 from ..._base_client import make_request_options
+from ...lib._uploads import FileSource, UploadManifest, split_file, upload_parts, async_upload_parts
 from ...types.upload import Upload
 from ...types.file_purpose import FilePurpose
 
@@ -40,6 +42,8 @@ __all__ = ["Uploads", "AsyncUploads"]
 # 64MB
 DEFAULT_PART_SIZE = 64 * 1024 * 1024
 
+DEFAULT_MAX_CONCURRENCY = 5
+
 log: logging.Logger = logging.getLogger(__name__)
 
 
@@ -77,8 +81,11 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them concurrently."""
 
     @overload
     def upload_file_chunked(
@@ -91,8 +98,11 @@ class Uploads(SyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them concurrently."""
 
     def upload_file_chunked(
         self,
@@ -104,8 +114,19 @@ class Uploads(SyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them concurrently.
+
+        Up to `max_concurrency` parts are uploaded at once, each part is retried separately
+        and the parts are always completed in order. If `compute_md5` is true and no `md5`
+        is given then the checksum of the file is computed while the parts are uploaded.
+
+        If a `manifest` path is given then the uploaded parts are recorded to that file, so
+        that if the upload fails, calling this method again with the same arguments resumes
+        the upload and only sends the parts that haven't been uploaded yet.
 
         ```py
         from pathlib import Path
@@ -123,6 +144,9 @@ class Uploads(SyncAPIResource):
 
             if bytes is None:
                 raise TypeError("The `bytes` argument must be given for in-memory files")
+
+            source: FileSource = memoryview(file)
+            size = len(file)
         else:
             if not isinstance(file, Path):
                 file = Path(file)
@@ -130,41 +154,60 @@ class Uploads(SyncAPIResource):
             if not filename:
                 filename = file.name
 
+            source = file
+            size = file.stat().st_size
             if bytes is None:
-                bytes = file.stat().st_size
-
-        upload = self.create(
-            bytes=bytes,
-            filename=filename,
-            mime_type=mime_type,
-            purpose=purpose,
-        )
-
-        part_ids: list[str] = []
+                bytes = size
 
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, builtins.bytes):
-            buf: io.FileIO | io.BytesIO = io.BytesIO(file)
+        parts = split_file(source, size=size, part_size=part_size)
+
+        upload_manifest = (
+            UploadManifest.load(
+                manifest, filename=filename, bytes=bytes, mime_type=mime_type, purpose=purpose, part_size=part_size
+            )
+            if manifest is not None
+            else None
+        )
+
+        if upload_manifest is not None and upload_manifest.upload_id is not None:
+            upload_id = upload_manifest.upload_id
+            log.info("Resuming upload %s from %s", upload_id, upload_manifest.path)
         else:
-            buf = io.FileIO(file)
+            upload = self.create(
+                bytes=bytes,
+                filename=filename,
+                mime_type=mime_type,
+                purpose=purpose,
+            )
+            upload_id = upload.id
+
+            if upload_manifest is not None:
+                upload_manifest.start(upload)
+
+        def upload_part(data: FileContent) -> str:
+            part = self.parts.create(upload_id=upload_id, data=data)
+            log.info("Uploaded part %s for upload %s", part.id, upload_id)
+            return part.id
+
+        part_ids, checksum = upload_parts(
+            upload_part,
+            parts,
+            max_concurrency=max_concurrency,
+            md5_source=source if compute_md5 and not is_given(md5) else None,
+            manifest=upload_manifest,
+        )
+        if checksum is not None:
+            md5 = checksum
 
-        try:
-            while True:
-                data = buf.read(part_size)
-                if not data:
-                    # EOF
-                    break
+        completed = self.complete(upload_id=upload_id, part_ids=part_ids, md5=md5)
 
-                part = self.parts.create(upload_id=upload.id, data=data)
-                log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                part_ids.append(part.id)
-        except Exception:
-            buf.close()
-            raise
+        if upload_manifest is not None:
+            upload_manifest.remove()
 
-        return self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
+        return completed
 
     def create(
         self,
@@ -370,8 +413,11 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits a file into multiple 64MB parts and uploads them sequentially."""
+        """Splits a file into multiple 64MB parts and uploads them concurrently."""
 
     @overload
     async def upload_file_chunked(
@@ -384,8 +430,11 @@ class AsyncUploads(AsyncAPIResource):
         purpose: FilePurpose,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits an in-memory file into multiple 64MB parts and uploads them sequentially."""
+        """Splits an in-memory file into multiple 64MB parts and uploads them concurrently."""
 
     async def upload_file_chunked(
         self,
@@ -397,8 +446,19 @@ class AsyncUploads(AsyncAPIResource):
         bytes: int | None = None,
         part_size: int | None = None,
         md5: str | NotGiven = NOT_GIVEN,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compute_md5: bool = False,
+        manifest: str | os.PathLike[str] | None = None,
     ) -> Upload:
-        """Splits the given file into multiple parts and uploads them sequentially.
+        """Splits the given file into multiple parts and uploads them concurrently.
+
+        Up to `max_concurrency` parts are uploaded at once, each part is retried separately
+        and the parts are always completed in order. If `compute_md5` is true and no `md5`
+        is given then the checksum of the file is computed while the parts are uploaded.
+
+        If a `manifest` path is given then the uploaded parts are recorded to that file, so
+        that if the upload fails, calling this method again with the same arguments resumes
+        the upload and only sends the parts that haven't been uploaded yet.
 
         ```py
         from pathlib import Path
@@ -416,6 +476,9 @@ class AsyncUploads(AsyncAPIResource):
 
             if bytes is None:
                 raise TypeError("The `bytes` argument must be given for in-memory files")
+
+            source: FileSource = memoryview(file)
+            size = len(file)
         else:
             if not isinstance(file, anyio.Path):
                 file = anyio.Path(file)
@@ -423,52 +486,69 @@ class AsyncUploads(AsyncAPIResource):
             if not filename:
                 filename = file.name
 
+            source = Path(file)
+            stat = await file.stat()
+            size = stat.st_size
             if bytes is None:
-                stat = await file.stat()
-                bytes = stat.st_size
-
-        upload = await self.create(
-            bytes=bytes,
-            filename=filename,
-            mime_type=mime_type,
-            purpose=purpose,
-        )
-
-        part_ids: list[str] = []
+                bytes = size
 
         if part_size is None:
             part_size = DEFAULT_PART_SIZE
 
-        if isinstance(file, anyio.Path):
-            fd = await file.open("rb")
-            async with fd:
-                while True:
-                    data = await fd.read(part_size)
-                    if not data:
-                        # EOF
-                        break
-
-                    part = await self.parts.create(upload_id=upload.id, data=data)
-                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                    part_ids.append(part.id)
+        parts = split_file(source, size=size, part_size=part_size)
+
+        upload_manifest = (
+            await anyio.to_thread.run_sync(
+                functools.partial(
+                    UploadManifest.load,
+                    manifest,
+                    filename=filename,
+                    bytes=bytes,
+                    mime_type=mime_type,
+                    purpose=purpose,
+                    part_size=part_size,
+                )
+            )
+            if manifest is not None
+            else None
+        )
+
+        if upload_manifest is not None and upload_manifest.upload_id is not None:
+            upload_id = upload_manifest.upload_id
+            log.info("Resuming upload %s from %s", upload_id, upload_manifest.path)
         else:
-            buf = io.BytesIO(file)
-
-            try:
-                while True:
-                    data = buf.read(part_size)
-                    if not data:
-                        # EOF
-                        break
-
-                    part = await self.parts.create(upload_id=upload.id, data=data)
-                    log.info("Uploaded part %s for upload %s", part.id, upload.id)
-                    part_ids.append(part.id)
-            except Exception:
-                buf.close()
-                raise
-
-        return await self.complete(upload_id=upload.id, part_ids=part_ids, md5=md5)
+            upload = await self.create(
+                bytes=bytes,
+                filename=filename,
+                mime_type=mime_type,
+                purpose=purpose,
+            )
+            upload_id = upload.id
+
+            if upload_manifest is not None:
+                await anyio.to_thread.run_sync(upload_manifest.start, upload)
+
+        async def upload_part(data: FileContent) -> str:
+            part = await self.parts.create(upload_id=upload_id, data=data)
+            log.info("Uploaded part %s for upload %s", part.id, upload_id)
+            return part.id
+
+        part_ids, checksum = await async_upload_parts(
+            upload_part,
+            parts,
+            max_concurrency=max_concurrency,
+            md5_source=source if compute_md5 and not is_given(md5) else None,
+            manifest=upload_manifest,
+        )
+        if checksum is not None:
+            md5 = checksum
+
+        completed = await self.complete(upload_id=upload_id, part_ids=part_ids, md5=md5)
+
+        if upload_manifest is not None:
+            await anyio.to_thread.run_sync(upload_manifest.remove)
+
+        return completed
 
     async def create(
         self,
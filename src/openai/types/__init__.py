@@ -2,51 +2,164 @@
 
 from __future__ import annotations
 
-from .batch import Batch as Batch
-from .image import Image as Image
-from .model import Model as Model
-from .shared import (
-    ErrorObject as ErrorObject,
-    FunctionDefinition as FunctionDefinition,
-    FunctionParameters as FunctionParameters,
-    ResponseFormatText as ResponseFormatText,
-    ResponseFormatJSONObject as ResponseFormatJSONObject,
-    ResponseFormatJSONSchema as ResponseFormatJSONSchema,
+from typing import TYPE_CHECKING
+
+from .._utils._lazy import lazy_imports
+
+if TYPE_CHECKING:
+    from .batch import Batch as Batch
+    from .image import Image as Image
+    from .model import Model as Model
+    from .shared import (
+        ErrorObject as ErrorObject,
+        FunctionDefinition as FunctionDefinition,
+        FunctionParameters as FunctionParameters,
+        ResponseFormatText as ResponseFormatText,
+        ResponseFormatJSONObject as ResponseFormatJSONObject,
+        ResponseFormatJSONSchema as ResponseFormatJSONSchema,
+    )
+    from .upload import Upload as Upload
+    from .embedding import Embedding as Embedding
+    from .chat_model import ChatModel as ChatModel
+    from .completion import Completion as Completion
+    from .moderation import Moderation as Moderation
+    from .audio_model import AudioModel as AudioModel
+    from .batch_error import BatchError as BatchError
+    from .file_object import FileObject as FileObject
+    from .image_model import ImageModel as ImageModel
+    from .file_content import FileContent as FileContent
+    from .file_deleted import FileDeleted as FileDeleted
+    from .file_purpose import FilePurpose as FilePurpose
+    from .model_deleted import ModelDeleted as ModelDeleted
+    from .embedding_model import EmbeddingModel as EmbeddingModel
+    from .images_response import ImagesResponse as ImagesResponse
+    from .completion_usage import CompletionUsage as CompletionUsage
+    from .file_list_params import FileListParams as FileListParams
+    from .moderation_model import ModerationModel as ModerationModel
+    from .batch_list_params import BatchListParams as BatchListParams
+    from .completion_choice import CompletionChoice as CompletionChoice
+    from .image_edit_params import ImageEditParams as ImageEditParams
+    from .file_create_params import FileCreateParams as FileCreateParams
+    from .batch_create_params import BatchCreateParams as BatchCreateParams
+    from .batch_request_counts import BatchRequestCounts as BatchRequestCounts
+    from .upload_create_params import UploadCreateParams as UploadCreateParams
+    from .audio_response_format import AudioResponseFormat as AudioResponseFormat
+    from .image_generate_params import ImageGenerateParams as ImageGenerateParams
+    from .upload_complete_params import UploadCompleteParams as UploadCompleteParams
+    from .embedding_create_params import EmbeddingCreateParams as EmbeddingCreateParams
+    from .completion_create_params import CompletionCreateParams as CompletionCreateParams
+    from .moderation_create_params import ModerationCreateParams as ModerationCreateParams
+    from .create_embedding_response import CreateEmbeddingResponse as CreateEmbeddingResponse
+    from .moderation_create_response import ModerationCreateResponse as ModerationCreateResponse
+    from .moderation_text_input_param import ModerationTextInputParam as ModerationTextInputParam
+    from .image_create_variation_params import ImageCreateVariationParams as ImageCreateVariationParams
+    from .moderation_image_url_input_param import ModerationImageURLInputParam as ModerationImageURLInputParam
+    from .moderation_multi_modal_input_param import ModerationMultiModalInputParam as ModerationMultiModalInputParam
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "beta": ".beta",
+        "chat": ".chat",
+        "audio": ".audio",
+        "shared": ".shared",
+        "uploads": ".uploads",
+        "fine_tuning": ".fine_tuning",
+        "shared_params": ".shared_params",
+        "Batch": ".batch",
+        "Image": ".image",
+        "Model": ".model",
+        "ErrorObject": ".shared",
+        "FunctionDefinition": ".shared",
+        "FunctionParameters": ".shared",
+        "ResponseFormatText": ".shared",
+        "ResponseFormatJSONObject": ".shared",
+        "ResponseFormatJSONSchema": ".shared",
+        "Upload": ".upload",
+        "Embedding": ".embedding",
+        "ChatModel": ".chat_model",
+        "Completion": ".completion",
+        "Moderation": ".moderation",
+        "AudioModel": ".audio_model",
+        "BatchError": ".batch_error",
+        "FileObject": ".file_object",
+        "ImageModel": ".image_model",
+        "FileContent": ".file_content",
+        "FileDeleted": ".file_deleted",
+        "FilePurpose": ".file_purpose",
+        "ModelDeleted": ".model_deleted",
+        "EmbeddingModel": ".embedding_model",
+        "ImagesResponse": ".images_response",
+        "CompletionUsage": ".completion_usage",
+        "FileListParams": ".file_list_params",
+        "ModerationModel": ".moderation_model",
+        "BatchListParams": ".batch_list_params",
+        "CompletionChoice": ".completion_choice",
+        "ImageEditParams": ".image_edit_params",
+        "FileCreateParams": ".file_create_params",
+        "BatchCreateParams": ".batch_create_params",
+        "BatchRequestCounts": ".batch_request_counts",
+        "UploadCreateParams": ".upload_create_params",
+        "AudioResponseFormat": ".audio_response_format",
+        "ImageGenerateParams": ".image_generate_params",
+        "UploadCompleteParams": ".upload_complete_params",
+        "EmbeddingCreateParams": ".embedding_create_params",
+        "CompletionCreateParams": ".completion_create_params",
+        "ModerationCreateParams": ".moderation_create_params",
+        "CreateEmbeddingResponse": ".create_embedding_response",
+        "ModerationCreateResponse": ".moderation_create_response",
+        "ModerationTextInputParam": ".moderation_text_input_param",
+        "ImageCreateVariationParams": ".image_create_variation_params",
+        "ModerationImageURLInputParam": ".moderation_image_url_input_param",
+        "ModerationMultiModalInputParam": ".moderation_multi_modal_input_param",
+    },
 )
-from .upload import Upload as Upload
-from .embedding import Embedding as Embedding
-from .chat_model import ChatModel as ChatModel
-from .completion import Completion as Completion
-from .moderation import Moderation as Moderation
-from .audio_model import AudioModel as AudioModel
-from .batch_error import BatchError as BatchError
-from .file_object import FileObject as FileObject
-from .image_model import ImageModel as ImageModel
-from .file_content import FileContent as FileContent
-from .file_deleted import FileDeleted as FileDeleted
-from .file_purpose import FilePurpose as FilePurpose
-from .model_deleted import ModelDeleted as ModelDeleted
-from .embedding_model import EmbeddingModel as EmbeddingModel
-from .images_response import ImagesResponse as ImagesResponse
-from .completion_usage import CompletionUsage as CompletionUsage
-from .file_list_params import FileListParams as FileListParams
-from .moderation_model import ModerationModel as ModerationModel
-from .batch_list_params import BatchListParams as BatchListParams
-from .completion_choice import CompletionChoice as CompletionChoice
-from .image_edit_params import ImageEditParams as ImageEditParams
-from .file_create_params import FileCreateParams as FileCreateParams
-from .batch_create_params import BatchCreateParams as BatchCreateParams
-from .batch_request_counts import BatchRequestCounts as BatchRequestCounts
-from .upload_create_params import UploadCreateParams as UploadCreateParams
-from .audio_response_format import AudioResponseFormat as AudioResponseFormat
-from .image_generate_params import ImageGenerateParams as ImageGenerateParams
-from .upload_complete_params import UploadCompleteParams as UploadCompleteParams
-from .embedding_create_params import EmbeddingCreateParams as EmbeddingCreateParams
-from .completion_create_params import CompletionCreateParams as CompletionCreateParams
-from .moderation_create_params import ModerationCreateParams as ModerationCreateParams
-from .create_embedding_response import CreateEmbeddingResponse as CreateEmbeddingResponse
-from .moderation_create_response import ModerationCreateResponse as ModerationCreateResponse
-from .moderation_text_input_param import ModerationTextInputParam as ModerationTextInputParam
-from .image_create_variation_params import ImageCreateVariationParams as ImageCreateVariationParams
-from .moderation_image_url_input_param import ModerationImageURLInputParam as ModerationImageURLInputParam
-from .moderation_multi_modal_input_param import ModerationMultiModalInputParam as ModerationMultiModalInputParam
+
+__all__ = [
+    "Batch",
+    "Image",
+    "Model",
+    "ErrorObject",
+    "FunctionDefinition",
+    "FunctionParameters",
+    "ResponseFormatText",
+    "ResponseFormatJSONObject",
+    "ResponseFormatJSONSchema",
+    "Upload",
+    "Embedding",
+    "ChatModel",
+    "Completion",
+    "Moderation",
+    "AudioModel",
+    "BatchError",
+    "FileObject",
+    "ImageModel",
+    "FileContent",
+    "FileDeleted",
+    "FilePurpose",
+    "ModelDeleted",
+    "EmbeddingModel",
+    "ImagesResponse",
+    "CompletionUsage",
+    "FileListParams",
+    "ModerationModel",
+    "BatchListParams",
+    "CompletionChoice",
+    "ImageEditParams",
+    "FileCreateParams",
+    "BatchCreateParams",
+    "BatchRequestCounts",
+    "UploadCreateParams",
+    "AudioResponseFormat",
+    "ImageGenerateParams",
+    "UploadCompleteParams",
+    "EmbeddingCreateParams",
+    "CompletionCreateParams",
+    "ModerationCreateParams",
+    "CreateEmbeddingResponse",
+    "ModerationCreateResponse",
+    "ModerationTextInputParam",
+    "ImageCreateVariationParams",
+    "ModerationImageURLInputParam",
+    "ModerationMultiModalInputParam",
+]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import time
+import threading
+from typing import Any, Dict, List, Iterator, AsyncIterator
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, AsyncOpenAI
+from openai.types.chat.completion_create_params import CompletionCreateParamsNonStreaming
+
+from ...conftest import base_url
+
+
+def _request(content: str) -> CompletionCreateParamsNonStreaming:
+    return {"model": "gpt-4o", "messages": [{"role": "user", "content": content}]}
+
+
+def _completion(content: str) -> Dict[str, Any]:
+    return {
+        "id": f"chatcmpl-{content}",
+        "object": "chat.completion",
+        "created": 1727346142,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls: Dict[str, int] = {}
+
+    def enter(self, content: str) -> int:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls[content] = self.calls.get(content, 0) + 1
+            return self.calls[content]
+
+    def exit(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+def _content(request: httpx.Request) -> str:
+    return str(json.loads(request.content)["messages"][0]["content"])
+
+
+def _delay(content: str) -> float:
+    # earlier requests take longer, so that they complete out of order
+    return 0.05 if content in ("0", "1") else 0.0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_map(client: OpenAI, respx_mock: MockRouter) -> None:
+    tracker = _Tracker()
+
+    def create(request: httpx.Request) -> httpx.Response:
+        content = _content(request)
+        attempt = tracker.enter(content)
+        try:
+            time.sleep(_delay(content))
+            if content == "3" and attempt == 1:
+                return httpx.Response(500, json={"error": {"message": "server error"}})
+            if content == "4":
+                return httpx.Response(400, json={"error": {"message": "bad request"}})
+            return httpx.Response(200, json=_completion(content))
+        finally:
+            tracker.exit()
+
+    respx_mock.post("/chat/completions").mock(side_effect=create)
+    client = client.with_options(max_retries=0)
+
+    with client.chat.completions.map((_request(str(i)) for i in range(8)), concurrency=3, max_retries=1) as results:
+        output = list(results)
+
+    assert [result.index for result in output] == list(range(8))
+    assert tracker.max_active <= 3
+
+    # the failed request is retried, and the bad request is returned as an error
+    assert tracker.calls["3"] == 2
+    assert output[3].result().choices[0].message.content == "3"
+    assert isinstance(output[4].error, openai.BadRequestError)
+    with pytest.raises(openai.BadRequestError):
+        output[4].result()
+
+    assert output[5].request == _request("5")
+    assert output[5].completion is not None
+    assert output[5].completion.choices[0].message.content == "5"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_map_unordered_backpressure(client: OpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.post("/chat/completions").mock(
+        side_effect=lambda request: httpx.Response(200, json=_completion(_content(request)))
+    )
+    taken: List[int] = []
+
+    def requests() -> Iterator[CompletionCreateParamsNonStreaming]:
+        for i in range(100):
+            taken.append(i)
+            yield _request(str(i))
+
+    with client.chat.completions.map(requests(), concurrency=2, ordered=False) as results:
+        first = next(results)
+
+    # only a bounded number of requests are taken from the input
+    assert first.completion is not None
+    assert len(taken) <= 4
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_map(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    tracker = _Tracker()
+
+    async def create(request: httpx.Request) -> httpx.Response:
+        content = _content(request)
+        tracker.enter(content)
+        try:
+            await anyio.sleep(_delay(content))
+            if content == "2":
+                return httpx.Response(400, json={"error": {"message": "bad request"}})
+            return httpx.Response(200, json=_completion(content))
+        finally:
+            tracker.exit()
+
+    respx_mock.post("/chat/completions").mock(side_effect=create)
+
+    async def requests() -> AsyncIterator[CompletionCreateParamsNonStreaming]:
+        for i in range(6):
+            yield _request(str(i))
+
+    async with async_client.chat.completions.map(requests(), concurrency=2) as results:
+        output = [result async for result in results]
+
+    assert [result.index for result in output] == list(range(6))
+    assert tracker.max_active <= 2
+    assert isinstance(output[2].error, openai.BadRequestError)
+    assert [result.completion.choices[0].message.content for result in output if result.completion] == [
+        "0",
+        "1",
+        "3",
+        "4",
+        "5",
+    ]
+
+    async with async_client.chat.completions.map(
+        [_request(str(i)) for i in range(6)], concurrency=3, ordered=False
+    ) as results:
+        unordered = [result.index async for result in results]
+
+    # the slow requests complete last
+    assert sorted(unordered) == list(range(6))
+    assert set(unordered[-2:]) == {0, 1}
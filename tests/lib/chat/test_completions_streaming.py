@@ -1048,6 +1048,50 @@ recommend checking a reliable weather website or a weather app.",
     )
 
 
+def test_chat_completion_state_interleaved_deltas() -> None:
+    def chunk(choices: list[dict[str, Any]]) -> ChatCompletionChunk:
+        return ChatCompletionChunk.construct(
+            id="chatcmpl-123",
+            object="chat.completion.chunk",
+            created=1727346142,
+            model="gpt-4o-2024-08-06",
+            choices=choices,
+        )
+
+    def tool_call(index: int, **fields: Any) -> dict[str, Any]:
+        return {"index": 0, "delta": {"tool_calls": [{"index": index, **fields}]}}
+
+    state: ChatCompletionStreamState[object] = ChatCompletionStreamState()
+    state.handle_chunk(chunk([{"index": 0, "delta": {"role": "assistant", "content": None}}]))
+    state.handle_chunk(chunk([tool_call(0, id="call_0", type="function", function={"name": "a", "arguments": ""})]))
+    state.handle_chunk(chunk([tool_call(1, id="call_1", type="function", function={"name": "b", "arguments": '{"x'})]))
+    state.handle_chunk(chunk([tool_call(0, function={"arguments": '{"y": 1'})]))
+    state.handle_chunk(
+        chunk(
+            [
+                tool_call(1, function={"arguments": '": 2}'}),
+                {"index": 1, "delta": {"role": "assistant", "content": "Hello"}},
+            ]
+        )
+    )
+    state.handle_chunk(chunk([tool_call(0, function={"arguments": "}"})]))
+    state.handle_chunk(chunk([{"index": 1, "delta": {"content": " world"}, "finish_reason": "stop"}]))
+
+    snapshot_ = state.current_completion_snapshot
+    tool_calls = snapshot_.choices[0].message.tool_calls
+    assert tool_calls is not None
+    assert [(call.id, call.function.name, call.function.arguments) for call in tool_calls] == [
+        ("call_0", "a", '{"y": 1}'),
+        ("call_1", "b", '{"x": 2}'),
+    ]
+    assert snapshot_.choices[0].message.model_fields_set >= {"role", "content", "tool_calls", "refusal"}
+    assert tool_calls[0].model_fields_set >= {"id", "type", "function"}
+    assert tool_calls[1].function.model_fields_set >= {"name", "arguments"}
+
+    assert snapshot_.choices[1].message.content == "Hello world"
+    assert snapshot_.choices[1].finish_reason == "stop"
+
+
 @pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
 def test_stream_method_in_sync(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
     checking_client: OpenAI | AsyncOpenAI = client if sync else async_client
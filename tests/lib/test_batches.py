@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List, Iterator, AsyncIterator
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI
+from openai.resources import batches
+from openai.lib.batches import BatchRequest
+
+from ..conftest import base_url
+
+REQUESTS = 5
+
+
+def _requests() -> Iterator[BatchRequest]:
+    for i in range(REQUESTS):
+        yield {"custom_id": f"request-{i}", "body": {"model": "gpt-4o-mini", "input": f"text {i}"}}
+
+
+def _batch(status: str) -> Dict[str, Any]:
+    batch: Dict[str, Any] = {
+        "id": "batch_abc",
+        "completion_window": "24h",
+        "created_at": 0,
+        "endpoint": "/v1/embeddings",
+        "input_file_id": "file_input",
+        "object": "batch",
+        "status": status,
+    }
+    if status == "completed":
+        batch.update(output_file_id="file_output", error_file_id="file_error")
+    return batch
+
+
+def _file(file_id: str) -> Dict[str, Any]:
+    return {
+        "id": file_id,
+        "bytes": 0,
+        "created_at": 0,
+        "filename": "batch_input.jsonl",
+        "object": "file",
+        "purpose": "batch",
+        "status": "uploaded",
+    }
+
+
+def _jsonl(lines: List[Dict[str, Any]]) -> bytes:
+    return b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+
+
+def _mock_batch(respx_mock: MockRouter) -> List[bytes]:
+    uploaded: List[bytes] = []
+
+    def create_file(request: httpx.Request) -> httpx.Response:
+        uploaded.append(request.read())
+        return httpx.Response(200, json=_file("file_input"))
+
+    respx_mock.post("/files").mock(side_effect=create_file)
+    respx_mock.post("/batches").mock(return_value=httpx.Response(200, json=_batch("validating")))
+    respx_mock.get("/batches/batch_abc").mock(
+        side_effect=[
+            httpx.Response(200, json=_batch("in_progress")),
+            httpx.Response(200, json=_batch("completed")),
+        ]
+    )
+    respx_mock.get("/files/file_output/content").mock(
+        return_value=httpx.Response(
+            200,
+            content=_jsonl(
+                [
+                    {
+                        "id": f"batch_req_{i}",
+                        "custom_id": f"request-{i}",
+                        "response": {"status_code": 200, "request_id": f"req_{i}", "body": {"object": "list"}},
+                        "error": None,
+                    }
+                    for i in reversed(range(1, REQUESTS))
+                ]
+            ),
+        )
+    )
+    respx_mock.get("/files/file_error/content").mock(
+        return_value=httpx.Response(
+            200,
+            content=_jsonl(
+                [
+                    {
+                        "id": "batch_req_0",
+                        "custom_id": "request-0",
+                        "response": None,
+                        "error": {"code": "batch_expired", "message": "This request could not be executed"},
+                    }
+                ]
+            ),
+        )
+    )
+    return uploaded
+
+
+def _input_lines(uploaded: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in uploaded.splitlines() if line.startswith(b'{"custom_id"')]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_run(client: OpenAI, respx_mock: MockRouter) -> None:
+    uploaded = _mock_batch(respx_mock)
+
+    results = client.batches.run(_requests(), endpoint="/v1/embeddings", poll_interval_ms=1)
+
+    assert results.batch.status == "completed"
+    assert json.loads(respx_mock.routes[1].calls.last.request.content) == {
+        "completion_window": "24h",
+        "endpoint": "/v1/embeddings",
+        "input_file_id": "file_input",
+    }
+    assert _input_lines(uploaded[0]) == [
+        {"custom_id": f"request-{i}", "method": "POST", "url": "/v1/embeddings", "body": request["body"]}
+        for i, request in enumerate(_requests())
+    ]
+
+    # the output files are only downloaded once the results are iterated
+    assert not respx_mock.routes[3].called
+
+    by_id = {result.custom_id: result for result in results}
+    assert sorted(by_id) == [f"request-{i}" for i in range(REQUESTS)]
+    assert by_id["request-1"].response is not None
+    assert by_id["request-1"].response.body == {"object": "list"}
+    assert by_id["request-0"].error is not None
+    assert by_id["request-0"].error.code == "batch_expired"
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_run_chunked_upload(client: OpenAI, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    _mock_batch(respx_mock)
+    monkeypatch.setattr(batches, "CHUNKED_UPLOAD_THRESHOLD", 16)
+
+    upload = {
+        "id": "upload_abc",
+        "bytes": 0,
+        "created_at": 0,
+        "expires_at": int(time.time()) + 3600,
+        "filename": "batch_input.jsonl",
+        "object": "upload",
+        "purpose": "batch",
+        "status": "pending",
+    }
+    respx_mock.post("/uploads").mock(return_value=httpx.Response(200, json=upload))
+    respx_mock.post("/uploads/upload_abc/parts").mock(
+        return_value=httpx.Response(
+            200, json={"id": "part_abc", "created_at": 0, "object": "upload.part", "upload_id": "upload_abc"}
+        )
+    )
+    respx_mock.post("/uploads/upload_abc/complete").mock(
+        return_value=httpx.Response(200, json={**upload, "status": "completed", "file": _file("file_input")})
+    )
+
+    results = client.batches.run(_requests(), endpoint="/v1/embeddings", poll_interval_ms=1)
+
+    assert not respx_mock.routes[0].called
+    assert json.loads(respx_mock.routes[5].calls.last.request.content)["mime_type"] == "application/jsonl"
+    assert len(list(results)) == REQUESTS
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_run(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    uploaded = _mock_batch(respx_mock)
+
+    async def requests() -> AsyncIterator[BatchRequest]:
+        for request in _requests():
+            yield request
+
+    results = await async_client.batches.run(requests(), endpoint="/v1/embeddings", poll_interval_ms=1)
+
+    assert results.batch.status == "completed"
+    assert [line["custom_id"] for line in _input_lines(uploaded[0])] == [f"request-{i}" for i in range(REQUESTS)]
+    assert sorted([result.custom_id async for result in results]) == [f"request-{i}" for i in range(REQUESTS)]
+
+
+def test_run_without_requests(client: OpenAI) -> None:
+    with pytest.raises(ValueError, match="at least one request"):
+        client.batches.run([], endpoint="/v1/embeddings")
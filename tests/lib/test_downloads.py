@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import re
+from typing import Set, List, Iterator, Optional, AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, AsyncOpenAI
+
+from ..conftest import base_url
+
+PART_SIZE = 16
+PARTS = 7
+DATA = b"".join(bytes([ord("a") + i]) * PART_SIZE for i in range(PARTS)) + b"tail"
+
+
+class _InterruptedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Sends the first half of the content and then fails, as if the connection was lost"""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.content[: len(self.content) // 2]
+        raise httpx.ReadError("Connection lost")
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.content[: len(self.content) // 2]
+        raise httpx.ReadError("Connection lost")
+
+
+def _mock_download(
+    respx_mock: MockRouter,
+    *,
+    ranges: bool = True,
+    unknown_size: bool = False,
+    etag: str = '"v1"',
+    interrupt: Optional[Set[int]] = None,
+    fail: Optional[Set[int]] = None,
+    data: bytes = DATA,
+) -> List[Optional[str]]:
+    """Returns the `Range` header of every request"""
+    requested: List[Optional[str]] = []
+    interrupt = set(interrupt or ())
+
+    def content(request: httpx.Request) -> httpx.Response:
+        requested.append(request.headers.get("range"))
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("range", ""))
+        if not ranges or match is None:
+            return httpx.Response(200, content=data, headers={"etag": etag})
+
+        first, last = int(match.group(1)), int(match.group(2))
+        if not data:
+            return httpx.Response(416, headers={"content-range": "bytes */0"})
+        if fail and first in fail:
+            return httpx.Response(500, json={"error": {"message": "server error"}})
+
+        body = data[first : last + 1]
+        headers = {"content-range": f"bytes {first}-{last}/{'*' if unknown_size else len(data)}", "etag": etag}
+        if first in interrupt:
+            interrupt.discard(first)
+            return httpx.Response(206, headers=headers, stream=_InterruptedStream(body))
+        return httpx.Response(206, content=body, headers=headers)
+
+    respx_mock.get("/files/file-abc/content").mock(side_effect=content)
+    return requested
+
+
+def _part_ranges(*indexes: int) -> List[str]:
+    return [f"bytes={i * PART_SIZE}-{min((i + 1) * PART_SIZE, len(DATA)) - 1}" for i in indexes]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_in_parallel(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock)
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=3)
+
+    assert path.read_bytes() == DATA
+    assert requested[0] == "bytes=0-0"
+    assert sorted(map(str, requested[1:])) == sorted(_part_ranges(*range(PARTS + 1)))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.jsonl"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_interrupted_part(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock, interrupt={2 * PART_SIZE})
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE)
+
+    assert path.read_bytes() == DATA
+    # only the rest of the part is requested again
+    assert f"bytes={2 * PART_SIZE + PART_SIZE // 2}-{3 * PART_SIZE - 1}" in requested
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_without_range_support(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock, ranges=False)
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE)
+
+    assert path.read_bytes() == DATA
+    assert requested == ["bytes=0-0"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_unknown_size(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock, unknown_size=True)
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE)
+
+    # the file is requested again without a `Range` header
+    assert path.read_bytes() == DATA
+    assert requested == ["bytes=0-0", None]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_empty_file(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_download(respx_mock, data=b"")
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl")
+    assert path.read_bytes() == b""
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_resume(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_download(respx_mock, fail={3 * PART_SIZE})
+
+    with pytest.raises(openai.InternalServerError):
+        client.with_options(max_retries=0).files.download(
+            "file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1
+        )
+
+    assert (tmp_path / "data.jsonl.part").stat().st_size == len(DATA)
+    assert (tmp_path / "data.jsonl.part.json").exists()
+    assert not (tmp_path / "data.jsonl").exists()
+
+    respx_mock.reset()
+    requested = _mock_download(respx_mock)
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1)
+
+    assert path.read_bytes() == DATA
+    # the parts that were written before the failure aren't requested again
+    assert requested[:2] == ["bytes=0-0", *_part_ranges(3)]
+    assert set(requested[2:]) <= set(_part_ranges(*range(4, PARTS + 1)))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.jsonl"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_resume_changed_file(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_download(respx_mock, fail={3 * PART_SIZE})
+
+    with pytest.raises(openai.InternalServerError):
+        client.with_options(max_retries=0).files.download(
+            "file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1
+        )
+
+    respx_mock.reset()
+    requested = _mock_download(respx_mock, etag='"v2"')
+
+    path = client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1)
+
+    assert path.read_bytes() == DATA
+    assert requested == ["bytes=0-0", *_part_ranges(*range(PARTS + 1))]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_validation(client: OpenAI, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="file_id"):
+        client.files.download("", tmp_path / "data.jsonl")
+
+    with pytest.raises(ValueError, match="concurrency"):
+        client.files.download("file-abc", tmp_path / "data.jsonl", concurrency=0)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_in_parallel(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock, interrupt={PART_SIZE})
+
+    path = await async_client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=3)
+
+    assert path.read_bytes() == DATA
+    assert requested[0] == "bytes=0-0"
+    assert f"bytes={PART_SIZE + PART_SIZE // 2}-{2 * PART_SIZE - 1}" in requested
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.jsonl"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_resume(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_download(respx_mock, fail={3 * PART_SIZE})
+
+    with pytest.raises(openai.InternalServerError):
+        await async_client.with_options(max_retries=0).files.download(
+            "file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1
+        )
+
+    respx_mock.reset()
+    requested = _mock_download(respx_mock)
+
+    path = await async_client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE, concurrency=1)
+
+    assert path.read_bytes() == DATA
+    assert requested[:2] == ["bytes=0-0", *_part_ranges(3)]
+    assert set(requested[2:]) <= set(_part_ranges(*range(4, PARTS + 1)))
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_without_range_support(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    requested = _mock_download(respx_mock, ranges=False)
+
+    path = await async_client.files.download("file-abc", tmp_path / "data.jsonl")
+
+    assert path.read_bytes() == DATA
+    assert requested == ["bytes=0-0"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_unknown_size(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requested = _mock_download(respx_mock, unknown_size=True)
+
+    path = await async_client.files.download("file-abc", tmp_path / "data.jsonl", part_size=PART_SIZE)
+
+    assert path.read_bytes() == DATA
+    assert requested == ["bytes=0-0", None]
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import json
+import base64
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, cast
+from pathlib import Path
+
+import anyio
+import httpx
+import numpy as np
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, AsyncOpenAI
+from openai.resources import embeddings
+from openai.lib.embedding_cache import LRUEmbeddingCache, AsyncEmbeddingCache, SQLiteEmbeddingCache
+
+from ..conftest import base_url
+
+# embeddings are returned as base64 strings when numpy is installed, which fails strict validation
+loose = pytest.mark.parametrize("client", [False], indirect=True, ids=["loose"])
+async_loose = pytest.mark.parametrize("async_client", [False], indirect=True, ids=["loose"])
+
+
+def _vector(text: str) -> List[float]:
+    return [float(len(text)), float(ord(text[0]))]
+
+
+def _mock_embeddings(respx_mock: MockRouter, *, status_code: int = 200) -> List[Any]:
+    requests: List[Any] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        if status_code != 200:
+            return httpx.Response(status_code, json={"error": {"message": "bad request"}})
+
+        data = []
+        # rows are returned out of order to check that they're matched by index
+        for index, text in reversed(list(enumerate(body["input"]))):
+            vector: Any = _vector(text)
+            if body.get("encoding_format") == "base64":
+                vector = base64.b64encode(np.array(vector, dtype="float32").tobytes()).decode()
+            data.append({"embedding": vector, "index": index, "object": "embedding"})
+
+        tokens = sum(len(text) for text in body["input"])
+        return httpx.Response(
+            200,
+            json={
+                "data": data,
+                "model": body["model"],
+                "object": "list",
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+        )
+
+    respx_mock.post("/embeddings").mock(side_effect=create)
+    return requests
+
+
+@loose
+@pytest.mark.respx(base_url=base_url)
+def test_batcher(client: OpenAI, respx_mock: MockRouter) -> None:
+    requests = _mock_embeddings(respx_mock)
+    batcher = client.embeddings.batcher(max_wait_ms=200)
+    texts = [["a"], ["bb", "ccc"], ["dddd"], ["e"]]
+    results: List[Any] = [None] * len(texts)
+
+    def create(index: int) -> None:
+        results[index] = batcher.create(input=texts[index], model="text-embedding-3-small")
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(requests) == 1
+    assert sorted(requests[0]["input"]) == ["a", "bb", "ccc", "dddd", "e"]
+    assert requests[0]["encoding_format"] == "base64"
+
+    for text, result in zip(texts, results):
+        assert [row.index for row in result.data] == list(range(len(text)))
+        assert [row.embedding for row in result.data] == [_vector(t) for t in text]
+
+    assert sum(result.usage.prompt_tokens for result in results) == 11
+
+
+@loose
+@pytest.mark.respx(base_url=base_url)
+def test_batcher_limits(client: OpenAI, respx_mock: MockRouter) -> None:
+    requests = _mock_embeddings(respx_mock)
+    batcher = client.embeddings.batcher(max_wait_ms=0, max_inputs=2)
+
+    result = batcher.create(input=["a", "b", "c"], model="text-embedding-3-small", encoding_format="float")
+
+    # the inputs don't fit in a batch, so they're sent as they are
+    assert sorted(requests[0]["input"]) == ["a", "b", "c"]
+    assert requests[0]["encoding_format"] == "float"
+    assert len(result.data) == 3
+
+
+@async_loose
+@pytest.mark.respx(base_url=base_url)
+async def test_async_batcher(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    requests = _mock_embeddings(respx_mock)
+    batcher = async_client.embeddings.batcher(max_wait_ms=50, max_inputs=3)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    results: List[Any] = [None] * len(texts)
+
+    async def create(index: int) -> None:
+        results[index] = await batcher.create(input=texts[index], model="text-embedding-3-small", dimensions=2)
+
+    async with anyio.create_task_group() as tg:
+        for i in range(len(texts)):
+            tg.start_soon(create, i)
+
+    # the first batch is sent as soon as it's full
+    assert [len(request["input"]) for request in requests] == [3, 2]
+    assert all(request["dimensions"] == 2 for request in requests)
+    for text, result in zip(texts, results):
+        assert [row.embedding for row in result.data] == [_vector(text)]
+        assert result.usage.prompt_tokens == len(text)
+
+
+@async_loose
+@pytest.mark.respx(base_url=base_url)
+async def test_async_batcher_error(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_embeddings(respx_mock, status_code=400)
+    batcher = async_client.embeddings.batcher(max_wait_ms=50)
+    errors: List[Exception] = []
+
+    async def create(text: str) -> None:
+        try:
+            await batcher.create(input=text, model="text-embedding-3-small")
+        except openai.BadRequestError as err:
+            errors.append(err)
+
+    async with anyio.create_task_group() as tg:
+        for text in ["a", "b"]:
+            tg.start_soon(create, text)
+
+    assert len(errors) == 2
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.parametrize("dimensions", [2, 3])
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix(client: OpenAI, respx_mock: MockRouter, dimensions: int) -> None:
+    vectors = np.arange(4 * dimensions, dtype="float32").reshape(4, dimensions)
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [
+                    {"embedding": base64.b64encode(vectors[i].tobytes()).decode(), "index": i, "object": "embedding"}
+                    for i in reversed(range(4))
+                ],
+                "model": "text-embedding-3-small",
+                "object": "list",
+                "usage": {"prompt_tokens": 4, "total_tokens": 4},
+            },
+        )
+    )
+
+    matrix = client.embeddings.create_matrix(input=["a", "b", "c", "d"], model="text-embedding-3-small")
+
+    assert json.loads(respx_mock.calls.last.request.content)["encoding_format"] == "base64"
+    assert isinstance(matrix, np.ndarray)
+    assert matrix.dtype == np.float32
+    assert matrix.flags.c_contiguous
+    assert np.array_equal(matrix, vectors)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_create_matrix_without_numpy(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(embeddings, "has_numpy", lambda: False)
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [
+                    {"embedding": [0.5, 1.5], "index": 1, "object": "embedding"},
+                    {"embedding": [2.5, 3.5], "index": 0, "object": "embedding"},
+                ],
+                "model": "text-embedding-3-small",
+                "object": "list",
+                "usage": {"prompt_tokens": 2, "total_tokens": 2},
+            },
+        )
+    )
+
+    matrix = await async_client.embeddings.create_matrix(input=["a", "b"], model="text-embedding-3-small")
+
+    assert isinstance(matrix, memoryview)
+    assert matrix.shape == (2, 2)
+    assert matrix.tolist() == [[2.5, 3.5], [0.5, 1.5]]  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "without-numpy"])
+@pytest.mark.respx(base_url=base_url)
+def test_create_matrix_empty(
+    client: OpenAI, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch, numpy: bool
+) -> None:
+    monkeypatch.setattr(embeddings, "has_numpy", lambda: numpy)
+    respx_mock.post("/embeddings").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [],
+                "model": "text-embedding-3-small",
+                "object": "list",
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            },
+        )
+    )
+
+    matrix = client.embeddings.create_matrix(input=[], model="text-embedding-3-small")
+
+    assert len(matrix) == 0
+    assert isinstance(matrix, np.ndarray if numpy else memoryview)
+
+
+def test_lru_embedding_cache() -> None:
+    cache = LRUEmbeddingCache(max_entries=2)
+    cache.set_many({"a": b"1", "b": b"2"})
+    assert cache.get_many(["a", "c"]) == [b"1", None]
+
+    # "b" is now the least recently used entry
+    cache.set_many({"c": b"3"})
+    assert cache.get_many(["a", "b", "c"]) == [b"1", None, b"3"]
+    assert len(cache) == 2
+
+
+def test_sqlite_embedding_cache(tmp_path: Path) -> None:
+    cache = SQLiteEmbeddingCache(tmp_path / "embeddings.db")
+    cache.set_many({f"key-{i}": str(i).encode() for i in range(1200)})
+    cache.close()
+
+    cache = SQLiteEmbeddingCache(tmp_path / "embeddings.db")
+    keys = [f"key-{i}" for i in reversed(range(1200))] + ["missing"]
+    assert cache.get_many(keys) == [str(i).encode() for i in reversed(range(1200))] + [None]
+    cache.close()
+
+
+@loose
+@pytest.mark.respx(base_url=base_url)
+def test_cached_create(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requests = _mock_embeddings(respx_mock)
+    embeddings = client.embeddings.with_cache(SQLiteEmbeddingCache(tmp_path / "embeddings.db"))
+
+    first = embeddings.create(input=["a", "bb", "a"], model="text-embedding-3-small")
+    second = embeddings.create(input=["ccc", "bb", "a"], model="text-embedding-3-small")
+    third = embeddings.create(input="bb", model="text-embedding-3-small")
+    other_model = embeddings.create(input="bb", model="text-embedding-3-large")
+
+    # identical inputs are only embedded once, and cached inputs aren't sent again
+    assert [request["input"] for request in requests] == [["a", "bb"], ["ccc"], ["bb"]]
+    assert requests[-1]["model"] == "text-embedding-3-large"
+
+    assert [row.embedding for row in first.data] == [_vector("a"), _vector("bb"), _vector("a")]
+    assert [row.embedding for row in second.data] == [_vector("ccc"), _vector("bb"), _vector("a")]
+    assert [row.index for row in second.data] == [0, 1, 2]
+    assert [row.embedding for row in other_model.data] == [_vector("bb")]
+
+    assert second.usage.prompt_tokens == 3
+    assert third.usage.prompt_tokens == 0
+    assert third.model == "text-embedding-3-small"
+
+
+@async_loose
+@pytest.mark.respx(base_url=base_url)
+async def test_async_cached_create(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    requests = _mock_embeddings(respx_mock)
+
+    class DictCache(AsyncEmbeddingCache):
+        def __init__(self) -> None:
+            self.entries: Dict[str, bytes] = {}
+
+        async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+            return [self.entries.get(key) for key in keys]
+
+        async def set_many(self, items: Mapping[str, bytes]) -> None:
+            self.entries.update(items)
+
+    for cache in (DictCache(), LRUEmbeddingCache()):
+        requests.clear()
+        embeddings = async_client.embeddings.with_cache(cache)
+
+        await embeddings.create(input=["a", "bb"], model="text-embedding-3-small", dimensions=2)
+        response = await embeddings.create(
+            input=["bb", "ccc"], model="text-embedding-3-small", dimensions=2, encoding_format="base64"
+        )
+
+        assert [request["input"] for request in requests] == [["a", "bb"], ["ccc"]]
+        assert [
+            np.frombuffer(base64.b64decode(cast(str, row.embedding)), dtype="float32").tolist() for row in response.data
+        ] == [_vector("bb"), _vector("ccc")]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from jiter import from_json
+
+from openai.lib.streaming._partial_json import PartialJSONParser
+
+DOCUMENTS = [
+    json.dumps(
+        {
+            "name": "Paris",
+            "population": 2102650,
+            "area": 105.4,
+            "tags": ["capital", "city", None, True, False],
+            "nested": {"a": [], "b": {}, "c": [{"d": "e"}, [1, [2, [3]]]]},
+            "escapes": 'quote " backslash \\ newline \n tab \t',
+            "unicode": "café \U0001f600",
+        },
+        ensure_ascii=ensure_ascii,
+        indent=indent,
+    )
+    for ensure_ascii in (True, False)
+    for indent in (None, 2)
+] + [
+    "[1, -0, 1e5, 1E+2, -2.5e-3, 10000000000000000000000000, Infinity, -Infinity]",
+    '  {"a": 1}  trailing',
+    '{"a": "\\ud83d\\ude00"}',
+    # invalid documents, these must raise the same errors as jiter
+    '{"a": tx}',
+    '{"a" 1}',
+    "[1,]",
+    '{"a": 01}',
+    '{"a": "\\x"}',
+    '{"a": "\\ude00"}',
+    '{"a": "\x01"}',
+    # documents that are not parsed incrementally
+    "  ",
+    '"string"',
+    "12",
+]
+
+
+def _jiter(text: str) -> object:
+    try:
+        return from_json(bytes(text, "utf-8"), partial_mode=True)
+    except ValueError as exc:
+        return exc.args
+
+
+def _parse(parser: PartialJSONParser, text: str) -> object:
+    try:
+        return parser.parse(text)
+    except ValueError as exc:
+        return exc.args
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_matches_jiter_for_every_prefix(document: str) -> None:
+    parser = PartialJSONParser()
+    for end in range(1, len(document) + 1):
+        text = document[:end]
+        assert _parse(parser, text) == _jiter(text), text
+
+
+@pytest.mark.parametrize("size", [1, 3, 64])
+def test_matches_jiter_for_chunks(size: int) -> None:
+    document = DOCUMENTS[0]
+    parser = PartialJSONParser()
+    for end in range(size, len(document) + size, size):
+        text = document[:end]
+        assert parser.parse(text) == from_json(bytes(text, "utf-8"), partial_mode=True)
+
+
+def test_snapshots_are_not_mutated() -> None:
+    parser = PartialJSONParser()
+
+    first = parser.parse('{"rows": [{"a": 1}, {"a": 1')
+    second = parser.parse('{"rows": [{"a": 1}, {"a": 12}, {"b"')
+    third = parser.parse('{"rows": [{"a": 1}, {"a": 12}, {"b": "c"}]}')
+
+    assert first == {"rows": [{"a": 1}, {"a": 1}]}
+    assert second == {"rows": [{"a": 1}, {"a": 12}, {}]}
+    assert third == {"rows": [{"a": 1}, {"a": 12}, {"b": "c"}]}
+
+    # completed values are shared between snapshots
+    assert first["rows"][0] is third["rows"][0]  # type: ignore[index]
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import queue
+import asyncio
+from typing import Dict, List, Iterator, Optional, AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, AsyncOpenAI
+from openai._utils import assert_signatures_in_sync
+from openai.lib.speech import FileSink, PipeSink, QueueSink, CallbackSink
+
+from ..conftest import base_url
+
+FRAMES = [b"a", b"bb", b"ccc", b"dd"]
+
+
+class _FrameStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Sends the frames one at a time, after an optional delay"""
+
+    def __init__(self, frames: List[bytes], delay: float = 0) -> None:
+        self.frames = frames
+        self.delay = delay
+
+    def __iter__(self) -> Iterator[bytes]:
+        time.sleep(self.delay)
+        yield from self.frames
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        await asyncio.sleep(self.delay)
+        for frame in self.frames:
+            yield frame
+
+
+def _mock_speech(respx_mock: MockRouter, *, delays: Optional[Dict[str, float]] = None) -> List[str]:
+    """Responds with `FRAMES`, or with the frames of the input for inputs other than "Hello", and returns the inputs"""
+    inputs: List[str] = []
+
+    def speech(request: httpx.Request) -> httpx.Response:
+        input = json.loads(request.content)["input"]
+        inputs.append(input)
+        if input == "fail":
+            return httpx.Response(500, json={"error": {"message": "server error"}})
+
+        frames = FRAMES if input == "Hello" else [f"<{input}".encode(), b">"]
+        return httpx.Response(200, stream=_FrameStream(frames, (delays or {}).get(input, 0)))
+
+    respx_mock.post("/audio/speech").mock(side_effect=speech)
+    return inputs
+
+
+def _requests(*inputs: str) -> List[openai.types.audio.SpeechCreateParams]:
+    return [{"input": input, "model": "tts-1", "voice": "alloy"} for input in inputs]
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+def test_stream_signature_in_sync(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
+    checking_client: OpenAI | AsyncOpenAI = client if sync else async_client
+
+    assert_signatures_in_sync(checking_client.audio.speech.create, checking_client.audio.speech.stream)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+
+    with client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+        before = stream.time_to_first_byte
+        assert list(stream) == FRAMES
+        assert before is None
+        assert stream.time_to_first_byte is not None and stream.time_to_first_byte >= 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_to_sink_coalesces_writes(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+    writes: List[bytes] = []
+
+    with client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+        stream.to_sink(CallbackSink(writes.append, buffer_size=4))
+
+    # the first frame is written straight away
+    assert writes == [b"a", b"bbccc", b"dd"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_to_file_and_pipe(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    _mock_speech(respx_mock)
+
+    with client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+        stream.to_sink(FileSink(tmp_path / "speech.mp3"))
+    assert (tmp_path / "speech.mp3").read_bytes() == b"".join(FRAMES)
+
+    read_fd, write_fd = os.pipe()
+    try:
+        with client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+            stream.to_sink(PipeSink(write_fd))
+        assert os.read(read_fd, 1024) == b"".join(FRAMES)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_many_is_ordered(client: OpenAI, respx_mock: MockRouter) -> None:
+    inputs = _mock_speech(respx_mock, delays={"one": 0.2})
+    writes: List[bytes] = []
+
+    with client.audio.speech.stream_many(_requests("one", "two", "three"), concurrency=3) as streams:
+        streams.to_sink(CallbackSink(writes.append))
+
+    # the audio of the first request is received last, but it's still written first
+    assert b"".join(writes) == b"<one><two><three>"
+    assert sorted(inputs) == ["one", "three", "two"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_many_time_to_first_byte(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+
+    with client.audio.speech.stream_many(_requests("one", "two")) as streams:
+        for index, stream in enumerate(streams):
+            assert list(stream) == [f"<{['one', 'two'][index]}".encode(), b">"]
+            assert stream.time_to_first_byte is not None
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_many_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+
+    with client.with_options(max_retries=0).audio.speech.stream_many(_requests("one", "fail", "three")) as streams:
+        assert b"".join(next(streams)) == b"<one>"
+        with pytest.raises(openai.InternalServerError):
+            list(next(streams))
+        assert b"".join(next(streams)) == b"<three>"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_many_stops_unread_streams(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+    requests = _requests(*(str(index) for index in range(100)))
+
+    with client.audio.speech.stream_many(requests, concurrency=2, max_buffered_frames=1) as streams:
+        # the requests that are in flight are stopped without reading their audio
+        for _ in streams:
+            break
+
+
+def test_stream_many_validation(client: OpenAI) -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        client.audio.speech.stream_many(_requests("one"), concurrency=0)
+
+    with pytest.raises(ValueError, match="max_buffered_frames"):
+        client.audio.speech.stream_many(_requests("one"), max_buffered_frames=0)
+
+
+def test_queue_sink() -> None:
+    frames: queue.Queue[Optional[bytes]] = queue.Queue()
+    sink = QueueSink(frames)
+    sink.write(b"a")
+    sink.close()
+    assert [frames.get(), frames.get()] == [b"a", None]
+
+    with pytest.raises(TypeError, match="asyncio.Queue"):
+        QueueSink(asyncio.Queue()).write(b"a")
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_stream_to_queue(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+    frames: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+
+    async with async_client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+        await stream.to_sink(QueueSink(frames))
+        assert stream.time_to_first_byte is not None
+
+    received: List[Optional[bytes]] = []
+    while not frames.empty():
+        received.append(frames.get_nowait())
+    assert received == [*FRAMES, None]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_stream_to_async_callback(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+    writes: List[bytes] = []
+
+    async def callback(data: bytes) -> None:
+        writes.append(data)
+
+    async with async_client.audio.speech.stream(input="Hello", model="tts-1", voice="alloy") as stream:
+        await stream.to_sink(CallbackSink(callback, buffer_size=4))
+
+    assert writes == [b"a", b"bbccc", b"dd"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_stream_many_is_ordered(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    inputs = _mock_speech(respx_mock, delays={"one": 0.2})
+
+    async with async_client.audio.speech.stream_many(_requests("one", "two", "three"), concurrency=3) as streams:
+        await streams.to_sink(FileSink(tmp_path / "speech.mp3"))
+
+    assert (tmp_path / "speech.mp3").read_bytes() == b"<one><two><three>"
+    assert sorted(inputs) == ["one", "three", "two"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_stream_many_error(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+
+    async with async_client.with_options(max_retries=0).audio.speech.stream_many(
+        _requests("one", "fail", "three")
+    ) as streams:
+        received: List[bytes] = []
+        async for stream in streams:
+            try:
+                received.append(b"".join([frame async for frame in stream]))
+            except openai.InternalServerError:
+                received.append(b"error")
+
+    assert received == [b"<one>", b"error", b"<three>"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_stream_many_stops_unread_streams(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_speech(respx_mock)
+    requests = _requests(*(str(index) for index in range(100)))
+
+    async with async_client.audio.speech.stream_many(requests, concurrency=2, max_buffered_frames=1) as streams:
+        async for _ in streams:
+            break
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import json
+import time
+import hashlib
+from typing import Any, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, AsyncOpenAI
+from openai.lib._uploads import FilePart
+
+from ..conftest import base_url
+
+PART_SIZE = 16
+PARTS = 7
+DATA = b"".join(bytes([ord("a") + i]) * PART_SIZE for i in range(PARTS)) + b"tail"
+
+
+def _upload(status: str = "pending") -> dict[str, Any]:
+    return {
+        "id": "upload_abc",
+        "bytes": len(DATA),
+        "created_at": 0,
+        "expires_at": int(time.time()) + 3600,
+        "filename": "data.jsonl",
+        "object": "upload",
+        "purpose": "batch",
+        "status": status,
+    }
+
+
+def _mock_upload(respx_mock: MockRouter, *, fail_part: int | None = None) -> List[bytes]:
+    received: List[bytes] = []
+    failed: List[int] = []
+
+    def create_part(request: httpx.Request) -> httpx.Response:
+        content = request.read()
+        index = next((i for i in range(PARTS + 1) if (DATA[i * PART_SIZE : (i + 1) * PART_SIZE]) in content), None)
+        if index is None:
+            received.append(b"changed")
+            return httpx.Response(
+                200, json={"id": "part_changed", "created_at": 0, "object": "upload.part", "upload_id": "upload_abc"}
+            )
+
+        if index == fail_part and not failed:
+            failed.append(index)
+            return httpx.Response(500, json={"error": {"message": "server error"}})
+
+        received.append(DATA[index * PART_SIZE : (index + 1) * PART_SIZE])
+        return httpx.Response(
+            200,
+            json={"id": f"part_{index}", "created_at": 0, "object": "upload.part", "upload_id": "upload_abc"},
+        )
+
+    respx_mock.post("/uploads").mock(return_value=httpx.Response(200, json=_upload()))
+    respx_mock.post("/uploads/upload_abc/parts").mock(side_effect=create_part)
+    respx_mock.post("/uploads/upload_abc/complete").mock(return_value=httpx.Response(200, json=_upload("completed")))
+    return received
+
+
+def _complete_body(respx_mock: MockRouter) -> Any:
+    return json.loads(respx_mock.calls.last.request.content)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_in_parallel(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    received = _mock_upload(respx_mock, fail_part=3)
+
+    upload = client.with_options(max_retries=1).uploads.upload_file_chunked(
+        file=file,
+        mime_type="jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        max_concurrency=3,
+        compute_md5=True,
+    )
+
+    assert upload.status == "completed"
+    assert sorted(received) == sorted(DATA[i : i + PART_SIZE] for i in range(0, len(DATA), PART_SIZE))
+    assert _complete_body(respx_mock) == {
+        "part_ids": [f"part_{i}" for i in range(PARTS + 1)],
+        "md5": hashlib.md5(DATA).hexdigest(),
+    }
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_in_memory(client: OpenAI, respx_mock: MockRouter) -> None:
+    _mock_upload(respx_mock)
+
+    client.uploads.upload_file_chunked(
+        file=DATA,
+        filename="data.jsonl",
+        bytes=len(DATA),
+        mime_type="jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        md5="abc",
+        compute_md5=True,
+    )
+
+    assert _complete_body(respx_mock) == {"part_ids": [f"part_{i}" for i in range(PARTS + 1)], "md5": "abc"}
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_upload_file_chunked_part_failure(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    _mock_upload(respx_mock, fail_part=2)
+
+    with pytest.raises(openai.InternalServerError):
+        client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE
+        )
+
+    assert not respx_mock.routes[2].called
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_upload_file_chunked_in_parallel(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    received = _mock_upload(respx_mock, fail_part=3)
+
+    def readall(_: FilePart) -> bytes:
+        raise AssertionError("parts should be streamed instead of being read into memory")
+
+    monkeypatch.setattr(FilePart, "readall", readall)
+
+    upload = await async_client.with_options(max_retries=1).uploads.upload_file_chunked(
+        file=file,
+        mime_type="jsonl",
+        purpose="batch",
+        part_size=PART_SIZE,
+        max_concurrency=3,
+        compute_md5=True,
+    )
+
+    assert upload.status == "completed"
+    assert sorted(received) == sorted(DATA[i : i + PART_SIZE] for i in range(0, len(DATA), PART_SIZE))
+    assert _complete_body(respx_mock) == {
+        "part_ids": [f"part_{i}" for i in range(PARTS + 1)],
+        "md5": hashlib.md5(DATA).hexdigest(),
+    }
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+async def test_async_upload_file_chunked_part_failure(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_upload(respx_mock, fail_part=2)
+
+    with pytest.raises(openai.InternalServerError):
+        await async_client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=DATA, filename="data.jsonl", bytes=len(DATA), mime_type="jsonl", purpose="batch", part_size=PART_SIZE
+        )
+
+    assert not respx_mock.routes[2].called
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_resume(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    manifest = tmp_path / "data.jsonl.manifest"
+    received = _mock_upload(respx_mock, fail_part=2)
+
+    with pytest.raises(openai.InternalServerError):
+        client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, max_concurrency=1, manifest=manifest
+        )
+
+    recorded = json.loads(manifest.read_text())
+    assert recorded["upload_id"] == "upload_abc"
+    assert recorded["parts"][0] == {
+        "offset": 0,
+        "size": PART_SIZE,
+        "md5": hashlib.md5(DATA[:PART_SIZE]).hexdigest(),
+        "id": "part_0",
+    }
+    assert sorted(part["offset"] for part in recorded["parts"]) == sorted(DATA.index(data) for data in received)
+
+    upload = client.with_options(max_retries=0).uploads.upload_file_chunked(
+        file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, manifest=manifest
+    )
+
+    assert upload.status == "completed"
+    assert sorted(received) == sorted(DATA[i : i + PART_SIZE] for i in range(0, len(DATA), PART_SIZE))
+    assert respx_mock.routes[0].call_count == 1
+    assert _complete_body(respx_mock) == {"part_ids": [f"part_{i}" for i in range(PARTS + 1)]}
+    assert not manifest.exists()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_upload_file_chunked_resume_changed_part(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    manifest = tmp_path / "data.jsonl.manifest"
+    received = _mock_upload(respx_mock, fail_part=2)
+
+    with pytest.raises(openai.InternalServerError):
+        client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, max_concurrency=1, manifest=manifest
+        )
+
+    recorded = len(json.loads(manifest.read_text())["parts"])
+
+    # the second part changed, so it has to be uploaded again
+    file.write_bytes(DATA[:PART_SIZE] + b"z" * PART_SIZE + DATA[2 * PART_SIZE :])
+    received.clear()
+
+    client.with_options(max_retries=0).uploads.upload_file_chunked(
+        file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, manifest=manifest
+    )
+
+    assert b"changed" in received
+    assert DATA[:PART_SIZE] not in received
+    assert len(received) == PARTS + 1 - recorded + 1
+    assert respx_mock.routes[0].call_count == 1
+    assert _complete_body(respx_mock)["part_ids"][:3] == ["part_0", "part_changed", "part_2"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_upload_file_chunked_resume(
+    async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    file = tmp_path / "data.jsonl"
+    file.write_bytes(DATA)
+    manifest = tmp_path / "data.jsonl.manifest"
+    received = _mock_upload(respx_mock, fail_part=2)
+
+    with pytest.raises(openai.InternalServerError):
+        await async_client.with_options(max_retries=0).uploads.upload_file_chunked(
+            file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, max_concurrency=1, manifest=manifest
+        )
+
+    assert len(json.loads(manifest.read_text())["parts"]) == 2
+
+    await async_client.with_options(max_retries=0).uploads.upload_file_chunked(
+        file=file, mime_type="jsonl", purpose="batch", part_size=PART_SIZE, manifest=manifest
+    )
+
+    assert sorted(received) == sorted(DATA[i : i + PART_SIZE] for i in range(0, len(DATA), PART_SIZE))
+    assert respx_mock.routes[0].call_count == 1
+    assert _complete_body(respx_mock) == {"part_ids": [f"part_{i}" for i in range(PARTS + 1)]}
+    assert not manifest.exists()
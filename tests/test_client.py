@@ -23,7 +23,7 @@ from pydantic import ValidationError
 from openai import OpenAI, AsyncOpenAI, APIResponseValidationError
 from openai._types import Omit
 from openai._models import BaseModel, FinalRequestOptions
-from openai._constants import RAW_RESPONSE_HEADER
+from openai._constants import RAW_RESPONSE_HEADER, DEFAULT_HTTP2_CONNECTION_LIMITS
 from openai._streaming import Stream, AsyncStream
 from openai._exceptions import OpenAIError, APIStatusError, APITimeoutError, APIResponseValidationError
 from openai._base_client import DEFAULT_TIMEOUT, HTTPX_DEFAULT_TIMEOUT, BaseClient, make_request_options
@@ -83,6 +83,21 @@ class TestOpenAI:
         assert copied.api_key == "another My API Key"
         assert self.client.api_key == "My API Key"
 
+    def test_lazy_resources(self) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True)
+        assert "chat" not in vars(client)
+        assert "with_raw_response" not in vars(client)
+
+        # resources are constructed on first access, and then reused
+        assert client.chat is client.chat
+        assert client.chat._client is client
+        assert client.with_raw_response.chat is client.with_raw_response.chat
+        assert "files" not in vars(client)
+
+        copied = client.copy()
+        assert copied.chat is not client.chat
+        assert copied.chat._client is copied
+
     def test_copy_default_options(self) -> None:
         # options that have a default are overridden correctly
         copied = self.client.copy(max_retries=7)
@@ -306,6 +321,23 @@ class TestOpenAI:
                     http_client=cast(Any, http_client),
                 )
 
+    def test_http2_option(self) -> None:
+        with pytest.raises(ValueError, match="`http_client` argument is mutually exclusive with `http2`"):
+            OpenAI(base_url=base_url, api_key=api_key, http2=True, http_client=httpx.Client())
+
+        pytest.importorskip("h2")
+        client = OpenAI(base_url=base_url, api_key=api_key, http2=True)
+        transport = client._client._transport
+        assert isinstance(transport, httpx.HTTPTransport)
+        assert transport._pool._http2
+        assert transport._pool._max_connections == DEFAULT_HTTP2_CONNECTION_LIMITS.max_connections
+
+        # the option is kept when the client is copied, unless it's overridden
+        assert client.copy()._client is client._client
+        copied = client.copy(http2=False)._client._transport
+        assert isinstance(copied, type(transport))
+        assert not copied._pool._http2
+
     def test_default_headers_option(self) -> None:
         client = OpenAI(
             base_url=base_url, api_key=api_key, _strict_response_validation=True, default_headers={"X-Foo": "bar"}
@@ -933,6 +965,21 @@ class TestAsyncOpenAI:
         assert copied.api_key == "another My API Key"
         assert self.client.api_key == "My API Key"
 
+    def test_lazy_resources(self) -> None:
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True)
+        assert "chat" not in vars(client)
+        assert "with_raw_response" not in vars(client)
+
+        # resources are constructed on first access, and then reused
+        assert client.chat is client.chat
+        assert client.chat._client is client
+        assert client.with_raw_response.chat is client.with_raw_response.chat
+        assert "files" not in vars(client)
+
+        copied = client.copy()
+        assert copied.chat is not client.chat
+        assert copied.chat._client is copied
+
     def test_copy_default_options(self) -> None:
         # options that have a default are overridden correctly
         copied = self.client.copy(max_retries=7)
@@ -1158,6 +1205,23 @@ class TestAsyncOpenAI:
                     http_client=cast(Any, http_client),
                 )
 
+    def test_http2_option(self) -> None:
+        with pytest.raises(ValueError, match="`http_client` argument is mutually exclusive with `http2`"):
+            AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True, http_client=httpx.AsyncClient())
+
+        pytest.importorskip("h2")
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True)
+        transport = client._client._transport
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert transport._pool._http2
+        assert transport._pool._max_connections == DEFAULT_HTTP2_CONNECTION_LIMITS.max_connections
+
+        # the option is kept when the client is copied, unless it's overridden
+        assert client.copy()._client is client._client
+        copied = client.copy(http2=False)._client._transport
+        assert isinstance(copied, type(transport))
+        assert not copied._pool._http2
+
     def test_default_headers_option(self) -> None:
         client = AsyncOpenAI(
             base_url=base_url, api_key=api_key, _strict_response_validation=True, default_headers={"X-Foo": "bar"}
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+import socket
+import threading
+from typing import Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import anyio
+import httpx
+import pytest
+
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, DefaultHttpxClient
+
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self) -> None:
+        # slow enough for concurrent requests to each need their own connection
+        time.sleep(0.05)
+        self.send_response(404)
+        self.send_header("content-length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_warmup(server_url: str) -> None:
+    with OpenAI(base_url=server_url, api_key=api_key) as client:
+        stats = client.warmup(connections=4)
+        assert (stats.in_use, stats.idle, stats.opened, stats.closed) == (0, 4, 4, 0)
+
+        # the warm connections are reused
+        stats = client.warmup(connections=2)
+        assert (stats.idle, stats.opened) == (4, 4)
+
+    assert client.pool_stats().closed == 4
+
+
+def test_warmup_connection_error() -> None:
+    with OpenAI(base_url="http://127.0.0.1:1/v1", api_key=api_key) as client:
+        with pytest.raises(APIConnectionError):
+            client.warmup()
+
+
+def test_pool_stats_custom_http_client(server_url: str) -> None:
+    with OpenAI(base_url=server_url, api_key=api_key, http_client=httpx.Client()) as client:
+        stats = client.warmup()
+        assert (stats.idle, stats.opened, stats.closed) == (1, None, None)
+
+
+def test_keep_alive(server_url: str) -> None:
+    http_client = DefaultHttpxClient(limits=httpx.Limits(keepalive_expiry=0.3))
+    with OpenAI(base_url=server_url, api_key=api_key, http_client=http_client) as client:
+        # defaults to half of the keep-alive expiry
+        assert client.keep_alive().interval == 0.15
+
+        client.warmup(connections=3)
+        with client.keep_alive(connections=2, interval=0.1):
+            time.sleep(0.6)
+            stats = client.pool_stats()
+
+        # two connections are refreshed before they expire, and the third one is evicted
+        assert stats.in_use + stats.idle == 2
+        assert (stats.opened, stats.closed) == (3, 1)
+
+
+@pytest.fixture
+def stalled_server_url() -> Iterator[str]:
+    # connections are accepted by the backlog, but no response is ever sent
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    yield f"http://127.0.0.1:{server.getsockname()[1]}/v1"
+    server.close()
+
+
+def test_keep_alive_stop_is_bounded(stalled_server_url: str) -> None:
+    with OpenAI(base_url=stalled_server_url, api_key=api_key, timeout=600) as client:
+        with client.keep_alive(interval=0.1):
+            # a refresh is in flight by now
+            time.sleep(0.15)
+            start = time.monotonic()
+
+        assert time.monotonic() - start < 1
+
+
+async def test_async_warmup(server_url: str) -> None:
+    async with AsyncOpenAI(base_url=server_url, api_key=api_key) as client:
+        stats = await client.warmup(connections=3)
+        assert (stats.in_use, stats.idle, stats.opened, stats.closed) == (0, 3, 3, 0)
+
+        async with client.keep_alive(connections=3, interval=0.1):
+            await anyio.sleep(0.25)
+
+        assert client.pool_stats().opened == 3
@@ -1,10 +1,17 @@
+import os
+from typing import List
 from pathlib import Path
 
 import anyio
+import httpx
 import pytest
-from dirty_equals import IsDict, IsList, IsBytes, IsTuple
+from respx import MockRouter
+from dirty_equals import IsDict, IsList, IsTuple, IsInstance
 
-from openai._files import to_httpx_files, async_to_httpx_files
+from openai import OpenAI, AsyncOpenAI
+from openai._files import PathFile, to_httpx_files, async_to_httpx_files
+
+from .conftest import base_url
 
 readme_path = Path(__file__).parent.parent.joinpath("README.md")
 
@@ -12,34 +19,34 @@ readme_path = Path(__file__).parent.parent.joinpath("README.md")
 def test_pathlib_includes_file_name() -> None:
     result = to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(PathFile))})
 
 
 def test_tuple_input() -> None:
     result = to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(PathFile))))
 
 
 @pytest.mark.asyncio
 async def test_async_pathlib_includes_file_name() -> None:
     result = await async_to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(PathFile))})
 
 
 @pytest.mark.asyncio
 async def test_async_supports_anyio_path() -> None:
     result = await async_to_httpx_files({"file": anyio.Path(readme_path)})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(PathFile))})
 
 
 @pytest.mark.asyncio
 async def test_async_tuple_input() -> None:
     result = await async_to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(PathFile))))
 
 
 def test_string_not_allowed() -> None:
@@ -49,3 +56,79 @@ def test_string_not_allowed() -> None:
                 "file": "foo",  # type: ignore
             }
         )
+
+
+def test_path_file(tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"0123456789")
+
+    file = PathFile(path)
+    assert (file.name, file.size) == ("data.jsonl", 10)
+    assert file.seek(0, os.SEEK_END) == 10
+    assert file.seek(0) == 0
+
+    assert file.read(4) == b"0123"
+    assert file.read() == b"456789"
+    # the file is closed once it has been read to the end
+    assert file._file is None
+    assert file.read() == b""
+
+    file.seek(2)
+    assert file.read(3) == b"234"
+    file.close()
+    assert file._file is None
+
+
+def _mock_create_file(respx_mock: MockRouter) -> List[httpx.Request]:
+    requests: List[httpx.Request] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(500, json={"error": {"message": "server error"}})
+        return httpx.Response(
+            200,
+            json={
+                "id": "file-abc",
+                "bytes": 0,
+                "created_at": 0,
+                "filename": "data.jsonl",
+                "object": "file",
+                "purpose": "batch",
+                "status": "uploaded",
+            },
+        )
+
+    respx_mock.post("/files").mock(side_effect=create)
+    return requests
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_path_is_streamed(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"x" * 200_000)
+    requests = _mock_create_file(respx_mock)
+
+    client.with_options(max_retries=1).files.create(file=path, purpose="batch")
+
+    # the file is sent again in full when the request is retried
+    assert len(requests) == 2
+    for request in requests:
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert b'filename="data.jsonl"' in request.content
+        assert b"x" * 200_000 in request.content
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_path_is_streamed(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"x" * 200_000)
+    requests = _mock_create_file(respx_mock)
+
+    await async_client.with_options(max_retries=1).files.create(file=anyio.Path(path), purpose="batch")
+
+    assert len(requests) == 2
+    for request in requests:
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert b"x" * 200_000 in request.content
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, HedgingPolicy, APIConnectionError
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+def test_policy_initial_delay() -> None:
+    policy = HedgingPolicy(initial_delay=0.5, min_samples=5)
+    assert policy.get_delay("/embeddings") == 0.5
+
+    for _ in range(4):
+        policy.record_latency("/embeddings", 0.1)
+    assert policy.get_delay("/embeddings") == 0.5
+
+
+def test_policy_percentile_delay() -> None:
+    policy = HedgingPolicy(percentile=90, min_samples=10)
+    for i in range(1, 101):
+        policy.record_latency("/embeddings", i / 100)
+
+    assert policy.get_delay("/embeddings") == 0.9
+    assert policy.get_delay("/moderations") == policy.initial_delay
+
+    policy.record_latency("/embeddings", 5)
+    assert policy.get_delay("/embeddings") == 0.91
+
+
+def test_policy_window_size() -> None:
+    policy = HedgingPolicy(percentile=100, min_samples=1, window_size=2)
+    policy.record_latency("/embeddings", 3)
+    policy.record_latency("/embeddings", 1)
+    policy.record_latency("/embeddings", 2)
+
+    assert policy.get_delay("/embeddings") == 2
+
+
+def test_policy_fixed_delay() -> None:
+    policy = HedgingPolicy(delay=0.25, min_delay=0.5)
+    assert policy.get_delay("/embeddings") == 0.5
+
+
+def test_policy_validation() -> None:
+    with pytest.raises(ValueError, match="percentile"):
+        HedgingPolicy(percentile=0)
+
+    with pytest.raises(ValueError, match="max_hedges"):
+        HedgingPolicy(max_hedges=0)
+
+
+def test_copy_keeps_policy() -> None:
+    policy = HedgingPolicy()
+    client = OpenAI(base_url=base_url, api_key=api_key, hedging_policy=policy)
+    assert client.copy().hedging_policy is policy
+    assert client.with_options(hedging_policy=None).hedging_policy is None
+
+
+class TestSyncHedging:
+    @pytest.mark.respx(base_url=base_url)
+    def test_slow_request_is_hedged(self, respx_mock: MockRouter) -> None:
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                time.sleep(0.5)
+                return httpx.Response(200, json={"attempt": 1})
+            return httpx.Response(200, json={"attempt": 2})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+
+        client = OpenAI(base_url=base_url, api_key=api_key, hedging_policy=HedgingPolicy(delay=0.05))
+        client._idempotency_header = "Idempotency-Key"
+
+        response = client.post("/foo", cast_to=httpx.Response, body={"input": "hello"})
+        assert response.json() == {"attempt": 2}
+
+        assert len(requests) == 2
+        assert requests[0].headers["Idempotency-Key"] == requests[1].headers["Idempotency-Key"]
+        assert requests[0].content == requests[1].content
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_fast_request_is_not_hedged(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+        client = OpenAI(base_url=base_url, api_key=api_key, hedging_policy=HedgingPolicy(delay=1))
+
+        response = client.post("/foo", cast_to=httpx.Response)
+        assert response.json() == {"foo": "bar"}
+        assert route.call_count == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_failing_request_is_not_hedged(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+        client = OpenAI(
+            base_url=base_url, api_key=api_key, max_retries=0, hedging_policy=HedgingPolicy(delay=1, max_hedges=3)
+        )
+
+        with pytest.raises(APIConnectionError):
+            client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 1
+
+
+class TestAsyncHedging:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_slow_request_is_hedged(self, respx_mock: MockRouter) -> None:
+        requests: List[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                await asyncio.sleep(0.5)
+                return httpx.Response(200, json={"attempt": 1})
+            return httpx.Response(200, json={"attempt": 2})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, hedging_policy=HedgingPolicy(delay=0.05))
+        client._idempotency_header = "Idempotency-Key"
+
+        response = await client.post("/foo", cast_to=httpx.Response, body={"input": "hello"})
+        assert response.json() == {"attempt": 2}
+
+        assert len(requests) == 2
+        assert requests[0].headers["Idempotency-Key"] == requests[1].headers["Idempotency-Key"]
+        assert requests[0].content == requests[1].content
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_fast_request_is_not_hedged(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, hedging_policy=HedgingPolicy(delay=1))
+
+        response = await client.post("/foo", cast_to=httpx.Response)
+        assert response.json() == {"foo": "bar"}
+        assert route.call_count == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_failing_request_is_not_hedged(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+        client = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, max_retries=0, hedging_policy=HedgingPolicy(delay=1, max_hedges=3)
+        )
+
+        with pytest.raises(APIConnectionError):
+            await client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 1
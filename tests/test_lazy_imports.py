@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import ast
+import sys
+import importlib
+import subprocess
+from types import ModuleType
+from typing import Set
+from pathlib import Path
+
+import pytest
+
+import openai
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_import_does_not_load_types_or_resources() -> None:
+    loaded = _run(
+        "import sys, openai; "
+        "print(sorted(name for name in sys.modules if name.startswith(('openai.types', 'openai.resources'))))"
+    )
+    assert loaded == "[]"
+
+
+def test_names_are_loaded_on_first_access() -> None:
+    code = "import sys, openai; openai.types.Batch; openai.OpenAI(api_key='My API Key').chat; print('openai.resources.chat' in sys.modules, 'openai.types.batch' in sys.modules)"
+    assert _run(code) == "True True"
+
+
+def test_lazy_attributes() -> None:
+    assert openai.types.Batch is openai.types.batch.Batch
+    assert openai.resources.Chat is openai.resources.chat.Chat
+    assert openai.pydantic_function_tool is openai.lib._tools.pydantic_function_tool
+
+    assert "Batch" in dir(openai.types)
+    assert "AssistantEventHandler" in dir(openai)
+
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        openai.types.Nope  # noqa: B018
+
+
+def test_subpackages_are_loaded_on_first_access() -> None:
+    code = (
+        "import openai; "
+        "print(openai.types.chat.ChatCompletion.__name__, openai.types.beta.Assistant.__name__, "
+        "openai.types.shared.ErrorObject.__name__, openai.types.audio.Transcription.__name__, "
+        "openai.resources.beta.vector_stores.VectorStores.__name__, "
+        "openai.resources.chat.completions.Completions.__name__, openai.resources.files.Files.__name__)"
+    )
+    assert _run(code) == "ChatCompletion Assistant ErrorObject Transcription VectorStores Completions Files"
+
+
+def _type_checking_names(module: ModuleType) -> Set[str]:
+    """Returns the names that are imported in the `if TYPE_CHECKING:` blocks of the given module"""
+    tree = ast.parse(Path(str(module.__file__)).read_text())
+    names: Set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+            for statement in node.body:
+                assert isinstance(statement, ast.ImportFrom)
+                names.update(alias.asname or alias.name for alias in statement.names)
+    return names
+
+
+@pytest.mark.parametrize("module_name", ["openai", "openai.types", "openai.resources", "openai.lib"])
+def test_type_checking_names_resolve(module_name: str) -> None:
+    # the lazy `__getattr__` mappings are maintained by hand next to the `TYPE_CHECKING` imports
+    module = importlib.import_module(module_name)
+    names = _type_checking_names(module)
+
+    assert names
+    for name in names:
+        assert getattr(module, name) is not None, name
+    if module_name != "openai":
+        assert names == set(module.__all__)
+
+
+@pytest.mark.parametrize("module_name", ["openai.types", "openai.resources", "openai.lib"])
+def test_star_import(module_name: str) -> None:
+    code = f"from {module_name} import *; print(sorted(name for name in dir() if not name.startswith('_')))"
+    assert _run(code) == str(sorted(importlib.import_module(module_name).__all__))
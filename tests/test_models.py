@@ -844,3 +844,65 @@ def test_type_alias_type() -> None:
     assert m.alias == "foo"
     assert isinstance(m.union, str)
     assert m.union == "bar"
+
+
+def test_constructors_are_cached() -> None:
+    from openai._models import _get_constructor
+
+    class Model(BaseModel):
+        items: List[BasicModel]
+
+    assert _get_constructor(List[Model]) is _get_constructor(List[Model])
+
+    m = construct_type(value=[{"items": [{"foo": "a"}, {"foo": "b"}]}], type_=List[Model])
+    assert isinstance(m, list)
+    assert [item.foo for item in m[0].items] == ["a", "b"]  # type: ignore[attr-defined]
+
+
+def test_self_referencing_model() -> None:
+    class Node(BaseModel):
+        name: str
+        children: Optional[List["Node"]] = None
+
+    if PYDANTIC_V2:
+        Node.model_rebuild()
+    else:
+        Node.update_forward_refs(Node=Node)  # type: ignore
+
+    m = Node.construct(name="root", children=[{"name": "a", "children": [{"name": "b", "children": "invalid"}]}])
+    assert m.children is not None
+    assert m.children[0].name == "a"
+    assert m.children[0].children is not None
+    assert isinstance(m.children[0].children[0], Node)
+    assert m.children[0].children[0].children == "invalid"  # type: ignore[comparison-overlap]
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="model_rebuild is not supported in Pydantic v1")
+def test_construct_after_forward_references_are_resolved() -> None:
+    class Parent(BaseModel):
+        child: Optional["Child"] = None
+
+    m = Parent.construct(child={"foo": "bar"})
+    assert m.child == {"foo": "bar"}  # type: ignore[comparison-overlap]
+
+    class Child(BaseModel):
+        foo: str
+
+    Parent.model_rebuild(_types_namespace={"Child": Child})
+
+    m = Parent.construct(child={"foo": "bar"})
+    assert isinstance(m.child, Child)
+    assert m.child.foo == "bar"
+
+
+def test_mutable_defaults_are_not_shared() -> None:
+    class Model(BaseModel):
+        tags: List[str] = ["a"]
+
+    first = construct_type(value={}, type_=Model)
+    assert isinstance(first, Model)
+    first.tags.append("b")
+
+    second = construct_type(value={}, type_=Model)
+    assert isinstance(second, Model)
+    assert second.tags == ["a"]
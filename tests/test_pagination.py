@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import Any, Dict, List, Optional, NamedTuple, AsyncGenerator, cast
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, InternalServerError
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+BATCH_IDS = [f"batch_{i}" for i in range(10)]
+
+
+def _list_batches(request: httpx.Request, *, fail_after: str | None = None) -> httpx.Response:
+    after = request.url.params.get("after")
+    if after is not None and after == fail_after:
+        return httpx.Response(500, json={"error": {"message": "Something went wrong"}})
+
+    start = BATCH_IDS.index(after) + 1 if after is not None else 0
+    data: List[Dict[str, Any]] = [
+        {"id": id, "object": "batch", "status": "completed"} for id in BATCH_IDS[start : start + 2]
+    ]
+    return httpx.Response(200, json={"object": "list", "data": data, "has_more": start + 2 < len(BATCH_IDS)})
+
+
+class BatchRecord(NamedTuple):
+    id: str
+    status: str
+    error_file_id: Optional[str]
+
+
+class IdRecord:
+    __slots__ = ("id",)
+
+    def __init__(self, *, id: str) -> None:
+        self.id = id
+
+
+def _wait_for(predicate: Any, timeout: float = 2) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestSyncPrefetch:
+    client = OpenAI(base_url=base_url, api_key=api_key, max_retries=0)
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_prefetch(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        first_page = self.client.batches.list(limit=2)
+        pages = first_page.iter_pages(prefetch=2)
+        assert next(pages) is first_page
+
+        # the next two pages are fetched while the first one is being processed
+        _wait_for(lambda: route.call_count == 3)
+        time.sleep(0.05)
+        assert route.call_count == 3
+
+        ids = [batch.id for batch in first_page.data]
+        for page in pages:
+            ids.extend(batch.id for batch in page.data)
+
+        assert ids == BATCH_IDS
+        assert route.call_count == 6
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_prefetch_error(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=lambda request: _list_batches(request, fail_after="batch_5"))
+
+        ids: List[str] = []
+        with pytest.raises(InternalServerError):
+            for page in self.client.batches.list(limit=2).iter_pages(prefetch=4):
+                ids.extend(batch.id for batch in page.data)
+
+        # the error is raised once the pages before the failed one have been processed
+        assert ids == BATCH_IDS[:6]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_prefetch_stops(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        for _page in self.client.batches.list(limit=2).iter_pages(prefetch=1):
+            _wait_for(lambda: route.call_count == 2)
+            break
+
+        time.sleep(0.05)
+        assert route.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_prefetch_validation(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        with pytest.raises(ValueError, match="prefetch"):
+            next(self.client.batches.list(limit=2).iter_pages(prefetch=-1))
+
+
+class TestAsyncPrefetch:
+    client = AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=0)
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_prefetch(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        first_page = await self.client.batches.list(limit=2)
+        pages = first_page.iter_pages(prefetch=2)
+        assert await pages.__anext__() is first_page
+
+        for _ in range(100):
+            if route.call_count == 3:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert route.call_count == 3
+
+        ids = [batch.id for batch in first_page.data]
+        async for page in pages:
+            ids.extend(batch.id for batch in page.data)
+
+        assert ids == BATCH_IDS
+        assert route.call_count == 6
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_prefetch_error(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=lambda request: _list_batches(request, fail_after="batch_5"))
+
+        ids: List[str] = []
+        with pytest.raises(InternalServerError):
+            async for page in (await self.client.batches.list(limit=2)).iter_pages(prefetch=4):
+                ids.extend(batch.id for batch in page.data)
+
+        assert ids == BATCH_IDS[:6]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_prefetch_stops(self, respx_mock: MockRouter) -> None:
+        requested = asyncio.Event()
+
+        async def list_batches(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("after") is not None:
+                requested.set()
+                # the request is in flight until it's cancelled
+                await asyncio.sleep(60)
+            return _list_batches(request)
+
+        respx_mock.get("/batches").mock(side_effect=list_batches)
+
+        pages = (await self.client.batches.list(limit=2)).iter_pages(prefetch=1)
+        async for _page in pages:
+            await requested.wait()
+            break
+        # this is what happens when the generator is garbage collected
+        await cast(AsyncGenerator[Any, None], pages).aclose()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class TestSyncProjection:
+    client = OpenAI(base_url=base_url, api_key=api_key, max_retries=0)
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_fields(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        items = list(self.client.iter_api_list("/batches", fields=["id", "status"], options={"params": {"limit": 2}}))
+        assert items == [{"id": id, "status": "completed"} for id in BATCH_IDS]
+
+        # the pages are followed in the same way as `SyncCursorPage`
+        assert route.call_count == 6
+        assert [call.request.url.params.get("after") for call in route.calls] == [None, *BATCH_IDS[1::2]]
+        assert all(call.request.url.params["limit"] == "2" for call in route.calls)
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_record(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        items = list(self.client.iter_api_list("/batches", fields=BatchRecord._fields, record=BatchRecord))
+        assert items[0] == BatchRecord(id="batch_0", status="completed", error_file_id=None)
+        assert len(items) == len(BATCH_IDS)
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_all_fields(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        items = list(self.client.iter_api_list("/batches"))
+        assert items[-1] == {"id": "batch_9", "object": "batch", "status": "completed"}
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_error(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=lambda request: _list_batches(request, fail_after="batch_1"))
+
+        items = self.client.iter_api_list("/batches", fields=["id"])
+        assert [next(items), next(items)] == [{"id": "batch_0"}, {"id": "batch_1"}]
+        with pytest.raises(InternalServerError):
+            next(items)
+
+
+class TestAsyncProjection:
+    client = AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=0)
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_fields(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        items = [item async for item in self.client.iter_api_list("/batches", fields=["id", "status"])]
+        assert items == [{"id": id, "status": "completed"} for id in BATCH_IDS]
+        assert route.call_count == 6
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_record(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/batches").mock(side_effect=_list_batches)
+
+        items = [item async for item in self.client.iter_api_list("/batches", fields=["id"], record=IdRecord)]
+        assert [item.id for item in items] == BATCH_IDS
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+import openai
+from openai import OpenAI, Poller, AsyncOpenAI, AsyncPoller
+from openai._poller import _TimingWheel
+
+from .conftest import base_url
+
+
+def _run(run_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": run_id,
+        "assistant_id": "asst_abc",
+        "created_at": 0,
+        "instructions": "",
+        "model": "gpt-4o",
+        "object": "thread.run",
+        "parallel_tool_calls": True,
+        "status": status,
+        "thread_id": "thread_abc",
+        "tools": [],
+    }
+
+
+def _file(file_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": file_id,
+        "bytes": 0,
+        "created_at": 0,
+        "filename": "data.jsonl",
+        "object": "file",
+        "purpose": "batch",
+        "status": status,
+    }
+
+
+def _vector_store_file(file_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": file_id,
+        "created_at": 0,
+        "object": "vector_store.file",
+        "status": status,
+        "usage_bytes": 0,
+        "vector_store_id": "vs_abc",
+    }
+
+
+def _mock_runs(respx_mock: MockRouter, run_ids: List[str], *, polls: int = 3) -> Dict[str, int]:
+    calls: Dict[str, int] = {run_id: 0 for run_id in run_ids}
+
+    def retrieve(request: httpx.Request, run_id: str) -> httpx.Response:
+        assert request.headers["X-Stainless-Poll-Helper"] == "true"
+        calls[run_id] += 1
+        status = "completed" if calls[run_id] >= polls else "in_progress"
+        return httpx.Response(200, json=_run(run_id, status), headers={"openai-poll-after-ms": "10"})
+
+    respx_mock.get(url__regex=r".*/threads/thread_abc/runs/(?P<run_id>[^/]+)$").mock(side_effect=retrieve)
+    return calls
+
+
+def test_timing_wheel_coalesces_entries() -> None:
+    wheel: _TimingWheel[str] = _TimingWheel(0.1)
+    wheel.schedule("c", 0.35)
+    wheel.schedule("a", 0.12)
+    wheel.schedule("b", 0.18)
+
+    assert len(wheel) == 3
+    assert wheel.next_due() == pytest.approx(0.2)
+    assert [wheel.pop(), wheel.pop()] == ["a", "b"]
+    assert wheel.next_due() == pytest.approx(0.4)
+    assert wheel.pop() == "c"
+    assert wheel.next_due() is None
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_poll_runs(client: OpenAI, respx_mock: MockRouter) -> None:
+    run_ids = [f"run_{i}" for i in range(5)]
+    calls = _mock_runs(respx_mock, run_ids)
+    poller = Poller(client, tick=0.01, max_qps=1000)
+
+    futures = [poller.poll_run(run_id, thread_id="thread_abc") for run_id in run_ids]
+    completed = list(poller.as_completed(futures))
+
+    assert sorted(future.result().id for future in completed) == run_ids
+    assert all(future.result().status == "completed" for future in completed)
+    assert calls == {run_id: 3 for run_id in run_ids}
+    assert poller.pending == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_poll_max_qps(client: OpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.get(url__regex=r".*/files/(?P<file_id>[^/]+)$").mock(
+        side_effect=lambda _request, file_id: httpx.Response(200, json=_file(file_id, "processed"))
+    )
+    poller = Poller(client, tick=0.01, max_qps=20)
+
+    start = time.monotonic()
+    futures = [poller.poll_file(f"file_{i}") for i in range(5)]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert [file.status for file in results] == ["processed"] * 5
+    assert time.monotonic() - start >= 4 / 20
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_poll_error(client: OpenAI, respx_mock: MockRouter) -> None:
+    respx_mock.get("/files/file_missing").mock(
+        return_value=httpx.Response(404, json={"error": {"message": "not found"}})
+    )
+    respx_mock.get("/files/file_abc").mock(return_value=httpx.Response(200, json=_file("file_abc", "processed")))
+    poller = Poller(client, tick=0.01)
+
+    missing = poller.poll_file("file_missing")
+    found = poller.poll_file("file_abc")
+
+    with pytest.raises(openai.NotFoundError):
+        missing.result(timeout=5)
+    assert found.result(timeout=5).status == "processed"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_poll_cancelled_in_flight(client: OpenAI, respx_mock: MockRouter) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def retrieve_slow(_request: httpx.Request) -> httpx.Response:
+        started.set()
+        release.wait(timeout=5)
+        return httpx.Response(200, json=_file("file_slow", "processed"))
+
+    respx_mock.get("/files/file_slow").mock(side_effect=retrieve_slow)
+    respx_mock.get("/files/file_abc").mock(return_value=httpx.Response(200, json=_file("file_abc", "processed")))
+    poller = Poller(client, tick=0.01, max_concurrency=1)
+
+    slow = poller.poll_file("file_slow")
+    assert started.wait(timeout=5)
+    assert slow.cancel()
+    release.set()
+
+    # the cancelled poll still releases its slot for the next one
+    assert poller.poll_file("file_abc").result(timeout=5).status == "processed"
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_poll(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    run_ids = [f"run_{i}" for i in range(5)]
+    calls = _mock_runs(respx_mock, run_ids)
+    respx_mock.get("/vector_stores/vs_abc/files/file_abc").mock(
+        side_effect=[
+            httpx.Response(200, json=_vector_store_file("file_abc", "in_progress")),
+            httpx.Response(200, json=_vector_store_file("file_abc", "completed")),
+        ]
+    )
+    poller = AsyncPoller(async_client, tick=0.01, max_qps=1000, max_concurrency=2)
+
+    for run_id in run_ids:
+        poller.poll_run(run_id, thread_id="thread_abc")
+    file = poller.poll_vector_store_file("file_abc", vector_store_id="vs_abc", poll_interval_ms=10)
+
+    completed = [future async for future in poller.as_completed()]
+
+    assert sorted(future.id for future in completed) == sorted([*run_ids, "file_abc"])
+    assert file.result().status == "completed"
+    assert calls == {run_id: 3 for run_id in run_ids}
+    assert poller.pending == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_poll_cancel(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    _mock_runs(respx_mock, ["run_abc"])
+    poller = AsyncPoller(async_client, tick=0.01, max_qps=1000)
+
+    cancelled = poller.poll_run("run_cancelled", thread_id="thread_abc")
+    run = poller.poll_run("run_abc", thread_id="thread_abc")
+    assert cancelled.cancel()
+
+    completed = [future async for future in poller.as_completed()]
+
+    assert completed == [run]
+    assert run.result().status == "completed"
+    with pytest.raises(RuntimeError, match="cancelled"):
+        cancelled.result()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+from typing import Any, List
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, RateLimiter, APIConnectionError
+from openai._models import FinalRequestOptions
+from openai._rate_limiter import estimate_tokens, parse_reset_duration
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+def make_options(body: Any) -> FinalRequestOptions:
+    return FinalRequestOptions.construct(method="post", url="/chat/completions", json_data=body)
+
+
+def rate_limit_headers(*, remaining_requests: int, remaining_tokens: int) -> dict[str, str]:
+    return {
+        "x-ratelimit-limit-requests": "60",
+        "x-ratelimit-limit-tokens": "1000",
+        "x-ratelimit-remaining-requests": str(remaining_requests),
+        "x-ratelimit-remaining-tokens": str(remaining_tokens),
+        "x-ratelimit-reset-requests": "1s",
+        "x-ratelimit-reset-tokens": "6m0s",
+    }
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("1s", 1.0),
+        ("20ms", 0.02),
+        ("6m0s", 360.0),
+        ("1h2m3.5s", 3723.5),
+        ("0.5", 0.5),
+        ("", None),
+        (None, None),
+        ("foo", None),
+    ],
+)
+def test_parse_reset_duration(value: str | None, expected: float | None) -> None:
+    assert parse_reset_duration(value) == expected
+
+
+def test_estimate_tokens() -> None:
+    body = {"model": "gpt-4o", "messages": [{"role": "user", "content": "x" * 400}]}
+    assert estimate_tokens(make_options(body)) == (len("gpt-4o") + len("user") + 400) // 4 + 1
+
+    assert estimate_tokens(make_options({**body, "max_tokens": 100})) == estimate_tokens(make_options(body)) + 100
+    assert (
+        estimate_tokens(make_options({**body, "max_completion_tokens": 100, "n": 3}))
+        == estimate_tokens(make_options(body)) + 300
+    )
+
+
+def test_no_delay_without_headers() -> None:
+    limiter = RateLimiter()
+    for _ in range(100):
+        assert limiter.reserve(make_options({"model": "gpt-4o"})).delay == 0
+
+
+def test_delay_when_exhausted() -> None:
+    limiter = RateLimiter()
+    options = make_options({"model": "gpt-4o"})
+
+    reservation = limiter.reserve(options)
+    limiter.release(reservation, httpx.Headers(rate_limit_headers(remaining_requests=0, remaining_tokens=900)))
+
+    # 60 requests are allowed per second, so one request should wait for ~1/60s
+    delay = limiter.reserve(options).delay
+    assert 0 < delay <= 1 / 60
+
+
+def test_delay_accounts_for_tokens() -> None:
+    limiter = RateLimiter(token_estimator=lambda _: 500)
+    options = make_options({"model": "gpt-4o"})
+
+    reservation = limiter.reserve(options)
+    limiter.release(reservation, httpx.Headers(rate_limit_headers(remaining_requests=59, remaining_tokens=100)))
+
+    # 900 tokens are replenished over 6 minutes, so 400 tokens take 160s, capped at `max_delay`
+    assert limiter.reserve(options).delay == 60
+
+
+def test_limits_are_per_model() -> None:
+    limiter = RateLimiter()
+
+    reservation = limiter.reserve(make_options({"model": "gpt-4o"}))
+    limiter.release(reservation, httpx.Headers(rate_limit_headers(remaining_requests=0, remaining_tokens=0)))
+
+    assert limiter.reserve(make_options({"model": "gpt-4o"})).delay > 0
+    assert limiter.reserve(make_options({"model": "gpt-4o-mini"})).delay == 0
+
+
+def test_in_flight_requests_are_counted() -> None:
+    limiter = RateLimiter()
+    options = make_options({"model": "gpt-4o"})
+
+    first = limiter.reserve(options)
+    second = limiter.reserve(options)
+
+    # the server has not seen the second request yet
+    limiter.release(first, httpx.Headers(rate_limit_headers(remaining_requests=1, remaining_tokens=1000)))
+    assert limiter.reserve(options).delay > 0
+
+    limiter.release(second)
+
+
+def test_copy_keeps_rate_limiter() -> None:
+    limiter = RateLimiter()
+    client = OpenAI(base_url=base_url, api_key=api_key, rate_limiter=limiter)
+    assert client.copy().rate_limiter is limiter
+    assert client.with_options(rate_limiter=None).rate_limiter is None
+
+
+class TestSyncRateLimiter:
+    @pytest.mark.respx(base_url=base_url)
+    def test_requests_are_paced(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200, json={}, headers=rate_limit_headers(remaining_requests=0, remaining_tokens=1000)
+            )
+        )
+
+        client = OpenAI(base_url=base_url, api_key=api_key, rate_limiter=RateLimiter())
+
+        delays: List[float] = []
+        with mock.patch("openai._base_client.time.sleep", side_effect=delays.append):
+            client.post("/chat/completions", cast_to=httpx.Response, body={"model": "gpt-4o"})
+            client.post("/chat/completions", cast_to=httpx.Response, body={"model": "gpt-4o"})
+
+        assert len(delays) == 1
+        assert 0 < delays[0] <= 1 / 60
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_released_on_error(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/chat/completions").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+        limiter = RateLimiter()
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=0, rate_limiter=limiter)
+
+        with pytest.raises(APIConnectionError):
+            client.post("/chat/completions", cast_to=httpx.Response, body={"model": "gpt-4o"})
+
+        requests_bucket, tokens_bucket = limiter._buckets["gpt-4o"]
+        assert requests_bucket.in_flight == 0
+        assert tokens_bucket.in_flight == 0
+
+
+class TestAsyncRateLimiter:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_requests_are_paced(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200, json={}, headers=rate_limit_headers(remaining_requests=0, remaining_tokens=1000)
+            )
+        )
+
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, rate_limiter=RateLimiter())
+
+        delays: List[float] = []
+
+        async def sleep(delay: float) -> None:
+            delays.append(delay)
+
+        with mock.patch("openai._base_client.anyio.sleep", side_effect=sleep):
+            await client.post("/chat/completions", cast_to=httpx.Response, body={"model": "gpt-4o"})
+            await client.post("/chat/completions", cast_to=httpx.Response, body={"model": "gpt-4o"})
+
+        assert len(delays) == 1
+        assert 0 < delays[0] <= 1 / 60
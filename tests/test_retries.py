@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import inspect
+from typing import List, Iterator, AsyncIterator
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI, APIStatusError, RequestAttempt, RetryScheduler, APIConnectionError
+from openai._constants import RAW_RESPONSE_HEADER
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+class RecordingRetryScheduler(RetryScheduler):
+    def __init__(self, *, max_pending: int | None = None) -> None:
+        super().__init__(max_pending=max_pending)
+        self.attempts: List[RequestAttempt] = []
+        self.delays: List[float] = []
+
+    def on_attempt(self, attempt: RequestAttempt) -> None:
+        self.attempts.append(attempt)
+
+    def wait(self, delay: float, attempt: RequestAttempt) -> bool:
+        self.delays.append(delay)
+        return super().wait(0, attempt)
+
+    async def async_wait(self, delay: float, attempt: RequestAttempt) -> bool:
+        self.delays.append(delay)
+        return await super().async_wait(0, attempt)
+
+
+class _ErrorBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """An error body that hasn't been read yet, as with a real connection"""
+
+    content = b'{"error": {"message": "unavailable"}}'
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.content
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.content
+
+
+def test_scheduler_validation() -> None:
+    with pytest.raises(ValueError, match="max_pending"):
+        RetryScheduler(max_pending=-1)
+
+
+def test_copy_keeps_retry_scheduler() -> None:
+    scheduler = RetryScheduler()
+    client = OpenAI(base_url=base_url, api_key=api_key, retry_scheduler=scheduler)
+    assert client.copy().retry_scheduler is scheduler
+    assert client.with_options(retry_scheduler=None).retry_scheduler is None
+
+
+class TestSyncRetries:
+    @pytest.mark.respx(base_url=base_url)
+    def test_retries_do_not_recurse(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/foo").mock(
+            side_effect=[httpx.Response(500, json={"error": "server error"}) for _ in range(50)]
+            + [httpx.Response(200, json={"foo": "bar"})]
+        )
+
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=50)
+
+        depths: List[int] = []
+        original = client._build_request
+
+        def build_request(*args: object, **kwargs: object) -> httpx.Request:
+            depths.append(len(inspect.stack(0)))
+            return original(*args, **kwargs)  # type: ignore[arg-type]
+
+        with mock.patch.object(client, "_build_request", build_request), mock.patch.object(
+            client, "_calculate_retry_timeout", lambda *_: 0
+        ):
+            response = client.post("/foo", cast_to=httpx.Response)
+
+        assert response.json() == {"foo": "bar"}
+        assert len(depths) == 51
+        assert len(set(depths)) == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_on_attempt_is_called_for_every_attempt(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/foo").mock(
+            side_effect=[
+                httpx.ConnectError("Connection refused"),
+                httpx.Response(429, headers={"retry-after": "3"}),
+                httpx.Response(200, json={"foo": "bar"}),
+            ]
+        )
+
+        scheduler = RecordingRetryScheduler()
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=2, retry_scheduler=scheduler)
+
+        response = client.post("/foo", cast_to=httpx.Response)
+        assert response.json() == {"foo": "bar"}
+
+        assert [attempt.retries_taken for attempt in scheduler.attempts] == [0, 1, 2]
+        assert isinstance(scheduler.attempts[0].error, httpx.ConnectError)
+        assert [attempt.response.status_code for attempt in scheduler.attempts[1:] if attempt.response] == [429, 200]
+        assert scheduler.delays[1] == 3
+        assert scheduler.pending == 0
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_max_pending_fails_fast(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(side_effect=lambda _: httpx.Response(503, stream=_ErrorBody()))
+
+        scheduler = RecordingRetryScheduler(max_pending=0)
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=2, retry_scheduler=scheduler)
+
+        with pytest.raises(APIStatusError) as exc_info:
+            client.post("/foo", cast_to=httpx.Response, options={"headers": {RAW_RESPONSE_HEADER: "stream"}})
+
+        assert exc_info.value.status_code == 503
+        # the body of the streamed error response is kept when the retry is refused
+        assert "unavailable" in exc_info.value.message
+        assert route.call_count == 1
+        assert len(scheduler.attempts) == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_max_pending_fails_fast_on_connection_errors(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+        client = OpenAI(
+            base_url=base_url, api_key=api_key, max_retries=2, retry_scheduler=RetryScheduler(max_pending=0)
+        )
+
+        with pytest.raises(APIConnectionError):
+            client.post("/foo", cast_to=httpx.Response)
+        assert route.call_count == 1
+
+
+class TestAsyncRetries:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_on_attempt_is_called_for_every_attempt(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/foo").mock(
+            side_effect=[
+                httpx.ConnectError("Connection refused"),
+                httpx.Response(429, headers={"retry-after": "3"}),
+                httpx.Response(200, json={"foo": "bar"}),
+            ]
+        )
+
+        scheduler = RecordingRetryScheduler()
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=2, retry_scheduler=scheduler)
+
+        response = await client.post("/foo", cast_to=httpx.Response)
+        assert response.json() == {"foo": "bar"}
+
+        assert [attempt.retries_taken for attempt in scheduler.attempts] == [0, 1, 2]
+        assert scheduler.delays[1] == 3
+        assert scheduler.pending == 0
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_max_pending_fails_fast(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/foo").mock(side_effect=lambda _: httpx.Response(503, stream=_ErrorBody()))
+
+        client = AsyncOpenAI(
+            base_url=base_url, api_key=api_key, max_retries=2, retry_scheduler=RetryScheduler(max_pending=0)
+        )
+
+        with pytest.raises(APIStatusError) as exc_info:
+            await client.post("/foo", cast_to=httpx.Response, options={"headers": {RAW_RESPONSE_HEADER: "stream"}})
+
+        assert exc_info.value.status_code == 503
+        # the body of the streamed error response is kept when the retry is refused
+        assert "unavailable" in exc_info.value.message
+        assert route.call_count == 1
@@ -423,3 +423,85 @@ async def test_base64_file_input(use_async: bool) -> None:
     assert await transform({"foo": io.BytesIO(b"Hello, world!")}, TypedDictBase64Input, use_async) == {
         "foo": "SGVsbG8sIHdvcmxkIQ=="
     }  # type: ignore[comparison-overlap]
+
+
+class PlainParams(TypedDict, total=False):
+    name: str
+    model: Any
+
+
+class PlainIterableParams(TypedDict, total=False):
+    items: Iterable[str]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_plain_typeddict(use_async: bool) -> None:
+    class Model(BaseModel):
+        foo: str
+
+    data = {"name": "foo", "model": Model(foo="bar"), "unknown": Model(foo="baz")}
+    result = cast(Any, await transform(data, PlainParams, use_async))
+
+    assert result is not data
+    assert result["name"] == "foo"
+    assert result["model"] == {"foo": "bar"}
+    # keys without type information are left as-is
+    assert isinstance(result["unknown"], Model)
+
+    # iterables are still converted to lists
+    assert cast(Any, await transform({"items": iter(["a", "b"])}, PlainIterableParams, use_async)) == {
+        "items": ["a", "b"]
+    }
+
+
+def test_transformers_are_cached() -> None:
+    from openai._utils._transform import _get_transformer
+
+    assert _get_transformer(Foo1) is _get_transformer(Foo1)
+    assert not _get_transformer(Foo1).needs_async()
+
+    # the fields are compiled lazily
+    plain = cast(Any, _get_transformer(PlainParams))
+    plain.transform({})
+    assert plain.typeddict._plain
+    assert _get_transformer(TypedDictBase64Input).needs_async()
+
+
+class SelfReferencingParams(TypedDict, total=False):
+    card_id: Annotated[str, PropertyInfo(alias="cardID")]
+    children: List[SelfReferencingParams]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_self_referencing_typeddict(use_async: bool) -> None:
+    data = {"card_id": "a", "children": [{"card_id": "b", "children": [{"card_id": "c"}]}]}
+    assert await transform(data, SelfReferencingParams, use_async) == {
+        "cardID": "a",
+        "children": [{"cardID": "b", "children": [{"cardID": "c"}]}],
+    }
+
+
+def test_typeddict_fields_are_published_when_complete(monkeypatch: pytest.MonkeyPatch) -> None:
+    from openai._utils import _transform as transform_module
+
+    class Params(TypedDict, total=False):
+        foo: str
+        card_id: Annotated[str, PropertyInfo(alias="cardID")]
+
+    typeddict = cast(Any, transform_module._get_transformer(Params)).typeddict
+    compile_transformer = transform_module._compile_transformer
+    concurrent_results: List[object] = []
+
+    def compile_and_transform(annotation: Any, inner_type: Any = None) -> Any:
+        # as if another thread transformed data while the first field is being compiled
+        if not concurrent_results:
+            concurrent_results.append(None)
+            concurrent_results.append(typeddict.transform({"card_id": "a"}))
+        return compile_transformer(annotation, inner_type)
+
+    monkeypatch.setattr(transform_module, "_compile_transformer", compile_and_transform)
+
+    assert typeddict.transform({"card_id": "a"}) == {"cardID": "a"}
+    assert concurrent_results[1] == {"cardID": "a"}